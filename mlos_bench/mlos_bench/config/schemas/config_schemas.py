@@ -21,11 +21,14 @@ Notes
   for additional config examples in the source tree.
 """
 
+import hashlib
 import json  # schema files are pure json - no comments
 import logging
+from collections import OrderedDict
 from collections.abc import Iterator, Mapping
 from enum import Enum
 from os import environ, path, walk
+from threading import Lock
 
 import jsonschema
 from referencing import Registry, Resource
@@ -62,6 +65,19 @@ _SKIP_VALIDATION = environ.get(VALIDATION_ENV_FLAG, "false").lower() in {
 }
 
 
+def _is_plain_json(obj: object) -> bool:
+    """Checks if the object consists of the plain JSON types only (e.g., no tuples or
+    non-string keys) and hence has a faithful JSON representation.
+    """
+    if obj is None or isinstance(obj, (str, int, float)):  # Including bool.
+        return True
+    if isinstance(obj, list):
+        return all(_is_plain_json(item) for item in obj)
+    if isinstance(obj, dict):
+        return all(isinstance(key, str) and _is_plain_json(val) for (key, val) in obj.items())
+    return False
+
+
 # Note: we separate out the SchemaStore from a class method on ConfigSchema
 # because of issues with mypy/pylint and non-Enum-member class members.
 class SchemaStore(Mapping):
@@ -72,6 +88,14 @@ class SchemaStore(Mapping):
     # A class member mapping of schema id to schema object.
     _SCHEMA_STORE: dict[str, dict] = {}
     _REGISTRY: Registry = Registry()
+    # A class member mapping of schema id to the (reusable) validator object.
+    _VALIDATORS: dict[str, jsonschema.Draft202012Validator] = {}
+    # LRU set of (schema id, config digest) pairs of the configs that passed the
+    # validation, to skip validating the same configs again (e.g., for each of
+    # the multiple TrialRunners).
+    _VALIDATED: OrderedDict[tuple[str, str], None] = OrderedDict()
+    _VALIDATED_MAX_SIZE = 1024
+    _VALIDATED_LOCK = Lock()
 
     def __len__(self) -> int:
         return self._SCHEMA_STORE.__len__()
@@ -114,12 +138,16 @@ class SchemaStore(Mapping):
         """
         if not cls._SCHEMA_STORE:
             cls._load_schemas()
-        cls._REGISTRY = Registry().with_resources(
-            [
-                (url, Resource.from_contents(schema, default_specification=DRAFT202012))
-                for url, schema in cls._SCHEMA_STORE.items()
-            ]
-        )
+        cls._REGISTRY = (
+            Registry()
+            .with_resources(
+                [
+                    (url, Resource.from_contents(schema, default_specification=DRAFT202012))
+                    for url, schema in cls._SCHEMA_STORE.items()
+                ]
+            )
+            .crawl()
+        )  # Pre-resolve the subschemas and anchors for faster $ref lookups.
 
     @property
     def registry(self) -> Registry:
@@ -128,6 +156,50 @@ class SchemaStore(Mapping):
             self._load_registry()
         return self._REGISTRY
 
+    def get_validator(self, key: str) -> jsonschema.Draft202012Validator:
+        """
+        Gets the validator for the schema with the given key.
+
+        The validator is created once and then reused, along with the ``$ref``
+        lookups it has already resolved.
+        """
+        validator = self._VALIDATORS.get(key)
+        if validator is None:
+            validator = jsonschema.Draft202012Validator(
+                schema=self[key],
+                registry=self.registry,
+            )
+            self._VALIDATORS[key] = validator
+        return validator
+
+    def validate(self, key: str, config: dict) -> None:
+        """
+        Validates the given config against the schema with the given key, unless an
+        identical config has passed the validation before.
+
+        Raises
+        ------
+        jsonschema.exceptions.ValidationError
+            On validation failure.
+        jsonschema.exceptions.SchemaError
+            On schema loading error.
+        """
+        if not _is_plain_json(config):
+            # Cannot compute a faithful digest - always validate.
+            self.get_validator(key).validate(config)
+            return
+        digest = hashlib.sha256(json.dumps(config, sort_keys=True).encode("utf-8")).hexdigest()
+        cache_key = (key, digest)
+        with self._VALIDATED_LOCK:
+            if cache_key in self._VALIDATED:
+                self._VALIDATED.move_to_end(cache_key)
+                return
+        self.get_validator(key).validate(config)
+        with self._VALIDATED_LOCK:
+            self._VALIDATED[cache_key] = None
+            while len(self._VALIDATED) > self._VALIDATED_MAX_SIZE:
+                self._VALIDATED.popitem(last=False)
+
 
 SCHEMA_STORE = SchemaStore()
 """Static :py:class:`.SchemaStore` instance used for storing and retrieving schemas for
@@ -247,7 +319,4 @@ class ConfigSchema(Enum):
         if _SKIP_VALIDATION:
             _LOG.warning("%s is set - skip schema validation", VALIDATION_ENV_FLAG)
         else:
-            jsonschema.Draft202012Validator(
-                schema=self.schema,
-                registry=SCHEMA_STORE.registry,
-            ).validate(config)
+            SCHEMA_STORE.validate(self.value, config)
@@ -19,6 +19,7 @@ from mlos_bench.config.schemas import ConfigSchema
 from mlos_bench.dict_templater import DictTemplater
 from mlos_bench.environments.status import Status
 from mlos_bench.services.base_service import Service
+from mlos_bench.tracing import trace_methods, traced
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
 from mlos_bench.util import instantiate_from_config, merge_parameters
@@ -29,6 +30,11 @@ if TYPE_CHECKING:
 _LOG = logging.getLogger(__name__)
 
 
+def _span_attributes(env: "Environment", *_args: Any, **_kwargs: Any) -> dict[str, Any]:
+    """Get the tracing span attributes of the Environment method call."""
+    return {"env": env.name}
+
+
 class Environment(ContextManager, metaclass=abc.ABCMeta):
     # pylint: disable=too-many-instance-attributes
     """An abstract base of all benchmark environments."""
@@ -42,6 +48,13 @@ class Environment(ContextManager, metaclass=abc.ABCMeta):
         "trial_id",
     }
 
+    # Methods of all Environments to record in the tracing spans.
+    _TRACED_METHODS = ("setup", "run", "status", "teardown")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, Environment._TRACED_METHODS, "environment", _span_attributes)
+
     @classmethod
     def new(  # pylint: disable=too-many-arguments
         cls,
@@ -363,6 +376,7 @@ class Environment(ContextManager, metaclass=abc.ABCMeta):
         """
         return self._params.copy()
 
+    @traced("environment", _span_attributes)
     def setup(self, tunables: TunableGroups, global_config: dict | None = None) -> bool:
         """
         Set up a new benchmark environment, if necessary. This method must be
@@ -417,6 +431,7 @@ class Environment(ContextManager, metaclass=abc.ABCMeta):
 
         return True
 
+    @traced("environment", _span_attributes)
     def teardown(self) -> None:
         """
         Tear down the benchmark environment.
@@ -429,6 +444,7 @@ class Environment(ContextManager, metaclass=abc.ABCMeta):
         assert self._in_context
         self._is_ready = False
 
+    @traced("environment", _span_attributes)
     def run(self) -> tuple[Status, datetime, dict[str, TunableValue] | None]:
         """
         Execute the run script for this environment.
@@ -449,6 +465,7 @@ class Environment(ContextManager, metaclass=abc.ABCMeta):
         (status, timestamp, _) = self.status()
         return (status, timestamp, None)
 
+    @traced("environment", _span_attributes)
     def status(self) -> tuple[Status, datetime, list[tuple[datetime, str, Any]]]:
         """
         Check the status of the benchmark environment.
@@ -0,0 +1,152 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Helper functions to read the benchmark results and telemetry files produced by the
+scripts of :py:class:`~mlos_bench.environments.local.local_env.LocalEnv`.
+
+Supported file formats are:
+
+- ``csv``: comma-separated values with a header row (default).
+- ``json``: a single JSON document. Either an object that maps metric names to values
+  (wide format), an object that maps column names to lists of values (columnar
+  format), or a list of records.
+- ``ndjson``: newline-delimited JSON, one record (object or array) per line.
+  The file is parsed line by line without loading the whole text in memory.
+- ``parquet``: Apache Parquet file (requires ``pyarrow``).
+
+The format is inferred from the file extension unless specified explicitly in the
+``read_results_format`` or ``read_telemetry_format`` config parameter of the
+environment.
+
+Examples
+--------
+>>> infer_file_format("results.csv")
+'csv'
+>>> infer_file_format("/tmp/telemetry.ndjson")
+'ndjson'
+>>> infer_file_format("results.out", "json")
+'json'
+"""
+
+import json
+import logging
+import os
+from typing import Any
+
+import pandas
+
+_LOG = logging.getLogger(__name__)
+
+FILE_FORMAT_EXTENSIONS: dict[str, str] = {
+    ".csv": "csv",
+    ".json": "json",
+    ".jsonl": "ndjson",
+    ".ndjson": "ndjson",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+"""Mapping of the supported file extensions to the data file formats."""
+
+FILE_FORMATS = frozenset(FILE_FORMAT_EXTENSIONS.values())
+"""Data file formats supported by :py:func:`.read_data_file`."""
+
+
+def infer_file_format(path: str, file_format: str | None = None) -> str:
+    """
+    Get the format of the data file from its extension, unless specified explicitly.
+
+    Parameters
+    ----------
+    path : str
+        Path to the data file.
+    file_format : str | None
+        Explicitly specified file format, if any.
+
+    Returns
+    -------
+    file_format : str
+        One of the values in :py:data:`.FILE_FORMATS`.
+    """
+    if file_format is None:
+        ext = os.path.splitext(path)[1].lower()
+        file_format = FILE_FORMAT_EXTENSIONS.get(ext)
+        if file_format is None:
+            raise ValueError(f"Cannot infer the data format from the file name: {path}")
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported data file format: {file_format}")
+    return file_format
+
+
+def read_data_file(path: str, file_format: str) -> pandas.DataFrame:
+    """
+    Read the data file into a DataFrame.
+
+    Parameters
+    ----------
+    path : str
+        Path to the data file.
+    file_format : str
+        Format of the file. One of the values in :py:data:`.FILE_FORMATS`.
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        The data from the file. Records without the column names (e.g., JSON arrays)
+        produce a DataFrame with positional (integer) column labels.
+
+    Raises
+    ------
+    pandas.errors.EmptyDataError
+        If the file has no data.
+    """
+    _LOG.debug("Read %s data from: %s", file_format, path)
+    if file_format == "csv":
+        return pandas.read_csv(path, index_col=False)
+    if file_format == "json":
+        with open(path, encoding="utf-8") as fh_data:
+            text = fh_data.read()
+        if not text.strip():
+            raise pandas.errors.EmptyDataError(f"No data in the JSON file: {path}")
+        return _json_to_frame(json.loads(text))
+    if file_format == "ndjson":
+        return _read_ndjson(path)
+    if file_format == "parquet":
+        return pandas.read_parquet(path)
+    raise ValueError(f"Unsupported data file format: {file_format}")
+
+
+def _json_to_frame(data: Any) -> pandas.DataFrame:
+    """Convert the parsed JSON document into a DataFrame."""
+    if isinstance(data, dict):
+        if data and all(isinstance(val, list) for val in data.values()):
+            # Columnar format: {"metric": [...], "value": [...]}
+            return pandas.DataFrame(data)
+        # Wide format: a single record {"metric1": value1, ...}
+        return pandas.DataFrame([data])
+    if isinstance(data, list):
+        return _records_to_frame(data)
+    raise ValueError(f"Invalid JSON data format: {data}")
+
+
+def _records_to_frame(records: list[Any]) -> pandas.DataFrame:
+    """Convert a list of JSON objects or JSON arrays into a DataFrame."""
+    if all(isinstance(rec, dict) for rec in records):
+        return pandas.DataFrame.from_records(records)
+    if all(isinstance(rec, list) for rec in records):
+        return pandas.DataFrame(records)
+    raise ValueError("JSON records must be either all objects or all arrays")
+
+
+def _read_ndjson(path: str) -> pandas.DataFrame:
+    """Parse a newline-delimited JSON file one line at a time."""
+    records: list[Any] = []
+    with open(path, encoding="utf-8") as fh_data:
+        for line in fh_data:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    if not records:
+        raise pandas.errors.EmptyDataError(f"No data in the NDJSON file: {path}")
+    return _records_to_frame(records)
@@ -19,12 +19,20 @@ from types import TracebackType
 from typing import Any, Literal
 
 import pandas
+from pytz import UTC
 
 from mlos_bench.environments.base_environment import Environment
+from mlos_bench.environments.local.data_file_reader import (
+    infer_file_format,
+    read_data_file,
+)
 from mlos_bench.environments.script_env import ScriptEnv
 from mlos_bench.environments.status import Status
 from mlos_bench.services.base_service import Service
-from mlos_bench.services.types.local_exec_type import SupportsLocalExec
+from mlos_bench.services.types.local_exec_type import (
+    LocalExecTimeoutError,
+    SupportsLocalExec,
+)
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
 from mlos_bench.util import datetime_parser, path_join
@@ -34,7 +42,15 @@ _LOG = logging.getLogger(__name__)
 
 class LocalEnv(ScriptEnv):
     # pylint: disable=too-many-instance-attributes
-    """Scheduler-side Environment that runs scripts locally."""
+    """
+    Scheduler-side Environment that runs scripts locally.
+
+    If ``record_resource_usage`` is set in the config, the resource usage of the
+    setup and run scripts (as reported by the
+    :py:class:`~mlos_bench.services.local.local_exec.LocalExecService`) is added to
+    the benchmark results and the telemetry of each trial as ``setup.<metric>`` and
+    ``run.<metric>`` values, e.g., ``run.cpu_user_time`` or ``setup.max_rss_kb``.
+    """
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
@@ -89,6 +105,23 @@ class LocalEnv(ScriptEnv):
         self._read_results_file: str | None = self.config.get("read_results_file")
         self._read_telemetry_file: str | None = self.config.get("read_telemetry_file")
 
+        self._read_results_format: str | None = None
+        if self._read_results_file:
+            self._read_results_format = infer_file_format(
+                self._read_results_file,
+                self.config.get("read_results_format"),
+            )
+        self._read_telemetry_format: str | None = None
+        if self._read_telemetry_file:
+            self._read_telemetry_format = infer_file_format(
+                self._read_telemetry_file,
+                self.config.get("read_telemetry_format"),
+            )
+
+        self._record_resource_usage = bool(self.config.get("record_resource_usage", False))
+        self._resource_usage: dict[str, TunableValue] = {}
+        self._resource_usage_telemetry: list[tuple[datetime, str, Any]] = []
+
     def __enter__(self) -> Environment:
         assert self._temp_dir is None and self._temp_dir_context is None
         self._temp_dir_context = self._local_exec_service.temp_dir_context(
@@ -137,6 +170,9 @@ class LocalEnv(ScriptEnv):
         _LOG.info("Set up the environment locally: '%s' at %s", self, self._temp_dir)
         assert self._temp_dir is not None
 
+        self._resource_usage = {}
+        self._resource_usage_telemetry = []
+
         if self._dump_params_file:
             fname = path_join(self._temp_dir, self._dump_params_file)
             _LOG.debug("Dump tunables to file: %s", fname)
@@ -158,8 +194,14 @@ class LocalEnv(ScriptEnv):
                 )
 
         if self._script_setup:
-            (return_code, _output) = self._local_exec(self._script_setup, self._temp_dir)
-            self._is_ready = bool(return_code == 0)
+            try:
+                (return_code, _output) = self._local_exec(
+                    self._script_setup, self._temp_dir, phase="setup"
+                )
+                self._is_ready = bool(return_code == 0)
+            except LocalExecTimeoutError as ex:
+                _LOG.warning("Local setup timed out: %s :: %s", self, ex)
+                self._is_ready = False
         else:
             self._is_ready = True
 
@@ -185,24 +227,32 @@ class LocalEnv(ScriptEnv):
 
         stdout_data: dict[str, TunableValue] = {}
         if self._script_run:
-            (return_code, output) = self._local_exec(self._script_run, self._temp_dir)
+            try:
+                (return_code, output) = self._local_exec(
+                    self._script_run, self._temp_dir, phase="run"
+                )
+            except LocalExecTimeoutError as ex:
+                _LOG.warning("Local run timed out: %s :: %s", self, ex)
+                return (Status.TIMED_OUT, timestamp, None)
             if return_code != 0:
                 return (Status.FAILED, timestamp, None)
             stdout_data = self._extract_stdout_results(output.get("stdout", ""))
 
-        # FIXME: We should not be assuming that the only output file type is a CSV.
+        stdout_data.update(self._resource_usage)
+
         if not self._read_results_file:
             _LOG.debug("Not reading the data at: %s", self)
             return (Status.SUCCEEDED, timestamp, stdout_data)
 
+        assert self._read_results_format is not None
         try:
             data = self._normalize_columns(
-                pandas.read_csv(
+                read_data_file(
                     self._config_loader_service.resolve_path(
                         self._read_results_file,
                         extra_paths=[self._temp_dir],
                     ),
-                    index_col=False,
+                    self._read_results_format,
                 )
             )
         except pandas.errors.EmptyDataError:
@@ -246,56 +296,75 @@ class LocalEnv(ScriptEnv):
     def status(self) -> tuple[Status, datetime, list[tuple[datetime, str, Any]]]:
 
         (status, timestamp, _) = super().status()
-        if not (self._is_ready and self._read_telemetry_file):
-            return (status, timestamp, [])
+        telemetry: list[tuple[datetime, str, Any]] = []
+        if self._is_ready and self._read_telemetry_file:
+            telemetry = self._read_telemetry()
+        return (status, timestamp, telemetry + self._resource_usage_telemetry)
 
-        assert self._temp_dir is not None
+    def _read_telemetry(self) -> list[tuple[datetime, str, Any]]:
+        """
+        Read the telemetry data from the `read_telemetry_file`.
+
+        Returns
+        -------
+        telemetry : list[tuple[datetime, str, Any]]
+            A list of (timestamp, metric, value) triplets.
+        """
+        assert self._temp_dir is not None and self._read_telemetry_file
         try:
             fname = self._config_loader_service.resolve_path(
                 self._read_telemetry_file,
                 extra_paths=[self._temp_dir],
             )
 
-            # TODO: Use the timestamp of the CSV file as our status timestamp?
+            # TODO: Use the timestamp of the telemetry file as our status timestamp?
 
-            # FIXME: We should not be assuming that the only output file type is a CSV.
-
-            data = self._normalize_columns(pandas.read_csv(fname, index_col=False))
-            data.iloc[:, 0] = datetime_parser(data.iloc[:, 0], origin="local")
+            assert self._read_telemetry_format is not None
+            data = self._normalize_columns(read_data_file(fname, self._read_telemetry_format))
 
             expected_col_names = ["timestamp", "metric", "value"]
             if len(data.columns) != len(expected_col_names):
                 raise ValueError(f"Telemetry data must have columns {expected_col_names}")
 
-            if list(data.columns) != expected_col_names:
-                # Assume no header - this is ok for telemetry data.
+            if list(data.columns) == list(range(len(expected_col_names))):
+                # JSON arrays have no column names - use the positional ones.
+                data.columns = pandas.Index(expected_col_names)
+            elif list(data.columns) != expected_col_names:
+                if self._read_telemetry_format != "csv":
+                    raise ValueError(f"Telemetry data must have columns {expected_col_names}")
+                # Assume no header - this is ok for telemetry data in CSV.
                 data = pandas.read_csv(fname, index_col=False, names=expected_col_names)
-                data.iloc[:, 0] = datetime_parser(data.iloc[:, 0], origin="local")
+
+            data.iloc[:, 0] = datetime_parser(data.iloc[:, 0], origin="local")
 
         except FileNotFoundError as ex:
-            _LOG.warning("Telemetry CSV file not found: %s :: %s", self._read_telemetry_file, ex)
-            return (status, timestamp, [])
+            _LOG.warning("Telemetry file not found: %s :: %s", self._read_telemetry_file, ex)
+            return []
 
         _LOG.debug("Read telemetry data:\n%s", data)
         col_dtypes: Mapping[int, type] = {0: datetime}
-        return (
-            status,
-            timestamp,
-            [
-                (pandas.Timestamp(ts).to_pydatetime(), metric, value)
-                for (ts, metric, value) in data.to_records(index=False, column_dtypes=col_dtypes)
-            ],
-        )
+        return [
+            (pandas.Timestamp(ts).to_pydatetime(), metric, value)
+            for (ts, metric, value) in data.to_records(index=False, column_dtypes=col_dtypes)
+        ]
 
     def teardown(self) -> None:
         """Clean up the local environment."""
         if self._script_teardown:
             _LOG.info("Local teardown: %s", self)
-            (return_code, _output) = self._local_exec(self._script_teardown)
-            _LOG.info("Local teardown complete: %s :: %s", self, return_code)
+            try:
+                (return_code, _output) = self._local_exec(self._script_teardown)
+                _LOG.info("Local teardown complete: %s :: %s", self, return_code)
+            except LocalExecTimeoutError as ex:
+                _LOG.warning("Local teardown timed out: %s :: %s", self, ex)
         super().teardown()
 
-    def _local_exec(self, script: Iterable[str], cwd: str | None = None) -> tuple[int, dict]:
+    def _local_exec(
+        self,
+        script: Iterable[str],
+        cwd: str | None = None,
+        phase: str | None = None,
+    ) -> tuple[int, dict]:
         """
         Execute a script locally in the scheduler environment.
 
@@ -306,19 +375,40 @@ class LocalEnv(ScriptEnv):
             Treat every line as a separate command to run.
         cwd : str | None
             Work directory to run the script at.
+        phase : str | None
+            Name of the script (e.g., "setup" or "run") to record its resource
+            usage under, if `record_resource_usage` is enabled.
 
         Returns
         -------
         (return_code, output) : (int, dict)
             Return code of the script and a dict with stdout/stderr. Return code = 0 if successful.
+
+        Raises
+        ------
+        LocalExecTimeoutError
+            If the script has timed out.
         """
         env_params = self._get_env_params()
         _LOG.info("Run script locally on: %s at %s with env %s", self, cwd, env_params)
-        (return_code, stdout, stderr) = self._local_exec_service.local_exec(
-            script,
-            env=env_params,
-            cwd=cwd,
-        )
+        usage: dict[str, float] | None = None
+        if phase and self._record_resource_usage:
+            usage = {}
+        try:
+            (return_code, stdout, stderr) = self._local_exec_service.local_exec(
+                script,
+                env=env_params,
+                cwd=cwd,
+                resource_usage=usage,
+            )
+        finally:
+            # Record the resource usage of the timed out scripts, too.
+            if usage:
+                _LOG.info("Resource usage of %s script: %s :: %s", phase, self, usage)
+                timestamp = datetime.now(UTC)
+                for metric, value in usage.items():
+                    self._resource_usage[f"{phase}.{metric}"] = value
+                    self._resource_usage_telemetry.append((timestamp, f"{phase}.{metric}", value))
         if return_code != 0:
             _LOG.warning("ERROR: Local script returns code %d stderr:\n%s", return_code, stderr)
         return (return_code, {"stdout": stdout, "stderr": stderr})
@@ -21,6 +21,7 @@ from mlos_bench.environments.script_env import ScriptEnv
 from mlos_bench.environments.status import Status
 from mlos_bench.services.base_service import Service
 from mlos_bench.services.types.host_ops_type import SupportsHostOps
+from mlos_bench.services.types.remote_exec_multi_type import SupportsRemoteExecMulti
 from mlos_bench.services.types.remote_exec_type import SupportsRemoteExec
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
@@ -59,6 +60,8 @@ class RemoteEnv(ScriptEnv):
             and the "const_args" sections.
             `RemoteEnv` must also have at least some of the following parameters:
             {setup, run, teardown, wait_boot}
+            An optional "hosts" list of per-host parameters (e.g., "ssh_hostname")
+            makes the environment run its scripts on all those hosts concurrently.
         global_config : dict
             Free-format dictionary of global parameters (e.g., security credentials)
             to be mixed in into the "const_args" section of the local config.
@@ -84,6 +87,13 @@ class RemoteEnv(ScriptEnv):
         ), "RemoteEnv requires a service that supports remote execution operations"
         self._remote_exec_service: SupportsRemoteExec = self._service
 
+        self._hosts: list[dict] = self.config.get("hosts", [])
+        if self._hosts:
+            assert isinstance(
+                self._service, SupportsRemoteExecMulti
+            ), "RemoteEnv with multiple hosts requires a service that supports multi-host exec"
+            self._remote_exec_multi_service: SupportsRemoteExecMulti = self._service
+
         if self._wait_boot:
             assert self._service is not None and isinstance(
                 self._service, SupportsHostOps
@@ -189,6 +199,8 @@ class RemoteEnv(ScriptEnv):
         env_params = self._get_env_params()
         command_name = self._command_prefix + command_name
         _LOG.debug("Submit command: %s with %s", command_name, env_params)
+        if self._hosts:
+            return self._remote_exec_multi(command_name, script, env_params)
         (status, output) = self._remote_exec_service.remote_exec(
             script,
             config={
@@ -204,3 +216,49 @@ class RemoteEnv(ScriptEnv):
         # FIXME: get the timestamp from the remote environment!
         timestamp = datetime.now(UTC)
         return (status, timestamp, output)
+
+    def _remote_exec_multi(
+        self,
+        command_name: str,
+        script: Iterable[str],
+        env_params: dict,
+    ) -> tuple[Status, datetime, dict | None]:
+        """
+        Run a script on all remote hosts concurrently.
+
+        Parameters
+        ----------
+        command_name : str
+            Name of the command to be executed on the remote hosts.
+        script : [str]
+            List of commands to be executed on the remote hosts.
+        env_params : dict
+            Parameters to pass as *shell* environment variables into the script.
+
+        Returns
+        -------
+        result : (Status, datetime.datetime, dict)
+            3-tuple of Status, timestamp, and dict with the benchmark/script results.
+            Status is one of {SUCCEEDED, FAILED, TIMED_OUT}
+        """
+        (status, output) = self._remote_exec_multi_service.remote_exec_multi(
+            script,
+            configs=[
+                {
+                    **self._params,
+                    **host,
+                    "commandName": command_name,
+                }
+                for host in self._hosts
+            ],
+            env_params=env_params,
+        )
+        _LOG.debug("Script submitted to %d hosts: %s %s", len(self._hosts), self, status)
+        if status in {Status.PENDING, Status.SUCCEEDED}:
+            (status, output) = self._remote_exec_multi_service.get_remote_exec_multi_results(
+                output
+            )
+        _LOG.debug("Status: %s :: %s", status, output)
+        # FIXME: get the timestamp from the remote environment!
+        timestamp = datetime.now(UTC)
+        return (status, timestamp, output)
@@ -29,6 +29,7 @@ from mlos_bench.services.config_persistence import ConfigPersistenceService
 from mlos_bench.services.local.local_exec import LocalExecService
 from mlos_bench.services.types.config_loader_type import SupportsConfigLoading
 from mlos_bench.storage.base_storage import Storage
+from mlos_bench.tracing import TRACER
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
 from mlos_bench.util import try_parse_val
@@ -64,13 +65,20 @@ class Launcher:
 
         # Bootstrap config loader: command line takes priority.
         config_path = args.config_path or []
-        self._config_loader = ConfigPersistenceService({"config_path": config_path})
+        self._config_loader = ConfigPersistenceService(
+            {"config_path": config_path, "config_cache_dir": args.config_cache_dir}
+        )
         if args.config:
             config = self._config_loader.load_config(args.config, ConfigSchema.CLI)
             assert isinstance(config, dict)
             # Merge the args paths for the config loader with the paths from JSON file.
             config_path += config.get("config_path", [])
-            self._config_loader = ConfigPersistenceService({"config_path": config_path})
+            self._config_loader = ConfigPersistenceService(
+                {
+                    "config_path": config_path,
+                    "config_cache_dir": args.config_cache_dir or config.get("config_cache_dir"),
+                }
+            )
         else:
             config = {}
 
@@ -89,6 +97,13 @@ class Launcher:
             log_handler.setFormatter(logging.Formatter(_LOG_FORMAT))
             logging.root.addHandler(log_handler)
 
+        # Record the tracing spans of the optimization loop, if requested.
+        self.trace_file: str | None = args.trace_file or config.get("trace_file")
+        trace_per_trial = bool(args.trace_per_trial or config.get("trace_per_trial", False))
+        if self.trace_file or trace_per_trial:
+            TRACER.clear()
+            TRACER.enable(per_trial=trace_per_trial)
+
         # Prepare global_config from a combination of global config files, cli
         # configs, and cli args.
         args_dict = vars(args)
@@ -171,6 +186,7 @@ class Launcher:
             svcs_json=service_files,
             env_json=self.root_env_config,
             num_trial_runners=self.global_config["num_trial_runners"],
+            max_workers=args.trial_runner_init_workers or config.get("trial_runner_init_workers"),
         )
 
         _LOG.info(
@@ -269,6 +285,27 @@ class Launcher:
             help="Path to the log file. Use stdout if omitted.",
         )
 
+        path_args_tracker.add_argument(
+            "--trace_file",
+            "--trace-file",
+            required=False,
+            help=(
+                "Path to the Chrome trace JSON file (viewable in Perfetto) to save "
+                "the timings of the scheduler, environment, service, optimizer, and "
+                "storage calls to."
+            ),
+        )
+
+        parser.add_argument(
+            "--trace_per_trial",
+            "--trace-per-trial",
+            required=False,
+            default=False,
+            dest="trace_per_trial",
+            action="store_true",
+            help="Store the timings of each trial's calls in the trial telemetry.",
+        )
+
         parser.add_argument(
             "--log_level",
             "--log-level",
@@ -291,6 +328,16 @@ class Launcher:
             help="One or more locations of JSON config files.",
         )
 
+        path_args_tracker.add_argument(
+            "--config_cache_dir",
+            "--config-cache-dir",
+            required=False,
+            help=(
+                "Directory to keep the parsed JSON config files in "
+                "to speed up loading them in the subsequent runs."
+            ),
+        )
+
         path_args_tracker.add_argument(
             "--service",
             "--services",
@@ -341,6 +388,17 @@ class Launcher:
             ),
         )
 
+        parser.add_argument(
+            "--trial_runner_init_workers",
+            "--trial-runner-init-workers",
+            required=False,
+            type=int,
+            help=(
+                "Number of threads to create the TrialRunners (and their Environments and "
+                "Services) concurrently. Default is to create them one by one."
+            ),
+        )
+
         path_args_tracker.add_argument(
             "--scheduler",
             required=False,
@@ -41,6 +41,10 @@ Optimizer instance using observations from a prior set of
     Automatically determining whether that makes sense to do is challenging and
     is left to the user to ensure for now.
 
+Any Optimizer can also be wrapped in a :py:class:`.PrefetchOptimizer` (by setting the
+``prefetch_suggestions`` config property) to compute its next suggestions in the
+background while the trials run.
+
 Stopping Conditions
 ^^^^^^^^^^^^^^^^^^^
 Currently the :py:meth:`.Optimizer.not_converged` method only checks that the number
@@ -243,7 +247,7 @@ mlos_core :py:data:`~mlos_core.optimizers.OptimizerType` enum values:
 
 >>> import mlos_core.optimizers
 >>> print([member.name for member in mlos_core.optimizers.OptimizerType])
-['RANDOM', 'FLAML', 'SMAC']
+['RANDOM', 'FLAML', 'SMAC', 'QUASI_RANDOM']
 
 These may also include their own configuration options, which can be specified
 as additional key-value pairs in the ``config`` section, where each key-value
@@ -352,6 +356,7 @@ from mlos_bench.optimizers.manual_optimizer import ManualOptimizer
 from mlos_bench.optimizers.mlos_core_optimizer import MlosCoreOptimizer
 from mlos_bench.optimizers.mock_optimizer import MockOptimizer
 from mlos_bench.optimizers.one_shot_optimizer import OneShotOptimizer
+from mlos_bench.optimizers.prefetch_optimizer import PrefetchOptimizer
 
 __all__ = [
     "GridSearchOptimizer",
@@ -360,4 +365,5 @@ __all__ = [
     "MockOptimizer",
     "OneShotOptimizer",
     "Optimizer",
+    "PrefetchOptimizer",
 ]
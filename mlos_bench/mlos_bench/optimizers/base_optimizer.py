@@ -17,7 +17,7 @@ from abc import ABCMeta, abstractmethod
 from collections.abc import Sequence
 from contextlib import AbstractContextManager as ContextManager
 from types import TracebackType
-from typing import Literal
+from typing import Any, Literal
 
 from ConfigSpace import ConfigurationSpace
 
@@ -25,6 +25,7 @@ from mlos_bench.config.schemas import ConfigSchema
 from mlos_bench.environments.status import Status
 from mlos_bench.optimizers.convert_configspace import tunable_groups_to_configspace
 from mlos_bench.services.base_service import Service
+from mlos_bench.tracing import trace_methods, traced
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
 from mlos_bench.util import strtobool
@@ -45,6 +46,13 @@ class Optimizer(ContextManager, metaclass=ABCMeta):  # pylint: disable=too-many-
         "start_with_defaults",
     }
 
+    # Methods of all Optimizers to record in the tracing spans.
+    _TRACED_METHODS = ("bulk_register", "suggest", "register")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, Optimizer._TRACED_METHODS, "optimizer")
+
     def __init__(
         self,
         tunables: TunableGroups,
@@ -226,6 +234,52 @@ class Optimizer(ContextManager, metaclass=ABCMeta):  # pylint: disable=too-many-
         """
         return True
 
+    @property
+    def checkpoint_file(self) -> str | None:
+        """
+        Path to the file to save the optimizer state to, or None if the optimizer
+        does not support (or is not configured to use) checkpoints.
+
+        See Also
+        --------
+        Optimizer.save_state : Save the optimizer state.
+        Optimizer.load_state : Restore the optimizer state.
+        """
+        return None
+
+    def save_state(self, path: str, last_trial_id: int) -> None:
+        """
+        Save the optimizer state (e.g., the underlying model, registered
+        observations, and the random state) to a file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the checkpoint file.
+        last_trial_id : int
+            ID of the last trial registered with the optimizer.
+            Saved along with the state to check its consistency with the storage.
+        """
+        raise NotImplementedError(f"Checkpoints are not supported by {self}")
+
+    def load_state(self, path: str) -> int:
+        """
+        Restore the optimizer state from a file saved by :py:meth:`.save_state`.
+
+        Parameters
+        ----------
+        path : str
+            Path to the checkpoint file.
+
+        Returns
+        -------
+        last_trial_id : int
+            ID of the last trial registered with the optimizer before saving the
+            state. The trials after it have to be registered again.
+        """
+        raise NotImplementedError(f"Checkpoints are not supported by {self}")
+
+    @traced("optimizer")
     @abstractmethod
     def bulk_register(
         self,
@@ -266,6 +320,7 @@ class Optimizer(ContextManager, metaclass=ABCMeta):  # pylint: disable=too-many-
             self._start_with_defaults = False
         return has_data
 
+    @traced("optimizer")
     def suggest(self) -> TunableGroups:
         """
         Generate the next suggestion. Base class' implementation increments the
@@ -282,6 +337,7 @@ class Optimizer(ContextManager, metaclass=ABCMeta):  # pylint: disable=too-many-
         _LOG.debug("Iteration %d :: Suggest", self._iter)
         return self._tunables.copy()
 
+    @traced("optimizer")
     @abstractmethod
     def register(
         self,
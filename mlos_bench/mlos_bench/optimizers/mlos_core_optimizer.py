@@ -66,7 +66,7 @@ mlos_core :py:data:`~mlos_core.optimizers.OptimizerType` enum values:
 
 >>> import mlos_core.optimizers
 >>> print([member.name for member in mlos_core.optimizers.OptimizerType])
-['RANDOM', 'FLAML', 'SMAC']
+['RANDOM', 'FLAML', 'SMAC', 'QUASI_RANDOM']
 
 These may also include their own configuration options, which can be specified
 as additional key-value pairs in the ``config`` section, where each key-value
@@ -167,6 +167,7 @@ configurations, like so:
 
 import logging
 import os
+import pickle
 from collections.abc import Sequence
 from types import TracebackType
 from typing import Literal
@@ -207,6 +208,9 @@ class MlosCoreOptimizer(Optimizer):
     ):
         super().__init__(tunables, config, global_config, service)
 
+        checkpoint_file = self._config.pop("checkpoint_file", None)
+        self._checkpoint_file = os.path.abspath(checkpoint_file) if checkpoint_file else None
+
         opt_type = getattr(
             OptimizerType, self._config.pop("optimizer_type", DEFAULT_OPTIMIZER_TYPE.name)
         )
@@ -267,6 +271,46 @@ class MlosCoreOptimizer(Optimizer):
     def name(self) -> str:
         return f"{self.__class__.__name__}:{self._opt.__class__.__name__}"
 
+    @property
+    def checkpoint_file(self) -> str | None:
+        return self._checkpoint_file
+
+    def save_state(self, path: str, last_trial_id: int) -> None:
+        state = {
+            "experiment_id": self.experiment_id,
+            "last_trial_id": last_trial_id,
+            "start_with_defaults": self._start_with_defaults,
+            # Includes the underlying model, observations, space adapter and RNG state.
+            "optimizer": self._opt,
+        }
+        _LOG.info("Save optimizer state: %s :: last trial ID: %d", path, last_trial_id)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Write to a temporary file first to never leave a partial checkpoint behind.
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as fh_state:
+            pickle.dump(state, fh_state)
+        os.replace(tmp_path, path)
+
+    def load_state(self, path: str) -> int:
+        _LOG.info("Load optimizer state: %s", path)
+        with open(path, "rb") as fh_state:
+            state = pickle.load(fh_state)
+        opt: BaseOptimizer = state["optimizer"]
+        if (
+            state["experiment_id"] != self.experiment_id
+            or type(opt) is not type(self._opt)
+            or type(opt.space_adapter) is not type(self._opt.space_adapter)
+            or opt.parameter_space != self._opt.parameter_space
+        ):
+            opt.cleanup()
+            raise ValueError(f"Optimizer state in {path} does not match {self}")
+        self._opt.cleanup()
+        self._opt = opt
+        self._start_with_defaults = state["start_with_defaults"]
+        last_trial_id: int = state["last_trial_id"]
+        _LOG.info("Loaded optimizer state: %s :: last trial ID: %d", path, last_trial_id)
+        return last_trial_id
+
     def bulk_register(
         self,
         configs: Sequence[dict],
@@ -0,0 +1,317 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+A wrapper for any :py:class:`.Optimizer` that prefetches its suggestions in a
+background thread.
+
+Model-based optimizers (e.g., SMAC) may have to refit their surrogate model before
+suggesting a new configuration, and that can take seconds once there are thousands of
+observations. Meanwhile, the :py:class:`~mlos_bench.schedulers.base_scheduler.Scheduler`
+and all of its TrialRunners would sit idle waiting for the next suggestion.
+
+The :py:class:`.PrefetchOptimizer` keeps up to ``prefetch_suggestions`` suggestions
+ready while the trials run:
+
+- All calls to the wrapped optimizer run sequentially in a single background thread,
+  so the wrapped optimizer does not have to be thread-safe.
+- :py:meth:`~.PrefetchOptimizer.register` and
+  :py:meth:`~.PrefetchOptimizer.bulk_register` return immediately and also start
+  computing fresh suggestions that take the new results into account.
+- :py:meth:`~.PrefetchOptimizer.suggest` returns the freshest suggestion that is
+  ready. Suggestions computed before the latest results are never thrown away
+  (stateful optimizers like the grid search or the manual one would lose those
+  configs otherwise), but those that have not started computing yet are replaced
+  with the fresh ones.
+- No more suggestions are prefetched once the wrapped optimizer has converged
+  (e.g., the grid search has suggested all points of the grid).
+
+Prefetching is only active within the optimizer's context (i.e., the ``with``
+statement, as used by the Scheduler); otherwise all calls are synchronous.
+
+Config
+------
+Set the ``prefetch_suggestions`` property in the config of any optimizer to wrap it
+in a :py:class:`.PrefetchOptimizer`, e.g.:
+
+.. code-block:: json
+
+    {
+        "class": "mlos_bench.optimizers.MlosCoreOptimizer",
+        "config": {
+            "optimizer_type": "SMAC",
+            "prefetch_suggestions": 2
+        }
+    }
+"""
+
+import logging
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Literal, TypeVar
+
+from mlos_bench.environments.status import Status
+from mlos_bench.optimizers.base_optimizer import Optimizer
+from mlos_bench.tunables.tunable_groups import TunableGroups
+from mlos_bench.tunables.tunable_types import TunableValue
+
+_LOG = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class PrefetchOptimizer(Optimizer):
+    """Prefetches the suggestions of another :py:class:`.Optimizer` in a background
+    thread.
+    """
+
+    def __init__(self, optimizer: Optimizer, num_prefetch: int = 1):
+        """
+        Wrap the optimizer to prefetch its suggestions.
+
+        Parameters
+        ----------
+        optimizer : Optimizer
+            The optimizer to wrap.
+        num_prefetch : int
+            Max. number of suggestions to compute in advance.
+        """
+        # pylint: disable=protected-access
+        super().__init__(
+            tunables=optimizer.tunable_params,
+            config={
+                "optimization_targets": optimizer.targets,
+                "max_suggestions": optimizer.max_suggestions,
+                "seed": optimizer.seed,
+                "start_with_defaults": optimizer.start_with_defaults,
+            },
+            global_config=optimizer._global_config,
+            service=optimizer._service,
+        )
+        if num_prefetch < 1:
+            raise ValueError(f"Invalid number of suggestions to prefetch: {num_prefetch}")
+        self._optimizer = optimizer
+        self._num_prefetch = num_prefetch
+        self._executor: ThreadPoolExecutor | None = None
+        # Number of registration calls so far. Suggestions computed
+        # before the latest registration are stale.
+        self._generation = 0
+        # Suggestions in the order of submission, tagged with their generation.
+        # The result is None if the wrapped optimizer has already converged.
+        self._prefetched: deque[tuple[int, Future[TunableGroups | None]]] = deque()
+        # Whether the wrapped optimizer has not converged after the latest call.
+        self._optimizer_not_converged = True
+        # Registrations that are still in flight (or have not been checked yet).
+        self._registrations: list[Future] = []
+
+    def _validate_json_config(self, config: dict) -> None:
+        # The wrapped optimizer has already validated its own config.
+        pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._optimizer!r},prefetch={self._num_prefetch})"
+
+    def __enter__(self) -> Optimizer:
+        super().__enter__()
+        self._optimizer.__enter__()
+        self._optimizer_not_converged = self._optimizer.not_converged()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        return self
+
+    def __exit__(
+        self,
+        ex_type: type[BaseException] | None,
+        ex_val: BaseException | None,
+        ex_tb: TracebackType | None,
+    ) -> Literal[False]:
+        assert self._executor is not None
+        # Drop the suggestions that have not started yet, but complete the
+        # registrations.
+        for _, future in self._prefetched:
+            future.cancel()
+        self._executor.shutdown(wait=True)
+        self._executor = None
+        self._prefetched.clear()
+        self._registrations.clear()
+        self._optimizer.__exit__(ex_type, ex_val, ex_tb)
+        return super().__exit__(ex_type, ex_val, ex_tb)
+
+    @property
+    def optimizer(self) -> Optimizer:
+        """The wrapped optimizer."""
+        return self._optimizer
+
+    @property
+    def num_prefetch(self) -> int:
+        """Max. number of suggestions to compute in advance."""
+        return self._num_prefetch
+
+    @property
+    def name(self) -> str:
+        return self._optimizer.name
+
+    @property
+    def start_with_defaults(self) -> bool:
+        return self._optimizer.start_with_defaults
+
+    @property
+    def supports_preload(self) -> bool:
+        return self._optimizer.supports_preload
+
+    @property
+    def checkpoint_file(self) -> str | None:
+        return self._optimizer.checkpoint_file
+
+    def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Call the method of the wrapped optimizer after all pending calls."""
+        self._check_registrations()
+        if self._executor is None:
+            return func(*args)
+        return self._executor.submit(func, *args).result()
+
+    def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Call the method of the wrapped optimizer in the background thread and
+        check if it has converged afterwards.
+        """
+        result = func(*args)
+        self._optimizer_not_converged = self._optimizer.not_converged()
+        return result
+
+    def _suggest_next(self) -> TunableGroups | None:
+        """Get the next suggestion of the wrapped optimizer unless it has
+        converged.
+        """
+        if not self._optimizer.not_converged():
+            self._optimizer_not_converged = False
+            return None
+        return self._run(self._optimizer.suggest)
+
+    def _check_registrations(self) -> None:
+        """Re-raise the errors (if any) of the completed background registrations."""
+        pending = []
+        for future in self._registrations:
+            if future.done():
+                future.result()
+            else:
+                pending.append(future)
+        self._registrations = pending
+
+    def _invalidate(self) -> None:
+        """Mark all prefetched suggestions as stale and replace the ones that have not
+        started computing yet with the fresh ones.
+        """
+        self._generation += 1
+        # The wrapped optimizer has not seen the cancelled ones, so nothing is lost.
+        self._prefetched = deque(
+            (gen, future) for (gen, future) in self._prefetched if not future.cancel()
+        )
+        self._prefetch()
+
+    def _prefetch(self) -> None:
+        """Top up the prefetched suggestions, but no more than the remaining budget."""
+        if self._executor is None or not self._optimizer_not_converged:
+            return
+        budget = min(self._num_prefetch, self._max_suggestions - self._iter)
+        for _ in range(budget - len(self._prefetched)):
+            _LOG.debug("Prefetch a suggestion: generation %d", self._generation)
+            self._prefetched.append((self._generation, self._executor.submit(self._suggest_next)))
+
+    def _pop_prefetched(self) -> TunableGroups | None:
+        """
+        Get the freshest prefetched suggestion that is ready, or wait for the first
+        one in the queue if none is ready yet.
+
+        Returns
+        -------
+        tunables : TunableGroups | None
+            The suggestion or None if there is nothing prefetched.
+        """
+        while self._prefetched:
+            done = [(gen, future) for (gen, future) in self._prefetched if future.done()]
+            (gen, future) = max(done, key=lambda item: item[0]) if done else self._prefetched[0]
+            self._prefetched.remove((gen, future))
+            tunables = future.result()
+            if tunables is None:
+                continue  # The wrapped optimizer has converged.
+            if gen < self._generation:
+                _LOG.info("Use a stale suggestion: generation %d < %d", gen, self._generation)
+            return tunables
+        return None
+
+    def bulk_register(
+        self,
+        configs: Sequence[dict],
+        scores: Sequence[dict[str, TunableValue] | None],
+        status: Sequence[Status] | None = None,
+    ) -> bool:
+        if not super().bulk_register(configs, scores, status):
+            return False
+        if self._executor is None:
+            return self._optimizer.bulk_register(configs, scores, status)
+        self._check_registrations()
+        self._registrations.append(
+            self._executor.submit(
+                self._run,
+                self._optimizer.bulk_register,
+                list(configs),
+                list(scores),
+                None if status is None else list(status),
+            )
+        )
+        self._invalidate()
+        return True
+
+    def suggest(self) -> TunableGroups:
+        super().suggest()  # Count the suggestions handed out.
+        self._check_registrations()
+        tunables = self._pop_prefetched()
+        if tunables is None:
+            tunables = self._call(self._optimizer.suggest)
+        self._prefetch()
+        return tunables
+
+    def register(
+        self,
+        tunables: TunableGroups,
+        status: Status,
+        score: dict[str, TunableValue] | None = None,
+    ) -> dict[str, float] | None:
+        registered_score = super().register(tunables, status, score)
+        if self._executor is None:
+            return self._optimizer.register(tunables, status, score)
+        self._check_registrations()
+        self._registrations.append(
+            self._executor.submit(
+                self._run, self._optimizer.register, tunables.copy(), status, score
+            )
+        )
+        self._invalidate()
+        return registered_score
+
+    def not_converged(self) -> bool:
+        if not super().not_converged():
+            return False
+        if self._executor is None:
+            return self._optimizer.not_converged()
+        self._check_registrations()
+        if self._optimizer_not_converged:
+            return True
+        # The wrapped optimizer has converged, so the remaining background calls
+        # return quickly: check if any of them got a suggestion before that.
+        return any(future.result() is not None for (_, future) in self._prefetched)
+
+    def save_state(self, path: str, last_trial_id: int) -> None:
+        self._call(self._optimizer.save_state, path, last_trial_id)
+
+    def load_state(self, path: str) -> int:
+        last_trial_id = self._call(self._run, self._optimizer.load_state, path)
+        self._invalidate()
+        return last_trial_id
+
+    def get_best_observation(
+        self,
+    ) -> tuple[dict[str, float], TunableGroups] | tuple[None, None]:
+        return self._call(self._optimizer.get_best_observation)
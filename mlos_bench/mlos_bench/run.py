@@ -22,6 +22,7 @@ import sys
 import numpy as np
 
 from mlos_bench.launcher import Launcher
+from mlos_bench.tracing import TRACER
 from mlos_bench.tunables.tunable_groups import TunableGroups
 
 _LOG = logging.getLogger(__name__)
@@ -63,9 +64,14 @@ def _main(
 ) -> tuple[dict[str, float] | None, TunableGroups | None]:
     launcher = Launcher("mlos_bench", "Systems autotuning and benchmarking tool", argv=argv)
 
-    with launcher.scheduler as scheduler_context:
-        scheduler_context.start()
-        scheduler_context.teardown()
+    try:
+        with launcher.scheduler as scheduler_context:
+            scheduler_context.start()
+            scheduler_context.teardown()
+    finally:
+        if launcher.trace_file:
+            TRACER.export_chrome_trace(launcher.trace_file)
+        TRACER.disable()
 
     _sanity_check_results(launcher)
 
@@ -20,16 +20,33 @@ from mlos_bench.environments.base_environment import Environment
 from mlos_bench.optimizers.base_optimizer import Optimizer
 from mlos_bench.schedulers.trial_runner import TrialRunner
 from mlos_bench.storage.base_storage import Storage
+from mlos_bench.tracing import trace_methods, traced, trial_span_attributes
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.util import merge_parameters
 
 _LOG = logging.getLogger(__name__)
 
 
+def _span_attributes(scheduler: "Scheduler", *args: Any, **_kwargs: Any) -> dict[str, Any]:
+    """Get the tracing span attributes of the Scheduler method call."""
+    if args and isinstance(args[0], Storage.Trial):
+        return trial_span_attributes(args[0])
+    if scheduler.experiment is not None:
+        return {"experiment_id": scheduler.experiment.experiment_id}
+    return {}
+
+
 class Scheduler(ContextManager, metaclass=ABCMeta):
     # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Base class for the optimization loop scheduling policies."""
 
+    # Methods of all Schedulers to record in the tracing spans.
+    _TRACED_METHODS = ("run_schedule", "add_new_optimizer_suggestions", "run_trial")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, Scheduler._TRACED_METHODS, "scheduler", _span_attributes)
+
     def __init__(  # pylint: disable=too-many-arguments
         self,
         *,
@@ -262,6 +279,8 @@ class Scheduler(ContextManager, metaclass=ABCMeta):
         is_warm_up: bool = self.optimizer.supports_preload
         if not is_warm_up:
             _LOG.warning("Skip pending trials and warm-up: %s", self.optimizer)
+        elif self.optimizer.checkpoint_file:
+            self._load_optimizer_checkpoint()
 
         not_done: bool = True
         while not_done:
@@ -309,6 +328,7 @@ class Scheduler(ContextManager, metaclass=ABCMeta):
             _LOG.debug("Config %d ::\n%s", config_id, json.dumps(tunable_values, indent=2))
         return tunables.copy()
 
+    @traced("scheduler", _span_attributes)
     def add_new_optimizer_suggestions(self) -> bool:
         """
         Optimizer part of the loop.
@@ -329,6 +349,8 @@ class Scheduler(ContextManager, metaclass=ABCMeta):
         _LOG.info("QUEUE: Update the optimizer with trial results: %s", trial_ids)
         self.optimizer.bulk_register(configs, scores, status)
         self._last_trial_id = max(trial_ids, default=self._last_trial_id)
+        if trial_ids and self.optimizer.checkpoint_file:
+            self._save_optimizer_checkpoint()
 
         # Check if the optimizer has converged or not.
         not_done = self.not_done()
@@ -337,6 +359,55 @@ class Scheduler(ContextManager, metaclass=ABCMeta):
             self.add_trial_to_queue(tunables)
         return not_done
 
+    def _load_optimizer_checkpoint(self) -> None:
+        """
+        Restore the optimizer state from its checkpoint (if the storage has a record
+        of it), so that only the trials after the checkpoint have to be registered
+        with the optimizer instead of the entire history of the experiment.
+        """
+        assert self.experiment is not None
+        checkpoint_file = self.optimizer.checkpoint_file
+        assert checkpoint_file
+        checkpoint_trial_id = self.experiment.get_checkpoint_trial_id()
+        if checkpoint_trial_id is None:
+            _LOG.info("No optimizer checkpoint for: %s", self.experiment)
+            return
+        try:
+            last_trial_id = self.optimizer.load_state(checkpoint_file)
+        # pylint: disable=broad-exception-caught
+        except Exception as ex:
+            _LOG.warning(
+                "Failed to load optimizer checkpoint: %s :: %s - replay all trials",
+                checkpoint_file,
+                ex,
+            )
+            return
+        # The checkpoint is authoritative: it contains exactly the trials up to its
+        # own last trial ID, even if we crashed before updating the storage.
+        if last_trial_id != checkpoint_trial_id:
+            _LOG.warning(
+                "Optimizer checkpoint %s covers trials up to %d, but storage has %d",
+                checkpoint_file,
+                last_trial_id,
+                checkpoint_trial_id,
+            )
+        self._last_trial_id = last_trial_id
+
+    def _save_optimizer_checkpoint(self) -> None:
+        """Save the optimizer state and record the last trial ID it covers in the
+        storage.
+        """
+        assert self.experiment is not None
+        checkpoint_file = self.optimizer.checkpoint_file
+        assert checkpoint_file
+        try:
+            self.optimizer.save_state(checkpoint_file, self._last_trial_id)
+        # pylint: disable=broad-exception-caught
+        except Exception as ex:
+            _LOG.warning("Failed to save optimizer checkpoint: %s :: %s", checkpoint_file, ex)
+            return
+        self.experiment.set_checkpoint_trial_id(self._last_trial_id)
+
     def add_trial_to_queue(
         self,
         tunables: TunableGroups,
@@ -497,6 +568,7 @@ class Scheduler(ContextManager, metaclass=ABCMeta):
         assert trial_runner.trial_runner_id == trial.trial_runner_id
         return trial_runner
 
+    @traced("scheduler", _span_attributes)
     def run_schedule(self, running: bool = False) -> None:
         """
         Runs the current schedule of trials.
@@ -540,6 +612,7 @@ class Scheduler(ContextManager, metaclass=ABCMeta):
             self._trial_count < self._max_trials or self._max_trials <= 0
         )
 
+    @traced("scheduler", _span_attributes)
     @abstractmethod
     def run_trial(self, trial: Storage.Trial) -> None:
         """
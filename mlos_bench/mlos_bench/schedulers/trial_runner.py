@@ -5,6 +5,7 @@
 """Simple class to run an individual Trial on a given Environment."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from types import TracebackType
 from typing import Any, Literal
@@ -19,6 +20,7 @@ from mlos_bench.services.config_persistence import ConfigPersistenceService
 from mlos_bench.services.local.local_exec import LocalExecService
 from mlos_bench.services.types import SupportsConfigLoading
 from mlos_bench.storage.base_storage import Storage
+from mlos_bench.tracing import TRACER, traced, trial_span_attributes
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.tunables.tunable_types import TunableValue
 
@@ -46,6 +48,7 @@ class TrialRunner:
         num_trial_runners: int = 1,
         tunable_groups: TunableGroups | None = None,
         global_config: dict[str, Any] | None = None,
+        max_workers: int | None = None,
     ) -> list["TrialRunner"]:
         # pylint: disable=too-many-arguments
         """
@@ -59,6 +62,11 @@ class TrialRunner:
         The global_config is shared across all TrialRunners, but each copy gets its
         own unique trial_runner_id.
 
+        The first TrialRunner is created in the current thread (so that the invalid
+        configs fail early and the rest get the parsed configs from the
+        :py:class:`.ConfigPersistenceService` cache), and the rest optionally in a
+        thread pool.
+
         Parameters
         ----------
         config_loader : Service
@@ -74,6 +82,9 @@ class TrialRunner:
             environment. Default is None.
         global_config : dict[str, Any] | None
             Global configuration parameters. Default is None.
+        max_workers : int | None
+            Max. number of threads to create the TrialRunners concurrently.
+            Default is None, i.e., create them one by one in the current thread.
 
         Returns
         -------
@@ -81,11 +92,14 @@ class TrialRunner:
             A list of TrialRunner instances created from the provided configuration.
         """
         assert isinstance(config_loader, SupportsConfigLoading)
+        if isinstance(svcs_json, str):
+            svcs_json = [svcs_json]
         svcs_json = svcs_json or []
         tunable_groups = tunable_groups or TunableGroups()
         global_config = global_config or {}
-        trial_runners: list[TrialRunner] = []
-        for trial_runner_id in range(1, num_trial_runners + 1):  # use 1-based indexing
+        config_paths = config_loader.get_config_paths()
+
+        def _create_trial_runner(trial_runner_id: int) -> TrialRunner:
             # Make a fresh Environment and Services copy for each TrialRunner.
             # Give each global_config copy its own unique trial_runner_id.
             # This is important in case multiple TrialRunners are running in parallel.
@@ -94,7 +108,7 @@ class TrialRunner:
             # Each Environment's parent service starts with at least a
             # LocalExecService in addition to the ConfigLoader.
             parent_service: Service = ConfigPersistenceService(
-                config={"config_path": config_loader.get_config_paths()},
+                config={"config_path": list(config_paths)},
                 global_config=global_config_copy,
             )
             parent_service = LocalExecService(parent=parent_service)
@@ -109,7 +123,21 @@ class TrialRunner:
                 global_config_copy,
                 service=parent_service,
             )
-            trial_runners.append(TrialRunner(trial_runner_id, env))
+            return TrialRunner(trial_runner_id, env)
+
+        # Note: we still build a separate Environment and Services object graph for
+        # each TrialRunner: those hold the runtime state (e.g., temp dirs,
+        # connections, event loops) and cannot be safely shared or deep copied.
+        trial_runner_ids = range(1, num_trial_runners + 1)  # use 1-based indexing
+        if max_workers is None or max_workers <= 1 or num_trial_runners <= 1:
+            return [_create_trial_runner(trial_runner_id) for trial_runner_id in trial_runner_ids]
+        trial_runners = [_create_trial_runner(trial_runner_ids[0])]
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="create_trial_runner",
+        ) as executor:
+            # Note: map() returns the results in the order of the trial_runner_ids.
+            trial_runners.extend(executor.map(_create_trial_runner, trial_runner_ids[1:]))
         return trial_runners
 
     def __init__(self, trial_runner_id: int, env: Environment) -> None:
@@ -165,6 +193,11 @@ class TrialRunner:
         """Get the running state of the current TrialRunner."""
         return self._is_running
 
+    @traced(
+        "trial_runner",
+        lambda _self, trial, *_args, **_kwargs: trial_span_attributes(trial),
+        collect=True,
+    )
     def run_trial(
         self,
         trial: Storage.Trial,
@@ -214,6 +247,11 @@ class TrialRunner:
         # and update the storage with the intermediate results.
         (_status, _timestamp, telemetry) = self.environment.status()
 
+        # Store the timings of the trial's setup, run, etc. along with its telemetry.
+        span = TRACER.current_span
+        if span is not None and span.collected:
+            telemetry = [*telemetry, *span.telemetry()]
+
         # Use the status and timestamp from `.run()` as it is the final status of the experiment.
         # TODO: Use the `.status()` output in async mode.
         trial.update_telemetry(status, timestamp, telemetry)
@@ -16,6 +16,7 @@ from typing import Any, Literal
 from mlos_bench.config.schemas import ConfigSchema
 from mlos_bench.services.types.bound_method import BoundMethod
 from mlos_bench.services.types.config_loader_type import SupportsConfigLoading
+from mlos_bench.tracing import trace_service_method
 from mlos_bench.util import instantiate_from_config
 
 _LOG = logging.getLogger(__name__)
@@ -255,7 +256,11 @@ class Service(ContextManager):
             services = {svc.__name__: svc for svc in services}
 
         self._service_methods.update(services)
-        self.__dict__.update(self._service_methods)
+        # Trace the calls of the mix-in methods, but keep the original (bound)
+        # methods in the registry (see below).
+        self.__dict__.update(
+            {name: trace_service_method(method) for (name, method) in services.items()}
+        )
 
         if _LOG.isEnabledFor(logging.DEBUG):
             _LOG.debug("Added methods to: %s", self.pprint())
@@ -12,10 +12,16 @@ See Also
 mlos_bench.config : Overview of the configuration system.
 """
 
+import hashlib
+import json as std_json  # Fast C parser for the configs without JSON5 extensions
 import logging
 import os
+import tempfile
+from collections import OrderedDict
 from collections.abc import Callable, Iterable
+from copy import deepcopy
 from importlib.resources import files
+from threading import Lock
 from typing import TYPE_CHECKING, Any
 
 import json5  # To read configs with comments and other JSON5 syntax features
@@ -24,6 +30,7 @@ from jsonschema import SchemaError, ValidationError
 from mlos_bench.config.schemas.config_schemas import ConfigSchema
 from mlos_bench.environments.base_environment import Environment
 from mlos_bench.optimizers.base_optimizer import Optimizer
+from mlos_bench.optimizers.prefetch_optimizer import PrefetchOptimizer
 from mlos_bench.services.base_service import Service
 from mlos_bench.services.types.config_loader_type import SupportsConfigLoading
 from mlos_bench.tunables.tunable_groups import TunableGroups
@@ -55,6 +62,14 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
     package.
     """
 
+    # LRU cache of the parsed config files shared by all instances in the process,
+    # keyed by the resolved path. The values are the (mtime_ns, size) of the file
+    # when it was parsed, the parsed config, and the set of schemas it was validated
+    # against (only accessed while holding the lock).
+    _CONFIG_CACHE: OrderedDict[str, tuple[tuple[int, int], Any, set[ConfigSchema]]] = OrderedDict()
+    _CONFIG_CACHE_MAX_SIZE = 256
+    _CONFIG_CACHE_LOCK = Lock()
+
     def __init__(
         self,
         config: dict[str, Any] | None = None,
@@ -70,6 +85,8 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
         config : dict
             Free-format dictionary that contains parameters for the service.
             (E.g., root path for config files, etc.)
+            If "config_cache_dir" is set, also keep the parsed config files
+            there to speed up loading them in other processes.
         global_config : dict
             Free-format dictionary of global parameters.
         parent : Service
@@ -111,6 +128,10 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
         if self.BUILTIN_CONFIG_PATH not in self._config_path:
             self._config_path.append(self.BUILTIN_CONFIG_PATH)
 
+        self._config_cache_dir: str | None = None
+        if self.config.get("config_cache_dir"):
+            self._config_cache_dir = path_join(self.config["config_cache_dir"], abs_path=True)
+
     @property
     def config_paths(self) -> list[str]:
         """
@@ -188,34 +209,39 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
             Free-format dictionary that contains the configuration.
         """
         assert isinstance(json, str)
+        validated_schemas: frozenset[ConfigSchema] = frozenset()
+        signature: tuple[int, int] | None = None
         if any(c in json for c in ("{", "[")):
             # If the path contains braces, it is likely already a json string,
             # so just parse it.
             _LOG.info("Load config from json string: %s", json)
             try:
-                config: Any = json5.loads(json)
+                config: Any = self._parse_json(json)
             except ValueError as ex:
                 _LOG.error("Failed to parse config from JSON string: %s", json)
                 raise ValueError(f"Failed to parse config from JSON string: {json}") from ex
         else:
             json = self.resolve_path(json)
             _LOG.info("Load config file: %s", json)
-            with open(json, encoding="utf-8") as fh_json:
-                config = json5.load(fh_json)
+            (config, signature, validated_schemas) = self._load_config_file(json)
         if schema_type is not None:
-            try:
-                schema_type.validate(config)
-            except (ValidationError, SchemaError) as ex:
-                _LOG.error(
-                    "Failed to validate config %s against schema type %s at %s",
-                    json,
-                    schema_type.name,
-                    schema_type.value,
-                )
-                raise ValueError(
-                    f"Failed to validate config {json} against "
-                    f"schema type {schema_type.name} at {schema_type.value}"
-                ) from ex
+            if schema_type not in validated_schemas:
+                try:
+                    schema_type.validate(config)
+                except (ValidationError, SchemaError) as ex:
+                    _LOG.error(
+                        "Failed to validate config %s against schema type %s at %s",
+                        json,
+                        schema_type.name,
+                        schema_type.value,
+                    )
+                    raise ValueError(
+                        f"Failed to validate config {json} against "
+                        f"schema type {schema_type.name} at {schema_type.value}"
+                    ) from ex
+                if signature is not None:
+                    # Do not validate the same (unchanged) config file again.
+                    self._add_validated_schema(json, signature, schema_type)
             if isinstance(config, dict) and config.get("$schema"):
                 # Remove $schema attributes from the config after we've validated
                 # them to avoid passing them on to other objects
@@ -228,6 +254,125 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
             _LOG.warning("Config %s is not validated against a schema.", json)
         return config  # type: ignore[no-any-return]
 
+    @staticmethod
+    def _parse_json(text: str) -> Any:
+        """Parse the JSON5 text, trying the (much faster) plain JSON parser first."""
+        try:
+            return std_json.loads(text)
+        except ValueError:
+            return json5.loads(text)
+
+    def _load_config_file(
+        self,
+        path: str,
+    ) -> tuple[Any, tuple[int, int], frozenset[ConfigSchema]]:
+        """
+        Load and parse the config file, or get it from the cache if the file has not
+        changed since it was last parsed.
+
+        Parameters
+        ----------
+        path : str
+            Resolved path to the config file.
+
+        Returns
+        -------
+        (config, signature, validated_schemas) : tuple
+            A (deep) copy of the parsed config, the (mtime_ns, size) signature of the
+            file, and the schemas the config has already been validated against.
+        """
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        with self._CONFIG_CACHE_LOCK:
+            cached = self._CONFIG_CACHE.get(path)
+            if cached is not None and cached[0] == signature:
+                self._CONFIG_CACHE.move_to_end(path)
+                (config, validated_schemas) = (cached[1], frozenset(cached[2]))
+            else:
+                cached = None
+        if cached is None:
+            config = self._load_config_disk_cache(path, signature)
+            if config is None:
+                with open(path, encoding="utf-8") as fh_json:
+                    config = self._parse_json(fh_json.read())
+                self._save_config_disk_cache(path, signature, config)
+            validated_schemas = frozenset()
+            with self._CONFIG_CACHE_LOCK:
+                self._CONFIG_CACHE[path] = (signature, config, set())
+                self._CONFIG_CACHE.move_to_end(path)
+                while len(self._CONFIG_CACHE) > self._CONFIG_CACHE_MAX_SIZE:
+                    self._CONFIG_CACHE.popitem(last=False)
+        else:
+            _LOG.debug("Config cache hit: %s", path)
+        # Make a copy so that the callers can modify the config.
+        return (deepcopy(config), signature, validated_schemas)
+
+    def _add_validated_schema(
+        self,
+        path: str,
+        signature: tuple[int, int],
+        schema_type: ConfigSchema,
+    ) -> None:
+        """Remember that the cached config at `path` (if it is still the same version)
+        has been validated against the `schema_type`.
+        """
+        with self._CONFIG_CACHE_LOCK:
+            cached = self._CONFIG_CACHE.get(path)
+            if cached is not None and cached[0] == signature:
+                cached[2].add(schema_type)
+
+    def _get_config_disk_cache_path(self, path: str) -> str | None:
+        """Get the path to the on-disk cache file for the config at `path`."""
+        if self._config_cache_dir is None:
+            return None
+        key = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        return os.path.join(self._config_cache_dir, f"{key}.json")
+
+    def _load_config_disk_cache(self, path: str, signature: tuple[int, int]) -> Any | None:
+        """Load the parsed config from the on-disk cache, if it is up to date."""
+        cache_path = self._get_config_disk_cache_path(path)
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, encoding="utf-8") as fh_cache:
+                entry = std_json.load(fh_cache)
+        except (OSError, ValueError) as ex:
+            _LOG.warning("Failed to read config cache file %s: %s", cache_path, ex)
+            return None
+        if entry.get("path") != path or tuple(entry.get("signature", ())) != signature:
+            return None
+        _LOG.debug("Config disk cache hit: %s :: %s", path, cache_path)
+        return entry["config"]
+
+    def _save_config_disk_cache(self, path: str, signature: tuple[int, int], config: Any) -> None:
+        """Save the parsed config to the on-disk cache (if enabled)."""
+        cache_path = self._get_config_disk_cache_path(path)
+        if cache_path is None:
+            return
+        assert self._config_cache_dir is not None
+        try:
+            os.makedirs(self._config_cache_dir, exist_ok=True)
+            # Write to a temp file first to never expose partially written entries
+            # to the concurrent readers.
+            (fd_tmp, tmp_path) = tempfile.mkstemp(dir=self._config_cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd_tmp, "w", encoding="utf-8") as fh_cache:
+                    std_json.dump(
+                        {"path": path, "signature": signature, "config": config}, fh_cache
+                    )
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.remove(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as ex:
+            _LOG.warning("Failed to write config cache file %s: %s", cache_path, ex)
+
+    @classmethod
+    def clear_config_cache(cls) -> None:
+        """Drop all parsed configs from the in-process cache."""
+        with cls._CONFIG_CACHE_LOCK:
+            cls._CONFIG_CACHE.clear()
+
     def prepare_class_load(
         self,
         config: dict[str, Any],
@@ -316,6 +461,8 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
         if tunables_path is not None:
             tunables = self.load_tunables(tunables_path, tunables)
         (class_name, class_config) = self.prepare_class_load(config, global_config)
+        # Not passed to the optimizer itself: wrap it into a PrefetchOptimizer instead.
+        num_prefetch = int(class_config.pop("prefetch_suggestions", 0))
         inst = instantiate_from_config(
             Optimizer,  # type: ignore[type-abstract]
             class_name,
@@ -324,6 +471,8 @@ class ConfigPersistenceService(Service, SupportsConfigLoading):
             global_config=global_config,
             service=service,
         )
+        if num_prefetch > 0:
+            inst = PrefetchOptimizer(inst, num_prefetch)
         _LOG.info("Created: Optimizer %s", inst)
         return inst
 
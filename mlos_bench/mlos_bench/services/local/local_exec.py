@@ -7,23 +7,88 @@
 import errno
 import logging
 import os
+import re
 import shlex
+import signal
 import subprocess
 import sys
+import threading
+import time
+import uuid
+from collections import deque
 from collections.abc import Callable, Iterable, Mapping
 from string import Template
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any
 
 from mlos_bench.os_environ import environ
 from mlos_bench.services.base_service import Service
+from mlos_bench.services.local.resource_usage import (
+    ProcTreeSampler,
+    merge_resource_usage,
+    wait_with_usage,
+)
 from mlos_bench.services.local.temp_dir_context import TempDirContextService
-from mlos_bench.services.types.local_exec_type import SupportsLocalExec
+from mlos_bench.services.types.local_exec_type import (
+    LocalExecTimeoutError,
+    SupportsLocalExec,
+)
+from mlos_bench.util import path_join
 
 if TYPE_CHECKING:
     from mlos_bench.tunables.tunable_types import TunableValue
 
 _LOG = logging.getLogger(__name__)
 
+_KILL_GRACE_PERIOD = 3.0
+"""Time (in seconds) to wait after SIGTERM before killing the process group with
+SIGKILL."""
+
+
+class _ReturnCodeMarkers:
+    """Strip the exit code marker lines from the output of a single shell script and
+    collect the exit codes of the script lines.
+    """
+
+    def __init__(self) -> None:
+        self.marker = f"__MLOS_BENCH_RC_{uuid.uuid4().hex}__"
+        self.return_codes: list[int] = []
+        # The marker follows the output of the line, which may not end with a newline.
+        self._marker_regex = re.compile(f"{self.marker}:(-?[0-9]+)\n")
+        self._partial = ""
+
+    def print_command(self, return_code: str) -> str:
+        """Get the shell command that prints the marker with the given exit code."""
+        return f"printf '{self.marker}:%d\\n' {return_code}"
+
+    def filter_line(self, line: str) -> str | None:
+        """
+        Remove the marker (if any) from the output line.
+
+        Returns
+        -------
+        line : str | None
+            The line without the marker, or None if the line is incomplete
+            (i.e., it will be prepended to the next line).
+        """
+        match = self._marker_regex.search(line)
+        if match is None:
+            (line, self._partial) = (self._partial + line, "")
+            return line
+        self.return_codes.append(int(match.group(1)))
+        self._partial += line[: match.start()]
+        return None
+
+    def flush(self) -> str:
+        """Get the incomplete output line left at the end of the output."""
+        (line, self._partial) = (self._partial, "")
+        return line
+
+    def strip(self, output: str) -> str:
+        """Remove all markers from the output and collect the exit codes."""
+        chunks = self._marker_regex.split(output)
+        self.return_codes.extend(int(code) for code in chunks[1::2])
+        return "".join(chunks[0::2])
+
 
 def split_cmdline(cmdline: str) -> Iterable[list[str]]:
     """
@@ -67,6 +132,27 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
 
     Can be useful for data processing due to reduced dependency management complications
     vs the target environment.
+
+    By default, each script line runs to completion and its whole output is kept in
+    memory. Setting ``streaming`` (or any of the timeouts) in the config switches the
+    service to a streaming mode which reads the output incrementally, optionally keeps
+    only the last ``max_output_lines`` lines of it in memory, appends the full output
+    to the ``output_log_file``, and kills the entire process group of the script line
+    that exceeds ``line_timeout`` or ``script_timeout`` (in seconds). Timed out
+    scripts raise :py:class:`.LocalExecTimeoutError` with the output collected so far.
+
+    Setting ``single_shell`` runs all lines of one :py:meth:`.local_exec` call in a
+    single shell process (POSIX only) instead of starting a new shell for each line.
+    Each line still runs in its own subshell, so ``cd`` or ``exit`` in one line do not
+    affect the others, and the exit code of every line is reported back via the marker
+    lines in stdout (which are then removed from the output). In that mode, only
+    ``script_timeout`` is enforced.
+
+    When the caller asks for the ``resource_usage`` of the script, each process is
+    reaped with :py:func:`os.wait4` (POSIX only) to get the CPU time, peak RSS, block
+    I/O, page faults, and context switches of it and its (waited for) descendants.
+    Setting ``resource_sample_interval`` (in seconds) additionally samples the total
+    RSS and the number of all processes of the script via ``/proc`` (Linux only).
     """
 
     def __init__(
@@ -98,12 +184,28 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
             self.merge_methods(methods, [self.local_exec]),
         )
         self.abort_on_error = self.config.get("abort_on_error", True)
+        self._line_timeout: float | None = self.config.get("line_timeout")
+        self._script_timeout: float | None = self.config.get("script_timeout")
+        self._max_output_lines: int | None = self.config.get("max_output_lines")
+        self._output_log_file: str | None = self.config.get("output_log_file")
+        self._single_shell: bool = bool(self.config.get("single_shell", False))
+        self._resource_sample_interval: float | None = self.config.get("resource_sample_interval")
+        # Cache of the resolved paths of the local script files to avoid searching
+        # the config paths on every call. Failed lookups are not cached, as the
+        # script can be created later (e.g., by a previous setup step).
+        self._resolved_script_paths: dict[str, str] = {}
+        self._streaming: bool = bool(
+            self.config.get("streaming", False)
+            or self._line_timeout is not None
+            or self._script_timeout is not None
+        )
 
     def local_exec(
         self,
         script_lines: Iterable[str],
         env: Mapping[str, "TunableValue"] | None = None,
         cwd: str | None = None,
+        resource_usage: dict[str, float] | None = None,
     ) -> tuple[int, str, str]:
         """
         Execute the script lines from `script_lines` in a local process.
@@ -118,23 +220,85 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
         cwd : str
             Work directory to run the script at.
             If omitted, use `temp_dir` or create a temporary dir.
+        resource_usage : dict[str, float] | None
+            An optional dict to store the resource usage metrics of the script
+            processes in (e.g., `wall_time` and `cpu_user_time` in seconds,
+            `max_rss_kb`, etc.). The metrics are summed up over all script lines,
+            except for the peak values.
 
         Returns
         -------
         (return_code, stdout, stderr) : (int, str, str)
             A 3-tuple of return code, stdout, and stderr of the script process.
+
+        Raises
+        ------
+        LocalExecTimeoutError
+            If the script has timed out (in streaming mode only).
         """
         (return_code, stdout_list, stderr_list) = (0, [], [])
+        proc_env = self._get_proc_env(env)
+        deadline: float | None = None
+        if self._script_timeout is not None:
+            deadline = time.monotonic() + self._script_timeout
+
         with self.temp_dir_context(cwd) as temp_dir:
 
             _LOG.debug("Run in directory: %s", temp_dir)
 
-            for line in script_lines:
-                (return_code, stdout, stderr) = self._local_exec_script(line, env, temp_dir)
-                stdout_list.append(stdout)
-                stderr_list.append(stderr)
-                if return_code != 0 and self.abort_on_error:
-                    break
+            output_log: IO[str] | None = None
+            if self._streaming and self._output_log_file:
+                output_log = open(  # pylint: disable=consider-using-with
+                    path_join(temp_dir, self._output_log_file),
+                    "a",
+                    encoding="utf-8",
+                )
+
+            try:
+                if self._single_shell and sys.platform != "win32":
+                    (return_code, stdout, stderr) = self._local_exec_single_shell(
+                        script_lines,
+                        proc_env,
+                        temp_dir,
+                        self._script_timeout,
+                        output_log,
+                        resource_usage,
+                    )
+                    stdout_list.append(stdout)
+                    stderr_list.append(stderr)
+                else:
+                    for line in script_lines:
+                        timeout = self._line_timeout
+                        if deadline is not None:
+                            remaining = deadline - time.monotonic()
+                            timeout = remaining if timeout is None else min(timeout, remaining)
+                        if timeout is not None and timeout <= 0:
+                            _LOG.warning("Script timed out before running: %s", line)
+                            raise LocalExecTimeoutError("Timed out", stderr="Timed out\n")
+                        line_usage: dict[str, float] | None = (
+                            None if resource_usage is None else {}
+                        )
+                        try:
+                            (return_code, stdout, stderr) = self._local_exec_script(
+                                line, proc_env, temp_dir, timeout, output_log, line_usage
+                            )
+                        finally:
+                            if resource_usage is not None and line_usage:
+                                merge_resource_usage(resource_usage, line_usage)
+                        stdout_list.append(stdout)
+                        stderr_list.append(stderr)
+                        if return_code != 0 and self.abort_on_error:
+                            break
+            except LocalExecTimeoutError as ex:
+                # Return the output of all script lines up to the timeout.
+                raise LocalExecTimeoutError(
+                    str(ex),
+                    stdout="".join(stdout_list) + ex.stdout,
+                    stderr="".join(stderr_list) + ex.stderr,
+                ) from None
+            finally:
+                if output_log is not None:
+                    output_log.close()
 
         stdout = "".join(stdout_list)
         stderr = "".join(stderr_list)
@@ -159,12 +323,19 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
         list[str]
             A modified sub command line with the script paths resolved.
         """
-        script_path = self.config_loader_service.resolve_path(subcmd_tokens[0])
-        # Special case check for lone `.` which means both `source` and
-        # "current directory" (which isn't executable) in posix shells.
-        if os.path.exists(script_path) and os.path.isfile(script_path):
-            # If the script exists, use it.
-            subcmd_tokens[0] = os.path.abspath(script_path)
+        token = subcmd_tokens[0]
+        script_path = self._resolved_script_paths.get(token)
+        if script_path is None:
+            resolved_path = self.config_loader_service.resolve_path(token)
+            # Special case check for lone `.` which means both `source` and
+            # "current directory" (which isn't executable) in posix shells.
+            if os.path.exists(resolved_path) and os.path.isfile(resolved_path):
+                # If the script exists, use it.
+                script_path = os.path.abspath(resolved_path)
+                self._resolved_script_paths[token] = script_path
+
+        if script_path is not None:
+            subcmd_tokens[0] = script_path
             # Also check if it is a python script and prepend the currently
             # executing python executable path to avoid requiring
             # executable mode bits or a shebang.
@@ -172,28 +343,19 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
                 subcmd_tokens.insert(0, sys.executable)
         return subcmd_tokens
 
-    def _local_exec_script(
-        self,
-        script_line: str,
-        env_params: Mapping[str, "TunableValue"] | None,
-        cwd: str,
-    ) -> tuple[int, str, str]:
+    def _resolve_cmdline(self, script_line: str) -> list[str]:
         """
-        Execute the script from `script_path` in a local process.
+        Resolve the local script paths in all subcommands of the script line.
 
         Parameters
         ----------
         script_line : str
             Line of the script to run in the local process.
-        env_params : Mapping[str, Union[int, float, str]]
-            Environment variables.
-        cwd : str
-            Work directory to run the script at.
 
         Returns
         -------
-        (return_code, stdout, stderr) : (int, str, str)
-            A 3-tuple of return code, stdout, and stderr of the script process.
+        list[str]
+            The command to pass to the shell.
         """
         # Split the command line into set of subcmd tokens.
         # For each subcmd, perform path resolution fixups for any scripts being executed.
@@ -201,7 +363,26 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
         subcmds = [self._resolve_cmdline_script_path(subcmd) for subcmd in subcmds]
         # Finally recombine all of the fixed up subcmd tokens into the original.
         cmd = [token for subcmd in subcmds for token in subcmd]
+        if sys.platform != "win32":
+            cmd = [" ".join(cmd)]
+        return cmd
+
+    @staticmethod
+    def _get_proc_env(env_params: Mapping[str, "TunableValue"] | None) -> dict[str, str]:
+        """
+        Merge the environment variables of the current process with the script
+        parameters.
+
+        Parameters
+        ----------
+        env_params : Mapping[str, Union[int, float, str]]
+            Environment variables.
 
+        Returns
+        -------
+        env : dict[str, str]
+            Environment variables to pass to the child processes.
+        """
         env: dict[str, str] = {}
         if env_params:
             env = {key: str(val) for (key, val) in env_params.items()}
@@ -211,17 +392,146 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
             # A hack to run Python on Windows with env variables set:
             env_copy["PYTHONPATH"] = ""
         env_copy.update(env)
-        env = env_copy
+        return env_copy
+
+    def _local_exec_script(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        script_line: str,
+        env: Mapping[str, str],
+        cwd: str,
+        timeout: float | None = None,
+        output_log: IO[str] | None = None,
+        resource_usage: dict[str, float] | None = None,
+    ) -> tuple[int, str, str]:
+        """
+        Execute the script from `script_path` in a local process.
+
+        Parameters
+        ----------
+        script_line : str
+            Line of the script to run in the local process.
+        env : Mapping[str, str]
+            Environment variables of the process.
+        cwd : str
+            Work directory to run the script at.
+        timeout : float | None
+            Time limit (in seconds) for the script line. Used in streaming mode only.
+        output_log : IO[str] | None
+            An optional file to append the script output to in streaming mode.
+        resource_usage : dict[str, float] | None
+            An optional dict to store the resource usage metrics of the process in.
+
+        Returns
+        -------
+        (return_code, stdout, stderr) : (int, str, str)
+            A 3-tuple of return code, stdout, and stderr of the script process.
+        """
+        return self._local_exec_cmd(
+            self._resolve_cmdline(script_line), env, cwd, timeout, output_log, resource_usage
+        )
+
+    def _local_exec_single_shell(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        script_lines: Iterable[str],
+        env: Mapping[str, str],
+        cwd: str,
+        timeout: float | None = None,
+        output_log: IO[str] | None = None,
+        resource_usage: dict[str, float] | None = None,
+    ) -> tuple[int, str, str]:
+        """
+        Execute all script lines in a single (POSIX) shell process.
+
+        Parameters
+        ----------
+        script_lines : Iterable[str]
+            Lines of the script to run locally.
+            Each line runs in its own subshell.
+        env : Mapping[str, str]
+            Environment variables of the process.
+        cwd : str
+            Work directory to run the script at.
+        timeout : float | None
+            Time limit (in seconds) for the entire script. Used in streaming mode only.
+        output_log : IO[str] | None
+            An optional file to append the script output to in streaming mode.
+        resource_usage : dict[str, float] | None
+            An optional dict to store the resource usage metrics of the shell in.
+
+        Returns
+        -------
+        (return_code, stdout, stderr) : (int, str, str)
+            A 3-tuple of return code, stdout, and stderr of the script process.
+            Return code is that of the last executed line.
+        """
+        markers = _ReturnCodeMarkers()
+        script = ["__mlos_rc=0"]
+        for line in script_lines:
+            # Newline before the closing bracket in case the line ends with a comment.
+            script.append(f"( {self._resolve_cmdline(line)[0]}\n)")
+            script.append("__mlos_rc=$?")
+            script.append(markers.print_command("$__mlos_rc"))
+            if self.abort_on_error:
+                script.append("[ $__mlos_rc -eq 0 ] || exit $__mlos_rc")
+        script.append("exit $__mlos_rc")
 
         try:
-            if sys.platform != "win32":
-                cmd = [" ".join(cmd)]
+            (return_code, stdout, stderr) = self._local_exec_cmd(
+                ["\n".join(script)], env, cwd, timeout, output_log, resource_usage, markers
+            )
+        finally:
+            _LOG.debug("Run: return codes of the script lines: %s", markers.return_codes)
+
+        # In streaming mode, the markers have been removed already.
+        return (return_code, markers.strip(stdout), stderr)
 
+    def _local_exec_cmd(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        cmd: list[str],
+        env: Mapping[str, str],
+        cwd: str,
+        timeout: float | None = None,
+        output_log: IO[str] | None = None,
+        resource_usage: dict[str, float] | None = None,
+        markers: _ReturnCodeMarkers | None = None,
+    ) -> tuple[int, str, str]:
+        """
+        Run the (already resolved) command in a local shell process.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            The command to pass to the shell.
+        env : Mapping[str, str]
+            Environment variables of the process.
+        cwd : str
+            Work directory to run the command at.
+        timeout : float | None
+            Time limit (in seconds) for the command. Used in streaming mode only.
+        output_log : IO[str] | None
+            An optional file to append the command output to in streaming mode.
+        resource_usage : dict[str, float] | None
+            An optional dict to store the resource usage metrics of the shell in.
+            Implies the streaming mode (to be able to reap the process ourselves).
+        markers : _ReturnCodeMarkers | None
+            The exit code markers to remove from stdout in streaming mode.
+
+        Returns
+        -------
+        (return_code, stdout, stderr) : (int, str, str)
+            A 3-tuple of return code, stdout, and stderr of the shell process.
+        """
+        try:
             _LOG.info("Run: %s", cmd)
             if _LOG.isEnabledFor(logging.DEBUG):
                 _LOG.debug("Expands to: %s", Template(" ".join(cmd)).safe_substitute(env))
                 _LOG.debug("Current working dir: %s", cwd)
 
+            if self._streaming or resource_usage is not None:
+                return self._local_exec_stream(
+                    cmd, env, cwd, timeout, output_log, resource_usage, markers
+                )
+
             proc = subprocess.run(
                 cmd,
                 env=env or None,
@@ -239,3 +549,185 @@ class LocalExecService(TempDirContextService, SupportsLocalExec):
             _LOG.warning("File not found: %s", cmd, exc_info=ex)
 
         return (errno.ENOENT, "", "File not found")
+
+    def _local_exec_stream(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        cmd: list[str],
+        env: Mapping[str, str],
+        cwd: str,
+        timeout: float | None,
+        output_log: IO[str] | None,
+        resource_usage: dict[str, float] | None = None,
+        markers: _ReturnCodeMarkers | None = None,
+    ) -> tuple[int, str, str]:
+        """
+        Run the command in a new process group and read its output incrementally.
+
+        Parameters
+        ----------
+        cmd : list[str]
+            The command to run in the shell.
+        env : Mapping[str, str]
+            Environment variables of the process.
+        cwd : str
+            Work directory to run the script at.
+        timeout : float | None
+            Time limit (in seconds) for the command.
+        output_log : IO[str] | None
+            An optional file to append the command output to.
+        resource_usage : dict[str, float] | None
+            An optional dict to store the resource usage metrics of the process in.
+        markers : _ReturnCodeMarkers | None
+            The exit code markers to remove from stdout before storing or logging it.
+
+        Returns
+        -------
+        (return_code, stdout, stderr) : (int, str, str)
+            A 3-tuple of return code, stdout, and stderr of the script process.
+            Only the last `max_output_lines` lines of the output are returned.
+
+        Raises
+        ------
+        LocalExecTimeoutError
+            If the command has timed out (with its output up to the timeout).
+        """
+        # pylint: disable=consider-using-with,too-many-locals
+        start_time = time.perf_counter()
+        proc = subprocess.Popen(
+            cmd,
+            env=env or None,
+            cwd=cwd,
+            shell=True,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            # Put the shell and all its children into a separate process group
+            # so we can kill them all at once.
+            start_new_session=(sys.platform != "win32"),
+        )
+        stdout_lines: deque[str] = deque(maxlen=self._max_output_lines)
+        stderr_lines: deque[str] = deque(maxlen=self._max_output_lines)
+        log_lock = threading.Lock()
+        readers = [
+            threading.Thread(
+                target=self._read_stream,
+                args=(stream, lines, output_log, log_lock, stream_markers),
+                daemon=True,
+            )
+            for (stream, lines, stream_markers) in [
+                (proc.stdout, stdout_lines, markers),
+                (proc.stderr, stderr_lines, None),
+            ]
+        ]
+        for reader in readers:
+            reader.start()
+
+        sampler: ProcTreeSampler | None = None
+        if (
+            resource_usage is not None
+            and self._resource_sample_interval
+            and ProcTreeSampler.is_supported()
+        ):
+            sampler = ProcTreeSampler(proc.pid, self._resource_sample_interval)
+            sampler.start()
+
+        timed_out = False
+        try:
+            if resource_usage is None:
+                return_code = proc.wait(timeout=timeout)
+            else:
+                return_code = wait_with_usage(proc, timeout, resource_usage)
+            _LOG.debug("Run: return code = %d", return_code)
+        except subprocess.TimeoutExpired:
+            _LOG.warning("Timed out after %s sec.: %s", timeout, cmd)
+            self._kill_process_group(proc)
+            timed_out = True
+            stderr_lines.append(f"Timed out after {timeout} sec.\n")
+        except BaseException:
+            # E.g., KeyboardInterrupt or other cancellation - don't leave orphans behind.
+            self._kill_process_group(proc)
+            raise
+        finally:
+            if resource_usage is not None:
+                resource_usage["wall_time"] = time.perf_counter() - start_time
+                if sampler is not None:
+                    resource_usage.update(sampler.stop())
+            for reader in readers:
+                reader.join(timeout=_KILL_GRACE_PERIOD)
+
+        if timed_out:
+            raise LocalExecTimeoutError(
+                f"Timed out after {timeout} sec.",
+                stdout="".join(stdout_lines),
+                stderr="".join(stderr_lines),
+            )
+        return (return_code, "".join(stdout_lines), "".join(stderr_lines))
+
+    @staticmethod
+    def _read_stream(
+        stream: IO[str],
+        lines: deque[str],
+        output_log: IO[str] | None,
+        log_lock: threading.Lock,
+        markers: _ReturnCodeMarkers | None = None,
+    ) -> None:
+        """
+        Read the output of the child process line by line until EOF.
+
+        Parameters
+        ----------
+        stream : IO[str]
+            The stdout or stderr pipe of the child process.
+        lines : deque[str]
+            A (possibly bounded) buffer to store the output lines in.
+        output_log : IO[str] | None
+            An optional file to append all output lines to.
+        log_lock : threading.Lock
+            A lock to serialize the writes to the `output_log` file.
+        markers : _ReturnCodeMarkers | None
+            The exit code markers to remove from the output (if any).
+        """
+
+        def _append(line: str) -> None:
+            lines.append(line)
+            if output_log is not None:
+                with log_lock:
+                    output_log.write(line)
+
+        with stream:
+            for line in stream:
+                if markers is None:
+                    _append(line)
+                    continue
+                filtered_line = markers.filter_line(line)
+                if filtered_line is not None:
+                    _append(filtered_line)
+            if markers is not None:
+                last_line = markers.flush()
+                if last_line:
+                    _append(last_line)
+
+    @staticmethod
+    def _kill_process_group(proc: subprocess.Popen) -> None:
+        """
+        Terminate the child process along with all its descendants.
+
+        Parameters
+        ----------
+        proc : subprocess.Popen
+            The (shell) process started in a new process group.
+        """
+        if sys.platform == "win32":
+            proc.kill()
+            proc.wait()
+            return
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            try:
+                os.killpg(proc.pid, sig)
+            except ProcessLookupError:
+                pass
+            try:
+                proc.wait(timeout=_KILL_GRACE_PERIOD)
+                return
+            except subprocess.TimeoutExpired:
+                _LOG.warning("Process group %d did not terminate - kill it", proc.pid)
@@ -0,0 +1,209 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Helper functions to account for the resources used by the local script processes."""
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from typing import Any
+
+_LOG = logging.getLogger(__name__)
+
+_RUSAGE_METRICS = {
+    "cpu_user_time": "ru_utime",
+    "cpu_system_time": "ru_stime",
+    "max_rss_kb": "ru_maxrss",
+    "minor_page_faults": "ru_minflt",
+    "major_page_faults": "ru_majflt",
+    "block_reads": "ru_inblock",
+    "block_writes": "ru_oublock",
+    "voluntary_ctx_switches": "ru_nvcsw",
+    "involuntary_ctx_switches": "ru_nivcsw",
+}
+"""Resource usage metrics (as returned by :py:func:`os.wait4`) of the child process
+and all its (waited for) descendants."""
+
+MAX_METRICS = frozenset(["max_rss_kb", "sampled_peak_rss_kb", "sampled_max_procs"])
+"""Resource usage metrics that are aggregated by taking a maximum instead of a sum."""
+
+_MAX_POLL_INTERVAL = 0.05
+"""Max time (in seconds) to sleep between the checks of the child process status when
+waiting with a timeout."""
+
+
+def rusage_metrics(rusage: Any) -> dict[str, float]:
+    """
+    Convert the :py:class:`resource.struct_rusage` to a dict of resource usage metrics.
+
+    Parameters
+    ----------
+    rusage : resource.struct_rusage
+        Resource usage of the child process as returned by :py:func:`os.wait4`.
+
+    Returns
+    -------
+    usage : dict[str, float]
+        Resource usage metrics, e.g., CPU time (in seconds), peak RSS (in KiB),
+        block I/O, and context switches.
+    """
+    usage = {metric: float(getattr(rusage, field)) for (metric, field) in _RUSAGE_METRICS.items()}
+    if sys.platform == "darwin":
+        # macOS reports max RSS in bytes rather than in kilobytes.
+        usage["max_rss_kb"] /= 1024
+    return usage
+
+
+def merge_resource_usage(total: dict[str, float], usage: Mapping[str, float]) -> None:
+    """
+    Add the resource usage of one process to the running total (in place).
+
+    Parameters
+    ----------
+    total : dict[str, float]
+        Accumulated resource usage metrics to update.
+    usage : Mapping[str, float]
+        Resource usage metrics of one more process.
+    """
+    for metric, value in usage.items():
+        if metric in MAX_METRICS:
+            total[metric] = max(total.get(metric, value), value)
+        else:
+            total[metric] = total.get(metric, 0.0) + value
+
+
+def wait_with_usage(
+    proc: subprocess.Popen,
+    timeout: float | None,
+    usage: dict[str, float],
+) -> int:
+    """
+    Wait for the child process to terminate and collect its resource usage.
+
+    Falls back to :py:meth:`subprocess.Popen.wait` (with no resource usage) on the
+    platforms that do not support :py:func:`os.wait4`.
+
+    Parameters
+    ----------
+    proc : subprocess.Popen
+        The child process to wait for.
+    timeout : float | None
+        Time limit (in seconds) to wait for the process. Wait forever if None.
+    usage : dict[str, float]
+        Dict to store the resource usage metrics of the process in.
+
+    Returns
+    -------
+    return_code : int
+        Return code of the process.
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If the process does not terminate within the `timeout`.
+    """
+    if not hasattr(os, "wait4"):
+        return proc.wait(timeout=timeout)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    delay = 0.001
+    try:
+        while True:
+            (pid, status, rusage) = os.wait4(proc.pid, 0 if deadline is None else os.WNOHANG)
+            if pid:
+                break
+            assert deadline is not None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(proc.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _MAX_POLL_INTERVAL)
+    except ChildProcessError:
+        # The process has already been reaped elsewhere.
+        _LOG.warning("Cannot get resource usage of process %d", proc.pid)
+        return proc.wait(timeout=timeout)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    usage.update(rusage_metrics(rusage))
+    return proc.returncode
+
+
+class ProcTreeSampler:
+    """
+    Periodically sample the total RSS and the number of processes in the process
+    session of the child process via ``/proc`` (Linux only).
+
+    Unlike :py:func:`wait_with_usage`, it also accounts for the background processes
+    that were started by the script but were not waited for.
+    """
+
+    def __init__(self, session_id: int, interval: float):
+        """
+        Create a new sampler for the processes of the given session.
+
+        Parameters
+        ----------
+        session_id : int
+            Session ID of the processes to sample (i.e., the PID of the child process
+            started with ``start_new_session=True``).
+        interval : float
+            Time (in seconds) between the samples.
+        """
+        self._session_id = session_id
+        self._interval = interval
+        self._page_size_kb = os.sysconf("SC_PAGE_SIZE") / 1024
+        self._peak_rss_kb = 0.0
+        self._max_procs = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def is_supported() -> bool:
+        """Check if the ``/proc`` filesystem is available."""
+        return sys.platform == "linux" and os.path.isdir("/proc")
+
+    def start(self) -> None:
+        """Start sampling in a background thread."""
+        self._thread.start()
+
+    def stop(self) -> dict[str, float]:
+        """
+        Stop sampling and return the results.
+
+        Returns
+        -------
+        usage : dict[str, float]
+            Peak total RSS (in KiB) and the max. number of processes of the session.
+        """
+        self._stop.set()
+        self._thread.join()
+        return {
+            "sampled_peak_rss_kb": self._peak_rss_kb,
+            "sampled_max_procs": float(self._max_procs),
+        }
+
+    def _run(self) -> None:
+        self._sample()
+        while not self._stop.wait(self._interval):
+            self._sample()
+
+    def _sample(self) -> None:
+        (rss_kb, num_procs) = (0.0, 0)
+        for pid in os.listdir("/proc"):
+            if not pid.isdigit():
+                continue
+            try:
+                with open(f"/proc/{pid}/stat", encoding="utf-8") as fh_stat:
+                    # The command name may contain spaces - skip it.
+                    fields = fh_stat.read().rsplit(")", 1)[1].split()
+            except (OSError, IndexError):
+                continue  # The process has terminated.
+            # Fields after the command name start from #3 (state); see proc(5).
+            if int(fields[3]) == self._session_id:
+                rss_kb += int(fields[21]) * self._page_size_kb
+                num_procs += 1
+        self._peak_rss_kb = max(self._peak_rss_kb, rss_kb)
+        self._max_procs = max(self._max_procs, num_procs)
@@ -9,14 +9,18 @@ import json
 import logging
 import time
 from collections.abc import Callable
-from typing import Any
+from types import TracebackType
+from typing import Any, Literal
 
 import requests
-from requests.adapters import HTTPAdapter, Retry
 
 from mlos_bench.dict_templater import DictTemplater
 from mlos_bench.environments.status import Status
 from mlos_bench.services.base_service import Service
+from mlos_bench.services.remote.azure.azure_operation_poller import (
+    AzureOperationPoller,
+)
+from mlos_bench.services.remote.azure.azure_session_pool import AzureSessionPool
 from mlos_bench.services.types.authenticator_type import SupportsAuth
 from mlos_bench.util import check_required_params, merge_parameters
 
@@ -32,6 +36,11 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
     _REQUEST_TOTAL_RETRIES = 10  # Total number retries for each request
     # Delay (seconds) between retries: {backoff factor} * (2 ** ({number of previous retries}))
     _REQUEST_RETRY_BACKOFF_FACTOR = 0.3
+    _POLL_BACKOFF_FACTOR = 1.0  # Multiply the poll interval by this after each check
+    _POLL_JITTER = 0.1  # Randomize the poll interval by up to this fraction
+
+    # Shared by all instances to wait for many operations on one background thread.
+    _OPERATION_POLLER = AzureOperationPoller()
 
     # Azure Resources Deployment REST API as described in
     # https://docs.microsoft.com/en-us/rest/api/resources/deployments
@@ -60,6 +69,9 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         config : dict
             Free-format dictionary that contains the benchmark environment
             configuration.
+            If "pollAsync" is true, the waits for the long-running operations
+            sleep on the shared background event loop instead of the calling
+            thread, and honor the Retry-After header of the status checks.
         global_config : dict
             Free-format dictionary of global parameters.
         parent : Service
@@ -87,6 +99,17 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         self._backoff_factor = float(
             self.config.get("requestBackoffFactor", self._REQUEST_RETRY_BACKOFF_FACTOR)
         )
+        self._pool_max_size = int(
+            self.config.get("requestPoolMaxSize", AzureSessionPool.POOL_MAX_SIZE)
+        )
+        self._poll_async = bool(self.config.get("pollAsync", False))
+        self._poll_backoff_factor = float(
+            self.config.get("pollBackoffFactor", self._POLL_BACKOFF_FACTOR)
+        )
+        self._poll_max_interval: float | None = None
+        if self.config.get("pollMaxInterval") is not None:
+            self._poll_max_interval = float(self.config["pollMaxInterval"])
+        self._poll_jitter = float(self.config.get("pollJitter", self._POLL_JITTER))
 
         self._deploy_template = {}
         self._deploy_params = {}
@@ -109,6 +132,23 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
                 "No deploymentTemplatePath provided. Deployment services will be unavailable.",
             )
 
+    def _enter_context(self) -> "AzureDeploymentService":
+        if self._poll_async:
+            # Keep the poller thread running while in context.
+            AzureDeploymentService._OPERATION_POLLER.enter()
+        super()._enter_context()
+        return self
+
+    def _exit_context(
+        self,
+        ex_type: type[BaseException] | None,
+        ex_val: BaseException | None,
+        ex_tb: TracebackType | None,
+    ) -> Literal[False]:
+        if self._poll_async:
+            AzureDeploymentService._OPERATION_POLLER.exit()
+        return super()._exit_context(ex_type, ex_val, ex_tb)
+
     @property
     def deploy_params(self) -> dict:
         """Get the deployment parameters."""
@@ -132,22 +172,17 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         raise NotImplementedError("Should be overridden by subclass.")
 
     def _get_session(self, params: dict) -> requests.Session:
-        """Get a session object that includes automatic retries and headers for REST API
-        calls.
+        """Get a shared session object that includes automatic retries and a pool of
+        keep-alive connections for REST API calls.
+
+        The session does not include the headers: pass ``self._get_headers()``
+        with each request.
         """
-        total_retries = params.get("requestTotalRetries", self._total_retries)
-        backoff_factor = params.get("requestBackoffFactor", self._backoff_factor)
-        session = requests.Session()
-        session.mount(
-            "https://",
-            HTTPAdapter(
-                max_retries=Retry(
-                    total=total_retries, backoff_factor=backoff_factor, status_forcelist=[503]
-                )
-            ),
+        return AzureSessionPool.instance().get_session(
+            total_retries=params.get("requestTotalRetries", self._total_retries),
+            backoff_factor=params.get("requestBackoffFactor", self._backoff_factor),
+            pool_max_size=self._pool_max_size,
         )
-        session.headers.update(self._get_headers())
-        return session
 
     def _get_headers(self) -> dict:
         """Get the headers for the REST API calls."""
@@ -156,6 +191,26 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         ), "Authorization service not provided. Include service-auth.jsonc?"
         return self._parent.get_auth_headers()
 
+    @staticmethod
+    def _get_retry_after(response: requests.Response) -> dict:
+        """
+        Get the poll interval suggested by the Retry-After header of the response.
+
+        Returns
+        -------
+        result : dict
+            {"pollInterval": seconds} if the header is present, otherwise {}.
+        """
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is None:
+            return {}
+        try:
+            return {"pollInterval": float(retry_after)}
+        except (TypeError, ValueError):
+            # Could be an HTTP date, which Azure does not use for the async operations.
+            _LOG.warning("Ignore invalid Retry-After header: %s", retry_after)
+            return {}
+
     @staticmethod
     def _extract_arm_parameters(json_data: dict) -> dict:
         """
@@ -194,7 +249,9 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         """
         _LOG.debug("Request: POST %s", url)
 
-        response = requests.post(url, headers=self._get_headers(), timeout=self._request_timeout)
+        response = self._get_session(params).post(
+            url, headers=self._get_headers(), timeout=self._request_timeout
+        )
         _LOG.debug("Response: %s", response)
 
         # Logical flow for async operations based on:
@@ -240,7 +297,7 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
 
         session = self._get_session(params)
         try:
-            response = session.get(url, timeout=self._request_timeout)
+            response = session.get(url, headers=self._get_headers(), timeout=self._request_timeout)
         except requests.exceptions.ReadTimeout:
             _LOG.warning("Request timed out after %.2f s: %s", self._request_timeout, url)
             return Status.RUNNING, {}
@@ -259,7 +316,7 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
             output = response.json()
             status = output.get("status")
             if status == "InProgress":
-                return Status.RUNNING, {}
+                return Status.RUNNING, self._get_retry_after(response)
             elif status == "Succeeded":
                 return Status.SUCCEEDED, output
 
@@ -294,6 +351,30 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         )
         return self._wait_while(self._check_deployment, Status.PENDING, params)
 
+    def _get_poll_params(
+        self,
+        func: Callable[[dict], tuple[Status, dict]],
+        loop_status: Status,
+        params: dict,
+    ) -> tuple[dict, float]:
+        """Check the polling parameters and get the initial poll interval."""
+        params = self._set_default_params(params)
+        config = merge_parameters(
+            dest=self.config.copy(),
+            source=params,
+            required_keys=["deploymentName"],
+        )
+        poll_period = float(params.get("pollInterval", self._poll_interval))
+        _LOG.debug(
+            "Wait for %s status %s with %s :: poll %.2f timeout %d s",
+            config["deploymentName"],
+            loop_status,
+            getattr(func, "__name__", func),
+            poll_period,
+            self._poll_timeout,
+        )
+        return (params, poll_period)
+
     def _wait_while(
         self,
         func: Callable[[dict], tuple[Status, dict]],
@@ -319,22 +400,21 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         result : (Status, dict)
             A pair of Status and result.
         """
-        params = self._set_default_params(params)
-        config = merge_parameters(
-            dest=self.config.copy(),
-            source=params,
-            required_keys=["deploymentName"],
-        )
-
-        poll_period = params.get("pollInterval", self._poll_interval)
-
-        _LOG.debug(
-            "Wait for %s status %s :: poll %.2f timeout %d s",
-            config["deploymentName"],
-            loop_status,
-            poll_period,
-            self._poll_timeout,
-        )
+        (params, poll_period) = self._get_poll_params(func, loop_status, params)
+
+        if self._poll_async:
+            # Still blocks the caller until the operation completes, but the delays
+            # between the status checks of all operations run on one shared thread.
+            return AzureDeploymentService._OPERATION_POLLER.wait(
+                func,
+                loop_status,
+                params,
+                poll_interval=poll_period,
+                poll_timeout=self._poll_timeout,
+                max_poll_interval=self._poll_max_interval,
+                backoff_factor=self._poll_backoff_factor,
+                jitter=self._poll_jitter,
+            )
 
         ts_timeout = time.time() + self._poll_timeout
         poll_delay = poll_period
@@ -397,7 +477,7 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
 
         session = self._get_session(params)
         try:
-            response = session.get(url, timeout=self._request_timeout)
+            response = session.get(url, headers=self._get_headers(), timeout=self._request_timeout)
         except requests.exceptions.ReadTimeout:
             _LOG.warning("Request timed out after %.2f s: %s", self._request_timeout, url)
             return Status.RUNNING, {}
@@ -414,7 +494,7 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
             if state == "Succeeded":
                 return (Status.SUCCEEDED, {})
             elif state in {"Accepted", "Creating", "Deleting", "Running", "Updating"}:
-                return (Status.PENDING, {})
+                return (Status.PENDING, self._get_retry_after(response))
             else:
                 _LOG.error("Response: %s :: %s", response, json.dumps(output, indent=2))
                 return (Status.FAILED, {})
@@ -481,7 +561,7 @@ class AzureDeploymentService(Service, metaclass=abc.ABCMeta):
         if _LOG.isEnabledFor(logging.DEBUG):
             _LOG.debug("Request: PUT %s\n%s", url, json.dumps(json_req, indent=2))
 
-        response = requests.put(
+        response = self._get_session(params).put(
             url,
             json=json_req,
             headers=self._get_headers(),
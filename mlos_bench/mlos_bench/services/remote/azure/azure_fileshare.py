@@ -4,17 +4,22 @@
 #
 """A collection FileShare functions for interacting with Azure File Shares."""
 
+import hashlib
 import logging
 import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 from typing import Any
 
 from azure.core.credentials import TokenCredential
-from azure.core.exceptions import ResourceNotFoundError
-from azure.storage.fileshare import ShareClient
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+from azure.core.pipeline.transport import RequestsTransport
+from azure.storage.fileshare import ContentSettings, ShareClient
 
 from mlos_bench.services.base_fileshare import FileShareService
 from mlos_bench.services.base_service import Service
+from mlos_bench.services.remote.azure.azure_session_pool import AzureSessionPool
 from mlos_bench.services.types.authenticator_type import SupportsAuth
 from mlos_bench.util import check_required_params
 
@@ -26,6 +31,10 @@ class AzureFileShareService(FileShareService):
 
     _SHARE_URL = "https://{account_name}.file.core.windows.net/{fs_name}"
 
+    _MAX_CONCURRENT_UPLOADS = 8
+
+    _MD5_CHUNK_SIZE = 4 * 1024 * 1024
+
     def __init__(
         self,
         config: dict[str, Any] | None = None,
@@ -42,6 +51,9 @@ class AzureFileShareService(FileShareService):
             Free-format dictionary that contains the file share configuration.
             It will be passed as a constructor parameter of the class
             specified by `class_name`.
+            Files get uploaded by a pool of up to "maxConcurrentUploads" threads.
+            If "skipUnchangedUploads" is true, the files that have the same MD5
+            hash as the remote ones are not uploaded again.
         global_config : dict
             Free-format dictionary of global parameters.
         parent : Service
@@ -67,6 +79,22 @@ class AzureFileShareService(FileShareService):
         ), "Authorization service not provided. Include service-auth.jsonc?"
         self._auth_service: SupportsAuth[TokenCredential] = self._parent
         self._share_client: ShareClient | None = None
+        self._max_concurrent_uploads = int(
+            self.config.get("maxConcurrentUploads", self._MAX_CONCURRENT_UPLOADS)
+        )
+        self._skip_unchanged_uploads = bool(self.config.get("skipUnchangedUploads", False))
+        # Keep enough connections open for all concurrent uploads.
+        self._pool_max_size = int(
+            self.config.get(
+                "requestPoolMaxSize",
+                max(AzureSessionPool.POOL_MAX_SIZE, self._max_concurrent_uploads),
+            )
+        )
+        # Remote directories known to exist, to avoid a round-trip per path component.
+        # The entries go stale if the directories get deleted outside of this service:
+        # we find out about that on upload (see `._upload_file()`).
+        self._remote_dirs: set[str] = set()
+        self._remote_dirs_lock = Lock()
 
     def _get_share_client(self) -> ShareClient:
         """Get the Azure file share client object."""
@@ -82,6 +110,16 @@ class AzureFileShareService(FileShareService):
                 ),
                 credential=credential,
                 token_intent="backup",
+                # Share the pooled connections with the other Azure services.
+                # The SDK has its own retry policy, so do not retry on the HTTP level.
+                transport=RequestsTransport(
+                    session=AzureSessionPool.instance().get_session(
+                        total_retries=0,
+                        backoff_factor=0,
+                        pool_max_size=self._pool_max_size,
+                    ),
+                    session_owner=False,
+                ),
             )
         return self._share_client
 
@@ -124,13 +162,36 @@ class AzureFileShareService(FileShareService):
         recursive: bool = True,
     ) -> None:
         super().upload(params, local_path, remote_path, recursive)
-        self._upload(local_path, remote_path, recursive, set())
+        files: list[tuple[str, str]] = []
+        self._upload(local_path, remote_path, recursive, set(), files)
+        if not files:
+            return
+        # Create all parent directories first, then upload the files in parallel.
+        for folder in sorted({os.path.split(remote_file)[0] for (_, remote_file) in files}):
+            self._remote_makedirs(folder)
+        num_workers = max(1, min(self._max_concurrent_uploads, len(files)))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(self._upload_file, local_file, remote_file)
+                for (local_file, remote_file) in files
+            ]
+            for future in futures:
+                future.result()  # Re-raise the first error, if any.
 
-    def _upload(self, local_path: str, remote_path: str, recursive: bool, seen: set[str]) -> None:
+    def _upload(
+        self,
+        local_path: str,
+        remote_path: str,
+        recursive: bool,
+        seen: set[str],
+        files: list[tuple[str, str]],
+    ) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
         """
-        Upload contents from a local path to an Azure file share. This method is called
-        from `.upload()` above. We need it to avoid exposing the `seen` parameter and to
-        make `.upload()` match the base class' virtual method.
+        Collect the files to upload from a local path to an Azure file share. This
+        method is called from `.upload()` above. We need it to avoid exposing the `seen`
+        and `files` parameters and to make `.upload()` match the base class' virtual
+        method.
 
         Parameters
         ----------
@@ -143,6 +204,8 @@ class AzureFileShareService(FileShareService):
             if True (the default), upload the entire directory tree.
         seen: set[str]
             Helper set for keeping track of visited directories to break circular paths.
+        files : list[tuple[str, str]]
+            Output list of (local_path, remote_path) pairs of the files to upload.
         """
         local_path = os.path.abspath(local_path)
         if local_path in seen:
@@ -157,21 +220,82 @@ class AzureFileShareService(FileShareService):
                 local_target = f"{local_path}/{name}"
                 remote_target = f"{remote_path}/{name}"
                 if recursive or not entry.is_dir():
-                    self._upload(local_target, remote_target, recursive, seen)
+                    self._upload(local_target, remote_target, recursive, seen, files)
         else:
-            # Ensure parent folders exist
-            folder, _ = os.path.split(remote_path)
-            self._remote_makedirs(folder)
-            file_client = self._get_share_client().get_file_client(remote_path)
+            files.append((local_path, remote_path))
+
+    def _upload_file(self, local_path: str, remote_path: str) -> None:
+        """
+        Upload a single file to the Azure file share, unless the remote file has the
+        same content (when "skipUnchangedUploads" is on).
+
+        Parameters
+        ----------
+        local_path : str
+            Path to the local file to upload.
+        remote_path : str
+            Path in the remote file share to store the file to.
+            The parent directory must already exist.
+        """
+        file_client = self._get_share_client().get_file_client(remote_path)
+        content_settings: ContentSettings | None = None
+        if self._skip_unchanged_uploads:
+            content_md5 = self._file_md5(local_path)
+            try:
+                remote_md5 = file_client.get_file_properties().content_settings.content_md5
+                if remote_md5 and bytes(remote_md5) == content_md5:
+                    _LOG.debug("Skip unchanged file: %s -> %s", local_path, remote_path)
+                    return
+            except ResourceNotFoundError:
+                pass
+            # Store the hash to compare against in the next upload.
+            content_settings = ContentSettings(content_md5=bytearray(content_md5))
+        try:
             with open(local_path, "rb") as file_data:
                 _LOG.debug("Upload file: %s -> %s", local_path, remote_path)
-                file_client.upload_file(file_data)
+                file_client.upload_file(file_data, content_settings=content_settings)
+        except ResourceNotFoundError:
+            # The parent directory is gone (e.g., deleted by someone else since we
+            # cached it): forget the cached directories, create them again, and retry.
+            folder = os.path.split(remote_path)[0]
+            _LOG.warning("Parent directory not found: %s :: retry upload", folder)
+            self._forget_remote_dirs(folder)
+            self._remote_makedirs(folder)
+            with open(local_path, "rb") as file_data:
+                file_client.upload_file(file_data, content_settings=content_settings)
+
+    def _file_md5(self, local_path: str) -> bytes:
+        """Compute the MD5 hash of the local file content."""
+        md5 = hashlib.md5(usedforsecurity=False)
+        with open(local_path, "rb") as file_data:
+            for chunk in iter(lambda: file_data.read(self._MD5_CHUNK_SIZE), b""):
+                md5.update(chunk)
+        return md5.digest()
+
+    def _forget_remote_dirs(self, remote_path: str) -> None:
+        """
+        Remove the remote directory and all its parents from the cache of the
+        existing directories.
+
+        Parameters
+        ----------
+        remote_path : str
+            Path in the remote file share to check again next time.
+        """
+        path = ""
+        with self._remote_dirs_lock:
+            for folder in remote_path.replace("\\", "/").split("/"):
+                if folder:
+                    path += folder + "/"
+                    self._remote_dirs.discard(path)
 
     def _remote_makedirs(self, remote_path: str) -> None:
         """
         Create remote directories for the entire path. Succeeds even some or all
         directories along the path already exist.
 
+        Directories created (or found) earlier are cached and not checked again.
+
         Parameters
         ----------
         remote_path : str
@@ -182,6 +306,13 @@ class AzureFileShareService(FileShareService):
             if not folder:
                 continue
             path += folder + "/"
+            with self._remote_dirs_lock:
+                if path in self._remote_dirs:
+                    continue
             dir_client = self._get_share_client().get_directory_client(path)
-            if not dir_client.exists():
+            try:
                 dir_client.create_directory()
+            except ResourceExistsError:
+                pass
+            with self._remote_dirs_lock:
+                self._remote_dirs.add(path)
@@ -0,0 +1,187 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+A shared poller for the long-running Azure operations (deployments, VM power
+operations, remote script runs, etc.).
+
+Instead of sleeping on the calling thread between the status checks, all
+pending operations wait on a single background :external:py:mod:`asyncio`
+event loop (see :py:class:`~mlos_bench.event_loop_context.EventLoopContext`).
+Only the (short) status check requests run on the worker threads. The delay
+between the checks honors the ``Retry-After`` value returned by Azure (passed as
+``pollInterval`` in the status check output), and otherwise can grow exponentially
+up to a limit. A random jitter keeps many operations from polling in lockstep.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from mlos_bench.environments.status import Status
+from mlos_bench.event_loop_context import EventLoopContext
+
+_LOG = logging.getLogger(__name__)
+
+StatusCheckFunc = Callable[[dict], tuple[Status, dict]]
+"""A function that takes the operation `params` and returns a pair of (Status, dict)."""
+
+
+class AzureOperationPoller:
+    """Polls the status of many long-running Azure operations concurrently."""
+
+    def __init__(self) -> None:
+        self._event_loop_context = EventLoopContext()
+
+    def enter(self) -> None:
+        """
+        Keep the background event loop thread running until the matching
+        :py:meth:`.exit` call.
+
+        To be used in the __enter__ method of a caller's context manager.
+        """
+        self._event_loop_context.enter()
+
+    def exit(self) -> None:
+        """
+        Release the background event loop thread.
+
+        To be used in the __exit__ method of a caller's context manager.
+        """
+        self._event_loop_context.exit()
+
+    def submit(  # pylint: disable=too-many-arguments
+        self,
+        func: StatusCheckFunc,
+        loop_status: Status,
+        params: dict,
+        *,
+        poll_interval: float,
+        poll_timeout: float,
+        max_poll_interval: float | None = None,
+        backoff_factor: float = 1.0,
+        jitter: float = 0.0,
+    ) -> Future[tuple[Status, dict]]:
+        """
+        Start polling `func` in the background while its status is equal to
+        `loop_status`. Must be called between :py:meth:`.enter` and :py:meth:`.exit`.
+
+        Parameters
+        ----------
+        func : StatusCheckFunc
+            A function that takes `params` and returns a pair of (Status, dict).
+            If the dict has the "pollInterval" key (e.g., from the Retry-After
+            header), the next check happens after that many seconds.
+        loop_status : Status
+            Steady state status - keep polling `func` while it returns `loop_status`.
+        params : dict
+            Flat dictionary of (key, value) pairs to pass to `func`.
+        poll_interval : float
+            Initial delay (in seconds) before the first and between the status checks.
+        poll_timeout : float
+            Total time (in seconds) to wait for the operation to complete.
+        max_poll_interval : float | None
+            Upper bound on the delay between the checks (None for no limit).
+        backoff_factor : float
+            Multiply the delay by this factor after each check (1.0 = fixed delay).
+        jitter : float
+            Randomize each delay by up to this fraction of its value.
+
+        Returns
+        -------
+        Future[tuple[Status, dict]]
+            A future that resolves to the final (Status, dict) pair of `func`,
+            or (TIMED_OUT, {}) when timing out.
+        """
+        return self._event_loop_context.run_coroutine(
+            self._poll(
+                func,
+                loop_status,
+                params,
+                poll_interval=poll_interval,
+                poll_timeout=poll_timeout,
+                max_poll_interval=max_poll_interval,
+                backoff_factor=backoff_factor,
+                jitter=jitter,
+            )
+        )
+
+    def wait(  # pylint: disable=too-many-arguments
+        self,
+        func: StatusCheckFunc,
+        loop_status: Status,
+        params: dict,
+        *,
+        poll_interval: float,
+        poll_timeout: float,
+        max_poll_interval: float | None = None,
+        backoff_factor: float = 1.0,
+        jitter: float = 0.0,
+    ) -> tuple[Status, dict]:
+        """
+        Poll `func` while its status is equal to `loop_status` and return the final
+        result. See :py:meth:`.submit` for the description of the parameters.
+        """
+        self.enter()
+        try:
+            return self.submit(
+                func,
+                loop_status,
+                params,
+                poll_interval=poll_interval,
+                poll_timeout=poll_timeout,
+                max_poll_interval=max_poll_interval,
+                backoff_factor=backoff_factor,
+                jitter=jitter,
+            ).result()
+        finally:
+            self.exit()
+
+    @staticmethod
+    async def _poll(  # pylint: disable=too-many-arguments
+        func: StatusCheckFunc,
+        loop_status: Status,
+        params: dict,
+        *,
+        poll_interval: float,
+        poll_timeout: float,
+        max_poll_interval: float | None,
+        backoff_factor: float,
+        jitter: float,
+    ) -> tuple[Status, dict]:
+        """Poll the status of a single operation on the background event loop."""
+        loop = asyncio.get_running_loop()
+        ts_timeout = time.monotonic() + poll_timeout
+        poll_delay = poll_interval
+        retry_after: float | None = None
+        while True:
+            if retry_after is not None:
+                # Honor the Retry-After suggested by the service: never poll earlier.
+                delay = retry_after * (1.0 + random.uniform(0, jitter))
+            else:
+                if max_poll_interval is not None:
+                    poll_delay = min(poll_delay, max_poll_interval)
+                delay = poll_delay * (1.0 + random.uniform(-jitter, jitter))
+            # Do not sleep past the deadline; check the status one last time instead.
+            delay = min(delay, ts_timeout - time.monotonic())
+            if delay < 0:
+                break
+            _LOG.debug("Sleep for: %.2f s", delay)
+            await asyncio.sleep(delay)
+
+            (status, output) = await loop.run_in_executor(None, func, params)
+            if status != loop_status:
+                return (status, output)
+
+            retry_after = output.get("pollInterval")
+            if retry_after is None:
+                poll_delay *= backoff_factor
+            else:
+                retry_after = float(retry_after)
+
+        _LOG.warning("Request timed out: %s", params)
+        return (Status.TIMED_OUT, {})
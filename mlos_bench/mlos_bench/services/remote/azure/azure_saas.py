@@ -11,6 +11,7 @@ import requests
 
 from mlos_bench.environments.status import Status
 from mlos_bench.services.base_service import Service
+from mlos_bench.services.remote.azure.azure_session_pool import AzureSessionPool
 from mlos_bench.services.types.authenticator_type import SupportsAuth
 from mlos_bench.services.types.remote_config_type import SupportsRemoteConfig
 from mlos_bench.util import check_required_params, merge_parameters
@@ -22,6 +23,9 @@ class AzureSaaSConfigService(Service, SupportsRemoteConfig):
     """Helper methods to configure Azure Flex services."""
 
     _REQUEST_TIMEOUT = 5  # seconds
+    _REQUEST_TOTAL_RETRIES = 10  # Total number retries for each request
+    # Delay (seconds) between retries: {backoff factor} * (2 ** ({number of previous retries}))
+    _REQUEST_RETRY_BACKOFF_FACTOR = 0.3
 
     # REST API for Azure SaaS DB Services configuration as described in:
     # https://learn.microsoft.com/en-us/rest/api/mysql/flexibleserver/configurations
@@ -117,6 +121,15 @@ class AzureSaaSConfigService(Service, SupportsRemoteConfig):
 
         # These parameters can come from command line as strings, so conversion is needed.
         self._request_timeout = float(self.config.get("requestTimeout", self._REQUEST_TIMEOUT))
+        self._total_retries = int(
+            self.config.get("requestTotalRetries", self._REQUEST_TOTAL_RETRIES)
+        )
+        self._backoff_factor = float(
+            self.config.get("requestBackoffFactor", self._REQUEST_RETRY_BACKOFF_FACTOR)
+        )
+        self._pool_max_size = int(
+            self.config.get("requestPoolMaxSize", AzureSessionPool.POOL_MAX_SIZE)
+        )
 
     def configure(self, config: dict[str, Any], params: dict[str, Any]) -> tuple[Status, dict]:
         """
@@ -159,7 +172,9 @@ class AzureSaaSConfigService(Service, SupportsRemoteConfig):
         config = merge_parameters(dest=self.config.copy(), source=config, required_keys=["vmName"])
         url = self._url_config_get.format(vm_name=config["vmName"])
         _LOG.debug("Request: GET %s", url)
-        response = requests.put(url, headers=self._get_headers(), timeout=self._request_timeout)
+        response = self._get_session().put(
+            url, headers=self._get_headers(), timeout=self._request_timeout
+        )
         _LOG.debug("Response: %s :: %s", response, response.text)
         if response.status_code == 504:
             return (Status.TIMED_OUT, {})
@@ -176,6 +191,16 @@ class AzureSaaSConfigService(Service, SupportsRemoteConfig):
             },
         )
 
+    def _get_session(self) -> requests.Session:
+        """Get a shared session object that includes automatic retries and a pool of
+        keep-alive connections for REST API calls.
+        """
+        return AzureSessionPool.instance().get_session(
+            total_retries=self._total_retries,
+            backoff_factor=self._backoff_factor,
+            pool_max_size=self._pool_max_size,
+        )
+
     def _get_headers(self) -> dict:
         """Get the headers for the REST API calls."""
         assert self._parent is not None and isinstance(
@@ -210,7 +235,7 @@ class AzureSaaSConfigService(Service, SupportsRemoteConfig):
         config = merge_parameters(dest=self.config.copy(), source=config, required_keys=["vmName"])
         url = self._url_config_set.format(vm_name=config["vmName"], param_name=param_name)
         _LOG.debug("Request: PUT %s", url)
-        response = requests.put(
+        response = self._get_session().put(
             url,
             headers=self._get_headers(),
             json={"properties": {"value": str(param_value)}},
@@ -273,7 +298,7 @@ class AzureSaaSConfigService(Service, SupportsRemoteConfig):
             # "resetAllToDefault": "True"
         }
         _LOG.debug("Request: POST %s", url)
-        response = requests.post(
+        response = self._get_session().post(
             url,
             headers=self._get_headers(),
             json=json_req,
@@ -0,0 +1,152 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+A process-wide pool of HTTP sessions shared by the Azure services.
+
+All Azure services talk to a handful of hosts (e.g., ``management.azure.com``).
+Instead of creating a new :py:class:`requests.Session` (and hence a new TCP and TLS
+connection) for every request, the services borrow a shared session whose
+:py:class:`~requests.adapters.HTTPAdapter` keeps a bounded pool of the keep-alive
+connections to each host and retries the throttled (429) and failed (5xx) requests
+with exponential backoff, honoring the ``Retry-After`` header.
+
+Only the idempotent requests (GET, HEAD, DELETE) are retried automatically. The
+mutating requests (PUT, POST) are sent once, and the services handle their status
+codes (and the retries) themselves, same as without the pool.
+"""
+
+import logging
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+_LOG = logging.getLogger(__name__)
+
+
+class AzureSessionPool:
+    """Process-wide pool of the HTTP sessions shared by the Azure services."""
+
+    POOL_MAX_SIZE = 10  # Max. number of connections kept open to each host
+    _POOL_MAX_HOSTS = 10  # Max. number of hosts to keep the connections to
+    _RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    _RETRY_METHODS = frozenset(["GET", "HEAD", "DELETE"])
+
+    _INSTANCE: "AzureSessionPool | None" = None
+    _INSTANCE_LOCK = Lock()
+
+    @classmethod
+    def instance(cls) -> "AzureSessionPool":
+        """Get the pool shared by all Azure services in the process."""
+        with cls._INSTANCE_LOCK:
+            if cls._INSTANCE is None:
+                cls._INSTANCE = AzureSessionPool()
+            return cls._INSTANCE
+
+    def __init__(self) -> None:
+        self._sessions: dict[tuple[int, float, int], requests.Session] = {}
+        self._lock = Lock()
+
+    def get_session(
+        self,
+        total_retries: int,
+        backoff_factor: float,
+        pool_max_size: int = POOL_MAX_SIZE,
+    ) -> requests.Session:
+        """
+        Get a shared session with the given retry and connection pool settings.
+
+        The session does not carry the authentication headers; the callers must pass
+        them with each request, as the tokens can expire.
+
+        Parameters
+        ----------
+        total_retries : int
+            Total number of retries for each request.
+        backoff_factor : float
+            Delay (seconds) between retries:
+            {backoff factor} * (2 ** ({number of previous retries})).
+        pool_max_size : int
+            Max. number of idle connections to keep open for each host.
+            More concurrent requests open extra connections that are closed
+            after use instead of returning to the pool.
+
+        Returns
+        -------
+        session : requests.Session
+            A session that can be used concurrently from multiple threads.
+        """
+        key = (int(total_retries), float(backoff_factor), int(pool_max_size))
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                _LOG.debug("Create HTTP session: %s", key)
+                adapter = HTTPAdapter(
+                    pool_connections=self._POOL_MAX_HOSTS,
+                    pool_maxsize=key[2],
+                    pool_block=False,
+                    max_retries=Retry(
+                        total=key[0],
+                        backoff_factor=key[1],
+                        status_forcelist=self._RETRY_STATUS_CODES,
+                        # Never resend the non-idempotent requests.
+                        allowed_methods=self._RETRY_METHODS,
+                        respect_retry_after_header=True,
+                        # Return the last response instead of raising an exception.
+                        raise_on_status=False,
+                    ),
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[key] = session
+            return session
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Get the connection pool usage metrics for each host.
+
+        Returns
+        -------
+        stats : dict[str, dict[str, int]]
+            A dictionary of {"scheme://host:port": metrics} where metrics has the
+            number of connections opened so far ("connections"), the number of
+            requests sent ("requests"), the number of idle connections currently
+            in the pool ("idle"), and the pool size limit ("max_size"). The metrics
+            are summed over the sessions with different retry settings.
+        """
+        stats: dict[str, dict[str, int]] = {}
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                if not isinstance(adapter, HTTPAdapter):
+                    continue
+                for pool_key in adapter.poolmanager.pools.keys():
+                    conn_pool = adapter.poolmanager.pools.get(pool_key)
+                    if conn_pool is None:
+                        continue
+                    host = f"{conn_pool.scheme}://{conn_pool.host}:{conn_pool.port}"
+                    host_stats = stats.setdefault(
+                        host, {"connections": 0, "requests": 0, "idle": 0, "max_size": 0}
+                    )
+                    host_stats["connections"] += conn_pool.num_connections
+                    host_stats["requests"] += conn_pool.num_requests
+                    if conn_pool.pool is not None:
+                        host_stats["idle"] += sum(
+                            1 for conn in list(conn_pool.pool.queue) if conn is not None
+                        )
+                        host_stats["max_size"] += conn_pool.pool.maxsize
+        return stats
+
+    def close(self) -> None:
+        """Close all sessions and their connections."""
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Close HTTP sessions. Usage: %s", self.get_stats())
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
@@ -546,7 +546,7 @@ class AzureVMService(
         if _LOG.isEnabledFor(logging.DEBUG):
             _LOG.debug("Request: PUT %s\n%s", url, json.dumps(json_req, indent=2))
 
-        response = requests.put(
+        response = self._get_session(config).put(
             url,
             json=json_req,
             headers=self._get_headers(),
@@ -601,7 +601,7 @@ class AzureVMService(
 
         session = self._get_session(params)
         try:
-            response = session.get(url, timeout=self._request_timeout)
+            response = session.get(url, headers=self._get_headers(), timeout=self._request_timeout)
         except requests.exceptions.ReadTimeout:
             _LOG.warning("Request timed out after %.2f s: %s", self._request_timeout, url)
             return Status.RUNNING, {}
@@ -622,7 +622,7 @@ class AzureVMService(
                 output.get("properties", {}).get("instanceView", {}).get("executionState")
             )
             if execution_state in {"Running", "Pending"}:
-                return Status.RUNNING, {}
+                return Status.RUNNING, self._get_retry_after(response)
             elif execution_state == "Succeeded":
                 return Status.SUCCEEDED, output
 
@@ -4,12 +4,27 @@
 #
 """A collection functions for interacting with SSH servers as file shares."""
 
+import asyncio
 import logging
+import os
+import posixpath
+from collections.abc import Callable
 from enum import Enum
+from typing import Any
 
-from asyncssh import SFTPError, SFTPFailure, SFTPNoSuchFile, SSHClientConnection, scp
+from asyncssh import (
+    FILEXFER_TYPE_DIRECTORY,
+    FILEXFER_TYPE_REGULAR,
+    SFTPClient,
+    SFTPError,
+    SFTPFailure,
+    SFTPNoSuchFile,
+    SSHClientConnection,
+    scp,
+)
 
 from mlos_bench.services.base_fileshare import FileShareService
+from mlos_bench.services.base_service import Service
 from mlos_bench.services.remote.ssh.ssh_service import SshService
 from mlos_bench.util import merge_parameters
 
@@ -23,11 +38,49 @@ class CopyMode(Enum):
     UPLOAD = 2
 
 
+FileStats = dict[str, tuple[int, int]]
+"""Mapping of the relative file paths to their (size, mtime) pairs."""
+
+
 class SshFileShareService(FileShareService, SshService):
     """A collection of functions for interacting with SSH servers as file shares."""
 
     # pylint: disable=too-many-ancestors
 
+    _MAX_PARALLEL_TRANSFERS = 8
+
+    def __init__(
+        self,
+        config: dict[str, Any] | None = None,
+        global_config: dict[str, Any] | None = None,
+        parent: Service | None = None,
+        methods: dict[str, Callable] | list[Callable] | None = None,
+    ):
+        """
+        Create a new instance of an SSH file share service.
+
+        Parameters
+        ----------
+        config : dict
+            Free-format dictionary that contains the benchmark environment
+            configuration.
+            If "ssh_sync" is true, only copy the files that differ in size or
+            modification time from the destination ones, using up to
+            "ssh_max_parallel_transfers" concurrent SFTP sessions
+            on the (cached) connection.
+        global_config : dict
+            Free-format dictionary of global parameters.
+        parent : Service
+            Parent service that can provide mixin functions.
+        methods : Union[dict[str, Callable], list[Callable], None]
+            New methods to register with the service.
+        """
+        super().__init__(config, global_config, parent, methods)
+        self._sync: bool = bool(self.config.get("ssh_sync", False))
+        self._max_parallel_transfers = int(
+            self.config.get("ssh_max_parallel_transfers", self._MAX_PARALLEL_TRANSFERS)
+        )
+
     async def _start_file_copy(
         self,
         params: dict,
@@ -64,6 +117,10 @@ class SshFileShareService(FileShareService, SshService):
             If the remote file does not exist, the SFTPError is converted to a FileNotFoundError.
         """
         connection, _ = await self._get_client_connection(params)
+        if self._sync:
+            return await self._start_file_sync(
+                connection, mode, local_path, remote_path, recursive
+            )
         srcpaths: str | tuple[SSHClientConnection, str]
         dstpath: str | tuple[SSHClientConnection, str]
         if mode == CopyMode.DOWNLOAD:
@@ -76,6 +133,150 @@ class SshFileShareService(FileShareService, SshService):
             raise ValueError(f"Unknown copy mode: {mode}")
         return await scp(srcpaths=srcpaths, dstpath=dstpath, recurse=recursive, preserve=True)
 
+    async def _start_file_sync(
+        self,
+        connection: SSHClientConnection,
+        mode: CopyMode,
+        local_path: str,
+        remote_path: str,
+        recursive: bool,
+    ) -> None:
+        # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        """
+        Copies only the files that differ in size or modification time from the
+        destination ones, in parallel.
+
+        The destination layout is the same as that of `scp`: if the destination is
+        an existing directory, the source file or directory is copied into it
+        (i.e., to ``dst/<basename of src>``); otherwise, it is copied to the
+        destination path itself.
+
+        Parameters
+        ----------
+        connection : SSHClientConnection
+            The (cached) connection to the remote host.
+        mode : CopyMode
+            Whether to download or upload the files.
+        local_path : str
+            Local path to the file/dir.
+        remote_path : str
+            Remote path to the file/dir.
+        recursive : bool
+            Whether to copy the subdirectories.
+        """
+        async with connection.start_sftp_client() as sftp:
+            if mode == CopyMode.UPLOAD:
+                src_is_dir = os.path.isdir(local_path)
+                if not (src_is_dir or os.path.isfile(local_path)):
+                    raise FileNotFoundError(f"Local path {local_path} does not exist")
+                src_name = os.path.basename(os.path.normpath(local_path))
+                if await sftp.isdir(remote_path):
+                    remote_path = posixpath.join(remote_path, src_name)
+                src_files = self._list_local_files(local_path, recursive)
+                dst_files = await self._list_remote_files(sftp, remote_path, recursive)
+            elif mode == CopyMode.DOWNLOAD:
+                # Raises SFTPNoSuchFile if the remote path does not exist.
+                src_is_dir = (await sftp.stat(remote_path)).type == FILEXFER_TYPE_DIRECTORY
+                src_name = posixpath.basename(posixpath.normpath(remote_path))
+                if os.path.isdir(local_path):
+                    local_path = os.path.join(local_path, src_name)
+                src_files = await self._list_remote_files(sftp, remote_path, recursive)
+                dst_files = self._list_local_files(local_path, recursive)
+            else:
+                raise ValueError(f"Unknown copy mode: {mode}")
+
+            changed_files = [
+                rel_path
+                for (rel_path, stats) in src_files.items()
+                if dst_files.get(rel_path) != stats
+            ]
+            _LOG.info(
+                "Sync %s %s <-> %s: %d of %d files changed",
+                mode.name.lower(),
+                local_path,
+                remote_path,
+                len(changed_files),
+                len(src_files),
+            )
+            if not changed_files:
+                return
+
+            # Create the destination directories first.
+            rel_dirs = {posixpath.dirname(rel_path) for rel_path in changed_files}
+            for rel_dir in sorted(rel_dirs if src_is_dir else []):
+                if mode == CopyMode.UPLOAD:
+                    await sftp.makedirs(posixpath.join(remote_path, rel_dir), exist_ok=True)
+                else:
+                    os.makedirs(os.path.join(local_path, rel_dir), exist_ok=True)
+
+        def _paths(rel_path: str) -> tuple[str, str]:
+            if not src_is_dir:
+                return (local_path, remote_path)
+            return (os.path.join(local_path, rel_path), posixpath.join(remote_path, rel_path))
+
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for rel_path in changed_files:
+            queue.put_nowait(rel_path)
+
+        async def _transfer_worker() -> None:
+            # Each worker uses its own SFTP session (channel) on the same connection.
+            async with connection.start_sftp_client() as sftp:
+                while not queue.empty():
+                    (local_file, remote_file) = _paths(queue.get_nowait())
+                    if mode == CopyMode.UPLOAD:
+                        await sftp.put(local_file, remote_file, preserve=True)
+                    else:
+                        await sftp.get(remote_file, local_file, preserve=True)
+
+        num_workers = max(1, min(self._max_parallel_transfers, len(changed_files)))
+        await asyncio.gather(*(_transfer_worker() for _ in range(num_workers)))
+
+    @staticmethod
+    def _list_local_files(path: str, recursive: bool) -> FileStats:
+        """
+        Get the (size, mtime) of the local file or of all files in the local
+        directory, if it exists.
+        """
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            return {"": (stat.st_size, int(stat.st_mtime))}
+        files: FileStats = {}
+        for root, dirs, file_names in os.walk(path):
+            if not recursive:
+                dirs.clear()
+            for file_name in file_names:
+                stat = os.stat(os.path.join(root, file_name))
+                rel_path = os.path.relpath(os.path.join(root, file_name), path)
+                files[rel_path.replace(os.sep, "/")] = (stat.st_size, int(stat.st_mtime))
+        return files
+
+    @staticmethod
+    async def _list_remote_files(sftp: SFTPClient, path: str, recursive: bool) -> FileStats:
+        """
+        Get the (size, mtime) of the remote file or of all files in the remote
+        directory, if it exists.
+        """
+        files: FileStats = {}
+        try:
+            attrs = await sftp.stat(path)
+        except SFTPNoSuchFile:
+            return files
+        if attrs.type != FILEXFER_TYPE_DIRECTORY:
+            return {"": (attrs.size or 0, int(attrs.mtime or 0))}
+        dirs = [""]
+        while dirs:
+            rel_dir = dirs.pop()
+            for entry in await sftp.readdir(posixpath.join(path, rel_dir)):
+                if entry.filename in (".", ".."):
+                    continue
+                rel_path = posixpath.join(rel_dir, str(entry.filename))
+                if entry.attrs.type == FILEXFER_TYPE_DIRECTORY:
+                    if recursive:
+                        dirs.append(rel_path)
+                elif entry.attrs.type == FILEXFER_TYPE_REGULAR:
+                    files[rel_path] = (entry.attrs.size or 0, int(entry.attrs.mtime or 0))
+        return files
+
     def download(
         self,
         params: dict,
@@ -4,6 +4,8 @@
 #
 """A collection Service functions for managing hosts via SSH."""
 
+import asyncio
+import concurrent.futures
 import logging
 from collections.abc import Callable, Iterable
 from concurrent.futures import Future
@@ -15,13 +17,17 @@ from mlos_bench.environments.status import Status
 from mlos_bench.services.base_service import Service
 from mlos_bench.services.remote.ssh.ssh_service import SshService
 from mlos_bench.services.types.os_ops_type import SupportsOSOps
+from mlos_bench.services.types.remote_exec_multi_type import SupportsRemoteExecMulti
 from mlos_bench.services.types.remote_exec_type import SupportsRemoteExec
-from mlos_bench.util import merge_parameters
+from mlos_bench.util import merge_parameters, nullable
 
 _LOG = logging.getLogger(__name__)
 
+_TIMEOUT_ERRORS = (TimeoutError, asyncio.TimeoutError, concurrent.futures.TimeoutError)
+"""Exceptions raised on timeouts (these are distinct classes before Python 3.11)."""
 
-class SshHostService(SshService, SupportsOSOps, SupportsRemoteExec):
+
+class SshHostService(SshService, SupportsOSOps, SupportsRemoteExec, SupportsRemoteExecMulti):
     """Helper methods to manage machines via SSH."""
 
     # pylint: disable=too-many-ancestors
@@ -63,6 +69,8 @@ class SshHostService(SshService, SupportsOSOps, SupportsRemoteExec):
                     self.wait_os_operation,
                     self.remote_exec,
                     self.get_remote_exec_results,
+                    self.remote_exec_multi,
+                    self.get_remote_exec_multi_results,
                 ],
             ),
         )
@@ -179,24 +187,185 @@ class SshHostService(SshService, SupportsOSOps, SupportsRemoteExec):
         try:
             result = future.result(timeout=self._request_timeout)
             assert isinstance(result, SSHCompletedProcess)
-            stdout = result.stdout.decode() if isinstance(result.stdout, bytes) else result.stdout
-            stderr = result.stderr.decode() if isinstance(result.stderr, bytes) else result.stderr
-            return (
-                (
-                    Status.SUCCEEDED
-                    if result.exit_status == 0 and result.returncode == 0
-                    else Status.FAILED
-                ),
-                {
-                    "stdout": stdout,
-                    "stderr": stderr,
-                    "ssh_completed_process_result": result,
-                },
-            )
-        except (ConnectionLost, DisconnectError, ProcessError, TimeoutError) as ex:
+            return self._get_completed_process_results(result)
+        except (ConnectionLost, DisconnectError, ProcessError, *_TIMEOUT_ERRORS) as ex:
             _LOG.error("Failed to get remote exec results: %s", ex)
             return (Status.FAILED, {"result": result})
 
+    @staticmethod
+    def _get_completed_process_results(result: SSHCompletedProcess) -> tuple[Status, dict]:
+        """
+        Convert the results of the remote command to the (Status, output) pair.
+
+        Parameters
+        ----------
+        result : SSHCompletedProcess
+            The results of the remote command.
+
+        Returns
+        -------
+        result : (Status, dict)
+            A pair of Status and the dict with stdout and stderr of the command.
+            Status is one of {SUCCEEDED, FAILED}
+        """
+        stdout = result.stdout.decode() if isinstance(result.stdout, bytes) else result.stdout
+        stderr = result.stderr.decode() if isinstance(result.stderr, bytes) else result.stderr
+        return (
+            (
+                Status.SUCCEEDED
+                if result.exit_status == 0 and result.returncode == 0
+                else Status.FAILED
+            ),
+            {
+                "stdout": stdout,
+                "stderr": stderr,
+                "ssh_completed_process_result": result,
+            },
+        )
+
+    async def _run_cmd_multi(
+        self,
+        configs: list[dict],
+        script: list[str],
+        env_params: dict,
+    ) -> list[SSHCompletedProcess | BaseException]:
+        """
+        Runs the same command on several hosts concurrently.
+
+        Parameters
+        ----------
+        configs : list[dict]
+            Connection parameters for each of the hosts.
+            Can also override the `ssh_request_timeout` for each host.
+        script : list[str]
+            Lines of the script to run on each host.
+        env_params : dict
+            Parameters to pass as *shell* environment variables into the script.
+
+        Returns
+        -------
+        list[SSHCompletedProcess | BaseException]
+            Results of the command (or the exception) for each host.
+        """
+
+        async def _run_host_cmd(config: dict) -> SSHCompletedProcess:
+            # Cover both establishing the (possibly cached) connection and running the
+            # command with the same per-host timeout.
+            timeout = nullable(float, config.get("ssh_request_timeout", self._request_timeout))
+            return await asyncio.wait_for(self._run_cmd(config, script, env_params), timeout)
+
+        return await asyncio.gather(
+            *(_run_host_cmd(config) for config in configs),
+            return_exceptions=True,
+        )
+
+    def remote_exec_multi(
+        self,
+        script: Iterable[str],
+        configs: Iterable[dict],
+        env_params: dict,
+    ) -> tuple[Status, dict]:
+        """
+        Start running the same script on several remote hosts concurrently over the
+        (cached) SSH connections.
+
+        Parameters
+        ----------
+        script : Iterable[str]
+            A list of lines to execute as a script on each of the remote hosts.
+        configs : Iterable[dict]
+            Flat dictionaries of (key, value) pairs of parameters, one per host.
+            Each one must have the "ssh_hostname" key, and can override other
+            connection parameters (e.g., "ssh_port" or "ssh_request_timeout").
+        env_params : dict
+            Parameters to pass as *shell* environment variables into the script.
+            This is usually a subset of `config` with some possible conversions.
+
+        Returns
+        -------
+        result : (Status, dict)
+            A pair of Status and result.
+            Status is one of {PENDING, SUCCEEDED, FAILED}
+        """
+        if isinstance(script, str):
+            script = [script]
+        host_configs = [
+            merge_parameters(
+                dest={"ssh_request_timeout": self._request_timeout, **self.config},
+                source=config,
+                required_keys=[
+                    "ssh_hostname",
+                ],
+            )
+            for config in configs
+        ]
+        _LOG.info(
+            "Run script on %d hosts: %s",
+            len(host_configs),
+            [config["ssh_hostname"] for config in host_configs],
+        )
+        future = self._run_coroutine(self._run_cmd_multi(host_configs, list(script), env_params))
+        return (
+            Status.PENDING,
+            {
+                "asyncRemoteExecMultiResultsFuture": future,
+                "hosts": [config["ssh_hostname"] for config in host_configs],
+            },
+        )
+
+    def get_remote_exec_multi_results(self, config: dict) -> tuple[Status, dict]:
+        """
+        Wait for the script to complete on all hosts and get the per-host results.
+
+        Parameters
+        ----------
+        config : dict
+            The result of the :py:meth:`.remote_exec_multi` call.
+            Must have the "asyncRemoteExecMultiResultsFuture" key.
+
+        Returns
+        -------
+        result : (Status, dict)
+            A pair of the overall Status and result.
+            Status is one of {SUCCEEDED, FAILED, TIMED_OUT}: SUCCEEDED if the script
+            succeeded on all hosts, TIMED_OUT if it timed out on some hosts and
+            succeeded on the rest, and FAILED otherwise.
+            The result has the "hosts" list with the (status, output) pairs
+            for each host, in the same order as in the `remote_exec_multi` call,
+            and the "stdout" and "stderr" of all hosts concatenated in that order.
+        """
+        future = config.get("asyncRemoteExecMultiResultsFuture")
+        if not future:
+            raise ValueError("Missing 'asyncRemoteExecMultiResultsFuture'.")
+        assert isinstance(future, Future)
+        host_results: list[tuple[Status, dict]] = []
+        for hostname, result in zip(config["hosts"], future.result()):
+            if isinstance(result, SSHCompletedProcess):
+                host_results.append(self._get_completed_process_results(result))
+            elif isinstance(result, _TIMEOUT_ERRORS):
+                _LOG.warning("Remote exec on %s timed out: %s", hostname, result)
+                host_results.append((Status.TIMED_OUT, {"result": result}))
+            else:
+                _LOG.error("Failed to get remote exec results on %s: %s", hostname, result)
+                host_results.append((Status.FAILED, {"result": result}))
+
+        statuses = {status for (status, _) in host_results}
+        if statuses == {Status.SUCCEEDED}:
+            status = Status.SUCCEEDED
+        elif statuses == {Status.SUCCEEDED, Status.TIMED_OUT} or statuses == {Status.TIMED_OUT}:
+            status = Status.TIMED_OUT
+        else:
+            status = Status.FAILED
+
+        return (
+            status,
+            {
+                "hosts": host_results,
+                "stdout": "".join(output.get("stdout", "") for (_, output) in host_results),
+                "stderr": "".join(output.get("stderr", "") for (_, output) in host_results),
+            },
+        )
+
     def _exec_os_op(self, cmd_opts_list: list[str], params: dict) -> tuple[Status, dict]:
         """
         _summary_
@@ -9,6 +9,7 @@ import os
 from abc import ABCMeta
 from asyncio import Event as CoroEvent
 from asyncio import Lock as CoroLock
+from collections import OrderedDict
 from collections.abc import Callable, Coroutine
 from threading import current_thread
 from types import TracebackType
@@ -118,13 +119,26 @@ class SshClientCache:
     """
     Manages a cache of SshClient connections.
 
+    Connections to distinct hosts are established concurrently, while concurrent
+    requests for the same host share a single connection attempt.
+    The cache keeps at most `max_size` connections and evicts the least recently
+    used ones beyond that.
+
     Note: Only one per event loop thread supported.
     See additional details in SshService comments.
     """
 
-    def __init__(self) -> None:
-        self._cache: dict[str, tuple[SSHClientConnection, SshClient]] = {}
+    _MAX_SIZE = 256
+    """Default maximum number of cached connections."""
+
+    def __init__(self, max_size: int | None = _MAX_SIZE) -> None:
+        # Ordered from the least to the most recently used connection.
+        self._cache: OrderedDict[str, tuple[SSHClientConnection, SshClient]] = OrderedDict()
+        # Protects the creation of the per-connection locks below.
         self._cache_lock = CoroLock()
+        # Serialize the (re)connects to the same host only.
+        self._conn_locks: dict[str, CoroLock] = {}
+        self._max_size = max_size
         self._refcnt: int = 0
 
     def __str__(self) -> str:
@@ -154,6 +168,26 @@ class SshClientCache:
                 warn(RuntimeWarning("SshClientCache lock was still held on exit."))
                 self._cache_lock.release()
 
+    async def _get_conn_lock(self, connection_id: str) -> CoroLock:
+        """Gets the lock for establishing the connection with the given id."""
+        async with self._cache_lock:
+            conn_lock = self._conn_locks.get(connection_id)
+            if conn_lock is None:
+                conn_lock = self._conn_locks[connection_id] = CoroLock()
+            return conn_lock
+
+    @staticmethod
+    async def _is_healthy(connection: SSHClientConnection, client: SshClient) -> bool:
+        """
+        Checks if the cached connection is still usable.
+
+        Dead peers are detected by the keepalive requests of the connection
+        (see `ssh_keepalive_interval`), which close it and notify the client.
+        """
+        if connection.is_closed():
+            return False
+        return await client.connection() is not None
+
     async def get_client_connection(
         self,
         connect_params: dict,
@@ -172,40 +206,59 @@ class SshClientCache:
             A tuple of (SSHClientConnection, SshClient).
         """
         _LOG.debug("%s: get_client_connection: %s", current_thread().name, connect_params)
-        async with self._cache_lock:
-            connection_id = SshClient.id_from_params(connect_params)
-            client: None | SshClient | asyncssh.SSHClient
-            _, client = self._cache.get(connection_id, (None, None))
-            if client:
+        connection_id = SshClient.id_from_params(connect_params)
+        async with await self._get_conn_lock(connection_id):
+            cached = self._cache.get(connection_id)
+            if cached:
                 _LOG.debug("%s: Checking cached client %s", current_thread().name, connection_id)
-                connection = await client.connection()
-                if not connection:
-                    _LOG.debug(
-                        "%s: Removing stale client connection %s from cache.",
-                        current_thread().name,
-                        connection_id,
-                    )
-                    self._cache.pop(connection_id)
-                    # Try to reconnect next.
-                else:
+                (connection, client) = cached
+                if await self._is_healthy(connection, client):
                     _LOG.debug("%s: Using cached client %s", current_thread().name, connection_id)
-            if connection_id not in self._cache:
+                    self._cache.move_to_end(connection_id)
+                    return cached
                 _LOG.debug(
-                    "%s: Establishing client connection to %s",
+                    "%s: Removing stale client connection %s from cache.",
                     current_thread().name,
                     connection_id,
                 )
-                connection, client = await asyncssh.create_connection(SshClient, **connect_params)
-                assert isinstance(client, SshClient)
-                self._cache[connection_id] = (connection, client)
-                _LOG.debug("%s: Created connection to %s.", current_thread().name, connection_id)
-            return self._cache[connection_id]
+                self._cache.pop(connection_id, None)
+                connection.close()
+                # Try to reconnect next.
+            _LOG.debug(
+                "%s: Establishing client connection to %s",
+                current_thread().name,
+                connection_id,
+            )
+            connection, client = await asyncssh.create_connection(SshClient, **connect_params)
+            assert isinstance(client, SshClient)
+            self._cache[connection_id] = (connection, client)
+            _LOG.debug("%s: Created connection to %s.", current_thread().name, connection_id)
+            self._evict()
+            return (connection, client)
+
+    def _evict(self) -> None:
+        """
+        Closes the least recently used connections beyond the cache size limit.
+
+        Note: This may cause in flight operations on the evicted connections to fail,
+        so the limit should exceed the number of hosts used concurrently.
+        """
+        if self._max_size is None:
+            return
+        while len(self._cache) > self._max_size:
+            (connection_id, (connection, _)) = self._cache.popitem(last=False)
+            _LOG.debug("%s: Evicting client connection %s", current_thread().name, connection_id)
+            connection.close()
+            conn_lock = self._conn_locks.get(connection_id)
+            if conn_lock is not None and not conn_lock.locked():
+                del self._conn_locks[connection_id]
 
     def cleanup(self) -> None:
         """Closes all cached connections."""
         for connection, _ in self._cache.values():
             connection.close()
-        self._cache = {}
+        self._cache = OrderedDict()
+        self._conn_locks = {}
 
 
 class SshService(Service, metaclass=ABCMeta):
@@ -241,6 +294,10 @@ class SshService(Service, metaclass=ABCMeta):
 
     _REQUEST_TIMEOUT: float | None = None  # seconds
 
+    # Send keepalive requests on idle connections by default so that the dead
+    # cached connections get detected and replaced before they are reused.
+    _KEEPALIVE_INTERVAL: int | None = 60  # seconds
+
     def __init__(
         self,
         config: dict[str, Any] | None = None,
@@ -284,9 +341,9 @@ class SshService(Service, metaclass=ABCMeta):
         if self._connect_params["known_hosts"] is None:
             _LOG.info("%s known_hosts checking is disabled per config.", self)
 
-        if "ssh_keepalive_interval" in self.config:
-            keepalive_internal = self.config.get("ssh_keepalive_interval")
-            self._connect_params["keepalive_interval"] = nullable(int, keepalive_internal)
+        # None can be used to disable the keepalive requests.
+        keepalive_interval = self.config.get("ssh_keepalive_interval", self._KEEPALIVE_INTERVAL)
+        self._connect_params["keepalive_interval"] = nullable(int, keepalive_interval)
 
     def _enter_context(self) -> "SshService":
         # Start the background thread if it's not already running.
@@ -14,6 +14,33 @@ from typing import Protocol, runtime_checkable
 from mlos_bench.tunables.tunable_types import TunableValue
 
 
+class LocalExecTimeoutError(TimeoutError):
+    """
+    Raised by :py:meth:`.SupportsLocalExec.local_exec` when the script runs out of
+    time.
+
+    Unlike a special return code, it cannot be confused with the exit code of the
+    script itself.
+    """
+
+    def __init__(self, message: str, stdout: str = "", stderr: str = ""):
+        """
+        Create a new timeout error.
+
+        Parameters
+        ----------
+        message : str
+            Description of the timeout.
+        stdout : str
+            Output of the script up to the timeout.
+        stderr : str
+            Error output of the script up to the timeout.
+        """
+        super().__init__(message)
+        self.stdout = stdout
+        self.stderr = stderr
+
+
 @runtime_checkable
 class SupportsLocalExec(Protocol):
     """
@@ -32,6 +59,7 @@ class SupportsLocalExec(Protocol):
         script_lines: Iterable[str],
         env: Mapping[str, TunableValue] | None = None,
         cwd: str | None = None,
+        resource_usage: dict[str, float] | None = None,
     ) -> tuple[int, str, str]:
         """
         Execute the script lines from `script_lines` in a local process.
@@ -46,11 +74,19 @@ class SupportsLocalExec(Protocol):
         cwd : str
             Work directory to run the script at.
             If omitted, use `temp_dir` or create a temporary dir.
+        resource_usage : dict[str, float] | None
+            An optional dict to store the resource usage metrics
+            (e.g., CPU time, peak RSS, etc.) of the script processes in.
 
         Returns
         -------
         (return_code, stdout, stderr) : (int, str, str)
             A 3-tuple of return code, stdout, and stderr of the script process.
+
+        Raises
+        ------
+        LocalExecTimeoutError
+            If the script has timed out.
         """
         ...
 
@@ -0,0 +1,71 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Protocol interface for Service types that can run the same script on several remote
+hosts concurrently.
+"""
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+if TYPE_CHECKING:
+    from mlos_bench.environments.status import Status
+
+
+@runtime_checkable
+class SupportsRemoteExecMulti(Protocol):
+    """Protocol interface for Service types that can run the same script on several
+    remote hosts concurrently (e.g., on a client/server pair or a cluster of hosts).
+    """
+
+    # pylint: disable=unnecessary-ellipsis
+
+    def remote_exec_multi(
+        self,
+        script: Iterable[str],
+        configs: Iterable[dict],
+        env_params: dict,
+    ) -> tuple["Status", dict]:
+        """
+        Start running the same script on several remote hosts concurrently.
+
+        Parameters
+        ----------
+        script : Iterable[str]
+            A list of lines to execute as a script on each of the remote hosts.
+        configs : Iterable[dict]
+            Flat dictionaries of (key, value) pairs of parameters, one per host.
+            They usually come from `const_args` and `tunable_params`
+            properties of the Environment, with the host-specific values mixed in.
+        env_params : dict
+            Parameters to pass as *shell* environment variables into the script.
+            This is usually a subset of `config` with some possible conversions.
+
+        Returns
+        -------
+        result : (Status, dict)
+            A pair of Status and result.
+            Status is one of {PENDING, SUCCEEDED, FAILED}
+        """
+        ...
+
+    def get_remote_exec_multi_results(self, config: dict) -> tuple["Status", dict]:
+        """
+        Wait for the script to complete on all hosts and get the per-host results.
+
+        Parameters
+        ----------
+        config : dict
+            The result of the :py:meth:`.remote_exec_multi` call.
+
+        Returns
+        -------
+        result : (Status, dict)
+            A pair of the overall Status and result.
+            Status is one of {SUCCEEDED, FAILED, TIMED_OUT}.
+            The result has the ``hosts`` list with the (status, output) pairs
+            for each host, in the same order as the `configs` of the
+            :py:meth:`.remote_exec_multi` call.
+        """
+        ...
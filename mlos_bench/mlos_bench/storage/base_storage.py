@@ -347,6 +347,30 @@ class Storage(metaclass=ABCMeta):
                 Trial ids, Tunable values, benchmark scores, and status of the trials.
             """
 
+        @abstractmethod
+        def get_checkpoint_trial_id(self) -> int | None:
+            """
+            Get the ID of the last trial covered by the optimizer checkpoint.
+
+            Returns
+            -------
+            trial_id : int | None
+                The last trial ID registered with the optimizer before saving its
+                state, or None if there is no checkpoint for this experiment.
+            """
+
+        @abstractmethod
+        def set_checkpoint_trial_id(self, trial_id: int | None) -> None:
+            """
+            Record the ID of the last trial covered by the optimizer checkpoint.
+
+            Parameters
+            ----------
+            trial_id : int | None
+                The last trial ID registered with the optimizer before saving its
+                state. None to invalidate the checkpoint.
+            """
+
         @abstractmethod
         def get_trial_by_id(
             self,
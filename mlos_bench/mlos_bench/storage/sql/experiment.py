@@ -21,12 +21,18 @@ from mlos_bench.storage.base_storage import Storage
 from mlos_bench.storage.sql.common import save_params
 from mlos_bench.storage.sql.schema import DbSchema
 from mlos_bench.storage.sql.trial import Trial
+from mlos_bench.tracing import traced
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.util import utcify_timestamp
 
 _LOG = logging.getLogger(__name__)
 
 
+def _span_attributes(exp: "Experiment", *_args: Any, **_kwargs: Any) -> dict[str, Any]:
+    """Get the tracing span attributes of the Experiment method call."""
+    return {"experiment_id": exp.experiment_id}
+
+
 class Experiment(Storage.Experiment):
     """Logic for retrieving and storing the results of a single experiment."""
 
@@ -125,14 +131,17 @@ class Experiment(Storage.Experiment):
                         exp_info.git_commit,
                     )
 
+    @traced("storage", _span_attributes)
     def merge(self, experiment_ids: list[str]) -> None:
         _LOG.info("Merge: %s <- %s", self._experiment_id, experiment_ids)
         raise NotImplementedError("TODO: Merging experiments not implemented yet.")
 
+    @traced("storage", _span_attributes)
     def load_tunable_config(self, config_id: int) -> dict[str, Any]:
         with self._engine.connect() as conn:
             return self._get_key_val(conn, self._schema.config_param, "param", config_id=config_id)
 
+    @traced("storage", _span_attributes)
     def load_telemetry(self, trial_id: int) -> list[tuple[datetime, str, Any]]:
         with self._engine.connect() as conn:
             cur_telemetry = conn.execute(
@@ -153,6 +162,7 @@ class Experiment(Storage.Experiment):
                 for row in cur_telemetry.fetchall()
             ]
 
+    @traced("storage", _span_attributes)
     def load(
         self,
         last_trial_id: int = -1,
@@ -214,6 +224,31 @@ class Experiment(Storage.Experiment):
 
             return (trial_ids, configs, scores, status)
 
+    def get_checkpoint_trial_id(self) -> int | None:
+        with self._engine.connect() as conn:
+            return conn.execute(
+                self._schema.experiment.select()
+                .with_only_columns(
+                    self._schema.experiment.c.checkpoint_trial_id,
+                )
+                .where(
+                    self._schema.experiment.c.exp_id == self._experiment_id,
+                )
+            ).scalar()
+
+    @traced("storage", _span_attributes)
+    def set_checkpoint_trial_id(self, trial_id: int | None) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                self._schema.experiment.update()
+                .where(
+                    self._schema.experiment.c.exp_id == self._experiment_id,
+                )
+                .values(
+                    checkpoint_trial_id=trial_id,
+                )
+            )
+
     @staticmethod
     def _get_key_val(conn: Connection, table: Table, field: str, **kwargs: Any) -> dict[str, Any]:
         """
@@ -235,6 +270,7 @@ class Experiment(Storage.Experiment):
             row._tuple() for row in cur_result.fetchall()  # pylint: disable=protected-access
         )
 
+    @traced("storage", _span_attributes)
     def get_trial_by_id(
         self,
         trial_id: int,
@@ -361,6 +397,7 @@ class Experiment(Storage.Experiment):
         )
         return config_id
 
+    @traced("storage", _span_attributes)
     def _new_trial(
         self,
         tunables: TunableGroups,
@@ -145,6 +145,15 @@ class DbSchema:
             # they start if and only if its NULL.
             Column("driver_name", String(40), comment="Driver Host/Container Name"),
             Column("driver_pid", Integer, comment="Driver Process ID"),
+            # The last trial ID covered by the optimizer checkpoint, if any.
+            # Trials after it have to be registered with the optimizer on resume.
+            Column(
+                "checkpoint_trial_id",
+                Integer,
+                nullable=True,
+                default=None,
+                comment="Last Trial ID in the Optimizer checkpoint",
+            ),
             PrimaryKeyConstraint("exp_id"),
         )
         """The Table storing
@@ -20,12 +20,18 @@ from mlos_bench.environments.status import Status
 from mlos_bench.storage.base_storage import Storage
 from mlos_bench.storage.sql.common import save_params
 from mlos_bench.storage.sql.schema import DbSchema
+from mlos_bench.tracing import traced, trial_span_attributes
 from mlos_bench.tunables.tunable_groups import TunableGroups
 from mlos_bench.util import nullable, utcify_timestamp
 
 _LOG = logging.getLogger(__name__)
 
 
+def _span_attributes(trial: "Trial", *_args: Any, **_kwargs: Any) -> dict[str, Any]:
+    """Get the tracing span attributes of the Trial method call."""
+    return trial_span_attributes(trial)
+
+
 class Trial(Storage.Trial):
     """Store the results of a single run of the experiment in SQL database."""
 
@@ -58,6 +64,7 @@ class Trial(Storage.Trial):
         self._engine = engine
         self._schema = schema
 
+    @traced("storage", _span_attributes)
     def set_trial_runner(self, trial_runner_id: int) -> int:
         trial_runner_id = super().set_trial_runner(trial_runner_id)
         with self._engine.begin() as conn:
@@ -95,6 +102,7 @@ class Trial(Storage.Trial):
             assert isinstance(self._trial_runner_id, int)
         return self._trial_runner_id
 
+    @traced("storage", _span_attributes)
     def _save_new_config_data(self, new_config_data: Mapping[str, int | float | str]) -> None:
         with self._engine.begin() as conn:
             save_params(
@@ -105,6 +113,7 @@ class Trial(Storage.Trial):
                 trial_id=self._trial_id,
             )
 
+    @traced("storage", _span_attributes)
     def update(
         self,
         status: Status,
@@ -194,6 +203,7 @@ class Trial(Storage.Trial):
                 raise
         return metrics
 
+    @traced("storage", _span_attributes)
     def update_telemetry(
         self,
         status: Status,
@@ -0,0 +1,7 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Performance benchmarks of the mlos_bench framework itself (e.g., its per-trial
+overhead).
+"""
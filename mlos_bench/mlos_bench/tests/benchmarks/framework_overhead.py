@@ -0,0 +1,411 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Benchmark of the time :py:mod:`mlos_bench` itself adds to each trial.
+
+Drives the :py:class:`~mlos_bench.launcher.Launcher` with the
+:py:class:`~mlos_bench.environments.mock_env.MockEnv` (i.e., trials that take no
+time at all), the mock or one-shot optimizers, and an in-memory or a temporary
+(tmpfs, if available) SQLite storage, and reports the number of trials per second
+and the latency breakdown by phase (e.g., scheduler bookkeeping, storage
+round-trips, tunable copies, config validation) for 1..N trial runners.
+
+Examples
+--------
+Run the benchmark and save the results::
+
+    python -m mlos_bench.tests.benchmarks.framework_overhead --output overhead.json
+
+Compare with the baseline results (e.g., after a change); the exit code is non-zero
+if the per-trial overhead or any of the phases got (much) slower::
+
+    python -m mlos_bench.tests.benchmarks.framework_overhead \\
+        --output new.json --baseline overhead.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from types import TracebackType
+from typing import Any, Literal
+
+import numpy as np
+
+from mlos_bench.config.schemas import ConfigSchema
+from mlos_bench.launcher import Launcher
+from mlos_bench.schedulers.trial_runner import TrialRunner
+from mlos_bench.storage.sql.experiment import Experiment
+from mlos_bench.storage.sql.trial import Trial
+from mlos_bench.tunables.tunable_groups import TunableGroups
+from mlos_core.tests.benchmarks import harness
+
+_LOG = logging.getLogger(__name__)
+
+OPTIMIZERS = {
+    "mock": "optimizers/mock_opt.jsonc",
+    "one_shot": None,
+}
+"""Optimizer configs to benchmark (None for the default one-shot optimizer)."""
+
+STORAGES = ("memory", "sqlite")
+"""Storage backends to benchmark: in-memory or a temporary SQLite file."""
+
+
+class PhaseTimer:
+    """Accumulates the wall-clock time of the (temporarily patched) method calls by
+    phase.
+    """
+
+    def __init__(self) -> None:
+        self._durations: dict[str, list[float]] = defaultdict(list)
+        # (owner, attribute name, original value in the owner's __dict__ or None)
+        self._patches: list[tuple[Any, str, Any]] = []
+
+    def __enter__(self) -> "PhaseTimer":
+        return self
+
+    def __exit__(
+        self,
+        ex_type: type[BaseException] | None,
+        ex_val: BaseException | None,
+        ex_tb: TracebackType | None,
+    ) -> Literal[False]:
+        self.restore()
+        return False
+
+    def patch(self, owner: Any, method_name: str, phase: str) -> None:
+        """
+        Time all calls of the method of a class or an object as the given phase.
+
+        Parameters
+        ----------
+        owner : Any
+            Class or object that has the method.
+        method_name : str
+            Name of the method to time.
+        phase : str
+            Name of the phase to account the time for.
+        """
+        method: Callable = getattr(owner, method_name)
+        durations = self._durations[phase]
+
+        def _timed(*args: Any, **kwargs: Any) -> Any:
+            start_time = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                durations.append(time.perf_counter() - start_time)
+
+        self._patches.append((owner, method_name, vars(owner).get(method_name)))
+        setattr(owner, method_name, _timed)
+
+    def restore(self) -> None:
+        """Restore all patched methods."""
+        for owner, method_name, orig_method in reversed(self._patches):
+            if orig_method is None:
+                delattr(owner, method_name)
+            else:
+                setattr(owner, method_name, orig_method)
+        self._patches.clear()
+
+    def summary(self, num_trials: int) -> dict[str, dict[str, float]]:
+        """
+        Summarize the (inclusive) time spent in each phase.
+
+        Returns
+        -------
+        summary : dict[str, dict[str, float]]
+            Number of calls, total time (in seconds), mean, median, 95th percentile,
+            and max time per call, and the time per trial (in milliseconds) for each
+            phase.
+        """
+        summary = {}
+        for phase, durations in self._durations.items():
+            if not durations:
+                continue
+            times_ms = np.array(durations) * 1000
+            summary[phase] = {
+                "count": len(durations),
+                "total_s": float(times_ms.sum() / 1000),
+                "mean_ms": float(times_ms.mean()),
+                "p50_ms": float(np.percentile(times_ms, 50)),
+                "p95_ms": float(np.percentile(times_ms, 95)),
+                "max_ms": float(times_ms.max()),
+                "per_trial_ms": float(times_ms.sum() / max(num_trials, 1)),
+            }
+        return summary
+
+
+def _patch_phases(timer: PhaseTimer, launcher: Launcher) -> None:
+    """Time the hot paths of the optimization loop."""
+    scheduler = launcher.scheduler
+    for method_name in ("run_schedule", "add_new_optimizer_suggestions", "assign_trial_runners"):
+        timer.patch(scheduler, method_name, f"scheduler.{method_name}")
+    for method_name in ("suggest", "bulk_register"):
+        timer.patch(launcher.optimizer, method_name, f"optimizer.{method_name}")
+    for method_name in ("load", "pending_trials", "new_trial"):
+        timer.patch(Experiment, method_name, f"storage.experiment.{method_name}")
+    for method_name in ("update", "update_telemetry", "set_trial_runner"):
+        timer.patch(Trial, method_name, f"storage.trial.{method_name}")
+    for trial_runner in launcher.trial_runners:
+        for method_name in ("setup", "run", "status"):
+            timer.patch(trial_runner.environment, method_name, f"environment.{method_name}")
+    timer.patch(TrialRunner, "run_trial", "trial_runner.run_trial")
+    timer.patch(TunableGroups, "copy", "tunables.copy")
+    timer.patch(ConfigSchema, "validate", "config.validate")
+
+
+def run_overhead_benchmark(
+    *,
+    optimizer: str = "mock",
+    storage: str = "memory",
+    num_trial_runners: int = 1,
+    num_trials: int = 1000,
+    log_level: str = "WARNING",
+) -> dict[str, Any]:
+    """
+    Run the optimization loop of `num_trials` mock trials and measure the framework
+    overhead.
+
+    Parameters
+    ----------
+    optimizer : str
+        One of the :py:data:`.OPTIMIZERS`.
+    storage : str
+        One of the :py:data:`.STORAGES`.
+    num_trial_runners : int
+        Number of TrialRunners for the scheduler.
+    num_trials : int
+        Number of trials to run.
+    log_level : str
+        Log level for the run (logging itself adds a lot of overhead at INFO level).
+
+    Returns
+    -------
+    result : dict[str, Any]
+        JSON-serializable settings and measurements of the run, including the
+        trials per second and the per-phase latency breakdown.
+    """
+    # pylint: disable=too-many-locals
+    tmp_dir = tempfile.mkdtemp(
+        prefix="mlos_bench_overhead_",
+        dir="/dev/shm" if os.path.isdir("/dev/shm") else None,
+    )
+    try:
+        argv = [
+            "--environment",
+            "environments/mock/mock_env.jsonc",
+            "--num-trial-runners",
+            str(num_trial_runners),
+            "--experiment-id",
+            "FrameworkOverhead",
+            "--log-level",
+            log_level,
+        ]
+        optimizer_config = OPTIMIZERS[optimizer]
+        if optimizer_config is None:
+            # The one-shot optimizer repeats the same config `num_trials` times.
+            argv += ["--trial-config-repeat-count", str(num_trials)]
+        else:
+            argv += ["--optimizer", optimizer_config, "--max-suggestions", str(num_trials)]
+        if storage == "sqlite":
+            storage_config = os.path.join(tmp_dir, "storage.json")
+            with open(storage_config, "w", encoding="utf-8") as fh_storage:
+                json.dump(
+                    {
+                        "class": "mlos_bench.storage.sql.storage.SqlStorage",
+                        "config": {
+                            "drivername": "sqlite",
+                            "database": os.path.join(tmp_dir, "mlos_bench.sqlite"),
+                        },
+                    },
+                    fh_storage,
+                )
+            argv += ["--storage", storage_config]
+        elif storage != "memory":
+            raise ValueError(f"Unknown storage: {storage}")
+
+        start_time = time.perf_counter()
+        launcher = Launcher("mlos_bench", "Framework overhead benchmark", argv=argv)
+        init_time = time.perf_counter() - start_time
+
+        with PhaseTimer() as timer:
+            _patch_phases(timer, launcher)
+            start_time = time.perf_counter()
+            with launcher.scheduler as scheduler:
+                scheduler.start()
+                loop_time = time.perf_counter() - start_time
+                scheduler.teardown()
+        trial_count = launcher.scheduler.trial_count
+    finally:
+        for file_name in os.listdir(tmp_dir):
+            os.remove(os.path.join(tmp_dir, file_name))
+        os.rmdir(tmp_dir)
+
+    if trial_count != num_trials:
+        raise RuntimeError(f"Expected {num_trials} trials, but ran {trial_count}")
+    result = {
+        "optimizer": optimizer,
+        "storage": storage,
+        "num_trial_runners": num_trial_runners,
+        "num_trials": num_trials,
+        "launcher_init_s": init_time,
+        "loop_s": loop_time,
+        "trials_per_sec": num_trials / loop_time,
+        "trial_overhead_ms": loop_time * 1000 / num_trials,
+        "phases": timer.summary(num_trials),
+    }
+    _LOG.info(
+        "%s :: %s :: %d runner(s) :: %.1f trials/sec",
+        optimizer,
+        storage,
+        num_trial_runners,
+        result["trials_per_sec"],
+    )
+    return result
+
+
+def run_suite(
+    optimizers: list[str] | None = None,
+    storages: list[str] | None = None,
+    num_trial_runners: list[int] | None = None,
+    *,
+    num_trials: int = 10000,
+    log_level: str = "WARNING",
+) -> dict[str, Any]:
+    """
+    Run the overhead benchmark for all combinations of the optimizers, storages, and
+    numbers of trial runners.
+
+    Returns
+    -------
+    results : dict[str, Any]
+        JSON-serializable results with the "metadata" and the "results" of all runs.
+    """
+    optimizers = optimizers or list(OPTIMIZERS)
+    storages = storages or list(STORAGES)
+    num_trial_runners = num_trial_runners or [1, 2, 4]
+    results = [
+        run_overhead_benchmark(
+            optimizer=optimizer,
+            storage=storage,
+            num_trial_runners=num_runners,
+            num_trials=num_trials,
+            log_level=log_level,
+        )
+        for optimizer in optimizers
+        for storage in storages
+        for num_runners in num_trial_runners
+    ]
+    settings = {
+        "optimizers": optimizers,
+        "storages": storages,
+        "num_trial_runners": num_trial_runners,
+        "num_trials": num_trials,
+        "log_level": log_level,
+    }
+    return {
+        "metadata": harness.get_metadata(
+            ("mlos-bench", "mlos-core", "sqlalchemy", "jsonschema"), settings
+        ),
+        "results": results,
+    }
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    results: dict[str, Any],
+    *,
+    max_ratio: float = 1.5,
+    min_diff_ms: float = 0.05,
+) -> list[str]:
+    """
+    Compare the per-trial overhead (overall and per phase) with the baseline.
+
+    A metric regresses if it is both more than `max_ratio` times and more than
+    `min_diff_ms` milliseconds per trial larger than in the baseline.
+
+    Returns
+    -------
+    regressions : list[str]
+        Descriptions of all regressions (empty if none).
+    """
+
+    def _metrics(results: dict[str, Any]) -> harness.Metrics:
+        metrics: harness.Metrics = {}
+        for result in results["results"]:
+            key = f"{result['optimizer']} :: {result['storage']} :: {result['num_trial_runners']}"
+            metrics[key] = {"trial_overhead": result["trial_overhead_ms"]}
+            for phase, stats in result["phases"].items():
+                metrics[key][phase] = stats["per_trial_ms"]
+        return metrics
+
+    return harness.find_regressions(
+        _metrics(baseline),
+        _metrics(results),
+        max_ratio=max_ratio,
+        min_diff=min_diff_ms,
+        unit=" ms/trial",
+    )
+
+
+def format_results(results: dict[str, Any]) -> str:
+    """Format the trials per second and the per-trial time of each phase as text."""
+    lines = []
+    for result in results["results"]:
+        lines.append(
+            f"{result['optimizer']} :: {result['storage']} :: "
+            f"{result['num_trial_runners']} runner(s) :: {result['num_trials']} trials :: "
+            f"{result['trials_per_sec']:.1f} trials/sec "
+            f"({result['trial_overhead_ms']:.3f} ms/trial)"
+        )
+        phases = sorted(
+            result["phases"].items(), key=lambda item: item[1]["per_trial_ms"], reverse=True
+        )
+        for phase, stats in phases:
+            lines.append(
+                f"    {phase:45s} {stats['per_trial_ms']:9.3f} ms/trial"
+                f"  {stats['count']:8d} calls  p95 {stats['p95_ms']:.3f} ms"
+            )
+    return "\n".join(lines)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = harness.create_arg_parser(__doc__)
+    parser.add_argument("--optimizers", nargs="+", choices=list(OPTIMIZERS))
+    parser.add_argument("--storages", nargs="+", choices=list(STORAGES))
+    parser.add_argument("--num-trial-runners", nargs="+", type=int, default=[1, 2, 4])
+    parser.add_argument("--num-trials", type=int, default=10000)
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the framework overhead benchmark from the command line."""
+    args = _parse_args(argv)
+    results = run_suite(
+        optimizers=args.optimizers,
+        storages=args.storages,
+        num_trial_runners=args.num_trial_runners,
+        num_trials=args.num_trials,
+        log_level=args.log_level,
+    )
+    return harness.report_results(
+        args,
+        results,
+        summary=format_results(results),
+        find_regressions_func=find_regressions,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for the framework overhead benchmark."""
+
+import copy
+import json
+import os
+
+import pytest
+
+from mlos_bench.storage.sql.experiment import Experiment
+from mlos_bench.tests.benchmarks.framework_overhead import (
+    PhaseTimer,
+    find_regressions,
+    main,
+    run_overhead_benchmark,
+    run_suite,
+)
+from mlos_bench.tunables.tunable_groups import TunableGroups
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    ("optimizer", "storage", "num_trial_runners"),
+    [
+        ("mock", "memory", 1),
+        ("mock", "sqlite", 2),
+        ("one_shot", "memory", 3),
+    ],
+)
+def test_run_overhead_benchmark(optimizer: str, storage: str, num_trial_runners: int) -> None:
+    """Run a few mock trials and check the measurements."""
+    result = run_overhead_benchmark(
+        optimizer=optimizer,
+        storage=storage,
+        num_trial_runners=num_trial_runners,
+        num_trials=12,
+    )
+    assert result["num_trials"] == 12
+    assert result["trials_per_sec"] > 0
+    assert result["trial_overhead_ms"] > 0
+    phases = result["phases"]
+    assert phases["storage.experiment.new_trial"]["count"] == 12
+    assert phases["trial_runner.run_trial"]["count"] == 12
+    assert phases["environment.run"]["count"] == 12
+    assert phases["tunables.copy"]["count"] >= 12
+    for stats in phases.values():
+        assert 0 <= stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+    # All the methods are restored.
+    assert Experiment.new_trial.__name__ == "new_trial"
+    assert TunableGroups.copy.__name__ == "copy"
+
+
+def test_phase_timer_restore() -> None:
+    """Restore both the own and the inherited methods after timing."""
+
+    class _Base:
+        def value(self) -> int:
+            return 1
+
+    class _Derived(_Base):
+        def other(self) -> int:
+            return 2
+
+    obj = _Derived()
+    with PhaseTimer() as timer:
+        timer.patch(_Derived, "value", "value")
+        timer.patch(_Derived, "other", "other")
+        timer.patch(obj, "other", "other")
+        assert obj.value() == 1
+        assert obj.other() == 2
+    assert "value" not in vars(_Derived)
+    assert "other" not in vars(obj)
+    assert obj.other() == 2
+    summary = timer.summary(num_trials=1)
+    assert summary["value"]["count"] == 1
+    assert summary["other"]["count"] == 2
+
+
+def test_find_regressions() -> None:
+    """Flag the metrics that got significantly slower than the baseline."""
+    baseline = run_suite(["mock"], ["memory"], [1], num_trials=5)
+    assert not find_regressions(baseline, baseline)
+    results = copy.deepcopy(baseline)
+    results["results"][0]["trial_overhead_ms"] *= 10
+    results["results"][0]["phases"]["tunables.copy"]["per_trial_ms"] *= 10
+    regressions = find_regressions(baseline, results)
+    assert len(regressions) == 2
+    assert any("trial_overhead" in regression for regression in regressions)
+    assert any("tunables.copy" in regression for regression in regressions)
+
+
+def test_main(tmp_path: str) -> None:
+    """Run the benchmark and save the results from the command line."""
+    output = os.path.join(tmp_path, "results.json")
+    argv = ["--optimizers", "mock", "--storages", "memory", "--num-trial-runners", "1"]
+    assert main([*argv, "--num-trials", "5", "--output", output]) == 0
+    with open(output, encoding="utf-8") as fh_results:
+        results = json.load(fh_results)
+    assert results["metadata"]["settings"]["num_trials"] == 5
+    assert len(results["results"]) == 1
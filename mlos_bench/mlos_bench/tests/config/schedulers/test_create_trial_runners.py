@@ -0,0 +1,51 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for creating multiple TrialRunners from the JSON configs."""
+
+import pytest
+
+from mlos_bench.schedulers.trial_runner import TrialRunner
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.tests.config.schedulers.conftest import TRIAL_RUNNERS_COUNT
+
+
+@pytest.mark.parametrize("max_workers", [None, 1, 3])
+def test_create_trial_runners(
+    config_loader_service: ConfigPersistenceService,
+    mock_env_config_path: str,
+    max_workers: int | None,
+) -> None:
+    """Each TrialRunner gets its own Environment, Services, and trial_runner_id,
+    regardless of whether they are created in parallel or not.
+    """
+    trial_runners = TrialRunner.create_from_json(
+        config_loader=config_loader_service,
+        env_json=mock_env_config_path,
+        num_trial_runners=TRIAL_RUNNERS_COUNT,
+        max_workers=max_workers,
+    )
+    assert [runner.trial_runner_id for runner in trial_runners] == list(
+        range(1, TRIAL_RUNNERS_COUNT + 1)
+    )
+    envs = [runner.environment for runner in trial_runners]
+    assert len({id(env) for env in envs}) == TRIAL_RUNNERS_COUNT
+    assert len({id(env.tunable_params) for env in envs}) == TRIAL_RUNNERS_COUNT
+    for runner in trial_runners:
+        assert runner.environment.parameters["trial_runner_id"] == runner.trial_runner_id
+    # Same configs, same tunables.
+    assert all(env.tunable_params == envs[0].tunable_params for env in envs)
+
+
+def test_create_trial_runners_invalid_config(
+    config_loader_service: ConfigPersistenceService,
+) -> None:
+    """Fail early on the invalid configs."""
+    with pytest.raises(ValueError):
+        TrialRunner.create_from_json(
+            config_loader=config_loader_service,
+            env_json='{"class": "mlos_bench.environments.mock_env.MockEnv"}',
+            num_trial_runners=TRIAL_RUNNERS_COUNT,
+            max_workers=2,
+        )
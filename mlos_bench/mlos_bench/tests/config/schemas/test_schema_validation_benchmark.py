@@ -0,0 +1,193 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Startup benchmark for the config schema validation over the shipped config tree.
+
+Run it as a script to see the timings and compare them with the baseline, e.g.::
+
+    python -m mlos_bench.tests.config.schemas.test_schema_validation_benchmark \\
+        --output new.json --baseline old.json
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Any
+
+import json5
+import jsonschema
+import pytest
+
+from mlos_bench.config.schemas.config_schemas import SCHEMA_STORE, ConfigSchema
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.tests.config import locate_config_examples
+from mlos_core.tests.benchmarks import harness
+
+_LOG = logging.getLogger(__name__)
+
+
+def _load_shipped_configs(max_configs: int | None = None) -> list[dict]:
+    """Load (up to `max_configs` of) the shipped configs that are valid mlos_bench
+    configs (i.e., skip the ARM templates, script params, etc.).
+    """
+    configs: list[dict] = []
+    for config_file in locate_config_examples(ConfigPersistenceService.BUILTIN_CONFIG_PATH, "."):
+        with open(config_file, encoding="utf-8") as fh_config:
+            config = json5.load(fh_config)
+        if jsonschema.Draft202012Validator(
+            schema=ConfigSchema.UNIFIED.schema,
+            registry=SCHEMA_STORE.registry,
+        ).is_valid(config):
+            configs.append(config)
+            if max_configs is not None and len(configs) >= max_configs:
+                break
+    return configs
+
+
+def run_schema_validation_benchmark(
+    num_runners: int = 8,
+    max_configs: int | None = None,
+) -> dict[str, float]:
+    """
+    Validate the shipped configs `num_runners` times (as we do when creating
+    multiple TrialRunners) with the different validation strategies.
+
+    Returns
+    -------
+    timings : dict[str, float]
+        Total validation time (in seconds) for each strategy.
+    """
+    configs = _load_shipped_configs(max_configs)
+    assert configs
+    timings: dict[str, float] = {}
+
+    # Baseline: create a new validator for each config.
+    start_time = time.perf_counter()
+    for _ in range(num_runners):
+        for config in configs:
+            jsonschema.Draft202012Validator(
+                schema=ConfigSchema.UNIFIED.schema,
+                registry=SCHEMA_STORE.registry,
+            ).validate(config)
+    timings["new_validator"] = time.perf_counter() - start_time
+
+    # Reuse the cached validator, but validate each config every time.
+    validator = SCHEMA_STORE.get_validator(ConfigSchema.UNIFIED.value)
+    start_time = time.perf_counter()
+    for _ in range(num_runners):
+        for config in configs:
+            validator.validate(config)
+    timings["cached_validator"] = time.perf_counter() - start_time
+
+    # ConfigSchema.validate() also skips the configs that have passed before.
+    SCHEMA_STORE._VALIDATED.clear()  # pylint: disable=protected-access
+    start_time = time.perf_counter()
+    for _ in range(num_runners):
+        for config in configs:
+            ConfigSchema.UNIFIED.validate(config)
+    timings["config_schema_validate"] = time.perf_counter() - start_time
+
+    _LOG.info(
+        "Validated %d configs x %d runners: %s",
+        len(configs),
+        num_runners,
+        {key: f"{val:.3f} s" for (key, val) in timings.items()},
+    )
+    return timings
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    results: dict[str, Any],
+    *,
+    max_ratio: float = 1.5,
+    min_diff: float = 0.01,
+) -> list[str]:
+    """
+    Compare the validation timings with the baseline.
+
+    A timing regresses if it is both more than `max_ratio` times and more than
+    `min_diff` seconds larger than in the baseline.
+
+    Returns
+    -------
+    regressions : list[str]
+        Descriptions of all regressions (empty if none).
+    """
+    return harness.find_regressions(
+        {"schema_validation": baseline["results"]},
+        {"schema_validation": results["results"]},
+        max_ratio=max_ratio,
+        min_diff=min_diff,
+        unit=" s",
+    )
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = harness.create_arg_parser(__doc__)
+    parser.add_argument("--num-runners", type=int, default=8)
+    parser.add_argument("--max-configs", type=int)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the schema validation benchmark from the command line."""
+    args = _parse_args(argv)
+    settings = {"num_runners": args.num_runners, "max_configs": args.max_configs}
+    timings = run_schema_validation_benchmark(**settings)
+    results = {
+        "metadata": harness.get_metadata(("mlos-bench", "jsonschema"), settings),
+        "results": timings,
+    }
+    return harness.report_results(
+        args,
+        results,
+        summary="\n".join(f"{key:25s} {val:.3f} s" for (key, val) in timings.items()),
+        find_regressions_func=find_regressions,
+    )
+
+
+@pytest.mark.slow
+def test_schema_validation_benchmark() -> None:
+    """Make sure that the repeated validation of the same configs is cheap."""
+    timings = run_schema_validation_benchmark(num_runners=4, max_configs=5)
+    assert timings["config_schema_validate"] < timings["new_validator"] / 2
+
+
+def test_schema_validation_cache() -> None:
+    """Cache the successful validations only, and only for the plain JSON configs."""
+    config = {"tunable_param": "value"}
+    ConfigSchema.TUNABLE_VALUES.validate(config)
+    ConfigSchema.TUNABLE_VALUES.validate(config)
+    # Same JSON representation, but tuples are not JSON arrays.
+    with pytest.raises(jsonschema.ValidationError):
+        ConfigSchema.TUNABLE_VALUES.validate({"tunable_param": ("value",)})
+    with pytest.raises(jsonschema.ValidationError):
+        ConfigSchema.TUNABLE_VALUES.validate({"tunable_param": ["value"]})
+    with pytest.raises(jsonschema.ValidationError):
+        ConfigSchema.TUNABLE_VALUES.validate({"tunable_param": ["value"]})
+
+
+def test_main(tmp_path: str) -> None:
+    """Run the benchmark from the command line and compare with the baseline."""
+    output = os.path.join(tmp_path, "results.json")
+    argv = ["--num-runners", "1", "--max-configs", "2", "--output", output]
+    assert main(argv) == 0
+    # The timings of such a small run are below the noise threshold.
+    assert main([*argv, "--baseline", output]) == 0
+    results = {"results": {"new_validator": 1.0, "cached_validator": 0.1}}
+    assert not find_regressions(results, results)
+    slower = {"results": {"new_validator": 1.0, "cached_validator": 0.2}}
+    assert find_regressions(results, slower) == [
+        "schema_validation :: cached_validator: 0.1 -> 0.2 s"
+    ]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -0,0 +1,212 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for reading non-CSV results and telemetry files in LocalEnv."""
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any
+
+import pandas
+import pytest
+from pytz import UTC
+
+from mlos_bench.environments.status import Status
+from mlos_bench.tests.environments import check_env_fail_telemetry, check_env_success
+from mlos_bench.tests.environments.local import create_local_env
+from mlos_bench.tunables.tunable_groups import TunableGroups
+
+
+def _write_json_lines(path: str, records: list[Any]) -> None:
+    """Write JSON records into a file, one record per line."""
+    with open(path, "w", encoding="utf-8") as fh_data:
+        for rec in records:
+            fh_data.write(json.dumps(rec) + "\n")
+
+
+def test_local_env_results_json_wide(tunable_groups: TunableGroups, tmp_path: str) -> None:
+    """Read the results from a JSON object that maps metric names to values."""
+    _write_json_lines(
+        os.path.join(tmp_path, "output.json"),
+        [{"latency": 10, "throughput": 66, "score": 0.9}],
+    )
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "temp_dir": str(tmp_path),
+            "run": ["echo 'benchmark done'"],
+            "read_results_file": "output.json",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={
+            "latency": 10,
+            "throughput": 66,
+            "score": 0.9,
+        },
+        expected_telemetry=[],
+    )
+
+
+def test_local_env_results_json_long(tunable_groups: TunableGroups, tmp_path: str) -> None:
+    """Read the results from a list of (metric, value) JSON records."""
+    _write_json_lines(
+        os.path.join(tmp_path, "output.txt"),
+        [[{"metric": "latency", "value": 10}, {"metric": "score", "value": 0.9}]],
+    )
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "temp_dir": str(tmp_path),
+            "run": ["echo 'benchmark done'"],
+            "read_results_file": "output.txt",
+            "read_results_format": "json",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={
+            "latency": 10.0,
+            "score": 0.9,
+        },
+        expected_telemetry=[],
+    )
+
+
+def test_local_env_results_ndjson(tunable_groups: TunableGroups, tmp_path: str) -> None:
+    """Read the results from a newline-delimited JSON file."""
+    _write_json_lines(
+        os.path.join(tmp_path, "output.ndjson"),
+        [
+            {"metric": "latency", "value": 10},
+            {"metric": "throughput", "value": 66},
+            {"metric": "score", "value": 0.9},
+        ],
+    )
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "temp_dir": str(tmp_path),
+            "run": ["echo 'benchmark done'"],
+            "read_results_file": "output.ndjson",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={
+            "latency": 10.0,
+            "throughput": 66.0,
+            "score": 0.9,
+        },
+        expected_telemetry=[],
+    )
+
+
+def test_local_env_results_json_empty(tunable_groups: TunableGroups) -> None:
+    """Fail the run if the JSON results file is empty."""
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "run": ["touch output.jsonl"],
+            "read_results_file": "output.jsonl",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results=None,
+        expected_telemetry=[],
+        expected_status_run={Status.FAILED},
+    )
+
+
+def test_local_env_results_parquet(tunable_groups: TunableGroups, tmp_path: str) -> None:
+    """Read the results from a Parquet file."""
+    pytest.importorskip("pyarrow")
+    pandas.DataFrame([{"latency": 10.0, "throughput": 66.0, "score": 0.9}]).to_parquet(
+        os.path.join(tmp_path, "output.parquet")
+    )
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "temp_dir": str(tmp_path),
+            "run": ["echo 'benchmark done'"],
+            "read_results_file": "output.parquet",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={
+            "latency": 10.0,
+            "throughput": 66.0,
+            "score": 0.9,
+        },
+        expected_telemetry=[],
+    )
+
+
+def test_local_env_telemetry_ndjson(tunable_groups: TunableGroups, tmp_path: str) -> None:
+    """Read the telemetry data from NDJSON arrays."""
+    ts1 = datetime.now(UTC)
+    ts2 = ts1 + timedelta(minutes=1)
+    _write_json_lines(
+        os.path.join(tmp_path, "telemetry.ndjson"),
+        [
+            [ts1.isoformat(), "cpu_load", 0.65],
+            [ts1.isoformat(), "mem_usage", 10240],
+            [ts2.isoformat(), "cpu_load", 0.8],
+        ],
+    )
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "temp_dir": str(tmp_path),
+            "run": ["echo 'benchmark done'"],
+            "read_telemetry_file": "telemetry.ndjson",
+        },
+    )
+
+    check_env_success(
+        local_env,
+        tunable_groups,
+        expected_results={},
+        expected_telemetry=[
+            (ts1, "cpu_load", 0.65),
+            (ts1, "mem_usage", 10240),
+            (ts2, "cpu_load", 0.8),
+        ],
+    )
+
+
+def test_local_env_telemetry_json_wrong_header(
+    tunable_groups: TunableGroups,
+    tmp_path: str,
+) -> None:
+    """Fail when the JSON telemetry records have unexpected field names."""
+    ts1 = datetime.now(UTC)
+    _write_json_lines(
+        os.path.join(tmp_path, "telemetry.tmp"),
+        [[{"ts": ts1.isoformat(), "metric_name": "cpu_load", "value": 0.65}]],
+    )
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "temp_dir": str(tmp_path),
+            # Make the telemetry file visible only after the benchmark run.
+            "run": ["mv telemetry.tmp telemetry.json"],
+            "read_telemetry_file": "telemetry.json",
+        },
+    )
+
+    check_env_fail_telemetry(local_env, tunable_groups)
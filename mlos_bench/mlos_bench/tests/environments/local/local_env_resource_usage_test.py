@@ -0,0 +1,64 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for recording the resource usage of the LocalEnv scripts."""
+import sys
+
+import pytest
+
+from mlos_bench.environments.status import Status
+from mlos_bench.tests.environments.local import create_local_env
+from mlos_bench.tunables.tunable_groups import TunableGroups
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="os.wait4 is POSIX only")
+def test_local_env_resource_usage(tunable_groups: TunableGroups) -> None:
+    """Add the resource usage of the setup and run scripts to results and
+    telemetry.
+    """
+    local_env = create_local_env(
+        tunable_groups,
+        {
+            "setup": ["echo setup"],
+            "run": ["echo 'score,0.9'"],
+            "results_stdout_pattern": "(\\w+),([0-9.]+)",
+            "record_resource_usage": True,
+        },
+    )
+    with local_env as env_context:
+        assert env_context.setup(tunable_groups)
+        (status, _ts, results) = env_context.run()
+        assert status.is_succeeded()
+        assert results is not None
+        assert results["score"] == pytest.approx(0.9)
+        for phase in ("setup", "run"):
+            assert results[f"{phase}.wall_time"] > 0
+            assert f"{phase}.cpu_user_time" in results
+            assert f"{phase}.max_rss_kb" in results
+
+        (status, _ts, telemetry) = env_context.status()
+        assert status == Status.READY
+        metrics = {metric: value for (_ts, metric, value) in telemetry}
+        assert metrics == {
+            key: val for (key, val) in results.items() if key.startswith(("setup.", "run."))
+        }
+
+        # Start over on the next trial.
+        assert env_context.setup(tunable_groups)
+        (status, _ts, telemetry) = env_context.status()
+        assert {metric for (_ts, metric, _val) in telemetry} == {
+            key for key in metrics if key.startswith("setup.")
+        }
+
+
+def test_local_env_no_resource_usage(tunable_groups: TunableGroups) -> None:
+    """Do not record the resource usage unless requested."""
+    local_env = create_local_env(tunable_groups, {"run": ["echo 'score,0.9'"]})
+    with local_env as env_context:
+        assert env_context.setup(tunable_groups)
+        (status, _ts, results) = env_context.run()
+        assert status.is_succeeded()
+        assert results == {}
+        (status, _ts, telemetry) = env_context.status()
+        assert telemetry == []
@@ -0,0 +1,43 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for RemoteEnv running its scripts on several hosts via loopback SSH
+servers.
+"""
+
+import sys
+
+import pytest
+
+from mlos_bench.environments.remote.remote_env import RemoteEnv
+from mlos_bench.environments.status import Status
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.services.remote.ssh.ssh_host_service import SshHostService
+from mlos_bench.tests.services.remote.ssh.loopback import loopback_ssh_servers
+from mlos_bench.tunables.tunable_groups import TunableGroups
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Loopback SSH servers require a POSIX shell")
+def test_remote_env_multi_host(tunable_groups: TunableGroups) -> None:
+    """Run the benchmark on a client/server pair and merge the results of both."""
+    with loopback_ssh_servers(["client", "server"]) as servers:
+        env = RemoteEnv(
+            name="TestRemoteEnvMulti",
+            config={
+                "hosts": [server.to_ssh_service_config() for server in servers],
+                "run": ['echo "${MLOS_TEST_SSH_SERVER}_score=0.$RANDOM"'],
+                "results_stdout_pattern": r"(\w+_score)=(\S+)",
+            },
+            tunables=tunable_groups,
+            service=SshHostService(
+                config={"ssh_request_timeout": 30},
+                parent=ConfigPersistenceService(),
+            ),
+        )
+        with env as env_context:
+            assert env_context.setup(tunable_groups)
+            (status, _ts, data) = env_context.run()
+            assert status == Status.SUCCEEDED
+            assert data is not None
+            assert set(data) == {"client_score", "server_score"}
@@ -0,0 +1,64 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Import time regression tests for the main CLI launcher."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# The optimizer backends (and their dependencies) that should only be imported
+# when an optimizer that needs them is actually created.
+LAZY_MODULES = [
+    "flaml",
+    "sklearn",
+    "smac",
+    "mlos_core.optimizers.bayesian_optimizers",
+    "mlos_core.optimizers.flaml_optimizer",
+    "mlos_core.spaces.adapters.llamatune",
+]
+
+
+def _get_imported_modules(module: str) -> list[str]:
+    """
+    Import the module in a fresh interpreter with ``python -X importtime``.
+
+    Returns
+    -------
+    imported_modules : list[str]
+        Names of all modules imported along with the given one.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+    imported_modules: list[str] = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        (_, cumulative, name) = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            imported_modules.append(name.strip())
+    return imported_modules
+
+
+@pytest.mark.parametrize("module", ["mlos_bench.run", "mlos_core.optimizers"])
+def test_import_time(module: str) -> None:
+    """Check that the CLI entry point does not eagerly import the optimizer
+    backends.
+    """
+    imported_modules = _get_imported_modules(module)
+    assert module in imported_modules
+    eager_modules = [
+        name
+        for name in imported_modules
+        if any(name == lazy or name.startswith(lazy + ".") for lazy in LAZY_MODULES)
+    ]
+    assert not eager_modules, f"Heavy modules imported by {module}: {eager_modules}"
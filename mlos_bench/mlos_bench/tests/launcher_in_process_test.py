@@ -5,9 +5,13 @@
 """Unit tests to check the launcher and the main optimization loop in-process."""
 
 
+from typing import Any
+
 import pytest
 
+from mlos_bench.launcher import Launcher
 from mlos_bench.run import _main
+from mlos_bench.schedulers.trial_runner import TrialRunner
 
 
 @pytest.mark.parametrize(
@@ -69,3 +73,25 @@ def test_main_bench(argv: list[str], expected_score: float) -> None:
     (score, _config) = _main(argv)
     assert score is not None
     assert pytest.approx(score["score"], 1e-5) == expected_score
+
+
+def test_trial_runner_init_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pass the number of threads to create the TrialRunners with from the CLI."""
+    create_from_json = TrialRunner.create_from_json
+    max_workers: list[int | None] = []
+
+    def _create_from_json(**kwargs: Any) -> list[TrialRunner]:
+        max_workers.append(kwargs["max_workers"])
+        return create_from_json(**kwargs)
+
+    monkeypatch.setattr(TrialRunner, "create_from_json", _create_from_json)
+    argv = ["--config", "mlos_bench/mlos_bench/tests/config/cli/mock-bench.jsonc"]
+    launcher = Launcher("mlos_bench", "Test", [*argv, "--num-trial-runners", "3"])
+    assert len(launcher.trial_runners) == 3
+    launcher = Launcher(
+        "mlos_bench",
+        "Test",
+        [*argv, "--num-trial-runners", "3", "--trial-runner-init-workers", "3"],
+    )
+    assert [runner.trial_runner_id for runner in launcher.trial_runners] == [1, 2, 3]
+    assert max_workers == [None, 3]
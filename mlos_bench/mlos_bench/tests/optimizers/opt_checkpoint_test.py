@@ -0,0 +1,198 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for saving and restoring the mlos_bench optimizer state."""
+
+import os
+from collections.abc import Sequence
+
+import pytest
+
+from mlos_bench.environments.status import Status
+from mlos_bench.optimizers.mlos_core_optimizer import MlosCoreOptimizer
+from mlos_bench.schedulers.sync_scheduler import SyncScheduler
+from mlos_bench.schedulers.trial_runner import TrialRunner
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.storage.sql.storage import SqlStorage
+from mlos_bench.tests import SEED
+from mlos_bench.tunables.tunable_groups import TunableGroups
+from mlos_bench.tunables.tunable_types import TunableValue
+
+
+def _create_optimizer(
+    tunable_groups: TunableGroups,
+    optimizer_type: str,
+    checkpoint_file: str,
+    experiment_id: str = "Test-Checkpoint",
+) -> MlosCoreOptimizer:
+    """Create a new mlos_core optimizer that saves its state to `checkpoint_file`."""
+    config = {
+        "optimization_targets": {"score": "min"},
+        "max_suggestions": 20,
+        "optimizer_type": optimizer_type,
+        "checkpoint_file": checkpoint_file,
+    }
+    if optimizer_type != "RANDOM":
+        config["seed"] = SEED
+    return MlosCoreOptimizer(
+        tunables=tunable_groups,
+        service=None,
+        config=config,
+        global_config={"experiment_id": experiment_id},
+    )
+
+
+@pytest.mark.parametrize("optimizer_type", ["RANDOM", "FLAML", "SMAC", "QUASI_RANDOM"])
+def test_save_load_state(
+    tunable_groups: TunableGroups,
+    optimizer_type: str,
+    tmp_path: str,
+) -> None:
+    """Restore the optimizer state and continue with the same suggestions."""
+    checkpoint_file = os.path.join(tmp_path, "opt", "checkpoint.pickle")
+    opt = _create_optimizer(tunable_groups, optimizer_type, checkpoint_file)
+    assert opt.checkpoint_file == checkpoint_file
+    for i in range(5):
+        tunables = opt.suggest()
+        opt.register(tunables, Status.SUCCEEDED, {"score": float(i % 3)})
+    opt.save_state(checkpoint_file, last_trial_id=5)
+
+    restored_opt = _create_optimizer(tunable_groups, optimizer_type, checkpoint_file)
+    assert restored_opt.load_state(checkpoint_file) == 5
+    assert restored_opt.get_best_observation() == opt.get_best_observation()
+    for _ in range(3):
+        tunables = opt.suggest()
+        restored_tunables = restored_opt.suggest()
+        assert restored_tunables.get_param_values() == tunables.get_param_values()
+        opt.register(tunables, Status.SUCCEEDED, {"score": 1.0})
+        restored_opt.register(restored_tunables, Status.SUCCEEDED, {"score": 1.0})
+
+
+def test_load_state_mismatch(tunable_groups: TunableGroups, tmp_path: str) -> None:
+    """Do not restore the state of the optimizer from a different experiment."""
+    checkpoint_file = os.path.join(tmp_path, "checkpoint.pickle")
+    opt = _create_optimizer(tunable_groups, "RANDOM", checkpoint_file)
+    opt.save_state(checkpoint_file, last_trial_id=0)
+    other_opt = _create_optimizer(
+        tunable_groups, "RANDOM", checkpoint_file, experiment_id="Test-Other"
+    )
+    with pytest.raises(ValueError):
+        other_opt.load_state(checkpoint_file)
+
+
+def _run_experiment(
+    monkeypatch: pytest.MonkeyPatch,
+    storage: SqlStorage,
+    tunable_groups: TunableGroups,
+    checkpoint_file: str,
+    max_trials: int,
+) -> tuple[MlosCoreOptimizer, int]:
+    """
+    Run (or resume) the experiment with a checkpointed SMAC optimizer.
+
+    Returns
+    -------
+    (opt, num_bulk_registered) : tuple[MlosCoreOptimizer, int]
+        The optimizer and the number of configs bulk-registered with it.
+    """
+    global_config = {"experiment_id": "Test-Checkpoint", "trial_id": 1}
+    trial_runners = TrialRunner.create_from_json(
+        config_loader=ConfigPersistenceService(),
+        global_config=global_config,
+        tunable_groups=tunable_groups,
+        env_json="""
+        {
+            "class": "mlos_bench.environments.mock_env.MockEnv",
+            "name": "Test Env",
+            "config": {
+                "tunable_params": ["provision", "boot", "kernel"],
+                "mock_env_seed": 42,
+                "mock_env_range": [60, 120],
+                "mock_env_metrics": ["score"]
+            }
+        }
+        """,
+        svcs_json=None,
+        num_trial_runners=1,
+    )
+    opt = MlosCoreOptimizer(
+        tunables=tunable_groups,
+        service=None,
+        config={
+            "optimization_targets": {"score": "min"},
+            "max_suggestions": 100,
+            "optimizer_type": "SMAC",
+            "seed": SEED,
+            "checkpoint_file": checkpoint_file,
+        },
+        global_config=global_config,
+    )
+    num_bulk_registered = 0
+    bulk_register = opt.bulk_register
+
+    def _bulk_register(
+        configs: Sequence[dict],
+        scores: Sequence[dict[str, TunableValue] | None],
+        status: Sequence[Status] | None = None,
+    ) -> bool:
+        nonlocal num_bulk_registered
+        num_bulk_registered += len(configs)
+        return bulk_register(configs, scores, status)
+
+    monkeypatch.setattr(opt, "bulk_register", _bulk_register)
+    scheduler = SyncScheduler(
+        config={"max_trials": max_trials},
+        global_config=global_config,
+        trial_runners=trial_runners,
+        optimizer=opt,
+        storage=storage,
+        root_env_config="environment.jsonc",
+    )
+    with scheduler:
+        scheduler.start()
+        scheduler.teardown()
+    return (opt, num_bulk_registered)
+
+
+def test_scheduler_resume_from_checkpoint(
+    monkeypatch: pytest.MonkeyPatch,
+    tunable_groups: TunableGroups,
+    tmp_path: str,
+) -> None:
+    """Resume the experiment from the optimizer checkpoint without replaying the
+    whole history of trials.
+    """
+    storage = SqlStorage(
+        service=None,
+        config={
+            "drivername": "sqlite",
+            "database": os.path.join(tmp_path, "mlos_bench.sqlite"),
+        },
+    )
+    checkpoint_file = os.path.join(tmp_path, "checkpoint.pickle")
+    (opt, num_bulk_registered) = _run_experiment(
+        monkeypatch, storage, tunable_groups, checkpoint_file, max_trials=5
+    )
+    assert os.path.exists(checkpoint_file)
+    assert num_bulk_registered == 5
+    exp_data = storage.experiments["Test-Checkpoint"]
+    assert len(exp_data.trials) == 5
+
+    # Resume the experiment: only the new trials are (bulk) registered.
+    (opt, num_bulk_registered) = _run_experiment(
+        monkeypatch, storage, tunable_groups, checkpoint_file, max_trials=3
+    )
+    assert num_bulk_registered == 3
+    (best_score, _) = opt.get_best_observation()
+    assert best_score is not None
+    # pylint: disable=protected-access
+    assert len(opt._opt.get_observations()) == 8
+
+    # Without the checkpoint, replay the entire history.
+    os.remove(checkpoint_file)
+    (opt, num_bulk_registered) = _run_experiment(
+        monkeypatch, storage, tunable_groups, checkpoint_file, max_trials=1
+    )
+    assert num_bulk_registered == 9
+    assert len(opt._opt.get_observations()) == 9
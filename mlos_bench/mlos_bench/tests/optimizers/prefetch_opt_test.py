@@ -0,0 +1,201 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for the suggestion prefetching mlos_bench optimizer wrapper."""
+
+import threading
+
+import pytest
+
+from mlos_bench.environments.mock_env import MockEnv
+from mlos_bench.environments.status import Status
+from mlos_bench.optimizers.grid_search_optimizer import GridSearchOptimizer
+from mlos_bench.optimizers.mlos_core_optimizer import MlosCoreOptimizer
+from mlos_bench.optimizers.mock_optimizer import MockOptimizer
+from mlos_bench.optimizers.prefetch_optimizer import PrefetchOptimizer
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.tests import SEED
+from mlos_bench.tests.optimizers.toy_optimization_loop_test import _optimize
+from mlos_bench.tunables.tunable_groups import TunableGroups
+
+# pylint: disable=protected-access
+
+
+def _create_mock_opt(tunable_groups: TunableGroups, max_suggestions: int = 10) -> MockOptimizer:
+    """Create a new MockOptimizer with a fixed seed."""
+    return MockOptimizer(
+        tunables=tunable_groups,
+        service=None,
+        config={
+            "optimization_targets": {"score": "max"},
+            "max_suggestions": max_suggestions,
+            "seed": SEED,
+        },
+    )
+
+
+def _wait_prefetched(opt: PrefetchOptimizer) -> None:
+    """Wait for all pending background calls of the optimizer to complete."""
+    opt._call(lambda: None)
+    assert all(future.done() for (_, future) in opt._prefetched)
+
+
+def test_prefetch_no_context(tunable_groups: TunableGroups) -> None:
+    """Outside the context, the wrapper is the same as the wrapped optimizer."""
+    opt = PrefetchOptimizer(_create_mock_opt(tunable_groups), num_prefetch=2)
+    ref_opt = _create_mock_opt(tunable_groups)
+    assert opt.name == ref_opt.name
+    assert opt.targets == {"score": "max"}
+    for score in [10, 30, 20]:
+        tunables = opt.suggest()
+        ref_tunables = ref_opt.suggest()
+        assert tunables.get_param_values() == ref_tunables.get_param_values()
+        assert opt.register(tunables, Status.SUCCEEDED, {"score": score}) == {"score": -score}
+        ref_opt.register(ref_tunables, Status.SUCCEEDED, {"score": score})
+    assert not opt._prefetched
+    assert opt.optimizer.current_iteration == opt.current_iteration == 3
+    assert opt.get_best_observation() == ref_opt.get_best_observation()
+
+
+def test_prefetch_suggestions(tunable_groups: TunableGroups) -> None:
+    """Compute the suggestions in advance, but never more than the budget."""
+    mock_opt = _create_mock_opt(tunable_groups, max_suggestions=4)
+    opt = PrefetchOptimizer(mock_opt, num_prefetch=2)
+    with opt:
+        suggestions = []
+        while opt.not_converged():
+            suggestions.append(opt.suggest())
+            _wait_prefetched(opt)
+            # Stay `num_prefetch` suggestions ahead within the budget.
+            assert mock_opt.current_iteration == min(opt.current_iteration + 2, 4)
+        assert len(suggestions) == 4
+        for tunables in suggestions:
+            opt.register(tunables, Status.SUCCEEDED, {"score": 1.0})
+        (best_score, _) = opt.get_best_observation()
+        assert best_score == {"score": 1.0}
+    assert opt._executor is None
+
+
+def test_prefetch_refresh(tunable_groups: TunableGroups) -> None:
+    """Keep the stale suggestions that are ready, but replace the ones that have not
+    started computing yet after registering new results.
+    """
+    mock_opt = _create_mock_opt(tunable_groups)
+    opt = PrefetchOptimizer(mock_opt, num_prefetch=2)
+    with opt:
+        tunables = opt.suggest()
+        _wait_prefetched(opt)
+        assert [gen for (gen, _) in opt._prefetched] == [0, 0]
+
+        opt.register(tunables, Status.SUCCEEDED, {"score": 1.0})
+        _wait_prefetched(opt)
+        # Nothing gets thrown away.
+        assert [gen for (gen, _) in opt._prefetched] == [0, 0]
+        tunables = opt.suggest()
+        _wait_prefetched(opt)
+        assert [gen for (gen, _) in opt._prefetched] == [0, 1]
+        assert mock_opt.current_iteration == 4
+
+        # Keep the background thread busy so the next suggestion does not start.
+        blocker = threading.Event()
+        assert opt._executor is not None
+        opt._executor.submit(blocker.wait)
+        opt.register(tunables, Status.SUCCEEDED, {"score": 2.0})
+        opt.suggest()  # Freshest ready (gen=1) suggestion.
+        assert [gen for (gen, _) in opt._prefetched] == [0, 2]
+        opt.register(tunables, Status.SUCCEEDED, {"score": 3.0})
+        assert [gen for (gen, _) in opt._prefetched] == [0, 3]
+        blocker.set()
+        _wait_prefetched(opt)
+        # The cancelled suggestion has never reached the wrapped optimizer.
+        assert mock_opt.current_iteration == 5
+
+
+@pytest.mark.parametrize("num_prefetch", [1, 3])
+def test_prefetch_grid_search(num_prefetch: int) -> None:
+    """Run every point of the grid exactly once, even with the stale suggestions."""
+    tunables = TunableGroups(
+        {
+            "grid": {
+                "cost": 1,
+                "params": {
+                    "cat": {"type": "categorical", "values": ["a", "b", "c"], "default": "a"},
+                    "int": {"type": "int", "range": [1, 4], "default": 2},
+                },
+            },
+        }
+    )
+    grid_opt = GridSearchOptimizer(
+        tunables=tunables,
+        config={"max_suggestions": 100, "optimization_targets": {"score": "max"}},
+    )
+    grid_size = len(list(grid_opt.pending_configs))
+    assert grid_size == 12
+    suggested = []
+    with PrefetchOptimizer(grid_opt, num_prefetch=num_prefetch) as opt:
+        while opt.not_converged():
+            suggestion = opt.suggest()
+            suggested.append(tuple(sorted(suggestion.get_param_values().items())))
+            opt.register(suggestion, Status.SUCCEEDED, {"score": len(suggested)})
+    assert len(suggested) == len(set(suggested)) == grid_size
+    assert not list(grid_opt.pending_configs)
+    assert not list(grid_opt.suggested_configs)
+    assert grid_opt.current_iteration == grid_size
+
+
+def test_prefetch_register_error(tunable_groups: TunableGroups) -> None:
+    """Re-raise the errors of the background registrations on the next call."""
+    mock_opt = _create_mock_opt(tunable_groups)
+    opt = PrefetchOptimizer(mock_opt, num_prefetch=1)
+
+    def _register_error(*_args: object) -> None:
+        raise RuntimeError("Cannot register")
+
+    with opt:
+        tunables = opt.suggest()
+        mock_opt.register = _register_error  # type: ignore[method-assign]
+        # Does not wait for the wrapped optimizer.
+        assert opt.register(tunables, Status.SUCCEEDED, {"score": 1.0}) == {"score": -1.0}
+        _wait_prefetched(opt)
+        with pytest.raises(RuntimeError):
+            opt.suggest()
+
+
+def test_prefetch_smac_optimization_loop(
+    mock_env_no_noise: MockEnv,
+    smac_opt: MlosCoreOptimizer,
+) -> None:
+    """Toy optimization loop with the prefetching SMAC optimizer."""
+    with PrefetchOptimizer(smac_opt, num_prefetch=2) as opt:
+        (score, _) = _optimize(mock_env_no_noise, opt)
+        assert opt.current_iteration == smac_opt.max_suggestions
+    # Which suggestions are stale depends on the timing, so the result may vary.
+    assert 60 <= score <= 120
+
+
+def test_build_prefetch_optimizer(tunable_groups: TunableGroups) -> None:
+    """Wrap the optimizer if the config has the `prefetch_suggestions` property."""
+    service = ConfigPersistenceService()
+    opt = service.build_optimizer(
+        tunables=tunable_groups,
+        service=service,
+        config={
+            "class": "mlos_bench.optimizers.MockOptimizer",
+            "config": {"max_suggestions": 7, "prefetch_suggestions": 3},
+        },
+    )
+    assert isinstance(opt, PrefetchOptimizer)
+    assert isinstance(opt.optimizer, MockOptimizer)
+    assert opt.num_prefetch == 3
+    assert opt.max_suggestions == 7
+
+    opt = service.build_optimizer(
+        tunables=tunable_groups,
+        service=service,
+        config={
+            "class": "mlos_bench.optimizers.MockOptimizer",
+            "config": {"prefetch_suggestions": 0},
+        },
+    )
+    assert isinstance(opt, MockOptimizer)
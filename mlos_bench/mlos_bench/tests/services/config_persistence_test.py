@@ -6,6 +6,8 @@
 
 import os
 from importlib.resources import files
+from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -136,3 +138,115 @@ def test_load_bad_config_string(config_persistence_service: ConfigPersistenceSer
     with pytest.raises(ValueError) as exc_info:
         _ = config_persistence_service.load_config(json_str, ConfigSchema.TUNABLE_VALUES)
     assert "Failed to parse config from JSON string" in str(exc_info.value)
+
+
+def _write_config(path: str, text: str) -> None:
+    """Write the config file and bump its mtime to make sure the change is noticed."""
+    mtime = os.stat(path).st_mtime_ns + 1_000_000_000 if os.path.exists(path) else None
+    with open(path, "w", encoding="utf-8") as fh_config:
+        fh_config.write(text)
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+def test_load_config_cached(
+    config_persistence_service: ConfigPersistenceService,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Parse and validate an unchanged config file only once, but always return a
+    fresh copy of it.
+    """
+    config_file = str(tmp_path / "globals.jsonc")
+    _write_config(config_file, '{"param_1": "value_1", "param_2": [1, 2]}')
+
+    num_validations = 0
+    validate = ConfigSchema.validate
+
+    def _validate(self: ConfigSchema, config: Any) -> None:
+        nonlocal num_validations
+        num_validations += 1
+        validate(self, config)
+
+    monkeypatch.setattr(ConfigSchema, "validate", _validate)
+
+    config1 = config_persistence_service.load_config(config_file, ConfigSchema.GLOBALS)
+    config1["param_2"].append(3)
+    config2 = config_persistence_service.load_config(config_file, ConfigSchema.GLOBALS)
+    assert config2 == {"param_1": "value_1", "param_2": [1, 2]}
+    assert num_validations == 1
+
+    # Changing the file invalidates the cache entry.
+    _write_config(
+        config_file,
+        """
+        {
+            // JSON5 comments require the slow parser.
+            "param_1": "value_2",
+        }
+        """,
+    )
+    config3 = config_persistence_service.load_config(config_file, ConfigSchema.GLOBALS)
+    assert config3 == {"param_1": "value_2"}
+    assert num_validations == 2
+
+
+def test_load_config_disk_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reuse the parsed config from the on-disk cache in a new process."""
+    cache_dir = tmp_path / "cache"
+    config_file = str(tmp_path / "tunable-values.jsonc")
+    _write_config(config_file, '{"param_1": "value_1", /* comment */ "param_2": 2}')
+    service = ConfigPersistenceService({"config_cache_dir": str(cache_dir)})
+
+    config = service.load_config(config_file, ConfigSchema.TUNABLE_VALUES)
+    assert config == {"param_1": "value_1", "param_2": 2}
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # Emulate a new process that has the on-disk cache only.
+    ConfigPersistenceService.clear_config_cache()
+
+    def _no_parse(text: str) -> Any:
+        raise AssertionError(f"Unexpected parse of: {text}")
+
+    monkeypatch.setattr(ConfigPersistenceService, "_parse_json", staticmethod(_no_parse))
+    assert service.load_config(config_file, ConfigSchema.TUNABLE_VALUES) == config
+
+    # Stale on-disk cache entries are ignored.
+    monkeypatch.undo()
+    _write_config(config_file, '{"param_1": "value_2"}')
+    ConfigPersistenceService.clear_config_cache()
+    assert service.load_config(config_file, ConfigSchema.TUNABLE_VALUES) == {"param_1": "value_2"}
+
+
+def test_load_config_cache_lru(
+    config_persistence_service: ConfigPersistenceService,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Keep only the most recently used configs in the in-process cache."""
+    monkeypatch.setattr(ConfigPersistenceService, "_CONFIG_CACHE_MAX_SIZE", 2)
+    ConfigPersistenceService.clear_config_cache()
+    config_files = [str(tmp_path / f"globals-{i}.jsonc") for i in range(3)]
+    for i, config_file in enumerate(config_files):
+        _write_config(config_file, f'{{"param": {i}}}')
+
+    num_parses = 0
+    parse_json = ConfigPersistenceService._parse_json  # pylint: disable=protected-access
+
+    def _parse_json(text: str) -> Any:
+        nonlocal num_parses
+        num_parses += 1
+        return parse_json(text)
+
+    monkeypatch.setattr(ConfigPersistenceService, "_parse_json", staticmethod(_parse_json))
+
+    for config_file in [config_files[0], config_files[1], config_files[0], config_files[2]]:
+        config_persistence_service.load_config(config_file, ConfigSchema.GLOBALS)
+    assert num_parses == 3
+    # The least recently used config has been evicted...
+    config_persistence_service.load_config(config_files[1], ConfigSchema.GLOBALS)
+    assert num_parses == 4
+    # ... but the recently used one is still cached.
+    config_persistence_service.load_config(config_files[2], ConfigSchema.GLOBALS)
+    assert num_parses == 4
+    ConfigPersistenceService.clear_config_cache()
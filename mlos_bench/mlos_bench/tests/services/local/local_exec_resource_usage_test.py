@@ -0,0 +1,78 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for the resource usage accounting of the local script processes."""
+import sys
+
+import pytest
+
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.services.local.local_exec import LocalExecService
+from mlos_bench.services.local.resource_usage import ProcTreeSampler
+from mlos_bench.services.types.local_exec_type import LocalExecTimeoutError
+
+# A script line that makes `sort` hold one ~20 MiB line in memory.
+_BUSY_LINE = "head -c 20000000 /dev/zero | sort > /dev/null"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="os.wait4 is POSIX only")
+@pytest.mark.parametrize("single_shell", [False, True])
+def test_resource_usage(single_shell: bool) -> None:
+    """Collect the CPU time and peak RSS of the script lines."""
+    local_exec_service = LocalExecService(
+        {"single_shell": single_shell},
+        parent=ConfigPersistenceService(),
+    )
+    usage: dict[str, float] = {}
+    (return_code, stdout, _stderr) = local_exec_service.local_exec(
+        [_BUSY_LINE, "echo done"],
+        resource_usage=usage,
+    )
+    assert return_code == 0
+    assert stdout.strip() == "done"
+    assert usage["wall_time"] > 0
+    assert usage["cpu_user_time"] + usage["cpu_system_time"] > 0
+    assert usage["max_rss_kb"] > 15 * 1024
+    assert usage["minor_page_faults"] > 0
+    assert usage["voluntary_ctx_switches"] >= 0
+    assert "sampled_peak_rss_kb" not in usage
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="os.wait4 is POSIX only")
+def test_resource_usage_timeout() -> None:
+    """Record the wall time of the script that timed out."""
+    local_exec_service = LocalExecService(
+        {"line_timeout": 0.5},
+        parent=ConfigPersistenceService(),
+    )
+    usage: dict[str, float] = {}
+    with pytest.raises(LocalExecTimeoutError):
+        local_exec_service.local_exec(["sleep 10"], resource_usage=usage)
+    assert 0.5 <= usage["wall_time"] < 10
+
+
+@pytest.mark.skipif(not ProcTreeSampler.is_supported(), reason="Requires /proc")
+def test_resource_usage_sampling() -> None:
+    """Sample the processes that run in the background of the script."""
+    local_exec_service = LocalExecService(
+        {"resource_sample_interval": 0.05},
+        parent=ConfigPersistenceService(),
+    )
+    usage: dict[str, float] = {}
+    (return_code, _stdout, _stderr) = local_exec_service.local_exec(
+        ["sleep 0.5 & sleep 0.5 & wait"],
+        resource_usage=usage,
+    )
+    assert return_code == 0
+    # The shell and the two sleeps.
+    assert usage["sampled_max_procs"] >= 3
+    assert usage["sampled_peak_rss_kb"] > 0
+
+
+def test_no_resource_usage() -> None:
+    """Do not change the default mode when the resource usage is not requested."""
+    local_exec_service = LocalExecService(parent=ConfigPersistenceService())
+    (return_code, stdout, _stderr) = local_exec_service.local_exec(["echo hello"])
+    assert return_code == 0
+    assert stdout.strip() == "hello"
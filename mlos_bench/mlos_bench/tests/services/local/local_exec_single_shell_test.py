@@ -0,0 +1,111 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for running all script lines in a single shell with LocalExecService."""
+import sys
+
+import pytest
+
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.services.local.local_exec import LocalExecService
+from mlos_bench.util import path_join
+
+# pylint: disable=redefined-outer-name
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Single shell mode is only supported on POSIX systems",
+)
+
+
+@pytest.fixture
+def local_exec_service() -> LocalExecService:
+    """Test fixture for LocalExecService in single shell mode."""
+    config = {
+        "abort_on_error": True,
+        "single_shell": True,
+    }
+    return LocalExecService(config, parent=ConfigPersistenceService())
+
+
+def test_run_script_single_shell(local_exec_service: LocalExecService) -> None:
+    """Run a multiline script in a single shell and check the results."""
+    (return_code, stdout, stderr) = local_exec_service.local_exec(
+        ["echo hello", "printf world", "echo $var"],
+        env={"var": "VALUE"},
+    )
+    assert return_code == 0
+    assert stdout == "hello\nworldVALUE\n"
+    assert stderr == ""
+
+
+def test_run_script_single_shell_output_tail() -> None:
+    """Remove the exit code markers before keeping the last lines of the output and
+    spooling it to the file.
+    """
+    local_exec_service = LocalExecService(
+        {
+            "single_shell": True,
+            "streaming": True,
+            "max_output_lines": 2,
+            "output_log_file": "output.log",
+        },
+        parent=ConfigPersistenceService(),
+    )
+    with local_exec_service.temp_dir_context() as temp_dir:
+        (return_code, stdout, stderr) = local_exec_service.local_exec(
+            ["echo 1", "printf 2", "echo 3 && echo 4", "echo 5"],
+            cwd=temp_dir,
+        )
+        assert return_code == 0
+        assert stdout == "4\n5\n"
+        assert stderr == ""
+        with open(path_join(temp_dir, "output.log"), encoding="utf-8") as fh_log:
+            assert fh_log.read() == "1\n23\n4\n5\n"
+
+
+def test_run_script_single_shell_isolation(local_exec_service: LocalExecService) -> None:
+    """Each line runs in its own subshell, like it does in the default mode."""
+    with local_exec_service.temp_dir_context() as temp_dir:
+        (return_code, stdout, _stderr) = local_exec_service.local_exec(
+            ["mkdir subdir && cd subdir && export foo=bar", "pwd", "echo foo=$foo"],
+            cwd=temp_dir,
+        )
+    assert return_code == 0
+    assert stdout.splitlines() == [temp_dir, "foo="]
+
+
+def test_run_script_single_shell_fail_abort(local_exec_service: LocalExecService) -> None:
+    """Abort the single shell script on the first failed line."""
+    (return_code, stdout, _stderr) = local_exec_service.local_exec(
+        ["echo hello", "exit 3", "echo world"]
+    )
+    assert return_code == 3
+    assert stdout.strip() == "hello"
+
+
+def test_run_script_single_shell_fail_pass(local_exec_service: LocalExecService) -> None:
+    """Continue the single shell script after the failed line."""
+    local_exec_service.abort_on_error = False
+    (return_code, stdout, _stderr) = local_exec_service.local_exec(
+        ["echo hello", "exit 3", "echo world"]
+    )
+    assert return_code == 0
+    assert stdout.splitlines() == ["hello", "world"]
+
+    (return_code, stdout, _stderr) = local_exec_service.local_exec(["echo hello", "false"])
+    assert return_code == 1
+    assert stdout.splitlines() == ["hello"]
+
+
+def test_run_script_single_shell_python(local_exec_service: LocalExecService) -> None:
+    """Resolve the script paths once and reuse them in the subsequent calls."""
+    script = "environments/os/linux/runtime/scripts/local/generate_kernel_config_script.py"
+    for _ in range(2):
+        (return_code, _stdout, stderr) = local_exec_service.local_exec([f"{script} --help"])
+        assert return_code == 0, stderr
+    # pylint: disable=protected-access
+    resolved_path = local_exec_service._resolved_script_paths[script]
+    assert resolved_path is not None
+    assert resolved_path.endswith(script)
@@ -0,0 +1,160 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Unit tests for the streaming mode of the service to run the scripts locally."""
+import os
+import sys
+import time
+
+import pytest
+
+from mlos_bench.environments.local.local_env import LocalEnv
+from mlos_bench.environments.status import Status
+from mlos_bench.services.config_persistence import ConfigPersistenceService
+from mlos_bench.services.local.local_exec import LocalExecService
+from mlos_bench.services.types.local_exec_type import LocalExecTimeoutError
+from mlos_bench.tunables.tunable_groups import TunableGroups
+from mlos_bench.util import path_join
+
+
+def _is_alive(pid: int) -> bool:
+    """Check if the process is still running (zombies are considered dead)."""
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as fh_stat:
+            return fh_stat.read().split()[2] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def _create_service(**config: bool | int | float | str) -> LocalExecService:
+    """Create a LocalExecService with the given config."""
+    return LocalExecService(config, parent=ConfigPersistenceService())
+
+
+def test_run_script_streaming() -> None:
+    """Streaming mode returns the same output as the default one."""
+    local_exec_service = _create_service(streaming=True)
+    (return_code, stdout, stderr) = local_exec_service.local_exec(["echo hello", "echo world"])
+    assert return_code == 0
+    assert stdout.strip().split() == ["hello", "world"]
+    assert stderr.strip() == ""
+
+
+def test_run_script_streaming_fail() -> None:
+    """Abort the streaming script on the first error."""
+    local_exec_service = _create_service(streaming=True)
+    (return_code, stdout, _stderr) = local_exec_service.local_exec(
+        ["echo hello", "cmd /c 'exit 1'" if sys.platform == "win32" else "false", "echo world"]
+    )
+    assert return_code != 0
+    assert stdout.strip() == "hello"
+
+
+def test_run_script_streaming_output_tail() -> None:
+    """Keep only the last lines of the output in memory and spool the rest to the
+    file.
+    """
+    local_exec_service = _create_service(max_output_lines=2, output_log_file="output.log")
+    with local_exec_service.temp_dir_context() as temp_dir:
+        (return_code, stdout, _stderr) = local_exec_service.local_exec(
+            ["echo 1 && echo 2 && echo 3 && echo 4"],
+            cwd=temp_dir,
+        )
+        assert return_code == 0
+        # Streaming mode is not enabled, so the full output gets returned.
+        assert stdout.split() == ["1", "2", "3", "4"]
+
+    local_exec_service = _create_service(
+        streaming=True,
+        max_output_lines=2,
+        output_log_file="output.log",
+    )
+    with local_exec_service.temp_dir_context() as temp_dir:
+        (return_code, stdout, _stderr) = local_exec_service.local_exec(
+            ["echo 1 && echo 2 && echo 3 && echo 4"],
+            cwd=temp_dir,
+        )
+        assert return_code == 0
+        assert stdout.split() == ["3", "4"]
+        with open(path_join(temp_dir, "output.log"), encoding="utf-8") as fh_log:
+            assert fh_log.read().split() == ["1", "2", "3", "4"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="sleep is not available on Windows")
+def test_run_script_line_timeout() -> None:
+    """Kill the script line that runs for too long and skip the rest of the script."""
+    local_exec_service = _create_service(line_timeout=0.5, abort_on_error=False)
+    start_time = time.monotonic()
+    with pytest.raises(LocalExecTimeoutError) as ex_info:
+        local_exec_service.local_exec(["echo hello", "sleep 30", "echo world"])
+    assert time.monotonic() - start_time < 10
+    assert ex_info.value.stdout.strip() == "hello"
+    assert "Timed out" in ex_info.value.stderr
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="sleep is not available on Windows")
+def test_run_script_single_shell_timeout() -> None:
+    """Return the output (without the exit code markers) of the timed out script."""
+    local_exec_service = _create_service(script_timeout=1, single_shell=True)
+    with pytest.raises(LocalExecTimeoutError) as ex_info:
+        local_exec_service.local_exec(["echo hello", "sleep 30", "echo world"])
+    assert ex_info.value.stdout.strip() == "hello"
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="sleep is not available on Windows")
+def test_run_script_timeout_kill_process_group() -> None:
+    """Kill the entire process group of the script when it runs out of time."""
+    local_exec_service = _create_service(script_timeout=1)
+    with local_exec_service.temp_dir_context() as temp_dir:
+        with pytest.raises(LocalExecTimeoutError):
+            local_exec_service.local_exec(
+                ["sleep 0.1", "sleep 30 & echo $! > child.pid ; wait"],
+                cwd=temp_dir,
+            )
+        with open(path_join(temp_dir, "child.pid"), encoding="utf-8") as fh_pid:
+            child_pid = int(fh_pid.read())
+
+    if os.path.exists("/proc"):
+        for _ in range(50):
+            if not _is_alive(child_pid):
+                break
+            time.sleep(0.1)
+        assert not _is_alive(child_pid)
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="sleep is not available on Windows")
+def test_local_env_timed_out(tunable_groups: TunableGroups) -> None:
+    """LocalEnv reports TIMED_OUT status when the benchmark script times out."""
+    local_env = LocalEnv(
+        name="TestLocalEnv",
+        config={"run": ["sleep 30"]},
+        tunables=tunable_groups,
+        service=LocalExecService(
+            config={"line_timeout": 0.5},
+            parent=ConfigPersistenceService(),
+        ),
+    )
+    with local_env as env_context:
+        assert env_context.setup(tunable_groups)
+        (status, _ts, data) = env_context.run()
+        assert status == Status.TIMED_OUT
+        assert data is None
+
+
+def test_local_env_exit_code_not_timed_out(tunable_groups: TunableGroups) -> None:
+    """A script that exits with the same code as ETIMEDOUT has FAILED, not TIMED_OUT."""
+    local_env = LocalEnv(
+        name="TestLocalEnv",
+        config={"run": ["exit 110"]},
+        tunables=tunable_groups,
+        service=LocalExecService(
+            config={"line_timeout": 30},
+            parent=ConfigPersistenceService(),
+        ),
+    )
+    with local_env as env_context:
+        assert env_context.setup(tunable_groups)
+        (status, _ts, data) = env_context.run()
+        assert status == Status.FAILED
+        assert data is None
@@ -71,6 +71,20 @@ def test_resolve_script(local_exec_service: LocalExecService) -> None:
     assert expanded_cmdline == expected_cmdline
 
 
+def test_resolve_script_created_later(local_exec_service: LocalExecService) -> None:
+    """Do not cache the failed lookups of the scripts that do not exist yet."""
+    with local_exec_service.temp_dir_context() as temp_dir:
+        script = path_join(temp_dir, "late_script.py", abs_path=True)
+        # pylint: disable=protected-access
+        assert local_exec_service._resolve_cmdline_script_path([script]) == [script]
+        with open(script, "w", encoding="utf-8") as fh_script:
+            fh_script.write("print('hello')\n")
+        assert local_exec_service._resolve_cmdline_script_path([script]) == [
+            sys.executable,
+            script,
+        ]
+
+
 def test_run_script(local_exec_service: LocalExecService) -> None:
     """Run a script locally and check the results."""
     # `echo` should work on all platforms
@@ -37,5 +37,6 @@ class MockLocalExecService(TempDirContextService, SupportsLocalExec):
         script_lines: Iterable[str],
         env: Mapping[str, "TunableValue"] | None = None,
         cwd: str | None = None,
+        resource_usage: dict[str, float] | None = None,
     ) -> tuple[int, str, str]:
         return (0, "", "")
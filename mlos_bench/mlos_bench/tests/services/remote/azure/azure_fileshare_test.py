@@ -4,9 +4,14 @@
 #
 """Tests for mlos_bench.services.remote.azure.azure_fileshare."""
 
+import hashlib
 import os
+from pathlib import Path
 from unittest.mock import MagicMock, Mock, call, patch
 
+from azure.core.exceptions import ResourceNotFoundError
+
+from mlos_bench.services.remote.azure.azure_auth import AzureAuthService
 from mlos_bench.services.remote.azure.azure_fileshare import AzureFileShareService
 
 # pylint: disable=missing-function-docstring
@@ -276,3 +281,134 @@ def test_upload_directory_recursive(
         ],
         any_order=True,
     )
+
+
+def _make_share_client(remote_md5: dict[str, bytes]) -> Mock:
+    """Create a mock ShareClient with the given MD5 hashes of the remote files."""
+
+    def _get_file_client(remote_path: str) -> Mock:
+        if remote_path in remote_md5:
+            file_properties = Mock(content_settings=Mock(content_md5=remote_md5[remote_path]))
+            get_file_properties = Mock(return_value=file_properties)
+        else:
+            get_file_properties = Mock(side_effect=ResourceNotFoundError("Not found"))
+        return Mock(get_file_properties=get_file_properties, upload_file=Mock())
+
+    return Mock(get_file_client=Mock(side_effect=_get_file_client))
+
+
+def test_upload_directory_parallel(
+    azure_fileshare: AzureFileShareService,
+    tmp_path: Path,
+) -> None:
+    local_folder = tmp_path / "local"
+    (local_folder / "a_folder").mkdir(parents=True)
+    for name in ["a_file_1.csv", "a_folder/a_file_2.csv", "a_folder/a_file_3.csv"]:
+        (local_folder / name).write_text(name, encoding="utf-8")
+    remote_folder = "a/remote/folder"
+
+    mock_share_client = _make_share_client({})
+    with patch.object(azure_fileshare, "_share_client", mock_share_client):
+        azure_fileshare.upload({}, str(local_folder), remote_folder)
+        # Each remote directory gets created once and without the exists() check.
+        created_dirs = [
+            call_args.args[0]
+            for call_args in mock_share_client.get_directory_client.call_args_list
+        ]
+        assert sorted(created_dirs) == [
+            "a/",
+            "a/remote/",
+            "a/remote/folder/",
+            "a/remote/folder/a_folder/",
+        ]
+        mock_share_client.get_directory_client.return_value.exists.assert_not_called()
+        mock_share_client.get_file_client.assert_has_calls(
+            [
+                call(f"{remote_folder}/a_file_1.csv"),
+                call(f"{remote_folder}/a_folder/a_file_2.csv"),
+                call(f"{remote_folder}/a_folder/a_file_3.csv"),
+            ],
+            any_order=True,
+        )
+
+        # The directories are cached for the next upload.
+        mock_share_client.get_directory_client.reset_mock()
+        azure_fileshare.upload({}, str(local_folder), remote_folder)
+        mock_share_client.get_directory_client.assert_not_called()
+
+
+def test_upload_skip_unchanged(
+    azure_auth_service: AzureAuthService,
+    tmp_path: Path,
+) -> None:
+    local_folder = tmp_path / "local"
+    local_folder.mkdir()
+    (local_folder / "same.csv").write_text("same", encoding="utf-8")
+    (local_folder / "changed.csv").write_text("changed", encoding="utf-8")
+    (local_folder / "new.csv").write_text("new", encoding="utf-8")
+    remote_folder = "remote"
+
+    with patch("mlos_bench.services.remote.azure.azure_fileshare.ShareClient"):
+        azure_fileshare = AzureFileShareService(
+            config={
+                "storageAccountName": "TEST_ACCOUNT_NAME",
+                "storageFileShareName": "TEST_FS_NAME",
+                "skipUnchangedUploads": True,
+            },
+            parent=azure_auth_service,
+        )
+
+    mock_share_client = _make_share_client(
+        {
+            f"{remote_folder}/same.csv": hashlib.md5(b"same").digest(),
+            f"{remote_folder}/changed.csv": hashlib.md5(b"old").digest(),
+        }
+    )
+    uploaded: dict[str, bytes] = {}
+
+    def _get_file_client(remote_path: str) -> Mock:
+        file_client = get_file_client(remote_path)
+        file_client.upload_file.side_effect = lambda data, content_settings: uploaded.update(
+            {remote_path: content_settings.content_md5}
+        )
+        return file_client
+
+    get_file_client = mock_share_client.get_file_client.side_effect
+    mock_share_client.get_file_client.side_effect = _get_file_client
+    with patch.object(azure_fileshare, "_share_client", mock_share_client):
+        azure_fileshare.upload({}, str(local_folder), remote_folder)
+
+    # The MD5 hash gets stored with the uploaded file content.
+    assert uploaded == {
+        f"{remote_folder}/changed.csv": hashlib.md5(b"changed").digest(),
+        f"{remote_folder}/new.csv": hashlib.md5(b"new").digest(),
+    }
+
+
+def test_upload_parent_deleted(
+    azure_fileshare: AzureFileShareService,
+    tmp_path: Path,
+) -> None:
+    local_file = tmp_path / "a_file.csv"
+    local_file.write_text("data", encoding="utf-8")
+    remote_folder = "a/remote"
+
+    mock_share_client = _make_share_client({})
+    with patch.object(azure_fileshare, "_share_client", mock_share_client):
+        azure_fileshare.upload({}, str(local_file), f"{remote_folder}/a_file.csv")
+
+        # The remote folder got deleted since the directories were cached:
+        # create them again and retry the upload.
+        mock_share_client.get_directory_client.reset_mock()
+        file_client = Mock(
+            upload_file=Mock(side_effect=[ResourceNotFoundError("ParentNotFound"), None])
+        )
+        mock_share_client.get_file_client.side_effect = None
+        mock_share_client.get_file_client.return_value = file_client
+        azure_fileshare.upload({}, str(local_file), f"{remote_folder}/a_file.csv")
+        assert file_client.upload_file.call_count == 2
+        created_dirs = [
+            call_args.args[0]
+            for call_args in mock_share_client.get_directory_client.call_args_list
+        ]
+        assert created_dirs == ["a/", "a/remote/"]
@@ -74,9 +74,9 @@ def test_wait_network_deployment_retry(
         (404, Status.SUCCEEDED),
     ],
 )
-@patch("mlos_bench.services.remote.azure.azure_deployment_services.requests")
+@patch("mlos_bench.services.remote.azure.azure_deployment_services.requests.Session")
 def test_network_operation_status(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     azure_network_service: AzureNetworkService,
     operation_name: str,
     accepts_params: bool,
@@ -87,7 +87,7 @@ def test_network_operation_status(
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     mock_response = MagicMock()
     mock_response.status_code = http_status_code
-    mock_requests.post.return_value = mock_response
+    mock_session.return_value.post.return_value = mock_response
 
     operation = getattr(azure_network_service, operation_name)
     with pytest.raises(ValueError):
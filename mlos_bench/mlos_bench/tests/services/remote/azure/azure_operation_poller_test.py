@@ -0,0 +1,154 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for mlos_bench.services.remote.azure.azure_operation_poller."""
+
+import time
+
+import pytest
+
+from mlos_bench.environments.status import Status
+from mlos_bench.services.remote.azure.azure_auth import AzureAuthService
+from mlos_bench.services.remote.azure.azure_operation_poller import (
+    AzureOperationPoller,
+)
+from mlos_bench.services.remote.azure.azure_vm_services import AzureVMService
+from mlos_bench.tests.services.remote.azure.mock_arm_server import MockArmServer
+
+# pylint: disable=redefined-outer-name
+
+
+@pytest.fixture
+def azure_vm_service_async(azure_auth_service: AzureAuthService) -> AzureVMService:
+    """Creates a dummy Azure VM service that polls asynchronously."""
+    return AzureVMService(
+        config={
+            "subscription": "TEST_SUB",
+            "resourceGroup": "TEST_RG",
+            "pollAsync": True,
+            "pollInterval": 1,
+            "pollTimeout": 5,
+        },
+        global_config={
+            "vmName": "test-vm",
+        },
+        parent=azure_auth_service,
+    )
+
+
+def test_poller_backoff() -> None:
+    """Grow the poll interval exponentially up to the limit."""
+    timestamps: list[float] = []
+
+    def _check_status(_params: dict) -> tuple[Status, dict]:
+        timestamps.append(time.monotonic())
+        return (Status.SUCCEEDED if len(timestamps) == 4 else Status.RUNNING, {})
+
+    (status, _) = AzureOperationPoller().wait(
+        _check_status,
+        Status.RUNNING,
+        {},
+        poll_interval=0.1,
+        poll_timeout=10,
+        max_poll_interval=0.3,
+        backoff_factor=2.0,
+    )
+    assert status == Status.SUCCEEDED
+    intervals = [ts2 - ts1 for (ts1, ts2) in zip(timestamps, timestamps[1:])]
+    assert intervals == pytest.approx([0.2, 0.3, 0.3], abs=0.08)
+
+
+def test_poller_timeout() -> None:
+    """Return TIMED_OUT if the operation does not complete in time."""
+    (status, _) = AzureOperationPoller().wait(
+        lambda _params: (Status.RUNNING, {}),
+        Status.RUNNING,
+        {},
+        poll_interval=0.1,
+        poll_timeout=0.5,
+        jitter=0.5,
+    )
+    assert status == Status.TIMED_OUT
+
+
+def test_poller_multiplex(
+    azure_vm_service_async: AzureVMService,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Poll many operations concurrently on the shared event loop and honor the
+    Retry-After header.
+    """
+    num_operations = 10
+    retry_after = 0.3
+    urls = [
+        mock_arm_server.add_operation(f"op{i}", num_polls=2, retry_after=retry_after)
+        for i in range(num_operations)
+    ]
+    # pylint: disable=protected-access
+    poller = azure_vm_service_async._OPERATION_POLLER
+    with azure_vm_service_async:
+        start_time = time.monotonic()
+        futures = [
+            poller.submit(
+                azure_vm_service_async._check_operation_status,
+                Status.RUNNING,
+                {"asyncResultsUrl": url},
+                poll_interval=0.1,
+                poll_timeout=10,
+                jitter=0.1,
+            )
+            for url in urls
+        ]
+        results = [future.result() for future in futures]
+        elapsed = time.monotonic() - start_time
+
+    assert all(status == Status.SUCCEEDED for (status, _) in results)
+    # Waiting one after another would take at least 10 * (0.1 + 2 * 0.3) = 7 s.
+    assert elapsed < 3
+    for name in (f"op{i}" for i in range(num_operations)):
+        polls = mock_arm_server.polls[name]
+        assert len(polls) == 3
+        assert all(ts2 - ts1 >= retry_after for (ts1, ts2) in zip(polls, polls[1:]))
+
+
+def test_wait_vm_operation_async(
+    azure_vm_service_async: AzureVMService,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Wait for the VM operation via the async poller."""
+    url = mock_arm_server.add_operation("vm-start", num_polls=1, retry_after=0.1)
+    (status, output) = azure_vm_service_async.wait_host_operation(
+        {"asyncResultsUrl": url, "vmName": "test-vm", "pollInterval": 0.1}
+    )
+    assert status == Status.SUCCEEDED
+    assert output == {"status": "Succeeded"}
+    assert len(mock_arm_server.polls["vm-start"]) == 2
+
+
+def test_wait_vm_operation_async_timeout(
+    azure_vm_service_async: AzureVMService,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Time out waiting for the VM operation via the async poller."""
+    url = mock_arm_server.add_operation("vm-stop", num_polls=1000, retry_after=1)
+    start_time = time.monotonic()
+    (status, _) = azure_vm_service_async.wait_host_operation(
+        {"asyncResultsUrl": url, "vmName": "test-vm", "pollInterval": 0.1}
+    )
+    assert status == Status.TIMED_OUT
+    assert time.monotonic() - start_time < 7
+
+
+def test_poller_thread_only_if_async(
+    azure_vm_service: AzureVMService,
+    azure_vm_service_async: AzureVMService,
+) -> None:
+    """Start the shared poller thread only for the services that poll asynchronously."""
+    # pylint: disable=protected-access
+    event_loop_context = AzureVMService._OPERATION_POLLER._event_loop_context
+    with azure_vm_service:
+        assert event_loop_context._event_loop_thread is None
+    with azure_vm_service_async:
+        assert event_loop_context._event_loop_thread is not None
+    assert event_loop_context._event_loop_thread is None
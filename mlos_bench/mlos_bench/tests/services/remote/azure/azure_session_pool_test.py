@@ -0,0 +1,113 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for mlos_bench.services.remote.azure.azure_session_pool."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from mlos_bench.environments.status import Status
+from mlos_bench.services.remote.azure.azure_auth import AzureAuthService
+from mlos_bench.services.remote.azure.azure_network_services import AzureNetworkService
+from mlos_bench.services.remote.azure.azure_session_pool import AzureSessionPool
+from mlos_bench.services.remote.azure.azure_vm_services import AzureVMService
+from mlos_bench.tests.services.remote.azure.mock_arm_server import MockArmServer
+
+
+def test_session_pool_shared(
+    azure_session_pool: AzureSessionPool,
+    azure_vm_service: AzureVMService,
+    azure_network_service: AzureNetworkService,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Reuse the keep-alive connections across requests and services."""
+    for i in range(5):
+        for service in (azure_vm_service, azure_network_service):
+            url = mock_arm_server.add_operation(f"op-{i}-{id(service)}", num_polls=0)
+            # pylint: disable=protected-access
+            (status, _) = service._check_operation_status({"asyncResultsUrl": url})
+            assert status == Status.SUCCEEDED
+
+    assert mock_arm_server.connections == 1
+    stats = azure_session_pool.get_stats()
+    assert stats == {
+        mock_arm_server.base_url: {
+            "connections": 1,
+            "requests": 10,
+            "idle": 1,
+            "max_size": AzureSessionPool.POOL_MAX_SIZE,
+        }
+    }
+
+
+def test_session_pool_bounded(
+    azure_session_pool: AzureSessionPool,
+    azure_auth_service: AzureAuthService,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Never keep more idle connections to the host than the pool size, and never
+    block the requests waiting for a free connection.
+    """
+    pool_max_size = 2
+    service = AzureVMService(
+        config={
+            "subscription": "TEST_SUB",
+            "resourceGroup": "TEST_RG",
+            "requestPoolMaxSize": pool_max_size,
+        },
+        parent=azure_auth_service,
+    )
+    urls = [mock_arm_server.add_operation(f"op{i}", num_polls=0) for i in range(20)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(
+            executor.map(
+                # pylint: disable=protected-access
+                lambda url: service._check_operation_status({"asyncResultsUrl": url}),
+                urls,
+            )
+        )
+    assert all(status == Status.SUCCEEDED for (status, _) in results)
+    stats = azure_session_pool.get_stats()[mock_arm_server.base_url]
+    assert stats["requests"] == len(urls)
+    assert stats["idle"] <= pool_max_size
+    assert stats["max_size"] == pool_max_size
+
+
+def test_session_pool_retry_throttled(
+    azure_auth_service: AzureAuthService,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Retry the throttled requests."""
+    service = AzureVMService(
+        config={
+            "subscription": "TEST_SUB",
+            "resourceGroup": "TEST_RG",
+            "requestTotalRetries": 3,
+            "requestBackoffFactor": 0.1,
+        },
+        parent=azure_auth_service,
+    )
+    url = mock_arm_server.add_operation("op-throttled", num_polls=0, num_throttled=2)
+    # pylint: disable=protected-access
+    (status, _) = service._check_operation_status({"asyncResultsUrl": url})
+    assert status == Status.SUCCEEDED
+
+    url = mock_arm_server.add_operation("op-failed", num_polls=0, num_throttled=5)
+    (status, _) = service._check_operation_status({"asyncResultsUrl": url})
+    assert status == Status.FAILED
+
+
+def test_session_pool_no_retry_post(
+    azure_session_pool: AzureSessionPool,
+    mock_arm_server: MockArmServer,
+) -> None:
+    """Never resend the throttled non-idempotent requests."""
+    session = azure_session_pool.get_session(total_retries=3, backoff_factor=0.1)
+    url = mock_arm_server.add_operation("op-post", num_polls=0, num_throttled=1)
+    response = session.post(url, timeout=5)
+    assert response.status_code == 429
+    assert mock_arm_server.posts["op-post"] == 1
+    # The status requests are still retried.
+    mock_arm_server.add_operation("op-post", num_polls=0, num_throttled=1)
+    response = session.get(url, timeout=5)
+    assert response.status_code == 200
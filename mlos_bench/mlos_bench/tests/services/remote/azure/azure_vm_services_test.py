@@ -139,9 +139,9 @@ def test_azure_vm_service_custom_data(azure_auth_service: AzureAuthService) -> N
         (404, Status.FAILED),
     ],
 )
-@patch("mlos_bench.services.remote.azure.azure_deployment_services.requests")
+@patch("mlos_bench.services.remote.azure.azure_deployment_services.requests.Session")
 def test_vm_operation_status(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     azure_vm_service: AzureVMService,
     operation_name: str,
     accepts_params: bool,
@@ -152,7 +152,7 @@ def test_vm_operation_status(
     # pylint: disable=too-many-arguments,too-many-positional-arguments
     mock_response = MagicMock()
     mock_response.status_code = http_status_code
-    mock_requests.post.return_value = mock_response
+    mock_session.return_value.post.return_value = mock_response
 
     operation = getattr(azure_vm_service, operation_name)
     with pytest.raises(ValueError):
@@ -280,9 +280,9 @@ def test_wait_vm_operation_retry(
         (404, Status.FAILED),
     ],
 )
-@patch("mlos_bench.services.remote.azure.azure_vm_services.requests")
+@patch("mlos_bench.services.remote.azure.azure_vm_services.requests.Session")
 def test_remote_exec_status(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     azure_vm_service_remote_exec_only: AzureVMService,
     http_status_code: int,
     operation_status: Status,
@@ -295,7 +295,7 @@ def test_remote_exec_status(
     mock_response.json.return_value = {
         "fake response": "body as json to dict",
     }
-    mock_requests.put.return_value = mock_response
+    mock_session.return_value.put.return_value = mock_response
 
     status, _ = azure_vm_service_remote_exec_only.remote_exec(
         script,
@@ -310,9 +310,9 @@ def test_remote_exec_status(
     assert status == operation_status
 
 
-@patch("mlos_bench.services.remote.azure.azure_vm_services.requests")
+@patch("mlos_bench.services.remote.azure.azure_vm_services.requests.Session")
 def test_remote_exec_output(
-    mock_requests: MagicMock,
+    mock_session: MagicMock,
     azure_vm_service_remote_exec_only: AzureVMService,
 ) -> None:
     """Check if HTTP headers from the remote execution on Azure are correct."""
@@ -328,7 +328,7 @@ def test_remote_exec_output(
             "fake response": "body as json to dict",
         }
     )
-    mock_requests.put.return_value = mock_response
+    mock_session.return_value.put.return_value = mock_response
 
     _, cmd_output = azure_vm_service_remote_exec_only.remote_exec(
         script,
@@ -345,7 +345,7 @@ def test_remote_exec_output(
 
     assert async_url_key in cmd_output
 
-    assert mock_requests.put.call_args[1]["json"] == {
+    assert mock_session.return_value.put.call_args[1]["json"] == {
         "location": "TEST_LOCATION",
         "properties": {
             "source": {"script": "; ".join(script)},
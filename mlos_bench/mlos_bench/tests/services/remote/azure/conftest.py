@@ -4,6 +4,7 @@
 #
 """Configuration test fixtures for azure_vm_services in mlos_bench."""
 
+from collections.abc import Generator
 from unittest.mock import patch
 
 import pytest
@@ -15,6 +16,8 @@ from mlos_bench.services.remote.azure import (
     AzureNetworkService,
     AzureVMService,
 )
+from mlos_bench.services.remote.azure.azure_session_pool import AzureSessionPool
+from mlos_bench.tests.services.remote.azure.mock_arm_server import MockArmServer
 
 # pylint: disable=redefined-outer-name
 
@@ -25,6 +28,24 @@ def config_persistence_service() -> ConfigPersistenceService:
     return ConfigPersistenceService()
 
 
+@pytest.fixture(autouse=True)
+def azure_session_pool() -> Generator[AzureSessionPool]:
+    """Drop the HTTP sessions (and mocks thereof) shared by the Azure services after
+    each test.
+    """
+    pool = AzureSessionPool.instance()
+    pool.close()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def mock_arm_server() -> Generator[MockArmServer]:
+    """A local HTTP server that emulates the ARM async operation endpoints."""
+    with MockArmServer().run() as server:
+        yield server
+
+
 @pytest.fixture
 def azure_auth_service(
     config_persistence_service: ConfigPersistenceService,
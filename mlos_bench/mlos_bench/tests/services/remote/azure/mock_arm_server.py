@@ -0,0 +1,146 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+A local HTTP server that emulates the Azure Resource Manager (ARM) async operation
+status endpoints for the Azure services tests.
+
+See Also
+--------
+https://learn.microsoft.com/en-us/azure/azure-resource-manager/management/async-operations
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Generator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class MockArmServer:
+    """
+    Emulates the ARM async operation status endpoints.
+
+    ``GET /operations/{name}`` returns ``{"status": "InProgress"}`` (with the
+    ``Retry-After`` header, if set) for the given number of polls and then
+    ``{"status": "Succeeded"}``. ``POST /operations/{name}`` just returns an empty
+    response. Optionally, the first few requests get throttled with the HTTP 429
+    response.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._operations: dict[str, tuple[int, float | None]] = {}
+        self._throttled: dict[str, int] = {}
+        self.polls: dict[str, list[float]] = defaultdict(list)
+        """Monotonic timestamps of the status requests for each operation."""
+        self.posts: dict[str, int] = defaultdict(int)
+        """Number of the POST requests for each operation."""
+        self.connections = 0
+        """Number of the client connections accepted by the server."""
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+
+    @property
+    def base_url(self) -> str:
+        """The URL of the server, e.g., http://127.0.0.1:12345."""
+        (host, port) = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def add_operation(
+        self,
+        name: str,
+        num_polls: int,
+        retry_after: float | None = None,
+        num_throttled: int = 0,
+    ) -> str:
+        """
+        Register a new operation that completes after `num_polls` status requests.
+        The first `num_throttled` requests get the HTTP 429 (Too Many Requests)
+        response and do not count as polls.
+
+        Returns
+        -------
+        url : str
+            The URL of the operation status endpoint.
+        """
+        with self._lock:
+            self._operations[name] = (num_polls, retry_after)
+            self._throttled[name] = num_throttled
+        return f"{self.base_url}/operations/{name}"
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        arm_server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep the connections alive.
+
+            def setup(self) -> None:
+                super().setup()
+                with arm_server._lock:  # pylint: disable=protected-access
+                    arm_server.connections += 1
+
+            def do_GET(self) -> None:  # pylint: disable=invalid-name
+                """Handle the status requests."""
+                name = self.path.rsplit("/", 1)[-1]
+                # pylint: disable=protected-access
+                with arm_server._lock:
+                    operation = arm_server._operations.get(name)
+                    if operation is None:
+                        self._reply(404, {"error": f"Unknown operation: {name}"})
+                        return
+                    if arm_server._throttled[name] > 0:
+                        arm_server._throttled[name] -= 1
+                        self._reply(429, {"error": "Too many requests"})
+                        return
+                    arm_server.polls[name].append(time.monotonic())
+                    (num_polls, retry_after) = operation
+                    arm_server._operations[name] = (num_polls - 1, retry_after)
+                if num_polls > 0:
+                    headers = {} if retry_after is None else {"Retry-After": str(retry_after)}
+                    self._reply(200, {"status": "InProgress"}, headers)
+                else:
+                    self._reply(200, {"status": "Succeeded"})
+
+            def do_POST(self) -> None:  # pylint: disable=invalid-name
+                """Handle the (mutating) action requests."""
+                name = self.path.rsplit("/", 1)[-1]
+                # pylint: disable=protected-access
+                with arm_server._lock:
+                    arm_server.posts[name] += 1
+                    if arm_server._throttled.get(name, 0) > 0:
+                        arm_server._throttled[name] -= 1
+                        self._reply(429, {"error": "Too many requests"})
+                        return
+                self._reply(200, {})
+
+            def _reply(self, code: int, body: dict, headers: dict | None = None) -> None:
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for key, val in (headers or {}).items():
+                    self.send_header(key, val)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: object) -> None:
+                # pylint: disable=redefined-builtin
+                pass
+
+        return _Handler
+
+    @contextmanager
+    def run(self) -> Generator["MockArmServer"]:
+        """Serve the requests in a background thread."""
+        thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            self._server.shutdown()
+            self._server.server_close()
+            thread.join()
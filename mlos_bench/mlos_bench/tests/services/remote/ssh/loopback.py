@@ -0,0 +1,135 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+In-process loopback SSH servers for the SSH service tests that do not require docker.
+
+Each server accepts any client without authentication and runs the requested
+commands in a local shell with the ``MLOS_TEST_SSH_SERVER`` environment variable
+set to the name of the server, so the tests can tell which host ran the script.
+The servers also provide SFTP (and SCP) access to the local file system.
+"""
+
+import asyncio
+import os
+import signal
+from collections.abc import Generator
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+import asyncssh
+
+from mlos_bench.event_loop_context import EventLoopContext
+
+
+@dataclass
+class LoopbackSshServerInfo:
+    """A data class for the loopback SSH server connection info."""
+
+    name: str
+    hostname: str
+    port: int
+
+    def to_ssh_service_config(self) -> dict:
+        """Convert to a per-host config dict for SshService."""
+        return {
+            "ssh_hostname": self.hostname,
+            "ssh_port": self.port,
+        }
+
+
+class _LoopbackSshServer(asyncssh.SSHServer):
+    """SSH server that lets any client in."""
+
+    def begin_auth(self, username: str) -> bool:
+        return False
+
+
+class _LoopbackSshServerGroup:
+    """Runs several loopback SSH servers in a background event loop."""
+
+    def __init__(self) -> None:
+        self._event_loop_context = EventLoopContext()
+        self._servers: list[asyncssh.SSHAcceptor] = []
+        self._procs: set[asyncio.subprocess.Process] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def _start_server(self, name: str) -> LoopbackSshServerInfo:
+        async def _handle_process(process: asyncssh.SSHServerProcess) -> None:
+            task = asyncio.current_task()
+            assert task is not None
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            proc = await asyncio.create_subprocess_shell(
+                process.command,
+                executable="/bin/bash",
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env={**os.environ, "MLOS_TEST_SSH_SERVER": name},
+                start_new_session=True,
+            )
+            self._procs.add(proc)
+            try:
+                (stdout, stderr) = await proc.communicate()
+            finally:
+                self._procs.discard(proc)
+            process.stdout.write(stdout.decode())
+            process.stderr.write(stderr.decode())
+            process.exit(proc.returncode or 0)
+
+        server = await asyncssh.listen(
+            host="127.0.0.1",
+            port=0,
+            server_host_keys=[asyncssh.generate_private_key("ssh-ed25519")],
+            server_factory=_LoopbackSshServer,
+            process_factory=_handle_process,
+            sftp_factory=True,
+            allow_scp=True,
+        )
+        self._servers.append(server)
+        return LoopbackSshServerInfo(name=name, hostname="127.0.0.1", port=server.get_port())
+
+    async def _stop_servers(self) -> None:
+        for proc in list(self._procs):
+            if proc.returncode is None:
+                os.killpg(proc.pid, signal.SIGKILL)
+        if self._tasks:
+            await asyncio.wait(self._tasks, timeout=3)
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers = []
+
+    @contextmanager
+    def run(self, names: list[str]) -> Generator[list[LoopbackSshServerInfo]]:
+        """Start the servers with the given names and stop them on exit."""
+        self._event_loop_context.enter()
+        try:
+            yield [
+                self._event_loop_context.run_coroutine(self._start_server(name)).result()
+                for name in names
+            ]
+        finally:
+            self._event_loop_context.run_coroutine(self._stop_servers()).result()
+            self._event_loop_context.exit()
+
+
+@contextmanager
+def loopback_ssh_servers(names: list[str]) -> Generator[list[LoopbackSshServerInfo]]:
+    """
+    Context manager to run loopback SSH servers with the given names.
+
+    Parameters
+    ----------
+    names : list[str]
+        Names of the servers. Each server exports its name to the scripts
+        it runs in the ``MLOS_TEST_SSH_SERVER`` environment variable.
+
+    Returns
+    -------
+    list[LoopbackSshServerInfo]
+        Connection info for each of the servers, in the same order as `names`.
+    """
+    with _LoopbackSshServerGroup().run(names) as servers:
+        yield servers
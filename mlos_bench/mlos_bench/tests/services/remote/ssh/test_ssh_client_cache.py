@@ -0,0 +1,129 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for the SshClientCache connection management using loopback SSH servers."""
+
+import asyncio
+import sys
+from collections.abc import Generator
+from typing import Any
+
+import asyncssh
+import pytest
+
+from mlos_bench.services.remote.ssh.ssh_service import SshClientCache
+from mlos_bench.tests.services.remote.ssh.loopback import (
+    LoopbackSshServerInfo,
+    loopback_ssh_servers,
+)
+
+# pylint: disable=redefined-outer-name
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Loopback SSH servers require a POSIX shell",
+)
+
+
+@pytest.fixture
+def loopback_servers() -> Generator[list[LoopbackSshServerInfo]]:
+    """Two in-process loopback SSH servers."""
+    with loopback_ssh_servers(["server1", "server2"]) as servers:
+        yield servers
+
+
+def _connect_params(server: LoopbackSshServerInfo) -> dict:
+    """Get the asyncssh connection parameters for the loopback server."""
+    return {
+        "host": server.hostname,
+        "port": server.port,
+        "known_hosts": None,
+    }
+
+
+def test_ssh_client_cache_parallel_connect(
+    loopback_servers: list[LoopbackSshServerInfo],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Connect to distinct hosts concurrently and coalesce the connects to the same
+    host.
+    """
+    create_connection = asyncssh.create_connection
+    active = 0
+    max_active = 0
+    num_connects = 0
+
+    async def _slow_create_connection(*args: Any, **kwargs: Any) -> Any:
+        nonlocal active, max_active, num_connects
+        num_connects += 1
+        active += 1
+        max_active = max(max_active, active)
+        try:
+            await asyncio.sleep(0.5)
+            return await create_connection(*args, **kwargs)
+        finally:
+            active -= 1
+
+    monkeypatch.setattr(asyncssh, "create_connection", _slow_create_connection)
+
+    async def _test() -> None:
+        cache = SshClientCache()
+        try:
+            connections = await asyncio.gather(
+                *(
+                    cache.get_client_connection(_connect_params(server))
+                    for server in loopback_servers + loopback_servers
+                )
+            )
+            assert len(cache) == 2
+            # Concurrent requests to the same host share the connection.
+            assert connections[0][0] is connections[2][0]
+            assert connections[1][0] is connections[3][0]
+            assert connections[0][0] is not connections[1][0]
+        finally:
+            cache.cleanup()
+
+    asyncio.run(_test())
+    assert num_connects == 2
+    assert max_active == 2
+
+
+def test_ssh_client_cache_reconnect(loopback_servers: list[LoopbackSshServerInfo]) -> None:
+    """Replace the closed connection on the next request."""
+
+    async def _test() -> None:
+        cache = SshClientCache()
+        try:
+            params = _connect_params(loopback_servers[0])
+            (connection, _client) = await cache.get_client_connection(params)
+            assert await cache.get_client_connection(params) == (connection, _client)
+            connection.close()
+            await connection.wait_closed()
+            (new_connection, _client) = await cache.get_client_connection(params)
+            assert new_connection is not connection
+            assert not new_connection.is_closed()
+            assert len(cache) == 1
+        finally:
+            cache.cleanup()
+
+    asyncio.run(_test())
+
+
+def test_ssh_client_cache_lru_eviction(loopback_servers: list[LoopbackSshServerInfo]) -> None:
+    """Close the least recently used connections beyond the cache size limit."""
+
+    async def _test() -> None:
+        cache = SshClientCache(max_size=1)
+        try:
+            (server1, server2) = loopback_servers
+            (connection1, _) = await cache.get_client_connection(_connect_params(server1))
+            (connection2, _) = await cache.get_client_connection(_connect_params(server2))
+            assert len(cache) == 1
+            await connection1.wait_closed()
+            assert connection1.is_closed()
+            assert not connection2.is_closed()
+        finally:
+            cache.cleanup()
+
+    asyncio.run(_test())
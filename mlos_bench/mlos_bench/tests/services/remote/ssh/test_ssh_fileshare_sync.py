@@ -0,0 +1,199 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for the sync mode of SshFileShareService using a loopback SSH server."""
+
+import os
+import sys
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import asyncssh
+import pytest
+
+from mlos_bench.services.remote.ssh.ssh_fileshare import SshFileShareService
+from mlos_bench.tests.services.remote.ssh.loopback import (
+    LoopbackSshServerInfo,
+    loopback_ssh_servers,
+)
+
+# pylint: disable=redefined-outer-name
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Loopback SSH servers require a POSIX shell",
+)
+
+
+@pytest.fixture
+def loopback_server() -> Generator[LoopbackSshServerInfo]:
+    """In-process loopback SSH server."""
+    with loopback_ssh_servers(["server"]) as servers:
+        yield servers[0]
+
+
+@pytest.fixture
+def transferred_files(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Keep track of the source paths of all SFTP file transfers."""
+    transfers: list[str] = []
+    sftp_put = asyncssh.SFTPClient.put
+    sftp_get = asyncssh.SFTPClient.get
+
+    async def _put(self: asyncssh.SFTPClient, src: str, *args: Any, **kwargs: Any) -> None:
+        transfers.append(src)
+        await sftp_put(self, src, *args, **kwargs)
+
+    async def _get(self: asyncssh.SFTPClient, src: str, *args: Any, **kwargs: Any) -> None:
+        transfers.append(src)
+        await sftp_get(self, src, *args, **kwargs)
+
+    monkeypatch.setattr(asyncssh.SFTPClient, "put", _put)
+    monkeypatch.setattr(asyncssh.SFTPClient, "get", _get)
+    return transfers
+
+
+def _write_tree(root: Path, files: dict[str, str]) -> None:
+    """Create the files with the given contents."""
+    for rel_path, text in files.items():
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(text, encoding="utf-8")
+
+
+def _read_tree(root: Path) -> dict[str, str]:
+    """Read all files in the directory tree."""
+    return {
+        str(path.relative_to(root)): path.read_text(encoding="utf-8")
+        for path in root.rglob("*")
+        if path.is_file()
+    }
+
+
+def test_ssh_fileshare_sync_upload(
+    loopback_server: LoopbackSshServerInfo,
+    transferred_files: list[str],
+    tmp_path: Path,
+) -> None:
+    """Upload only the new and changed files on the second sync."""
+    local_dir = tmp_path / "local"
+    remote_dir = tmp_path / "remote"
+    files = {"a.txt": "a", "conf/b.txt": "b", "conf/sub/c.txt": "c"}
+    _write_tree(local_dir, files)
+    # Like scp, upload the directory into the existing remote one.
+    remote_dir.mkdir()
+
+    with SshFileShareService(
+        config={"ssh_sync": True, "ssh_max_parallel_transfers": 2}
+    ) as fileshare_service:
+        params = loopback_server.to_ssh_service_config()
+        fileshare_service.upload(params, str(local_dir), str(remote_dir))
+        assert _read_tree(remote_dir / "local") == files
+        assert len(transferred_files) == 3
+
+        transferred_files.clear()
+        fileshare_service.upload(params, str(local_dir), str(remote_dir))
+        assert not transferred_files
+
+        # Only touch the changed files: the sync compares the mtimes (in seconds),
+        # so rewriting an unchanged file would make it look modified.
+        changed_files = {"conf/b.txt": "bb", "d.txt": "d"}
+        _write_tree(local_dir, changed_files)
+        files.update(changed_files)
+        fileshare_service.upload(params, str(local_dir), str(remote_dir))
+        assert _read_tree(remote_dir / "local") == files
+        assert sorted(transferred_files) == [
+            str(local_dir / "conf/b.txt"),
+            str(local_dir / "d.txt"),
+        ]
+
+
+def test_ssh_fileshare_sync_upload_into_dir(
+    loopback_server: LoopbackSshServerInfo,
+    tmp_path: Path,
+) -> None:
+    """Upload the file and the directory into an existing remote directory."""
+    local_dir = tmp_path / "local"
+    remote_dir = tmp_path / "remote"
+    _write_tree(local_dir, {"a.txt": "a"})
+    remote_dir.mkdir()
+
+    with SshFileShareService(config={"ssh_sync": True}) as fileshare_service:
+        params = loopback_server.to_ssh_service_config()
+        fileshare_service.upload(params, str(local_dir / "a.txt"), str(remote_dir / "sub"))
+        fileshare_service.upload(params, str(local_dir / "a.txt"), str(remote_dir))
+        _write_tree(local_dir, {"b.txt": "b"})
+        fileshare_service.upload(params, str(local_dir), str(remote_dir))
+        assert _read_tree(remote_dir) == {
+            "a.txt": "a",
+            "sub": "a",
+            "local/a.txt": "a",
+            "local/b.txt": "b",
+        }
+
+
+def test_ssh_fileshare_sync_download(
+    loopback_server: LoopbackSshServerInfo,
+    transferred_files: list[str],
+    tmp_path: Path,
+) -> None:
+    """Download only the changed files and skip the subdirectories if not
+    recursive.
+    """
+    remote_dir = tmp_path / "remote"
+    local_dir = tmp_path / "local"
+    files = {"a.txt": "a", "conf/b.txt": "b"}
+    _write_tree(remote_dir, files)
+    local_dir.mkdir()
+
+    with SshFileShareService(config={"ssh_sync": True}) as fileshare_service:
+        params = loopback_server.to_ssh_service_config()
+        fileshare_service.download(params, str(remote_dir), str(local_dir), recursive=False)
+        assert _read_tree(local_dir) == {"remote/a.txt": "a"}
+
+        fileshare_service.download(params, str(remote_dir), str(local_dir))
+        assert _read_tree(local_dir / "remote") == files
+
+        transferred_files.clear()
+        (remote_dir / "a.txt").write_text("aa", encoding="utf-8")
+        fileshare_service.download(params, str(remote_dir), str(local_dir))
+        assert transferred_files == [str(remote_dir / "a.txt")]
+        assert _read_tree(local_dir / "remote") == {"a.txt": "aa", "conf/b.txt": "b"}
+
+        with pytest.raises(FileNotFoundError):
+            fileshare_service.download(
+                params,
+                os.path.join(str(remote_dir), "missing.txt"),
+                str(local_dir / "missing.txt"),
+            )
+
+
+@pytest.mark.parametrize("dst_exists", [False, True])
+@pytest.mark.parametrize("src_is_dir", [False, True])
+def test_ssh_fileshare_sync_same_layout_as_scp(
+    loopback_server: LoopbackSshServerInfo,
+    tmp_path: Path,
+    src_is_dir: bool,
+    dst_exists: bool,
+) -> None:
+    """The sync and the scp modes put the files at the same destination paths."""
+    src_dir = tmp_path / "src"
+    _write_tree(src_dir, {"a.txt": "a", "conf/b.txt": "b"})
+    src_path = src_dir if src_is_dir else src_dir / "a.txt"
+    layouts = {}
+    for sync in (False, True):
+        for mode in ("upload", "download"):
+            root = tmp_path / f"{mode}-{sync}"
+            root.mkdir()
+            dst_path = root / "dst"
+            if dst_exists:
+                dst_path.mkdir()
+            with SshFileShareService(config={"ssh_sync": sync}) as fileshare_service:
+                params = loopback_server.to_ssh_service_config()
+                if mode == "upload":
+                    fileshare_service.upload(params, str(src_path), str(dst_path))
+                else:
+                    fileshare_service.download(params, str(src_path), str(dst_path))
+            layouts[(sync, mode)] = _read_tree(root)
+
+    assert len({str(layout) for layout in layouts.values()}) == 1, layouts
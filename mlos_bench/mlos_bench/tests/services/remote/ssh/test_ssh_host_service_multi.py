@@ -0,0 +1,127 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for running the same script on several hosts with SshHostService."""
+
+import asyncio
+import sys
+import time
+from collections.abc import Generator
+from concurrent.futures import Future
+
+import pytest
+
+from mlos_bench.environments.status import Status
+from mlos_bench.services.remote.ssh.ssh_host_service import SshHostService
+from mlos_bench.tests.services.remote.ssh.loopback import (
+    LoopbackSshServerInfo,
+    loopback_ssh_servers,
+)
+
+# pylint: disable=redefined-outer-name
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32",
+    reason="Loopback SSH servers require a POSIX shell",
+)
+
+
+@pytest.fixture
+def loopback_servers() -> Generator[list[LoopbackSshServerInfo]]:
+    """Two in-process loopback SSH servers."""
+    with loopback_ssh_servers(["client", "server"]) as servers:
+        yield servers
+
+
+def test_ssh_service_remote_exec_multi(loopback_servers: list[LoopbackSshServerInfo]) -> None:
+    """Run the same script on all hosts concurrently and collect per-host results."""
+    with SshHostService(config={"ssh_request_timeout": 30}) as ssh_host_service:
+        start_time = time.monotonic()
+        (status, results_info) = ssh_host_service.remote_exec_multi(
+            script=["sleep 1", "echo $MLOS_TEST_SSH_SERVER $FOO"],
+            configs=[server.to_ssh_service_config() for server in loopback_servers],
+            env_params={"FOO": "bar"},
+        )
+        assert status.is_pending()
+        (status, results) = ssh_host_service.get_remote_exec_multi_results(results_info)
+        # The hosts run the script concurrently, not one after another.
+        assert time.monotonic() - start_time < 2 * len(loopback_servers)
+        assert status.is_succeeded()
+        assert [host_status for (host_status, _) in results["hosts"]] == [
+            Status.SUCCEEDED,
+            Status.SUCCEEDED,
+        ]
+        assert [output["stdout"] for (_, output) in results["hosts"]] == [
+            "client bar\n",
+            "server bar\n",
+        ]
+        assert results["stdout"] == "client bar\nserver bar\n"
+
+
+def test_ssh_service_remote_exec_multi_fail(
+    loopback_servers: list[LoopbackSshServerInfo],
+) -> None:
+    """The overall status is FAILED if the script fails on any of the hosts."""
+    with SshHostService(config={"ssh_request_timeout": 30}) as ssh_host_service:
+        (status, results_info) = ssh_host_service.remote_exec_multi(
+            script=['[ "$MLOS_TEST_SSH_SERVER" = client ]'],
+            configs=[server.to_ssh_service_config() for server in loopback_servers],
+            env_params={},
+        )
+        assert status.is_pending()
+        (status, results) = ssh_host_service.get_remote_exec_multi_results(results_info)
+        assert status.is_failed()
+        assert [host_status for (host_status, _) in results["hosts"]] == [
+            Status.SUCCEEDED,
+            Status.FAILED,
+        ]
+
+
+def test_ssh_service_remote_exec_multi_timeout(
+    loopback_servers: list[LoopbackSshServerInfo],
+) -> None:
+    """A host that runs for too long times out without holding up the other ones."""
+    with SshHostService(config={"ssh_request_timeout": 30}) as ssh_host_service:
+        (client, server) = loopback_servers
+        start_time = time.monotonic()
+        (status, results_info) = ssh_host_service.remote_exec_multi(
+            script=['[ "$MLOS_TEST_SSH_SERVER" = client ] || sleep 30'],
+            configs=[
+                client.to_ssh_service_config(),
+                {**server.to_ssh_service_config(), "ssh_request_timeout": 1},
+            ],
+            env_params={},
+        )
+        assert status.is_pending()
+        (status, results) = ssh_host_service.get_remote_exec_multi_results(results_info)
+        assert time.monotonic() - start_time < 10
+        assert status.is_timed_out()
+        assert [host_status for (host_status, _) in results["hosts"]] == [
+            Status.SUCCEEDED,
+            Status.TIMED_OUT,
+        ]
+
+
+def test_ssh_service_remote_exec_multi_missing_hostname() -> None:
+    """Each host config must have the ssh_hostname."""
+    with SshHostService() as ssh_host_service:
+        with pytest.raises(ValueError):
+            ssh_host_service.remote_exec_multi(
+                script=["true"],
+                configs=[{"ssh_port": 22}],
+                env_params={},
+            )
+
+
+def test_ssh_service_remote_exec_multi_asyncio_timeout() -> None:
+    """The asyncio timeout errors (distinct from TimeoutError on Python 3.10) map to
+    TIMED_OUT."""
+    future: Future = Future()
+    future.set_result([asyncio.TimeoutError("timed out")])
+    with SshHostService() as ssh_host_service:
+        (status, results) = ssh_host_service.get_remote_exec_multi_results(
+            {"hosts": ["host1"], "asyncRemoteExecMultiResultsFuture": future}
+        )
+        assert status.is_timed_out()
+        assert [host_status for (host_status, _) in results["hosts"]] == [Status.TIMED_OUT]
@@ -29,6 +29,15 @@ def test_exp_pending_empty(exp_storage: Storage.Experiment) -> None:
     assert not trials
 
 
+def test_exp_checkpoint_trial_id(exp_storage: Storage.Experiment) -> None:
+    """Record the last trial ID covered by the optimizer checkpoint."""
+    assert exp_storage.get_checkpoint_trial_id() is None
+    exp_storage.set_checkpoint_trial_id(5)
+    assert exp_storage.get_checkpoint_trial_id() == 5
+    exp_storage.set_checkpoint_trial_id(None)
+    assert exp_storage.get_checkpoint_trial_id() is None
+
+
 @pytest.mark.parametrize(("zone_info"), ZONE_INFO)
 def test_exp_trial_pending(
     exp_storage: Storage.Experiment,
@@ -15,7 +15,7 @@ from mlos_bench.tests.storage.sql.fixtures import DOCKER_DBMS_FIXTURES
 # NOTE: This value is hardcoded to the latest revision in the alembic versions directory.
 # It could also be obtained programmatically using the "alembic heads" command or heads() API.
 # See Also: schema.py for an example of programmatic alembic config access.
-CURRENT_ALEMBIC_HEAD = "b61aa446e724"
+CURRENT_ALEMBIC_HEAD = "3c1e6f0a2b9d"
 
 # Try to test multiple DBMS engines.
 
@@ -38,6 +38,10 @@ def test_storage_schemas(some_sql_storage_fixture: SqlStorage) -> None:
         assert any(
             column["name"] == "trial_runner_id" for column in inspect(conn).get_columns("trial")
         )
+        assert any(
+            column["name"] == "checkpoint_trial_id"
+            for column in inspect(conn).get_columns("experiment")
+        )
         # Make sure the "alembic_version" table exists and is appropriately stamped.
         assert inspector.has_table("alembic_version")
         context = MigrationContext.configure(conn)
@@ -0,0 +1,153 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for the tracing spans of the mlos_bench optimization loop."""
+
+import json
+import os
+from collections.abc import Iterator
+
+import pytest
+
+from mlos_bench.launcher import Launcher
+from mlos_bench.run import _main
+from mlos_bench.tracing import TELEMETRY_PREFIX, TRACER, Tracer, trace_methods, traced
+
+_LOCAL_ENV_ARGV = [
+    "--config",
+    "mlos_bench/mlos_bench/tests/config/cli/test-cli-local-env-bench.jsonc",
+    "--globals",
+    "experiment_test_local.jsonc",
+    "--tunable_values",
+    "tunable-values/tunable-values-local.jsonc",
+]
+
+
+@pytest.fixture
+def tracer() -> Iterator[Tracer]:
+    """Make sure the global tracer is reset after the test."""
+    yield TRACER
+    TRACER.disable()
+    TRACER.clear()
+
+
+def test_tracer_spans() -> None:
+    """Record the nested spans with the inherited attributes."""
+    tracer = Tracer()
+    with tracer.span("disabled") as span:
+        assert span is None
+    tracer.enable()
+    with tracer.span("trial", "test", trial_id=1, experiment_id="exp") as outer:
+        assert tracer.current_span is outer
+        with tracer.span("call", "test", key="key", extra=True):
+            with tracer.span("call", "test", key="key") as same:
+                # Same key as the enclosing span: no new span.
+                assert same is tracer.current_span
+        with pytest.raises(ValueError):
+            with tracer.span("fail", "test"):
+                raise ValueError("oops")
+    assert tracer.current_span is None
+
+    spans = {span.name: span for span in tracer.spans}
+    assert list(spans) == ["call", "fail", "trial"]
+    assert spans["call"].attributes == {"extra": True, "trial_id": 1, "experiment_id": "exp"}
+    assert spans["fail"].attributes["error"] == "ValueError"
+    assert spans["trial"].duration >= spans["call"].duration + spans["fail"].duration
+    assert spans["trial"].start_time <= spans["call"].start_time
+    # The nested spans are not collected unless requested.
+    assert not spans["trial"].telemetry()
+
+    tracer.clear()
+    assert not tracer.spans
+
+
+def test_tracer_collect() -> None:
+    """Collect the nested spans (e.g., of a trial) as telemetry."""
+    tracer = Tracer()
+    tracer.enable(per_trial=True)
+    with tracer.span("trial", collect=True) as trial:
+        with tracer.span("setup"):
+            with tracer.span("exec"):
+                pass
+        with tracer.span("run"):
+            pass
+    assert trial is not None
+    assert [name for (_ts, name, _val) in trial.telemetry()] == [
+        TELEMETRY_PREFIX + name for name in ("exec", "setup", "run")
+    ]
+    assert all(duration >= 0 for (_ts, _name, duration) in trial.telemetry())
+
+
+def test_traced_methods(tracer: Tracer) -> None:
+    """Trace the overridden methods only once."""
+
+    class _Base:
+        @traced("test", lambda obj, *_args, **_kwargs: {"value": obj.value})
+        def compute(self) -> int:
+            return 1
+
+        def __init_subclass__(cls) -> None:
+            super().__init_subclass__()
+            trace_methods(cls, ["compute"], "test")
+
+        @property
+        def value(self) -> int:
+            return 42
+
+    class _Derived(_Base):
+        def compute(self) -> int:
+            return super().compute() + 1
+
+    assert _Derived().compute() == 2
+    assert not tracer.spans
+    tracer.enable()
+    assert _Derived().compute() == 2
+    assert [(span.name, span.category) for span in tracer.spans] == [("_Derived.compute", "test")]
+
+
+def test_chrome_trace(tracer: Tracer, tmp_path: str) -> None:
+    """Export the trace of a local environment run to a Chrome trace JSON file."""
+    trace_file = os.path.join(tmp_path, "trace.json")
+    (score, _config) = _main([*_LOCAL_ENV_ARGV, "--trace-file", trace_file])
+    assert score is not None
+    assert not tracer.enabled
+
+    with open(trace_file, encoding="utf-8") as fh_trace:
+        trace = json.load(fh_trace)
+    events = {event["name"]: event for event in trace["traceEvents"] if event["ph"] == "X"}
+    assert {
+        "SyncScheduler.run_trial",
+        "TrialRunner.run_trial",
+        "LocalEnv.setup",
+        "LocalEnv.run",
+        "LocalExecService.local_exec",
+        "OneShotOptimizer.suggest",
+        "Trial.update",
+    } <= set(events)
+    run_trial = events["TrialRunner.run_trial"]
+    setup = events["LocalEnv.setup"]
+    assert setup["cat"] == "environment"
+    assert setup["args"]["env"] == "Local Shell Test Environment"
+    assert setup["args"]["trial_id"] == run_trial["args"]["trial_id"] == 1
+    assert run_trial["ts"] <= setup["ts"]
+    assert setup["ts"] + setup["dur"] <= run_trial["ts"] + run_trial["dur"]
+
+
+def test_trace_per_trial(tracer: Tracer) -> None:
+    """Store the timings of each trial's calls in the trial telemetry."""
+    launcher = Launcher("mlos_bench", "Tracing test", [*_LOCAL_ENV_ARGV, "--trace-per-trial"])
+    assert tracer.enabled and tracer.per_trial
+    with launcher.scheduler as scheduler:
+        scheduler.start()
+        scheduler.teardown()
+    experiment = launcher.storage.experiments[launcher.global_config["experiment_id"]]
+    telemetry = experiment.trials[1].telemetry_df
+    metrics = set(telemetry["metric"])
+    assert {
+        TELEMETRY_PREFIX + "LocalEnv.setup",
+        TELEMETRY_PREFIX + "LocalEnv.run",
+        TELEMETRY_PREFIX + "LocalExecService.local_exec",
+    } <= metrics
+    durations = telemetry[telemetry["metric"].str.startswith(TELEMETRY_PREFIX)]["value"]
+    assert (durations.astype(float) >= 0).all()
@@ -5,10 +5,12 @@
 """Unit tests for get_git_info utility function."""
 import os
 import re
+import subprocess
 import tempfile
 from pathlib import Path
 from subprocess import CalledProcessError
 from subprocess import check_call as run
+from typing import Any
 
 import pytest
 
@@ -95,3 +97,55 @@ def test_github_actions_git_info() -> None:
     assert (
         git_commit == sha_env
     ), f"git_commit '{git_commit}' does not match GITHUB_SHA '{sha_env}'"
+
+
+def test_git_info_no_subprocess(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Check that we read the git metadata directly (without running git) and get the
+    same results as git itself.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_dir = path_join(tmp_dir, abs_path=True)
+        # Isolate the test from the user's global git config.
+        monkeypatch.setenv("HOME", tmp_dir)
+        monkeypatch.setenv("XDG_CONFIG_HOME", tmp_dir)
+        local_git_dir = path_join(tmp_dir, "repo")
+        run(["git", "init", local_git_dir, "-b", "main"])
+        run(["git", "-C", local_git_dir, "config", "--local", "user.email", "pytest@example.com"])
+        run(["git", "-C", local_git_dir, "config", "--local", "user.name", "PyTest User"])
+        run(["git", "-C", local_git_dir, "remote", "add", "origin", "https://example.com/o.git"])
+        run(["git", "-C", local_git_dir, "remote", "add", "upstream", "https://example.com/u.git"])
+        Path(local_git_dir).joinpath("README.md").touch()
+        run(["git", "-C", local_git_dir, "add", "README.md"])
+        run(["git", "-C", local_git_dir, "commit", "-m", "Initial commit"])
+        run(["git", "-C", local_git_dir, "config", "branch.main.remote", "upstream"])
+        run(["git", "-C", local_git_dir, "config", "branch.main.merge", "refs/heads/main"])
+        run(["git", "-C", local_git_dir, "update-ref", "refs/remotes/upstream/main", "HEAD"])
+        run(["git", "-C", local_git_dir, "pack-refs", "--all"])
+        worktree_dir = path_join(tmp_dir, "worktree")
+        run(["git", "-C", local_git_dir, "worktree", "add", "--detach", worktree_dir])
+        Path(worktree_dir).joinpath("subdir").mkdir()
+
+        git_commit = subprocess.check_output(
+            ["git", "-C", local_git_dir, "rev-parse", "HEAD"], text=True
+        ).strip()
+
+        def _no_subprocess(*args: Any, **kwargs: Any) -> str:
+            raise AssertionError(f"Unexpected subprocess call: {args} {kwargs}")
+
+        monkeypatch.setattr(subprocess, "check_output", _no_subprocess)
+        readme_path = path_join(local_git_dir, "README.md")
+        assert get_git_root(readme_path) == local_git_dir
+        assert get_git_info(readme_path) == (
+            "https://example.com/u.git",  # The upstream of the "main" branch.
+            git_commit,
+            "README.md",
+            readme_path,
+        )
+        subdir_path = path_join(worktree_dir, "subdir")
+        assert get_git_root(subdir_path) == worktree_dir
+        assert get_git_info(subdir_path) == (
+            "https://example.com/o.git",  # Detached HEAD: use "origin".
+            git_commit,
+            "subdir",
+            subdir_path,
+        )
@@ -0,0 +1,473 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Lightweight in-process tracing of the mlos_bench optimization loop.
+
+The main methods of the :py:class:`~mlos_bench.schedulers.base_scheduler.Scheduler`,
+:py:class:`~mlos_bench.schedulers.trial_runner.TrialRunner`,
+:py:class:`~mlos_bench.environments.base_environment.Environment`,
+:py:class:`~mlos_bench.services.base_service.Service`,
+:py:class:`~mlos_bench.optimizers.base_optimizer.Optimizer`, and the SQL
+:py:class:`~mlos_bench.storage.base_storage.Storage` classes are wrapped in (nested)
+spans that record their wall-clock time along with the experiment, trial, and trial
+runner IDs.
+
+Tracing is disabled by default and then costs a single flag check per call.
+When enabled (e.g., via the ``--trace-file`` or ``--trace-per-trial`` CLI options),
+the spans are kept in memory (no external collector needed) and can be exported to a
+`Chrome trace <https://docs.google.com/document/d/1CvAClvFfyA5R-PhYUmn5OOQtYMH4h6I0nSsKchNAySU>`_
+JSON file (viewable in ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_)
+and/or stored as the telemetry of each trial.
+
+Examples
+--------
+>>> from mlos_bench.tracing import Tracer
+>>> tracer = Tracer()
+>>> tracer.enable()
+>>> with tracer.span("outer", "test", trial_id=1):
+...     with tracer.span("inner", "test"):
+...         pass
+>>> [(span.name, span.attributes) for span in tracer.spans]
+[('inner', {'trial_id': 1}), ('outer', {'trial_id': 1})]
+>>> trace = tracer.to_chrome_trace()
+>>> [event["name"] for event in trace["traceEvents"] if event["ph"] == "X"]
+['inner', 'outer']
+"""
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, ContextManager, TypeVar
+
+from pytz import UTC
+
+_LOG = logging.getLogger(__name__)
+
+_FuncT = TypeVar("_FuncT", bound=Callable[..., Any])
+
+INHERITED_ATTRIBUTES = ("experiment_id", "trial_id", "trial_runner_id")
+"""Span attributes that are passed down to the nested spans."""
+
+TELEMETRY_PREFIX = "trace:"
+"""Prefix of the trial telemetry metric names of the spans."""
+
+
+@dataclass
+class Span:  # pylint: disable=too-many-instance-attributes
+    """A single timed call."""
+
+    name: str
+    """Name of the span, e.g., "LocalEnv.setup"."""
+
+    category: str
+    """Category of the span, e.g., "environment" or "storage"."""
+
+    attributes: dict[str, Any]
+    """Attributes of the span (including the inherited ones)."""
+
+    start_time: float
+    """Start time (in seconds since the epoch)."""
+
+    duration: float = 0.0
+    """Duration (in seconds)."""
+
+    thread_id: int = field(default_factory=threading.get_native_id)
+    """ID of the thread that ran the span."""
+
+    key: Hashable | None = None
+    """Key of the call to avoid the nested spans for the overridden methods."""
+
+    collected: list["Span"] | None = field(default=None, repr=False)
+    """Completed nested spans (if collected for this span, e.g., for a trial)."""
+
+    sink: list["Span"] | None = field(default=None, repr=False)
+    """Where to add this span to when completed (i.e., the nearest collecting
+    ancestor's list).
+    """
+
+    @property
+    def timestamp(self) -> datetime:
+        """Start time of the span as a (UTC) datetime."""
+        return datetime.fromtimestamp(self.start_time, UTC)
+
+    def telemetry(self) -> list[tuple[datetime, str, Any]]:
+        """
+        Get the collected nested spans as telemetry records.
+
+        Returns
+        -------
+        telemetry : list[tuple[datetime, str, Any]]
+            (start timestamp, "trace:<span name>", duration in seconds) records.
+        """
+        return [
+            (span.timestamp, TELEMETRY_PREFIX + span.name, span.duration)
+            for span in self.collected or []
+        ]
+
+
+_CURRENT_SPAN: ContextVar[Span | None] = ContextVar("mlos_bench_current_span", default=None)
+
+
+class Tracer:
+    """Collects the spans of the traced calls in memory."""
+
+    def __init__(self, max_spans: int = 1_000_000):
+        """
+        Create a new (disabled) tracer.
+
+        Parameters
+        ----------
+        max_spans : int
+            Max. number of the spans to keep in memory (the oldest ones are dropped
+            first).
+        """
+        self._enabled = False
+        self._per_trial = False
+        self._spans: deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        # Anchor the high-resolution perf counter to the wall clock time.
+        self._time_offset = time.time() - time.perf_counter()
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(enabled={self._enabled}, spans={len(self._spans)})"
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the spans are being recorded."""
+        return self._enabled
+
+    @property
+    def per_trial(self) -> bool:
+        """Whether to collect the nested spans of each trial to store them in the
+        trial telemetry.
+        """
+        return self._per_trial
+
+    @property
+    def current_span(self) -> Span | None:
+        """The innermost span of the current thread (or task), if any."""
+        return _CURRENT_SPAN.get()
+
+    def enable(self, per_trial: bool = False) -> None:
+        """
+        Start recording the spans.
+
+        Parameters
+        ----------
+        per_trial : bool
+            Whether to collect the nested spans of each trial to store them in the
+            trial telemetry (see :py:meth:`.Span.telemetry`).
+        """
+        self._per_trial = per_trial
+        self._enabled = True
+
+    def disable(self) -> None:
+        """Stop recording the spans."""
+        self._enabled = False
+        self._per_trial = False
+
+    def clear(self) -> None:
+        """Drop all recorded spans."""
+        with self._lock:
+            self._spans.clear()
+
+    @property
+    def spans(self) -> list[Span]:
+        """All recorded spans (in the order of completion)."""
+        with self._lock:
+            return list(self._spans)
+
+    def span(
+        self,
+        name: str,
+        category: str = "",
+        *,
+        key: Hashable | None = None,
+        collect: bool = False,
+        **attributes: Any,
+    ) -> ContextManager[Span | None]:
+        """
+        Record the time spent in the `with` block as a span.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span.
+        category : str
+            Category of the span.
+        key : Hashable | None
+            Optional key of the call. If the enclosing span has the same key, no new
+            span is recorded (e.g., for the overridden methods calling `super()`).
+        collect : bool
+            Whether to collect the nested spans in :py:attr:`.Span.collected`
+            (only if :py:attr:`.per_trial` is enabled).
+        attributes : Any
+            Attributes of the span.
+
+        Returns
+        -------
+        context : ContextManager[Span | None]
+            Context manager that yields the new span (or None when tracing is
+            disabled).
+        """
+        if not self._enabled:
+            return nullcontext()
+        parent = _CURRENT_SPAN.get()
+        sink = None
+        if parent is not None:
+            if key is not None and parent.key == key:
+                return nullcontext(parent)
+            for attr in INHERITED_ATTRIBUTES:
+                if attr in parent.attributes:
+                    attributes.setdefault(attr, parent.attributes[attr])
+            sink = parent.collected if parent.collected is not None else parent.sink
+        span = Span(
+            name=name,
+            category=category,
+            attributes=attributes,
+            start_time=0.0,
+            key=key,
+            collected=[] if collect and self._per_trial else None,
+            sink=sink,
+        )
+        return self._record(span)
+
+    @contextmanager
+    def _record(self, span: Span) -> Iterator[Span]:
+        """Time the span and add it to the records."""
+        start_time = time.perf_counter()
+        span.start_time = start_time + self._time_offset
+        token = _CURRENT_SPAN.set(span)
+        try:
+            yield span
+        except BaseException as ex:
+            span.attributes["error"] = type(ex).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - start_time
+            _CURRENT_SPAN.reset(token)
+            if span.sink is not None:
+                span.sink.append(span)
+            with self._lock:
+                self._spans.append(span)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert the recorded spans to the Chrome trace event format.
+
+        Returns
+        -------
+        trace : dict[str, Any]
+            JSON-serializable Chrome trace.
+        """
+        pid = os.getpid()
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": pid,
+                "args": {"name": "mlos_bench"},
+            }
+        ]
+        for span in self.spans:
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": span.category,
+                    "ph": "X",
+                    "ts": span.start_time * 1e6,
+                    "dur": span.duration * 1e6,
+                    "pid": pid,
+                    "tid": span.thread_id,
+                    "args": {
+                        key: (
+                            val
+                            if val is None or isinstance(val, (bool, int, float, str))
+                            else str(val)
+                        )
+                        for (key, val) in span.attributes.items()
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        """
+        Save the recorded spans to a Chrome trace (Perfetto) JSON file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the output JSON file.
+        """
+        trace = self.to_chrome_trace()
+        with open(path, "w", encoding="utf-8") as fh_trace:
+            json.dump(trace, fh_trace)
+        _LOG.info("Saved %d trace events to: %s", len(trace["traceEvents"]), path)
+
+
+TRACER = Tracer()
+"""The process-wide tracer used by all mlos_bench components."""
+
+
+def traced(
+    category: str,
+    attributes: Callable[..., dict[str, Any]] | None = None,
+    *,
+    collect: bool = False,
+) -> Callable[[_FuncT], _FuncT]:
+    """
+    Decorator to record the calls of the method as spans of the
+    :py:data:`.TRACER`.
+
+    The span is named after the class of the object and the method, e.g.,
+    "LocalEnv.setup".
+    Nested calls of the same method on the same object (e.g., via `super()`) produce
+    only one span.
+
+    Parameters
+    ----------
+    category : str
+        Category of the spans.
+    attributes : Callable[..., dict[str, Any]] | None
+        Optional function to compute the span attributes from the method's
+        arguments (including `self`).
+    collect : bool
+        Whether to collect the nested spans of the calls (e.g., of a trial).
+
+    Returns
+    -------
+    decorator : Callable
+        The decorator for the methods.
+    """
+
+    def _decorator(method: _FuncT) -> _FuncT:
+        method_name = method.__name__
+
+        @functools.wraps(method)
+        def _traced(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not TRACER.enabled:
+                return method(self, *args, **kwargs)
+            attrs = attributes(self, *args, **kwargs) if attributes else {}
+            with TRACER.span(
+                f"{type(self).__name__}.{method_name}",
+                category,
+                key=(id(self), method_name),
+                collect=collect,
+                **attrs,
+            ):
+                return method(self, *args, **kwargs)
+
+        setattr(_traced, "__mlos_traced__", True)
+        return _traced  # type: ignore[return-value]
+
+    return _decorator
+
+
+def trial_span_attributes(trial: Any) -> dict[str, Any]:
+    """
+    Get the span attributes of the :py:class:`~mlos_bench.storage.base_storage.Storage.Trial`.
+
+    Returns
+    -------
+    attributes : dict[str, Any]
+        The experiment, trial, and trial runner IDs of the trial.
+    """
+    return {
+        "experiment_id": trial.experiment_id,
+        "trial_id": trial.trial_id,
+        "trial_runner_id": trial.trial_runner_id,
+    }
+
+
+def trace_methods(
+    cls: type,
+    method_names: Iterable[str],
+    category: str,
+    attributes: Callable[..., dict[str, Any]] | None = None,
+) -> None:
+    """
+    Wrap the given methods defined (or overridden) in the class with
+    :py:func:`.traced`.
+
+    Usually called from the `__init_subclass__` of the base classes, so that all
+    implementations of their main methods are traced.
+
+    Parameters
+    ----------
+    cls : type
+        The class to patch.
+    method_names : Iterable[str]
+        Names of the methods to trace (ignored if not defined in `cls` itself).
+    category : str
+        Category of the spans.
+    attributes : Callable[..., dict[str, Any]] | None
+        Optional function to compute the span attributes from the method's
+        arguments (including `self`).
+    """
+    for method_name in method_names:
+        method = vars(cls).get(method_name)
+        if callable(method) and not getattr(method, "__mlos_traced__", False):
+            setattr(cls, method_name, traced(category, attributes)(method))
+
+
+class _TracedServiceMethod:
+    """A (picklable) wrapper of the bound Service mix-in method that records its calls
+    as spans of the :py:data:`.TRACER`.
+    """
+
+    __mlos_traced__ = True
+
+    def __init__(self, method: Callable[..., Any]):
+        self._method = method
+        owner = getattr(method, "__self__", None)
+        name = getattr(method, "__name__", str(method))
+        if owner is not None:
+            name = f"{type(owner).__name__}.{name}"
+        self._name = name
+        self._key = (id(owner), name)
+        functools.update_wrapper(self, method)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if not TRACER.enabled:
+            return self._method(*args, **kwargs)
+        with TRACER.span(self._name, "service", key=self._key):
+            return self._method(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        # Delegate the rest (e.g., ``__self__``) to the original method.
+        return getattr(self.__dict__["_method"], name)
+
+    def __reduce__(self) -> tuple[Callable[..., Any], tuple[Callable[..., Any]]]:
+        return (trace_service_method, (self._method,))
+
+
+def trace_service_method(method: _FuncT) -> _FuncT:
+    """
+    Wrap the (bound) Service mix-in method to record its calls as spans of the
+    :py:data:`.TRACER`.
+
+    Parameters
+    ----------
+    method : Callable
+        The Service method to trace.
+
+    Returns
+    -------
+    method : Callable
+        The traced method.
+    """
+    if getattr(method, "__mlos_traced__", False):
+        return method
+    return _TracedServiceMethod(method)  # type: ignore[return-value]
@@ -10,6 +10,7 @@ import importlib
 import json
 import logging
 import os
+import re
 import subprocess
 from collections.abc import Callable, Iterable, Mapping
 from datetime import datetime
@@ -274,6 +275,183 @@ def check_required_params(config: Mapping[str, Any], required_params: Iterable[s
         )
 
 
+_GIT_HASH_RE = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+
+_GIT_REPO_CACHE: dict[tuple[str, str | None], tuple[tuple[int, ...], str | None]] = {}
+"""
+Process-level cache of the remote URLs of the git repositories, keyed by the git dir
+and the branch name. The values are the mtimes of the git config files the URL was
+read from, and the URL itself (None, if it has to be resolved by the git command).
+"""
+
+
+def _find_git_dir(path: str) -> tuple[str, str] | None:
+    """
+    Find the git worktree root and the git dir for the given directory without
+    running any git commands.
+
+    Returns
+    -------
+    (git_root, git_dir) : tuple[str, str] | None
+        The root of the working tree and the path to its ``.git`` directory, or
+        None if those cannot be found (or reliably determined) that way.
+    """
+    if any(var in os.environ for var in ("GIT_DIR", "GIT_WORK_TREE", "GIT_COMMON_DIR")):
+        return None
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            return (path, dot_git)
+        if os.path.isfile(dot_git):
+            # Worktrees and submodules have a .git file that points to the git dir.
+            with open(dot_git, encoding="utf-8") as fh_git:
+                line = fh_git.read().strip()
+            if not line.startswith("gitdir:"):
+                return None
+            return (path, os.path.normpath(os.path.join(path, line[len("gitdir:") :].strip())))
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _get_git_common_dir(git_dir: str) -> str:
+    """Get the git dir shared by all worktrees of the repository."""
+    commondir_path = os.path.join(git_dir, "commondir")
+    if not os.path.isfile(commondir_path):
+        return git_dir
+    with open(commondir_path, encoding="utf-8") as fh_commondir:
+        return os.path.normpath(os.path.join(git_dir, fh_commondir.read().strip()))
+
+
+def _read_git_ref(git_dir: str, ref: str, depth: int = 0) -> str | None:
+    """Resolve the git ref (e.g., "refs/heads/main") to a commit hash by reading the
+    loose and packed refs directly.
+    """
+    common_dir = _get_git_common_dir(git_dir)
+    for ref_dir in dict.fromkeys([git_dir, common_dir]):
+        ref_path = os.path.join(ref_dir, ref)
+        if os.path.isfile(ref_path):
+            with open(ref_path, encoding="utf-8") as fh_ref:
+                value = fh_ref.read().strip()
+            if value.startswith("ref:") and depth < 5:
+                return _read_git_ref(git_dir, value[len("ref:") :].strip(), depth + 1)
+            return value if _GIT_HASH_RE.match(value) else None
+    packed_refs_path = os.path.join(common_dir, "packed-refs")
+    if os.path.isfile(packed_refs_path):
+        with open(packed_refs_path, encoding="utf-8") as fh_packed_refs:
+            for line in fh_packed_refs:
+                if line.startswith(("#", "^")):
+                    continue
+                (commit, _, packed_ref) = line.strip().partition(" ")
+                if packed_ref == ref and _GIT_HASH_RE.match(commit):
+                    return commit
+    return None
+
+
+def _read_git_head(git_dir: str) -> tuple[str | None, str | None]:
+    """
+    Read the current branch and commit hash from the git dir.
+
+    Returns
+    -------
+    (branch, commit) : tuple[str | None, str | None]
+        The current branch name (None for detached HEAD) and the commit hash
+        (None if it cannot be resolved without running git).
+    """
+    with open(os.path.join(git_dir, "HEAD"), encoding="utf-8") as fh_head:
+        head = fh_head.read().strip()
+    if not head.startswith("ref:"):
+        return (None, head if _GIT_HASH_RE.match(head) else None)
+    ref = head[len("ref:") :].strip()
+    branch = ref[len("refs/heads/") :] if ref.startswith("refs/heads/") else None
+    return (branch, _read_git_ref(git_dir, ref))
+
+
+def _read_git_config(config_path: str) -> dict[str, dict[str, str]] | None:
+    """
+    Parse the simple git config file into a {section: {key: value}} dictionary,
+    where the section names include the subsection, e.g., 'remote "origin"'.
+
+    Returns None if the config uses the features that we do not handle here
+    (includes, URL rewrites, etc.) and hence must be interpreted by git itself.
+    """
+    config: dict[str, dict[str, str]] = {}
+    section: dict[str, str] = {}
+    with open(config_path, encoding="utf-8") as fh_config:
+        for line in fh_config:
+            line = line.strip()
+            if not line or line.startswith(("#", ";")):
+                continue
+            if line.startswith("["):
+                if not line.endswith("]"):
+                    return None
+                name = line[1:-1].strip()
+                (base, _, subsection) = name.partition(" ")
+                if base.lower().startswith("include"):
+                    return None
+                section = config.setdefault(f"{base.lower()} {subsection}".strip(), {})
+                continue
+            (key, _, value) = line.partition("=")
+            (key, value) = (key.strip().lower(), value.strip())
+            if key == "insteadof" or (
+                key in ("url", "remote", "merge") and any(c in value for c in "#;\\")
+            ):
+                # Leave the URL rewrites, comments, and escapes to git.
+                return None
+            section[key] = value.strip('"')
+    return config
+
+
+def _read_git_repo_url(git_dir: str, branch: str | None) -> str | None:
+    """
+    Get the URL of the upstream (or "origin") remote from the git config files.
+
+    Returns
+    -------
+    git_repo : str | None
+        The remote URL, an empty string if there is no suitable remote, or None
+        if it has to be resolved by the git command.
+    """
+    config_paths = [os.path.join(_get_git_common_dir(git_dir), "config")]
+    xdg_config_home = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    config_paths += [
+        os.path.join(xdg_config_home, "git", "config"),
+        os.path.expanduser("~/.gitconfig"),
+    ]
+    signature = tuple(
+        os.stat(config_path).st_mtime_ns if os.path.isfile(config_path) else 0
+        for config_path in config_paths
+    )
+    cache_key = (git_dir, branch)
+    cached = _GIT_REPO_CACHE.get(cache_key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    git_repo: str | None = None
+    configs = [
+        _read_git_config(config_path) if os.path.isfile(config_path) else {}
+        for config_path in config_paths
+    ]
+    # The global configs may rewrite the remote URLs (handled by git itself), but
+    # are not expected to define the remotes or branches of the local repository.
+    if all(config is not None for config in configs):
+        (local_config, *global_configs) = configs
+        assert local_config is not None
+        branch_config = local_config.get(f'branch "{branch}"', {}) if branch else {}
+        remote = branch_config.get("remote")
+        if not remote or remote == "." or "merge" not in branch_config:
+            remote = "origin"
+        git_repo = local_config.get(f'remote "{remote}"', {}).get("url")
+        if git_repo is None and not any(
+            section.startswith(("remote ", "branch "))
+            for config in global_configs
+            for section in config or {}
+        ):
+            git_repo = ""  # No remotes configured at all.
+    _GIT_REPO_CACHE[cache_key] = (signature, git_repo)
+    return git_repo
+
+
 def get_git_root(path: str = __file__) -> str:
     """
     Get the root dir of the git repository.
@@ -298,6 +476,9 @@ def get_git_root(path: str = __file__) -> str:
         dirname = os.path.dirname(abspath)
     else:
         dirname = abspath
+    git_dirs = _find_git_dir(dirname)
+    if git_dirs is not None:
+        return path_join(git_dirs[0], abs_path=True)
     git_root = subprocess.check_output(
         ["git", "-C", dirname, "rev-parse", "--show-toplevel"], text=True
     ).strip()
@@ -357,6 +538,20 @@ def get_git_repo_info(path: str) -> str:
     # upstream, we should handle it gracefully.
     # (e.g., fallback to the first one we find?)
     path = path_join(path, abs_path=True)
+    git_dirs = _find_git_dir(path)
+    if git_dirs is not None:
+        (branch, _) = _read_git_head(git_dirs[1])
+        git_repo = _read_git_repo_url(git_dirs[1], branch)
+        if git_repo == "":
+            git_repo = "file://" + path
+            _LOG.warning(
+                "Failed to get the upstream branch or 'origin' remote for %s."
+                " Falling back to '%s'.",
+                path,
+                git_repo,
+            )
+        if git_repo is not None:
+            return git_repo
     cmd = ["git", "-C", path, "rev-parse", "--abbrev-ref", "--symbolic-full-name", "HEAD@{u}"]
     try:
         git_remote = subprocess.check_output(cmd, text=True).strip()
@@ -408,9 +603,12 @@ def get_git_info(path: str = __file__) -> tuple[str, str, str, str]:
         dirname = os.path.dirname(abspath)
     git_root = get_git_root(path=abspath)
     git_repo = get_git_repo_info(git_root)
-    git_commit = subprocess.check_output(
-        ["git", "-C", dirname, "rev-parse", "HEAD"], text=True
-    ).strip()
+    git_dirs = _find_git_dir(dirname)
+    git_commit = _read_git_head(git_dirs[1])[1] if git_dirs is not None else None
+    if git_commit is None:
+        git_commit = subprocess.check_output(
+            ["git", "-C", dirname, "rev-parse", "HEAD"], text=True
+        ).strip()
     _LOG.debug("Current git branch for %s: %s %s", git_root, git_repo, git_commit)
     rel_path = os.path.relpath(abspath, os.path.abspath(git_root))
     # TODO: return the branch too?
@@ -69,6 +69,8 @@ extra_requires: dict[str, list[str]] = {  # pylint: disable=consider-using-named
     # Additional tools for extra functionality.
     "azure": ["azure-storage-file-share", "azure-identity", "azure-keyvault"],
     "ssh": ["asyncssh>=2.19.0"],
+    # Reading the benchmark results and telemetry in Parquet format.
+    "parquet": ["pyarrow"],
     "storage-sql-duckdb": ["sqlalchemy", "alembic", "duckdb_engine"],
     "storage-sql-mysql": ["sqlalchemy", "alembic", "mysql-connector-python"],
     "storage-sql-postgres": ["sqlalchemy", "alembic", "psycopg2"],
@@ -35,14 +35,28 @@ for additional documentation and examples in the source tree.
 """
 
 from enum import Enum
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Any
 
 import ConfigSpace
 
-from mlos_core.optimizers.bayesian_optimizers.smac_optimizer import SmacOptimizer
-from mlos_core.optimizers.flaml_optimizer import FlamlOptimizer
 from mlos_core.optimizers.optimizer import BaseOptimizer
 from mlos_core.optimizers.random_optimizer import RandomOptimizer
 from mlos_core.spaces.adapters import SpaceAdapterFactory, SpaceAdapterType
+from mlos_core.util import get_class_from_name
+
+if TYPE_CHECKING:
+    from mlos_core.optimizers.bayesian_optimizers.smac_optimizer import SmacOptimizer
+    from mlos_core.optimizers.flaml_optimizer import FlamlOptimizer
+    from mlos_core.optimizers.quasi_random_optimizer import QuasiRandomOptimizer
+
+    ConcreteOptimizer = RandomOptimizer | FlamlOptimizer | SmacOptimizer | QuasiRandomOptimizer
+    """
+    Type alias for concrete optimizer classes.
+
+    (e.g., :class:`~mlos_core.optimizers.bayesian_optimizers.smac_optimizer.SmacOptimizer`, etc.)
+    """
 
 __all__ = [
     "OptimizerType",
@@ -53,35 +67,63 @@ __all__ = [
     "RandomOptimizer",
     "FlamlOptimizer",
     "SmacOptimizer",
+    "QuasiRandomOptimizer",
 ]
 
 
 class OptimizerType(Enum):
-    """Enumerate supported mlos_core optimizers."""
+    """
+    Enumerate supported mlos_core optimizers.
+
+    The optimizer backends (and their dependencies) are only imported when the
+    :py:attr:`.value` of the respective member is first accessed.
+    """
 
-    RANDOM = RandomOptimizer
+    RANDOM = "mlos_core.optimizers.random_optimizer.RandomOptimizer"
     """An instance of :class:`~mlos_core.optimizers.random_optimizer.RandomOptimizer`
     class will be used.
     """
 
-    FLAML = FlamlOptimizer
+    FLAML = "mlos_core.optimizers.flaml_optimizer.FlamlOptimizer"
     """An instance of :class:`~mlos_core.optimizers.flaml_optimizer.FlamlOptimizer`
     class will be used.
     """
 
-    SMAC = SmacOptimizer
+    SMAC = "mlos_core.optimizers.bayesian_optimizers.smac_optimizer.SmacOptimizer"
     """An instance of
     :class:`~mlos_core.optimizers.bayesian_optimizers.smac_optimizer.SmacOptimizer`
     class will be used.
     """
 
+    QUASI_RANDOM = "mlos_core.optimizers.quasi_random_optimizer.QuasiRandomOptimizer"
+    """An instance of
+    :class:`~mlos_core.optimizers.quasi_random_optimizer.QuasiRandomOptimizer`
+    class will be used.
+    """
 
-ConcreteOptimizer = RandomOptimizer | FlamlOptimizer | SmacOptimizer
-"""
-Type alias for concrete optimizer classes.
+    @property
+    def value(self) -> type["ConcreteOptimizer"]:  # type: ignore[override]
+        """The optimizer class (imported on first access)."""
+        cls: type[ConcreteOptimizer] = get_class_from_name(self._value_)
+        return cls
+
+
+_LAZY_OPTIMIZERS = {
+    "FlamlOptimizer": OptimizerType.FLAML,
+    "SmacOptimizer": OptimizerType.SMAC,
+    "QuasiRandomOptimizer": OptimizerType.QUASI_RANDOM,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the optimizer backends on first use."""
+    if name in _LAZY_OPTIMIZERS:
+        return _LAZY_OPTIMIZERS[name].value
+    if name == "ConcreteOptimizer":
+        # Type alias for concrete optimizer classes (e.g., SmacOptimizer, etc.).
+        return reduce(or_, (member.value for member in OptimizerType))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-(e.g., :class:`~mlos_core.optimizers.bayesian_optimizers.smac_optimizer.SmacOptimizer`, etc.)
-"""
 
 DEFAULT_OPTIMIZER_TYPE = OptimizerType.FLAML
 """Default optimizer type to use if none is specified."""
@@ -103,7 +145,7 @@ class OptimizerFactory:
         optimizer_kwargs: dict | None = None,
         space_adapter_type: SpaceAdapterType = SpaceAdapterType.IDENTITY,
         space_adapter_kwargs: dict | None = None,
-    ) -> ConcreteOptimizer:
+    ) -> "ConcreteOptimizer":
         """
         Create a new optimizer instance, given the parameter space, optimizer type, and
         potential optimizer options.
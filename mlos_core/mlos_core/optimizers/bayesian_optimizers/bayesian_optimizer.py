@@ -6,7 +6,9 @@
 
 from abc import ABCMeta, abstractmethod
 
+import numpy as np
 import numpy.typing as npt
+import pandas as pd
 
 from mlos_core.data_classes import Suggestion
 from mlos_core.optimizers.optimizer import BaseOptimizer
@@ -40,3 +42,59 @@ class BaseBayesianOptimizer(BaseOptimizer, metaclass=ABCMeta):
             The suggestion containing the configuration(s) to evaluate.
         """
         pass  # pylint: disable=unnecessary-pass # pragma: no cover
+
+    def surrogate_predict_batch(self, configs: pd.DataFrame) -> tuple[npt.NDArray, npt.NDArray]:
+        """
+        Obtain the predictions from this Bayesian optimizer's surrogate model for a
+        batch of configurations.
+
+        The default implementation calls :py:meth:`.surrogate_predict` for each
+        configuration, and does not provide the variance (i.e., returns NaN).
+        Subclasses should override it with a vectorized version.
+
+        Parameters
+        ----------
+        configs : pd.DataFrame
+            Dataframe of configurations in the original parameter space.
+            The columns are parameter names and the rows are the configurations.
+
+        Returns
+        -------
+        (mean, variance) : tuple[npt.NDArray, npt.NDArray]
+            The predicted mean and variance for each configuration.
+        """
+        mean = np.array(
+            [
+                self.surrogate_predict(Suggestion(config=config)).item()
+                for (_, config) in configs.iterrows()
+            ],
+            dtype=float,
+        )
+        return (mean, np.full_like(mean, np.nan))
+
+    def acquisition_function_batch(self, configs: pd.DataFrame) -> npt.NDArray:
+        """
+        Invokes the acquisition function from this Bayesian optimizer for a batch of
+        configurations.
+
+        The default implementation calls :py:meth:`.acquisition_function` for each
+        configuration. Subclasses should override it with a vectorized version.
+
+        Parameters
+        ----------
+        configs : pd.DataFrame
+            Dataframe of configurations in the original parameter space.
+            The columns are parameter names and the rows are the configurations.
+
+        Returns
+        -------
+        acquisition_values : npt.NDArray
+            The value of the acquisition function for each configuration.
+        """
+        return np.array(
+            [
+                self.acquisition_function(Suggestion(config=config)).item()
+                for (_, config) in configs.iterrows()
+            ],
+            dtype=float,
+        )
@@ -11,6 +11,8 @@ See the `SMAC3 Documentation <https://automl.github.io/SMAC3/main/index.html>`_
 more details.
 """
 
+import io
+import pickle
 from logging import warning
 from pathlib import Path
 from tempfile import TemporaryDirectory
@@ -18,6 +20,7 @@ from typing import TYPE_CHECKING
 from warnings import warn
 
 import ConfigSpace
+import numpy as np
 import numpy.typing as npt
 import pandas as pd
 
@@ -29,6 +32,32 @@ from mlos_core.spaces.adapters.adapter import BaseSpaceAdapter
 from mlos_core.spaces.adapters.identity_adapter import IdentityAdapter
 
 
+class _SmacStatePickler(pickle.Pickler):
+    """Pickler that stores the given unpicklable objects as None."""
+
+    def __init__(self, file: io.BytesIO, unpicklable: list[object]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._unpicklable_ids = {id(obj) for obj in unpicklable}
+
+    def persistent_id(self, obj: object) -> str | None:
+        return "unpicklable" if id(obj) in self._unpicklable_ids else None
+
+
+class _SmacStateUnpickler(pickle.Unpickler):
+    """Unpickler that restores the objects skipped by the :py:class:`._SmacStatePickler`
+    as None.
+    """
+
+    def persistent_load(self, pid: object) -> None:
+        return None
+
+
+_SMAC_COMPUTE_MAJOR_VERSIONS = frozenset([2])
+"""SMAC major versions whose private ``AbstractAcquisitionFunction._compute()`` method
+(that takes a config array instead of a list of Configurations) is known to work with
+:py:meth:`.SmacOptimizer.acquisition_function_batch`."""
+
+
 class SmacOptimizer(BaseBayesianOptimizer):
     """Wrapper class for SMAC based Bayesian optimization."""
 
@@ -47,6 +76,12 @@ class SmacOptimizer(BaseBayesianOptimizer):
         max_ratio: float | None = None,
         use_default_config: bool = False,
         n_random_probability: float = 0.1,
+        retrain_after: int = 1,
+        max_retrain_time_ratio: float | None = None,
+        n_trees: int = 10,
+        n_jobs: int | None = -1,
+        n_challengers: int = 10000,
+        n_local_search_iterations: int = 10,
     ):
         """
         Instantiate a new SMAC optimizer wrapper.
@@ -102,6 +137,32 @@ class SmacOptimizer(BaseBayesianOptimizer):
         n_random_probability : float
             Probability of choosing to evaluate a random configuration during optimization.
             Defaults to `0.1`. Setting this to a higher value favors exploration over exploitation.
+
+        retrain_after : int
+            Number of suggestions between the refits of the surrogate model.
+            Defaults to `1`, i.e., retrain the model after every new observation.
+            Higher values make the suggestions cheaper for large histories.
+
+        max_retrain_time_ratio : float | None
+            Maximum fraction of the (wall clock) time to spend on the surrogate model
+            refits. If set, the refits are skipped (and the last trained model is
+            reused) while the last refit took more than that fraction of the time
+            since its start. Defaults to `None`, i.e., no time budget.
+
+        n_trees : int
+            Number of trees in the random forest surrogate model. Defaults to `10`.
+
+        n_jobs : int | None
+            Number of parallel jobs to train the random forest and predict with it.
+            Defaults to `-1`, i.e., use all available cores.
+
+        n_challengers : int
+            Number of random configurations to sample when maximizing the
+            acquisition function. Defaults to `10000`.
+
+        n_local_search_iterations : int
+            Number of local search iterations when maximizing the acquisition
+            function. Defaults to `10`.
         """
         super().__init__(
             parameter_space=parameter_space,
@@ -122,6 +183,10 @@ class SmacOptimizer(BaseBayesianOptimizer):
         from smac.runhistory import TrialInfo
         from smac.utils.configspace import convert_configurations_to_array
 
+        from mlos_core.optimizers.bayesian_optimizers.smac_random_forest import (
+            ThrottledRandomForest,
+        )
+
         # Save util function here as a property for later usage, also to satisfy linter
         self._convert_configurations_to_array = convert_configurations_to_array
 
@@ -166,9 +231,30 @@ class SmacOptimizer(BaseBayesianOptimizer):
             scenario,
             max_config_calls=1,
         )
+        assert isinstance(retrain_after, int) and retrain_after >= 1
         config_selector: ConfigSelector = Optimizer_Smac.get_config_selector(
             scenario,
-            retrain_after=1,
+            retrain_after=retrain_after,
+        )
+        # Same as the Optimizer_Smac.get_model() defaults, but with more options.
+        model = ThrottledRandomForest(
+            log_y=True,
+            n_trees=n_trees,
+            bootstrapping=True,
+            ratio_features=1.0,
+            min_samples_split=2,
+            min_samples_leaf=1,
+            max_depth=2**20,
+            configspace=scenario.configspace,
+            instance_features=scenario.instance_features,
+            seed=scenario.seed,
+            n_jobs=n_jobs,
+            max_train_time_ratio=max_retrain_time_ratio,
+        )
+        acquisition_maximizer = Optimizer_Smac.get_acquisition_maximizer(
+            scenario,
+            challengers=n_challengers,
+            local_search_iterations=n_local_search_iterations,
         )
 
         # TODO: When bulk registering prior configs to rewarm the optimizer,
@@ -227,6 +313,8 @@ class SmacOptimizer(BaseBayesianOptimizer):
         self.base_optimizer = Optimizer_Smac(
             scenario,
             SmacOptimizer._dummy_target_func,
+            model=model,
+            acquisition_maximizer=acquisition_maximizer,
             initial_design=initial_design,
             intensifier=intensifier,
             random_design=random_design,
@@ -243,6 +331,77 @@ class SmacOptimizer(BaseBayesianOptimizer):
         # Best-effort attempt to clean up, in case the user forgets to call .cleanup()
         self.cleanup()
 
+    def __getstate__(self) -> dict:
+        """
+        Get the state of the optimizer for pickling (e.g., to checkpoint it).
+
+        Some of the SMAC internals (the config and trial generators and the
+        intensifier callbacks) cannot be pickled, so we store them as None (without
+        copying the rest of the optimizer) and recreate them in
+        :py:meth:`.__setstate__`. Note that the generators restart from the current
+        runhistory, as they would when resuming a SMAC run.
+        """
+        # pylint: disable=protected-access
+        intensifier = self.base_optimizer._intensifier
+        smbo = self.base_optimizer._optimizer
+        # The intensifier's callback is an instance of a local class that is
+        # redefined on every get_callback() call, so match it by the class name.
+        callback_name = type(intensifier.get_callback()).__qualname__
+        unpicklable = [
+            intensifier._config_generator,
+            intensifier._used_walltime_func,
+            smbo._trial_generator,
+            *(
+                callback
+                for callback in smbo._callbacks
+                if type(callback).__qualname__ == callback_name
+            ),
+        ]
+        state = self.__dict__.copy()
+        # Keep the path of the temporary directory only and let the original
+        # instance clean it up.
+        temp_output_directory = state.pop("_temp_output_directory")
+        buffer = io.BytesIO()
+        _SmacStatePickler(buffer, unpicklable).dump(state)
+        return {
+            "_temp_output_directory": (
+                None if temp_output_directory is None else temp_output_directory.name
+            ),
+            "_state": buffer.getvalue(),
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the optimizer state and recreate the SMAC internals that could not
+        be pickled.
+        """
+        # pylint: disable=protected-access
+        temp_output_directory: str | None = state["_temp_output_directory"]
+        self.__dict__.update(_SmacStateUnpickler(io.BytesIO(state["_state"])).load())
+        self._temp_output_directory = None
+        scenario = self.base_optimizer.scenario
+        if temp_output_directory is not None:
+            # The original temporary directory belongs to (and gets removed by)
+            # the original instance: move the SMAC output to a new one.
+            self._temp_output_directory = TemporaryDirectory(ignore_cleanup_errors=True)
+            output_directory = Path(self._temp_output_directory.name) / Path(
+                scenario.output_directory
+            ).relative_to(temp_output_directory)
+            # Scenario is a frozen dataclass shared by all SMAC components.
+            object.__setattr__(scenario, "output_directory", output_directory)
+        Path(scenario.output_directory).mkdir(parents=True, exist_ok=True)
+
+        intensifier = self.base_optimizer._intensifier
+        smbo = self.base_optimizer._optimizer
+        intensifier.config_selector = intensifier._config_selector
+        intensifier.used_walltime = lambda: smbo.used_walltime
+        # Replace the intensifier's callback (stored as None) in place to keep the
+        # order of the callbacks.
+        smbo._callbacks = [
+            intensifier.get_callback() if callback is None else callback
+            for callback in smbo._callbacks
+        ]
+        smbo._trial_generator = iter(intensifier)
+
     @property
     def max_ratio(self) -> float | None:
         """
@@ -442,11 +601,53 @@ class SmacOptimizer(BaseBayesianOptimizer):
             raise RuntimeError("Acquisition function is not yet initialized")
 
         return self.base_optimizer._config_selector._acquisition_function(
-            suggestion.config.config_to_configspace(self.optimizer_parameter_space)
+            [
+                ConfigSpace.Configuration(
+                    self.optimizer_parameter_space, values=suggestion.config.to_dict()
+                )
+            ]
         ).reshape(
             -1,
         )
 
+    def surrogate_predict_batch(self, configs: pd.DataFrame) -> tuple[npt.NDArray, npt.NDArray]:
+        # pylint: disable=protected-access
+        if len(self._observations) <= self.base_optimizer._initial_design._n_configs:
+            raise RuntimeError(
+                "Surrogate model can make predictions *only* after "
+                "all initial points have been evaluated "
+                f"{len(self._observations)} <= {self.base_optimizer._initial_design._n_configs}"
+            )
+        if self.base_optimizer._config_selector._model is None:
+            raise RuntimeError("Surrogate model is not yet trained")
+
+        config_array = self._to_configspace_array(configs=self._inverse_transform_batch(configs))
+        (mean, variance) = self.base_optimizer._config_selector._model.predict_marginalized(
+            config_array
+        )
+        if mean.ndim > 1 and mean.shape[1] == 1:
+            (mean, variance) = (mean[:, 0], variance[:, 0])
+        return (mean, variance)
+
+    def acquisition_function_batch(self, configs: pd.DataFrame) -> npt.NDArray:
+        import smac  # pylint: disable=import-outside-toplevel
+
+        # pylint: disable=protected-access
+        acquisition_function = self.base_optimizer._config_selector._acquisition_function
+        if acquisition_function is None:
+            raise RuntimeError("Acquisition function is not yet initialized")
+
+        configs = self._inverse_transform_batch(configs)
+        if int(smac.version.split(".")[0]) not in _SMAC_COMPUTE_MAJOR_VERSIONS:
+            # Fall back to the public (but slower) API of the unknown SMAC versions.
+            return acquisition_function(self._to_configspace_configs(configs=configs)).reshape(-1)
+
+        config_array = self._to_configspace_array(configs=configs)
+        # Same as AbstractAcquisitionFunction.__call__(), but for the array of configs.
+        acquisition_values = acquisition_function._compute(config_array)
+        acquisition_values[np.isnan(acquisition_values)] = -np.finfo(float).max
+        return acquisition_values.reshape(-1)
+
     def cleanup(self) -> None:
         if hasattr(self, "_temp_output_directory") and self._temp_output_directory is not None:
             self._temp_output_directory.cleanup()
@@ -471,3 +672,48 @@ class SmacOptimizer(BaseBayesianOptimizer):
             ConfigSpace.Configuration(self.optimizer_parameter_space, values=config.to_dict())
             for (_, config) in configs.astype("O").iterrows()
         ]
+
+    def _inverse_transform_batch(self, configs: pd.DataFrame) -> pd.DataFrame:
+        """Translate a batch of configs from the original parameter space to the
+        optimizer's parameter space, if there is a space adapter.
+        """
+        if self._space_adapter is None:
+            return configs
+        return self._space_adapter.inverse_transform_batch(configs)
+
+    def _to_configspace_array(self, *, configs: pd.DataFrame) -> npt.NDArray:
+        """
+        Convert a dataframe of configs to the numeric array representation used by
+        the SMAC models (i.e., the vectorized equivalent of
+        ``convert_configurations_to_array(self._to_configspace_configs(configs))``).
+
+        Parameters
+        ----------
+        configs : pd.DataFrame
+            Dataframe of configs / parameters. The columns are parameter names and
+            the rows are the configs.
+
+        Returns
+        -------
+        config_array : npt.NDArray
+            Array of shape (n_configs, n_params) in the ConfigSpace vector
+            representation.
+        """
+        space = self.optimizer_parameter_space
+        if space.conditions or space.forbidden_clauses:
+            # Let ConfigSpace check the activity of conditional parameters.
+            return self._convert_configurations_to_array(
+                self._to_configspace_configs(configs=configs)
+            )
+        if set(configs.columns) != set(space.keys()):
+            raise ValueError(
+                f"Config columns {list(configs.columns)} do not match "
+                f"the parameter space {list(space.keys())}"
+            )
+        config_array = np.empty((len(configs), len(space)), dtype=np.float64)
+        for i, param in enumerate(space.values()):
+            values = configs[param.name].to_numpy()
+            if not param.legal_value(values).all():
+                raise ValueError(f"Illegal value(s) for {param.name}: {values}")
+            config_array[:, i] = param.to_vector(values)
+        return config_array
@@ -0,0 +1,71 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Contains the SMAC random forest surrogate model used by the :py:class:`.SmacOptimizer`.
+
+Notes
+-----
+This module imports SMAC at the top level, so it should only be imported lazily
+(i.e., when a :py:class:`.SmacOptimizer` is actually created).
+"""
+
+import time
+from typing import Any
+
+import numpy as np
+from smac.model.random_forest import RandomForest
+
+
+class ThrottledRandomForest(RandomForest):
+    """
+    SMAC random forest surrogate model that can skip some of the refits to spend at
+    most a given fraction of the (wall clock) time on training.
+
+    When a refit is skipped, SMAC keeps using the previously trained forest to
+    maximize the acquisition function (still updated with the latest incumbent).
+    """
+
+    def __init__(self, *args: Any, max_train_time_ratio: float | None = None, **kwargs: Any):
+        """
+        Create a new random forest surrogate model.
+
+        Parameters
+        ----------
+        *args, **kwargs
+            Arguments to pass to the SMAC :py:class:`smac.model.random_forest.RandomForest`.
+        max_train_time_ratio : float | None
+            Maximum fraction of the time to spend on the refits, i.e., the model is
+            only retrained if the last refit took no more than that fraction of the
+            time elapsed since the start of it.
+            If None (default), retrain the model every time SMAC asks for it.
+        """
+        super().__init__(*args, **kwargs)
+        assert max_train_time_ratio is None or 0 < max_train_time_ratio <= 1
+        self._max_train_time_ratio = max_train_time_ratio
+        self._train_time = 0.0
+        self._train_end: float | None = None
+        self.num_trains = 0
+        """Number of times the model has been actually (re)trained."""
+        self.num_skipped_trains = 0
+        """Number of refits skipped due to the time budget."""
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # Monotonic timestamps are meaningless in another process.
+        state["_train_end"] = None
+        return state
+
+    def train(self, X: np.ndarray, Y: np.ndarray) -> "ThrottledRandomForest":
+        if self._max_train_time_ratio is not None and self._train_end is not None:
+            elapsed = time.monotonic() - self._train_end + self._train_time
+            if self._train_time > self._max_train_time_ratio * elapsed:
+                self.num_skipped_trains += 1
+                return self
+        start = time.monotonic()
+        super().train(X, Y)
+        self._train_end = time.monotonic()
+        self._train_time = self._train_end - start
+        self.num_trains += 1
+        return self
@@ -4,14 +4,15 @@
 #
 """Contains the :py:class:`.BaseOptimizer` abstract class."""
 
-import collections
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
+from typing import Any
 
 import ConfigSpace
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+from ConfigSpace.hyperparameters import Hyperparameter
 
 from mlos_core.data_classes import Observation, Observations, Suggestion
 from mlos_core.spaces.adapters.adapter import BaseSpaceAdapter
@@ -73,6 +74,10 @@ class BaseOptimizer(metaclass=ABCMeta):
         self._observations: Observations = Observations()
         self._has_context: bool | None = None
         self._pending_observations: list[tuple[pd.DataFrame, pd.DataFrame | None]] = []
+        # One-hot encoding layout and the parameter space it was computed for.
+        self._1hot_layout: (
+            tuple[ConfigSpace.ConfigurationSpace, list[tuple[Hyperparameter, int]], int] | None
+        ) = None
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(space_adapter={self.space_adapter})"
@@ -297,56 +302,65 @@ class BaseOptimizer(metaclass=ABCMeta):
         cleanup.
         """
 
-    def _from_1hot(self, config: npt.NDArray) -> pd.DataFrame:
-        """Convert numpy array from one-hot encoding to a DataFrame with categoricals
-        and ints in proper columns.
+    def _get_1hot_layout(self) -> tuple[list[tuple[Hyperparameter, int]], int]:
         """
-        df_dict = collections.defaultdict(list)
-        for i in range(config.shape[0]):
-            j = 0
+        Get the layout of the one-hot encoded columns for the parameter space.
+
+        The layout is computed once per :py:attr:`.optimizer_parameter_space`.
+
+        Returns
+        -------
+        layout : list[tuple[Hyperparameter, int]]
+            The hyperparameters in the order of the parameter space and the offsets
+            of their first column in the one-hot encoded array. Categorical
+            hyperparameters take one column per choice, others take one column.
+        n_cols : int
+            Total number of columns in the one-hot encoded array.
+        """
+        if self._1hot_layout is None or self._1hot_layout[0] is not self.optimizer_parameter_space:
+            layout: list[tuple[Hyperparameter, int]] = []
+            offset = 0
             for param in self.optimizer_parameter_space.values():
+                layout.append((param, offset))
                 if isinstance(param, ConfigSpace.CategoricalHyperparameter):
-                    for offset, val in enumerate(param.choices):
-                        if config[i][j + offset] == 1:
-                            df_dict[param.name].append(val)
-                            break
-                    j += len(param.choices)
+                    offset += len(param.choices)
                 else:
-                    val = config[i][j]
-                    if isinstance(param, ConfigSpace.UniformIntegerHyperparameter):
-                        val = int(val)
-                    df_dict[param.name].append(val)
-                    j += 1
+                    offset += 1
+            self._1hot_layout = (self.optimizer_parameter_space, layout, offset)
+        return (self._1hot_layout[1], self._1hot_layout[2])
+
+    def _from_1hot(self, config: npt.NDArray) -> pd.DataFrame:
+        """Convert numpy array from one-hot encoding to a DataFrame with categoricals
+        and ints in proper columns.
+        """
+        df_dict: dict[str, Any] = {}
+        (layout, _) = self._get_1hot_layout()
+        for param, offset in layout:
+            if isinstance(param, ConfigSpace.CategoricalHyperparameter):
+                # Pick the (first) hot column in the block of this categorical.
+                indices = np.argmax(config[:, offset : offset + len(param.choices)], axis=1)
+                df_dict[param.name] = np.asarray(param.choices, dtype=object)[indices]
+            else:
+                values = config[:, offset]
+                if isinstance(param, ConfigSpace.UniformIntegerHyperparameter):
+                    values = values.astype(int)
+                df_dict[param.name] = values
         return pd.DataFrame(df_dict)
 
     def _to_1hot(self, config: pd.DataFrame | pd.Series) -> npt.NDArray:
         """Convert pandas DataFrame to one-hot-encoded numpy array."""
-        n_cols = 0
-        n_rows = config.shape[0] if config.ndim > 1 else 1
-        for param in self.optimizer_parameter_space.values():
+        if isinstance(config, pd.Series):
+            config = config.to_frame().T
+        (layout, n_cols) = self._get_1hot_layout()
+        n_rows = config.shape[0]
+        one_hot = np.zeros((n_rows, n_cols), dtype=np.float32)
+        for param, offset in layout:
             if isinstance(param, ConfigSpace.CategoricalHyperparameter):
-                n_cols += len(param.choices)
+                codes = pd.Categorical(config[param.name], categories=param.choices).codes
+                if (codes < 0).any():
+                    invalid = config[param.name][codes < 0].iloc[0]
+                    raise ValueError(f"{invalid!r} is not in {param.name} choices {param.choices}")
+                one_hot[np.arange(n_rows), offset + codes] = 1
             else:
-                n_cols += 1
-        one_hot = np.zeros((n_rows, n_cols), dtype=np.float32)
-        for i in range(n_rows):
-            j = 0
-            for param in self.optimizer_parameter_space.values():
-                if config.ndim > 1:
-                    assert isinstance(config, pd.DataFrame)
-                    col = config.columns.get_loc(param.name)
-                    assert isinstance(col, int)
-                    val = config.iloc[i, col]
-                else:
-                    assert isinstance(config, pd.Series)
-                    col = config.index.get_loc(param.name)
-                    assert isinstance(col, int)
-                    val = config.iloc[col]
-                if isinstance(param, ConfigSpace.CategoricalHyperparameter):
-                    offset = param.choices.index(val)
-                    one_hot[i][j + offset] = 1
-                    j += len(param.choices)
-                else:
-                    one_hot[i][j] = val
-                    j += 1
+                one_hot[:, offset] = config[param.name].to_numpy(dtype=np.float32)
         return one_hot
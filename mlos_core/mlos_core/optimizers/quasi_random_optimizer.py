@@ -0,0 +1,360 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Contains the :py:class:`.QuasiRandomOptimizer` class.
+
+Notes
+-----
+Unlike the :py:class:`~mlos_core.optimizers.random_optimizer.RandomOptimizer`, which
+samples one configuration at a time, the :py:class:`.QuasiRandomOptimizer` generates
+whole batches of space-filling points (Sobol, Halton, or Latin Hypercube designs from
+:py:mod:`scipy.stats.qmc`) as NumPy arrays in the ConfigSpace vector representation,
+and then serves the suggestions from that buffer.
+
+See Also
+--------
+scipy.stats.qmc : The underlying quasi-Monte Carlo engines.
+"""
+
+import logging
+from warnings import warn
+
+import ConfigSpace
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from ConfigSpace.exceptions import ForbiddenValueError
+from ConfigSpace.functional import quantize
+from ConfigSpace.hyperparameters import (
+    CategoricalHyperparameter,
+    Constant,
+    NumericalHyperparameter,
+    OrdinalHyperparameter,
+    UniformFloatHyperparameter,
+    UniformIntegerHyperparameter,
+)
+from ConfigSpace.util import deactivate_inactive_hyperparameters
+from scipy.stats import qmc
+
+from mlos_core.data_classes import Observations, Suggestion
+from mlos_core.optimizers.optimizer import BaseOptimizer
+from mlos_core.spaces.adapters.adapter import BaseSpaceAdapter
+from mlos_core.spaces.converters.util import QUANTIZATION_BINS_META_KEY
+
+_LOG = logging.getLogger(__name__)
+
+# Max. number of batches to generate in a row without finding a single new point
+# before giving up on the deduplication (e.g., when a small space is exhausted).
+_MAX_EMPTY_BATCHES = 10
+
+
+class QuasiRandomOptimizer(BaseOptimizer):
+    """
+    Optimizer class that produces quasi-random (space-filling) suggestions.
+
+    Useful for (large) design of experiments sweeps and as a baseline for comparison
+    against the Bayesian optimizers.
+    """
+
+    SAMPLERS = ("sobol", "halton", "lhs")
+    """Names of the supported quasi-random sequences."""
+
+    def __init__(
+        self,
+        *,  # pylint: disable=too-many-arguments
+        parameter_space: ConfigSpace.ConfigurationSpace,
+        optimization_targets: list[str],
+        objective_weights: list[float] | None = None,
+        space_adapter: BaseSpaceAdapter | None = None,
+        sampler: str = "sobol",
+        batch_size: int = 64,
+        scramble: bool = True,
+        seed: int | None = None,
+    ):
+        """
+        Create a new quasi-random optimizer.
+
+        Parameters
+        ----------
+        parameter_space : ConfigSpace.ConfigurationSpace
+            The parameter space to optimize.
+        optimization_targets : list[str]
+            The names of the optimization targets to minimize.
+        objective_weights : Optional[list[float]]
+            Optional list of weights of optimization targets.
+        space_adapter : BaseSpaceAdapter
+            The space adapter class to employ for parameter space transformations.
+        sampler : str
+            The quasi-random sequence to use: "sobol" (default), "halton", or
+            "lhs" (Latin Hypercube).
+        batch_size : int
+            Number of points to generate at once.
+            For the Sobol sequence, it is rounded up to a power of 2 to preserve
+            its balance properties.
+        scramble : bool
+            Whether to randomize (scramble) the sequence. Defaults to True.
+        seed : int | None
+            Random seed for the (scrambled) sequence.
+            If None, draw it from the random state of the parameter space (same as
+            the other optimizers do), so that a seeded space gives the same
+            suggestions every time.
+        """
+        super().__init__(
+            parameter_space=parameter_space,
+            optimization_targets=optimization_targets,
+            objective_weights=objective_weights,
+            space_adapter=space_adapter,
+        )
+        if sampler not in self.SAMPLERS:
+            raise ValueError(f"Invalid sampler: {sampler} :: must be one of {self.SAMPLERS}")
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch size: {batch_size}")
+        if sampler == "sobol":
+            batch_size = 1 << (batch_size - 1).bit_length()
+        self._sampler = sampler
+        self._batch_size = batch_size
+
+        num_dims = len(self.optimizer_parameter_space)
+        if seed is None:
+            seed = int(self.optimizer_parameter_space.random.randint(2**31 - 1))
+        rng = np.random.default_rng(seed)
+        self._engine: qmc.QMCEngine
+        if sampler == "sobol":
+            self._engine = qmc.Sobol(num_dims, scramble=scramble, seed=rng)
+        elif sampler == "halton":
+            self._engine = qmc.Halton(num_dims, scramble=scramble, seed=rng)
+        else:
+            self._engine = qmc.LatinHypercube(num_dims, scramble=scramble, seed=rng)
+        # For the parameters that cannot be mapped from the unit hypercube.
+        self._random_state = np.random.RandomState(seed)
+
+        # Points generated but not suggested yet, in the ConfigSpace vector
+        # representation (one row per config).
+        self._buffer: npt.NDArray = np.empty((0, num_dims))
+        # Keys of all configs suggested, pending, or registered so far.
+        self._seen: set[bytes] = set()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(sampler={self._sampler}, "
+            f"batch_size={self._batch_size}, space_adapter={self.space_adapter})"
+        )
+
+    @property
+    def num_buffered(self) -> int:
+        """Number of pre-computed suggestions left in the buffer."""
+        return len(self._buffer)
+
+    @staticmethod
+    def _vector_key(vector: npt.NDArray) -> bytes:
+        """Get a hashable key for the config in the ConfigSpace vector representation
+        (i.e., with NaN for the inactive parameters).
+        """
+        return bytes(np.round(np.nan_to_num(vector, nan=-1.0), 9).tobytes())
+
+    def _config_key(self, config: pd.Series) -> bytes:
+        """Get a hashable key for the config in the optimizer's parameter space."""
+        cs_config = ConfigSpace.Configuration(
+            self.optimizer_parameter_space,
+            values={key: val for (key, val) in config.items() if pd.notna(val)},
+        )
+        return self._vector_key(cs_config.get_array())
+
+    def _unit_to_vector(self, unit_matrix: npt.NDArray) -> npt.NDArray:
+        """
+        Map the points from the unit hypercube to the ConfigSpace vector
+        representation of the optimizer's parameter space (as the inverse CDF of the
+        parameters' distributions).
+
+        Parameters
+        ----------
+        unit_matrix : npt.NDArray
+            Points of shape (num_params, num_points) in [0, 1).
+
+        Returns
+        -------
+        config_matrix : npt.NDArray
+            Configs of shape (num_params, num_points) in the vector representation.
+        """
+        config_matrix = np.empty_like(unit_matrix)
+        for i, param in enumerate(self.optimizer_parameter_space.values()):
+            unit = unit_matrix[i]
+            if isinstance(param, Constant):
+                vector = np.full_like(unit, param.to_vector(param.value))
+            elif isinstance(param, (CategoricalHyperparameter, OrdinalHyperparameter)):
+                choices = np.asarray(
+                    (
+                        param.choices
+                        if isinstance(param, CategoricalHyperparameter)
+                        else param.sequence
+                    ),
+                    dtype=object,
+                )
+                if isinstance(param, CategoricalHyperparameter):
+                    cdf = np.cumsum(param.probabilities)
+                else:
+                    cdf = np.arange(1, len(choices) + 1) / len(choices)
+                index = np.minimum(np.searchsorted(cdf, unit, side="right"), len(choices) - 1)
+                vector = param.to_vector(choices[index])
+            elif isinstance(param, UniformIntegerHyperparameter) and not param.log:
+                # Equal-width bins for each value (rounding the unit interval
+                # would give the bounds only half of the bin).
+                index = np.minimum(np.floor(unit * param.size), param.size - 1)
+                vector = param.to_vector((param.lower + index).astype(np.int64))
+            elif isinstance(param, (UniformFloatHyperparameter, UniformIntegerHyperparameter)):
+                # The vector representation of the uniform (incl. log-scaled)
+                # parameters is the unit interval: round-trip it via the values to
+                # get the legal (e.g., integer) vectors.
+                vector = param.to_vector(param.to_value(unit))
+            else:
+                # E.g., normal or beta distributions.
+                _LOG.debug("Sample %s at random: not a uniform distribution", param)
+                vector = param.sample_vector(len(unit), seed=self._random_state)
+            # Apply the quantization monkey-patched by mlos_core (if any).
+            bins = (param.meta or {}).get(QUANTIZATION_BINS_META_KEY)
+            if bins is not None and isinstance(param, NumericalHyperparameter):
+                vector = quantize(
+                    vector,
+                    bounds=(param.lower_vectorized, param.upper_vectorized),
+                    bins=int(bins),
+                )
+            config_matrix[i] = vector
+        return config_matrix
+
+    def _generate_batch(self) -> npt.NDArray:
+        """
+        Generate the next batch of valid quasi-random configs.
+
+        Returns
+        -------
+        configs : npt.NDArray
+            Valid configs of shape (num_configs, num_params) in the ConfigSpace
+            vector representation, with NaN for the inactive parameters.
+            May contain fewer than `batch_size` configs due to the forbidden clauses.
+        """
+        space = self.optimizer_parameter_space
+        configs = self._unit_to_vector(self._engine.random(self._batch_size).T).T
+        if not space.conditions and not space.forbidden_clauses:
+            return np.asarray(configs)
+        # Deactivate the inactive parameters and drop the forbidden configs
+        # one by one (same as ConfigurationSpace.sample_configuration() does).
+        valid_configs: list[npt.NDArray] = []
+        for vector in configs:
+            try:
+                config = deactivate_inactive_hyperparameters(
+                    None,  # type: ignore[arg-type]  # use the vector instead
+                    space,
+                    vector=vector,
+                )
+                config.check_valid_configuration()
+            except ForbiddenValueError:
+                continue
+            valid_configs.append(config.get_array())
+        return np.asarray(valid_configs).reshape(-1, configs.shape[1])
+
+    def _refill_buffer(self) -> None:
+        """Generate new batches until there are some new (previously unseen) configs in
+        the buffer.
+        """
+        for _ in range(_MAX_EMPTY_BATCHES):
+            batch = self._generate_batch()
+            is_new = np.zeros(len(batch), dtype=np.bool_)
+            for i, vector in enumerate(batch):
+                key = self._vector_key(vector)
+                if key not in self._seen:
+                    self._seen.add(key)
+                    is_new[i] = True
+            if is_new.any():
+                self._buffer = batch[is_new]
+                return
+        warn(
+            f"No new configs in the last {_MAX_EMPTY_BATCHES} batches: "
+            "the parameter space may be exhausted. Allow repeated configs.",
+            UserWarning,
+        )
+        self._buffer = self._generate_batch()
+        if len(self._buffer) == 0:
+            raise RuntimeError(f"Failed to generate valid configs for {self}")
+
+    def _register(
+        self,
+        observations: Observations,
+    ) -> None:
+        """
+        Registers the given config/score pairs.
+
+        Notes
+        -----
+        The scores are not used to guide the search: the registered configs are only
+        excluded from the future suggestions.
+
+        Parameters
+        ----------
+        observations : Observations
+            The observations to register.
+        """
+        if observations.contexts is not None:
+            warn(
+                f"Not Implemented: Ignoring context {list(observations.contexts.index)}",
+                UserWarning,
+            )
+        if observations.metadata is not None:
+            warn(
+                f"Not Implemented: Ignoring metadata {list(observations.metadata.index)}",
+                UserWarning,
+            )
+        self._add_seen([self._config_key(observation.config) for observation in observations])
+
+    def _suggest(
+        self,
+        *,
+        context: pd.Series | None = None,
+    ) -> Suggestion:
+        """
+        Suggests a new configuration.
+
+        Taken from the buffer of the pre-computed quasi-random points.
+
+        Parameters
+        ----------
+        context : None
+            Not Yet Implemented.
+
+        Returns
+        -------
+        suggestion: Suggestion
+            The suggestion to evaluate.
+        """
+        if context is not None:
+            warn(f"Not Implemented: Ignoring context {list(context.index)}", UserWarning)
+        if len(self._buffer) == 0:
+            self._refill_buffer()
+        vector = self._buffer[0]
+        self._buffer = self._buffer[1:]
+        config = ConfigSpace.Configuration(self.optimizer_parameter_space, vector=vector)
+        return Suggestion(
+            config=pd.Series(dict(config), dtype=object),
+            context=context,
+            metadata=None,
+        )
+
+    def register_pending(self, pending: Suggestion) -> None:
+        config = pending.config
+        if self._space_adapter:
+            config = self._space_adapter.inverse_transform(config)
+        self._add_seen([self._config_key(config)])
+
+    def _add_seen(self, keys: list[bytes]) -> None:
+        """Exclude the (registered or pending) configs from the future suggestions,
+        including the ones that are already in the buffer.
+        """
+        self._seen.update(keys)
+        if len(self._buffer) > 0:
+            # The buffered points are in `_seen` already: drop the ones that have
+            # just been registered from outside of this optimizer.
+            new_keys = set(keys)
+            self._buffer = self._buffer[
+                [self._vector_key(vector) not in new_keys for vector in self._buffer]
+            ]
@@ -38,11 +38,20 @@ for additional documentation and examples in the source tree.
 """
 
 from enum import Enum
+from typing import TYPE_CHECKING, Any
 
 import ConfigSpace
 
 from mlos_core.spaces.adapters.identity_adapter import IdentityAdapter
-from mlos_core.spaces.adapters.llamatune import LlamaTuneAdapter
+from mlos_core.util import get_class_from_name
+
+if TYPE_CHECKING:
+    from mlos_core.spaces.adapters.llamatune import LlamaTuneAdapter
+
+    ConcreteSpaceAdapter = IdentityAdapter | LlamaTuneAdapter
+    """Type alias for concrete SpaceAdapter classes (e.g.,
+    :class:`~mlos_core.spaces.adapters.identity_adapter.IdentityAdapter`, etc.)
+    """
 
 __all__ = [
     "ConcreteSpaceAdapter",
@@ -54,19 +63,34 @@ __all__ = [
 
 
 class SpaceAdapterType(Enum):
-    """Enumerate supported mlos_core space adapters."""
+    """
+    Enumerate supported mlos_core space adapters.
 
-    IDENTITY = IdentityAdapter
+    The space adapters (and their dependencies) are only imported when the
+    :py:attr:`.value` of the respective member is first accessed.
+    """
+
+    IDENTITY = "mlos_core.spaces.adapters.identity_adapter.IdentityAdapter"
     """A no-op adapter (:class:`.IdentityAdapter`) will be used."""
 
-    LLAMATUNE = LlamaTuneAdapter
+    LLAMATUNE = "mlos_core.spaces.adapters.llamatune.LlamaTuneAdapter"
     """An instance of :class:`.LlamaTuneAdapter` class will be used."""
 
+    @property
+    def value(self) -> type["ConcreteSpaceAdapter"]:  # type: ignore[override]
+        """The space adapter class (imported on first access)."""
+        cls: type[ConcreteSpaceAdapter] = get_class_from_name(self._value_)
+        return cls
 
-ConcreteSpaceAdapter = IdentityAdapter | LlamaTuneAdapter
-"""Type alias for concrete SpaceAdapter classes (e.g.,
-:class:`~mlos_core.spaces.adapters.identity_adapter.IdentityAdapter`, etc.)
-"""
+
+def __getattr__(name: str) -> Any:
+    """Import the space adapters on first use."""
+    if name == "LlamaTuneAdapter":
+        return SpaceAdapterType.LLAMATUNE.value
+    if name == "ConcreteSpaceAdapter":
+        # Type alias for concrete SpaceAdapter classes (e.g., IdentityAdapter, etc.).
+        return IdentityAdapter | SpaceAdapterType.LLAMATUNE.value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class SpaceAdapterFactory:
@@ -82,7 +106,7 @@ class SpaceAdapterFactory:
         parameter_space: ConfigSpace.ConfigurationSpace,
         space_adapter_type: SpaceAdapterType | None = SpaceAdapterType.IDENTITY,
         space_adapter_kwargs: dict | None = None,
-    ) -> ConcreteSpaceAdapter:
+    ) -> "ConcreteSpaceAdapter":
         """
         Create a new space adapter instance, given the parameter space and potential
         space adapter options.
@@ -12,7 +12,10 @@ space for the Optimizer to search over.
 
 It's main APIs are the :py:meth:`~.BaseSpaceAdapter.transform` and
 :py:meth:`~.BaseSpaceAdapter.inverse_transform` methods, which are used to translate
-configurations from one space to another.
+configurations from one space to another, and their
+:py:meth:`~.BaseSpaceAdapter.transform_batch` and
+:py:meth:`~.BaseSpaceAdapter.inverse_transform_batch` counterparts for translating
+many configurations at once.
 """
 
 from abc import ABCMeta, abstractmethod
@@ -101,3 +104,56 @@ class BaseSpaceAdapter(metaclass=ABCMeta):
             the rows are the configurations.
         """
         pass  # pylint: disable=unnecessary-pass # pragma: no cover
+
+    def transform_batch(self, configurations: pd.DataFrame) -> pd.DataFrame:
+        """
+        Translates a batch of configurations from the target parameter space to the
+        original parameter space (see :py:meth:`~.BaseSpaceAdapter.transform`).
+
+        The default implementation transforms the configurations one by one.
+        Derived classes can override it with a vectorized implementation.
+
+        Parameters
+        ----------
+        configurations : pandas.DataFrame
+            Dataframe of configurations. Column names are the parameter names
+            of the target parameter space and the rows are the configurations.
+
+        Returns
+        -------
+        configurations : pandas.DataFrame
+            Dataframe of the translated configurations. Column names are the
+            parameter names of the original parameter space.
+        """
+        return pd.DataFrame(
+            [self.transform(config) for (_, config) in configurations.astype("O").iterrows()],
+            index=configurations.index,
+        )
+
+    def inverse_transform_batch(self, configurations: pd.DataFrame) -> pd.DataFrame:
+        """
+        Translates a batch of configurations from the original parameter space to the
+        target parameter space (see :py:meth:`~.BaseSpaceAdapter.inverse_transform`).
+
+        The default implementation transforms the configurations one by one.
+        Derived classes can override it with a vectorized implementation.
+
+        Parameters
+        ----------
+        configurations : pandas.DataFrame
+            Dataframe of configurations. Column names are the parameter names
+            of the original parameter space and the rows are the configurations.
+
+        Returns
+        -------
+        configurations : pandas.DataFrame
+            Dataframe of the translated configurations. Column names are the
+            parameter names of the target parameter space.
+        """
+        return pd.DataFrame(
+            [
+                self.inverse_transform(config)
+                for (_, config) in configurations.astype("O").iterrows()
+            ],
+            index=configurations.index,
+        )
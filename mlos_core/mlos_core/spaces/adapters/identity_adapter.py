@@ -29,3 +29,9 @@ class IdentityAdapter(BaseSpaceAdapter):
 
     def inverse_transform(self, configuration: pd.Series) -> pd.Series:
         return configuration
+
+    def transform_batch(self, configurations: pd.DataFrame) -> pd.DataFrame:
+        return configurations
+
+    def inverse_transform_batch(self, configurations: pd.DataFrame) -> pd.DataFrame:
+        return configurations
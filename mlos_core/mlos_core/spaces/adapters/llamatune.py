@@ -14,7 +14,6 @@ See Also: `LlamaTune: Sample-Efficient DBMS Configuration Tuning
 <https://www.microsoft.com/en-us/research/publication/llamatune-sample-efficient-dbms-configuration-tuning>`_.
 """
 import os
-from importlib.metadata import version
 from typing import Any
 from warnings import warn
 
@@ -23,15 +22,13 @@ import ConfigSpace.exceptions
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
-from ConfigSpace.hyperparameters import NumericalHyperparameter
-from packaging.version import Version
+from ConfigSpace.configuration import ROUND_PLACES
+from ConfigSpace.hyperparameters import FloatHyperparameter, NumericalHyperparameter
 from sklearn.preprocessing import MinMaxScaler
 
 from mlos_core.spaces.adapters.adapter import BaseSpaceAdapter
 from mlos_core.util import normalize_config
 
-_NUMPY_VERS = Version(version("numpy"))
-
 
 class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-attributes
     """Implementation of LlamaTune, a set of parameter space transformation techniques,
@@ -111,6 +108,7 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
         self._suggested_configs: dict[ConfigSpace.Configuration, ConfigSpace.Configuration] = {}
         self._pinv_matrix: npt.NDArray
         self._use_approximate_reverse_mapping = use_approximate_reverse_mapping
+        self._default_config: ConfigSpace.Configuration | None = None
 
     @property
     def target_parameter_space(self) -> ConfigSpace.ConfigurationSpace:
@@ -123,6 +121,86 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
             values=configuration.dropna().to_dict(),
         )
 
+        target_config = self._get_suggested_config(config)
+        if target_config is None:
+            target_config = self._try_inverse_transform_config(config)
+
+        return pd.Series(target_config, index=list(self.target_parameter_space.keys()))
+
+    def inverse_transform_batch(self, configurations: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized version of :py:meth:`.inverse_transform`.
+
+        Looks up the previously suggested configurations one by one, but computes
+        the approximate reverse mapping for the rest of them in one go.
+
+        Parameters
+        ----------
+        configurations : pandas.DataFrame
+            Dataframe of configurations in the original parameter space.
+
+        Returns
+        -------
+        configurations : pandas.DataFrame
+            Dataframe of the configurations in the low-dimensional space.
+        """
+        target_columns = list(self.target_parameter_space.keys())
+        configs = [
+            ConfigSpace.Configuration(
+                self.orig_parameter_space,
+                values=configuration.dropna().to_dict(),
+            )
+            for (_, configuration) in configurations.astype("O").iterrows()
+        ]
+        target_rows: list[list[Any]] = []
+        approx_rows: list[int] = []
+        for config in configs:
+            target_config = self._get_suggested_config(config)
+            if target_config is None:
+                approx_rows.append(len(target_rows))
+                target_rows.append([])
+            else:
+                target_rows.append([target_config[key] for key in target_columns])
+
+        if approx_rows:
+            if getattr(self, "_pinv_matrix", None) is None:
+                self._try_generate_approx_inverse_mapping()
+            # Replace NaNs with zeros for inactive hyperparameters
+            config_vectors = np.nan_to_num(
+                np.array([configs[row].get_array() for row in approx_rows]),
+                nan=0.0,
+            )
+            target_vectors = self._approx_inverse_vectors(config_vectors)
+            if self._q_scaler is None:
+                # Round the values the same way ConfigSpace.Configuration does.
+                target_vectors = np.round(target_vectors, ROUND_PLACES)
+            for row, target_vector in zip(approx_rows, target_vectors.tolist()):
+                target_rows[row] = target_vector
+                self._check_approx_inverse_mapping(
+                    configs[row], dict(zip(target_columns, target_vector))
+                )
+
+        return pd.DataFrame(target_rows, columns=target_columns, index=configurations.index)
+
+    def _get_suggested_config(
+        self,
+        config: ConfigSpace.Configuration,
+    ) -> ConfigSpace.Configuration | None:
+        """
+        Get the low-dimensional configuration previously suggested for the given one.
+
+        Returns
+        -------
+        ConfigSpace.Configuration | None
+            Configuration in the low-dimensional space, or None if the configuration
+            was not suggested by the optimizer and has to be mapped approximately.
+
+        Raises
+        ------
+        ValueError
+            If the configuration was not suggested by the optimizer and the
+            approximate reverse mapping is disabled.
+        """
         target_config = self._suggested_configs.get(config, None)
         # NOTE: HeSBO is a non-linear projection method, and does not inherently
         # support inverse projection
@@ -132,7 +210,9 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
         if target_config is None:
             # Inherently it is not supported to register points, which were not
             # suggested by the optimizer.
-            if config == self.orig_parameter_space.get_default_configuration():
+            if self._default_config is None:
+                self._default_config = self.orig_parameter_space.get_default_configuration()
+            if config == self._default_config:
                 # Default configuration should always be registerable.
                 pass
             elif not self._use_approximate_reverse_mapping:
@@ -143,10 +223,7 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
                     "thus *only* configurations suggested "
                     "previously by the optimizer can be registered."
                 )
-
-            target_config = self._try_inverse_transform_config(config)
-
-        return pd.Series(target_config, index=list(self.target_parameter_space.keys()))
+        return target_config
 
     def _try_inverse_transform_config(
         self,
@@ -178,24 +255,7 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
 
         # Replace NaNs with zeros for inactive hyperparameters
         config_vector = np.nan_to_num(config.get_array(), nan=0.0)
-        # Perform approximate reverse mapping
-        # NOTE: applying special value biasing is not possible
-        vector: npt.NDArray = self._config_scaler.inverse_transform(np.array([config_vector]))[0]
-        target_config_vector: npt.NDArray = self._pinv_matrix.dot(vector)
-        # Clip values to to [-1, 1] range of the low dimensional space.
-        for idx, value in enumerate(target_config_vector):
-            target_config_vector[idx] = np.clip(value, -1, 1)
-        if self._q_scaler is not None:
-            # If the max_unique_values_per_param is set, we need to scale
-            # the low dimension space back to the discretized space as well.
-            target_config_vector = self._q_scaler.inverse_transform(
-                np.array([target_config_vector])
-            )[0]
-            assert isinstance(target_config_vector, np.ndarray)
-            # Clip values to [1, max_value] range (floating point errors may occur).
-            for idx, value in enumerate(target_config_vector):
-                target_config_vector[idx] = int(np.clip(value, 1, self._q_scaler.data_max_[idx]))
-            target_config_vector = target_config_vector.astype(int)
+        target_config_vector = self._approx_inverse_vectors(np.array([config_vector]))[0]
         # Convert the vector to a dictionary.
         target_config_dict = dict(
             zip(
@@ -211,44 +271,86 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
             # vector=target_config_vector,
         )
 
-        # Check to see if the approximate reverse mapping looks OK.
-        # Note: we know this isn't 100% accurate, so this is just a warning and
-        # mostly meant for internal debugging.
+        self._check_approx_inverse_mapping(config, dict(target_config))
+
+        # But the inverse mapping should at least be valid in the target space.
+        try:
+            ConfigSpace.Configuration(
+                self.target_parameter_space,
+                values=target_config,
+            ).check_valid_configuration()
+        except ConfigSpace.exceptions.IllegalValueError as err:
+            raise ValueError(
+                f"Invalid configuration {target_config} generated by "
+                f"inverse mapping of {config}:\n{err}"
+            ) from err
+
+        return target_config
+
+    def _approx_inverse_vectors(self, config_vectors: npt.NDArray) -> npt.NDArray:
+        """
+        Maps the (normalized) vectors of the original space configurations to the
+        low-dimensional space using the pseudo-inverse of the projection matrix.
+
+        Parameters
+        ----------
+        config_vectors : npt.NDArray
+            2D array of normalized configurations in the original space, one per row.
+
+        Returns
+        -------
+        npt.NDArray
+            2D array of configurations in the low-dimensional space, one per row.
+        """
+        # Perform approximate reverse mapping
+        # NOTE: applying special value biasing is not possible
+        vectors: npt.NDArray = self._config_scaler.inverse_transform(config_vectors)
+        # Multiply the rows one by one to get exactly the same (floating point)
+        # results regardless of the batch size.
+        target_vectors = np.array([self._pinv_matrix.dot(vector) for vector in vectors])
+        # Clip values to to [-1, 1] range of the low dimensional space.
+        target_vectors = np.clip(target_vectors, -1, 1)
+        if self._q_scaler is not None:
+            # If the max_unique_values_per_param is set, we need to scale
+            # the low dimension space back to the discretized space as well.
+            target_vectors = self._q_scaler.inverse_transform(target_vectors)
+            assert isinstance(target_vectors, np.ndarray)
+            # Clip values to [1, max_value] range (floating point errors may occur).
+            target_vectors = np.clip(target_vectors, 1, self._q_scaler.data_max_).astype(int)
+        return target_vectors
+
+    def _check_approx_inverse_mapping(
+        self,
+        config: ConfigSpace.Configuration,
+        target_config: dict[str, Any],
+    ) -> None:
+        """
+        Check to see if the approximate reverse mapping looks OK.
+
+        Note: we know this isn't 100% accurate, so this is just a warning and
+        mostly meant for internal debugging.
+        """
+        if os.environ.get("MLOS_DEBUG", "false").lower() not in {"1", "true", "y", "yes"}:
+            return
         configuration_dict = dict(config)
-        double_checked_config = self._transform(dict(target_config))
+        double_checked_config = self._transform(target_config)
         double_checked_config = {
             # Skip the special values that aren't in the original space.
             k: v
             for k, v in double_checked_config.items()
             if k in configuration_dict
         }
-        if double_checked_config != configuration_dict and (
-            os.environ.get("MLOS_DEBUG", "false").lower() in {"1", "true", "y", "yes"}
-        ):
+        if double_checked_config != configuration_dict:
             warn(
                 (
                     f"Note: Configuration {configuration_dict} was inverse transformed to "
-                    f"{dict(target_config)} and then back to {double_checked_config}. "
+                    f"{target_config} and then back to {double_checked_config}. "
                     "This is an approximate reverse mapping for previously unregistered "
                     "configurations, so this is just a warning."
                 ),
                 UserWarning,
             )
 
-        # But the inverse mapping should at least be valid in the target space.
-        try:
-            ConfigSpace.Configuration(
-                self.target_parameter_space,
-                values=target_config,
-            ).check_valid_configuration()
-        except ConfigSpace.exceptions.IllegalValueError as err:
-            raise ValueError(
-                f"Invalid configuration {target_config} generated by "
-                f"inverse mapping of {config}:\n{err}"
-            ) from err
-
-        return target_config
-
     def transform(self, configuration: pd.Series) -> pd.Series:
         target_values_dict = configuration.to_dict()
         target_configuration = ConfigSpace.Configuration(
@@ -257,6 +359,92 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
         )
 
         orig_values_dict = self._transform(target_values_dict)
+        orig_configuration = self._normalize_orig_config(orig_values_dict, target_configuration)
+
+        # Add to inverse dictionary -- needed for registering the performance later
+        self._suggested_configs[orig_configuration] = target_configuration
+
+        ret: pd.Series = pd.Series(
+            list(orig_configuration.values()), index=list(orig_configuration.keys())
+        )
+        return ret
+
+    def transform_batch(self, configurations: pd.DataFrame) -> pd.DataFrame:
+        """
+        Vectorized version of :py:meth:`.transform`.
+
+        Applies the HeSBO projection, special values biasing, and quantization to
+        all configurations at once. The results are the same as transforming the
+        configurations one by one, but, unlike :py:meth:`.transform`, the
+        configurations are *not* recorded for the later
+        :py:meth:`.inverse_transform` calls, so use this method to, e.g., score the
+        candidate configurations rather than to suggest them.
+
+        Parameters
+        ----------
+        configurations : pandas.DataFrame
+            Dataframe of configurations in the low-dimensional space.
+
+        Returns
+        -------
+        configurations : pandas.DataFrame
+            Dataframe of the projected configurations in the original space.
+            Inactive parameters (if any) are NaN.
+        """
+        target_params = list(self.target_parameter_space.values())
+        if set(configurations.columns) != {param.name for param in target_params}:
+            raise ValueError(
+                f"Columns {list(configurations.columns)} do not match the target space "
+                f"parameters {list(self.target_parameter_space.keys())}"
+            )
+        for param in target_params:
+            values = configurations[param.name].to_numpy()
+            legal = np.asarray(param.legal_value(values), dtype=bool)
+            if not legal.all():
+                raise ConfigSpace.exceptions.IllegalValueError(param, values[~legal][0])
+
+        orig_columns = self._transform_vectors(
+            configurations[[param.name for param in target_params]].to_numpy(dtype=float)
+        )
+
+        orig_space = self.orig_parameter_space
+        if orig_space.conditions or orig_space.forbidden_clauses:
+            # Inactive parameters and forbidden values have to be handled
+            # for each configuration separately.
+            rows = [
+                dict(
+                    self._normalize_orig_config(
+                        {name: values[row] for (name, values) in orig_columns.items()},
+                        configurations.iloc[row].to_dict(),
+                    )
+                )
+                for row in range(len(configurations))
+            ]
+            return pd.DataFrame(rows, columns=list(orig_columns), index=configurations.index)
+
+        orig_configs = pd.DataFrame(orig_columns, index=configurations.index)
+        for param in orig_space.values():
+            if isinstance(param, FloatHyperparameter):
+                # Round the values the same way ConfigSpace.Configuration does.
+                orig_configs[param.name] = np.round(
+                    orig_configs[param.name].to_numpy(dtype=float), ROUND_PLACES
+                )
+        return orig_configs
+
+    def _normalize_orig_config(
+        self,
+        orig_values_dict: dict,
+        target_configuration: Any,
+    ) -> ConfigSpace.Configuration:
+        """
+        Normalize the projected configuration and validate that it is in the
+        original space.
+
+        Raises
+        ------
+        ValueError
+            If the projected configuration is not valid.
+        """
         orig_configuration = normalize_config(self.orig_parameter_space, orig_values_dict)
 
         # Validate that the configuration is in the original space.
@@ -271,13 +459,7 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
                 f"transformation of {target_configuration}:\n{err}"
             ) from err
 
-        # Add to inverse dictionary -- needed for registering the performance later
-        self._suggested_configs[orig_configuration] = target_configuration
-
-        ret: pd.Series = pd.Series(
-            list(orig_configuration.values()), index=list(orig_configuration.keys())
-        )
-        return ret
+        return orig_configuration
 
     def _construct_low_dim_space(
         self,
@@ -354,90 +536,104 @@ class LlamaTuneAdapter(BaseSpaceAdapter):  # pylint: disable=too-many-instance-a
         configuration : dict
             Projected configuration in the high-dimensional original search space.
         """
-        original_parameters = list(self.orig_parameter_space.values())
-        low_dim_config_values = list(configuration.values())
+        orig_columns = self._transform_vectors(
+            np.array([list(configuration.values())], dtype=float)
+        )
+        return {name: values[0] for (name, values) in orig_columns.items()}
+
+    def _transform_vectors(self, low_dim_values: npt.NDArray) -> dict[str, list]:
+        """
+        Projects a batch of low-dimensional points to the high-dimensional original
+        parameter space, and then biases the resulting parameter values towards
+        their special value(s) (if any).
+
+        Parameters
+        ----------
+        low_dim_values : npt.NDArray
+            2D array of configurations in the low-dimensional space, one per row.
 
+        Returns
+        -------
+        configurations : dict[str, list]
+            Projected configurations in the high-dimensional original search space,
+            as a {parameter name: list of values} dictionary.
+        """
         if self._q_scaler is not None:
             # Scale parameter values from [1, max_value] to [-1, 1]
-            low_dim_config_values = self._q_scaler.transform(np.array([low_dim_config_values]))[0]
+            low_dim_values = self._q_scaler.transform(low_dim_values)
 
-        # Project low-dim point to original parameter space
-        original_config_values = [
-            self._sigma_vector[idx] * low_dim_config_values[self._h_matrix[idx]]
-            for idx in range(len(original_parameters))
-        ]
+        # Project low-dim points to original parameter space
+        orig_values = self._sigma_vector * low_dim_values[:, self._h_matrix]
         # Scale parameter values to [0, 1]
-        original_config_values = self._config_scaler.transform(np.array([original_config_values]))[
-            0
-        ]
-
-        original_config = {}
-        for param, norm_value in zip(original_parameters, original_config_values):
-            # Clip value to force it to fall in [0, 1]
-            # NOTE: HeSBO projection ensures that theoretically but due to
-            #       floating point ops nuances this is not always guaranteed
-            value = np.clip(norm_value, 0, 1)
-
+        orig_values = self._config_scaler.transform(orig_values)
+        # Clip values to force them to fall in [0, 1]
+        # NOTE: HeSBO projection ensures that theoretically but due to
+        #       floating point ops nuances this is not always guaranteed
+        orig_values = np.clip(orig_values, 0, 1)
+
+        orig_columns: dict[str, list] = {}
+        for idx, param in enumerate(self.orig_parameter_space.values()):
+            values = orig_values[:, idx]
             if isinstance(param, ConfigSpace.CategoricalHyperparameter):
-                index = int(value * len(param.choices))  # truncate integer part
-                index = max(0, min(len(param.choices) - 1, index))
+                # truncate integer part
+                indices = (values * len(param.choices)).astype(int)
+                indices = np.clip(indices, 0, len(param.choices) - 1)
                 # NOTE: potential rounding here would be unfair to first & last values
-                orig_value = param.choices[index]
+                orig_columns[param.name] = [param.choices[index] for index in indices]
             elif isinstance(param, NumericalHyperparameter):
                 if param.name in self._special_param_values_dict:
-                    value = self._special_param_value_scaler(param, value)
-
-                orig_value = param.to_value(value)
-                orig_value = np.clip(orig_value, param.lower, param.upper)
-
-                if _NUMPY_VERS >= Version("2.0"):
-                    # Convert numpy types to native Python types (e.g., np.int64 to int)
-                    # This was performed automatically in NumPy<2.0, but not anymore.
-                    # see, https://numpy.org/doc/stable/reference/generated/numpy.can_cast.html
-                    orig_value = orig_value.item()
+                    values = self._special_param_value_scaler(param, values)
 
+                orig_param_values = np.clip(param.to_value(values), param.lower, param.upper)
+                # Convert numpy types to native Python types (e.g., np.int64 to int)
+                orig_columns[param.name] = orig_param_values.tolist()
             else:
                 raise NotImplementedError(
                     "Only Categorical, Integer, and Float hyperparameters are currently supported."
                 )
 
-            original_config[param.name] = orig_value
-
-        return original_config
+        return orig_columns
 
     def _special_param_value_scaler(
         self,
         param: NumericalHyperparameter,
-        input_value: float,
-    ) -> float:
+        input_values: npt.NDArray,
+    ) -> npt.NDArray:
         """
         Biases the special value(s) of this parameter, by shifting the normalized
-        `input_value` towards those.
+        `input_values` towards those.
 
         Parameters
         ----------
         param: NumericalHyperparameter
             Parameter of the original parameter space.
 
-        input_value: float
-            Normalized value for this parameter, as suggested by the underlying optimizer.
+        input_values: npt.NDArray
+            Normalized values for this parameter, as suggested by the underlying optimizer.
 
         Returns
         -------
-        biased_value: float
-            Normalized value after special value(s) biasing is applied.
+        biased_values: npt.NDArray
+            Normalized values after special value(s) biasing is applied.
         """
         special_values_list = self._special_param_values_dict[param.name]
+        biased_values = np.empty(len(input_values), dtype=float)
+        is_special = np.zeros(len(input_values), dtype=bool)
 
-        # Check if input value corresponds to some special value
+        # Check if input values correspond to some special value
         perc_sum = 0.0
         for special_value, biasing_perc in special_values_list:
             perc_sum += biasing_perc
-            if input_value < perc_sum:
-                return float(param.to_vector(special_value))
-
-        # Scale input value uniformly to non-special values
-        return float(param.to_vector((input_value - perc_sum) / (1 - perc_sum)))
+            mask = ~is_special & (input_values < perc_sum)
+            biased_values[mask] = float(param.to_vector(special_value))
+            is_special |= mask
+
+        # Scale input values uniformly to non-special values
+        if not is_special.all():
+            biased_values[~is_special] = param.to_vector(
+                (input_values[~is_special] - perc_sum) / (1 - perc_sum)
+            )
+        return biased_values
 
     # pylint: disable=too-complex,too-many-branches
     def _validate_special_param_values(self, special_param_values_dict: dict) -> None:
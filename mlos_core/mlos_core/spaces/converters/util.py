@@ -4,6 +4,10 @@
 #
 """Helper functions for config space converters."""
 
+from functools import partial
+
+import numpy as np
+import numpy.typing as npt
 from ConfigSpace import ConfigurationSpace
 from ConfigSpace.functional import quantize
 from ConfigSpace.hyperparameters import Hyperparameter, NumericalHyperparameter
@@ -11,6 +15,26 @@ from ConfigSpace.hyperparameters import Hyperparameter, NumericalHyperparameter
 QUANTIZATION_BINS_META_KEY = "quantization_bins"
 
 
+def _sample_quantized_vector(
+    dist: object,
+    bins: int,
+    n: int,
+    *,
+    seed: np.random.RandomState | None = None,
+) -> npt.NDArray:
+    """
+    Sample from the original distribution and quantize the results.
+
+    A module-level function (rather than a lambda) to keep the patched
+    hyperparameters picklable.
+    """
+    return quantize(
+        dist.sample_vector_mlos_orig(n, seed=seed),  # type: ignore[attr-defined]
+        bounds=(dist.lower_vectorized, dist.upper_vectorized),  # type: ignore[attr-defined]
+        bins=bins,
+    )
+
+
 def monkey_patch_hp_quantization(hp: Hyperparameter) -> Hyperparameter:
     """
     Monkey-patch quantization into the Hyperparameter.
@@ -64,14 +88,7 @@ def monkey_patch_hp_quantization(hp: Hyperparameter) -> Hyperparameter:
     setattr(
         dist,
         "sample_vector",
-        lambda n, *, seed=None: quantize(
-            dist.sample_vector_mlos_orig(  # pyright: ignore[reportAttributeAccessIssue]
-                n,
-                seed=seed,
-            ),
-            bounds=(dist.lower_vectorized, dist.upper_vectorized),
-            bins=quantization_bins,
-        ),
+        partial(_sample_quantized_vector, dist, quantization_bins),
     )
     return hp
 
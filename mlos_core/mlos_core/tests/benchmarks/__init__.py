@@ -0,0 +1,16 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Synthetic-function benchmark suite for the :py:mod:`mlos_core` optimizers.
+
+The :py:mod:`~mlos_core.tests.benchmarks.problems` module defines the objectives
+(Branin, Hartmann6, Rosenbrock of different dimensionality, their mixed
+integer/categorical variants, and a high-dimensional problem optimized in a LlamaTune
+embedding), and the :py:mod:`~mlos_core.tests.benchmarks.suite` module runs them with
+the optimizers created via :py:meth:`~mlos_core.optimizers.OptimizerFactory.create`
+and flags the regressions against the baseline results. The
+:py:mod:`~mlos_core.tests.benchmarks.harness` module has the baseline comparison and
+the command line interface shared by all MLOS benchmarks.
+"""
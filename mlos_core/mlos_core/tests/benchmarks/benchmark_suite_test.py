@@ -0,0 +1,115 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for the mlos_core synthetic benchmark suite."""
+
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlos_core.optimizers import OptimizerType
+from mlos_core.tests import SEED
+from mlos_core.tests.benchmarks.problems import (
+    BENCHMARK_PROBLEMS,
+    BRANIN_OPTIMUM,
+    HARTMANN6_OPTIMUM,
+    branin,
+    hartmann6,
+    rosenbrock,
+)
+from mlos_core.tests.benchmarks.suite import (
+    find_regressions,
+    main,
+    run_benchmark,
+    run_suite,
+)
+
+
+def test_known_optima() -> None:
+    """Check the objective functions at their known minimizers."""
+    assert branin(np.array([-np.pi, np.pi, 9.42478]), np.array([12.275, 2.275, 2.475])) == (
+        pytest.approx(BRANIN_OPTIMUM, abs=1e-5)
+    )
+    minimizer = np.array([[0.20169, 0.150011, 0.476874, 0.275332, 0.311652, 0.6573]])
+    assert hartmann6(minimizer) == pytest.approx(HARTMANN6_OPTIMUM, abs=1e-5)
+    assert rosenbrock(np.ones((1, 5))) == pytest.approx(0.0)
+
+
+@pytest.mark.parametrize("problem_name", list(BENCHMARK_PROBLEMS))
+def test_problem_regret(problem_name: str) -> None:
+    """The random samples of each problem are no better than its optimum."""
+    problem = BENCHMARK_PROBLEMS[problem_name]
+    space = problem.create_space(SEED)
+    configs = pd.DataFrame([dict(config) for config in space.sample_configuration(100)])
+    scores = problem.objective(configs)
+    assert scores.shape == (100,)
+    assert (scores >= problem.optimum - 1e-9).all()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("optimizer_type", [OptimizerType.RANDOM, OptimizerType.QUASI_RANDOM])
+@pytest.mark.parametrize("problem_name", ["branin_mixed", "rosenbrock_embedded_50d"])
+def test_run_benchmark(optimizer_type: OptimizerType, problem_name: str) -> None:
+    """Record the timings and the (non-increasing) regret curve of a run."""
+    result = run_benchmark(
+        BENCHMARK_PROBLEMS[problem_name],
+        optimizer_type,
+        num_iterations=10,
+        seed=SEED,
+    )
+    assert result.optimizer_type == optimizer_type.name
+    assert len(result.suggest_times) == len(result.register_times) == len(result.regret) == 10
+    assert all(regret >= 0 for regret in result.regret)
+    assert all(np.diff(result.regret) <= 0)
+    assert result.peak_memory_mb is not None and result.peak_memory_mb > 0
+
+
+def test_find_regressions() -> None:
+    """Flag the slower timings and worse regrets than in the baseline."""
+    baseline = run_suite(
+        problems=["branin"],
+        optimizer_types=[OptimizerType.RANDOM],
+        num_iterations=5,
+        seeds=[1, 2],
+        trace_memory=False,
+    )
+    assert len(baseline["results"]) == 2
+    assert baseline["metadata"]["settings"]["num_iterations"] == 5
+    # JSON roundtrip.
+    baseline = json.loads(json.dumps(baseline))
+    assert not find_regressions(baseline, baseline)
+
+    results = json.loads(json.dumps(baseline))
+    for result in results["results"]:
+        result["suggest_times"] = [time + 1.0 for time in result["suggest_times"]]
+        result["regret"][-1] = 10 * result["regret"][-1] + 1.0
+    regressions = find_regressions(baseline, results)
+    assert len(regressions) == 2
+    assert "suggest_time" in regressions[0]
+    assert "final_regret" in regressions[1]
+
+
+def test_main(tmp_path: str) -> None:
+    """Run the suite from the command line and compare with the baseline."""
+    output = os.path.join(tmp_path, "results.json")
+    argv = [
+        "--problems",
+        "hartmann6",
+        "--optimizer-types",
+        "RANDOM",
+        "--num-iterations",
+        "3",
+        "--no-trace-memory",
+        "--output",
+        output,
+    ]
+    assert main(argv) == 0
+    with open(output, encoding="utf-8") as fh_results:
+        results = json.load(fh_results)
+    assert results["results"][0]["problem"] == "hartmann6"
+    assert results["results"][0]["peak_memory_mb"] is None
+    assert main([*argv, "--baseline", output]) == 0
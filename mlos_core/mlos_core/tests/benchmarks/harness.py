@@ -0,0 +1,180 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Common harness for the performance benchmarks of the MLOS packages.
+
+Each benchmark module only defines its workload (what to run and which metrics to
+compare), and uses the helpers here to describe the environment of the run, compare
+the metrics with the baseline results, and provide the common command line
+interface::
+
+    python -m <benchmark module> [workload options] --output new.json --baseline old.json
+
+The exit code is non-zero if any of the metrics got (much) worse than in the baseline.
+
+Notes
+-----
+The benchmark tests that take a long time are marked with ``@pytest.mark.slow`` and
+are skipped by default (see ``setup.cfg``). Run them with ``pytest -m slow``.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+Metrics = dict[str, dict[str, float]]
+"""Metrics to compare for each run: {run name: {metric name: value}}, where the
+larger values are worse (e.g., timings)."""
+
+
+def get_metadata(packages: Iterable[str], settings: dict[str, Any]) -> dict[str, Any]:
+    """
+    Describe the environment of the benchmark run.
+
+    Parameters
+    ----------
+    packages : Iterable[str]
+        Names of the (installed) packages to record the versions of.
+    settings : dict[str, Any]
+        JSON-serializable settings of the benchmark run.
+
+    Returns
+    -------
+    metadata : dict[str, Any]
+        The timestamp, Python version, platform, package versions, and the settings.
+    """
+    versions = {}
+    for package in packages:
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version,
+        "platform": platform.platform(),
+        "versions": versions,
+        "settings": settings,
+    }
+
+
+def find_regressions(
+    baseline: Metrics,
+    results: Metrics,
+    *,
+    max_ratio: float = 1.5,
+    min_diff: float = 0.0,
+    thresholds: Mapping[str, tuple[float, float]] | None = None,
+    unit: str = "",
+) -> list[str]:
+    """
+    Compare the metrics of the benchmark runs with the baseline.
+
+    A metric regresses if it is both more than `max_ratio` times and more than
+    `min_diff` larger than in the baseline (the latter to ignore the noise in the
+    very small values). The runs and metrics missing from the baseline are ignored.
+
+    Parameters
+    ----------
+    baseline : Metrics
+        Metrics of the baseline runs.
+    results : Metrics
+        Metrics of the new runs.
+    max_ratio : float
+        Max. acceptable ratio of the new value to the baseline one.
+    min_diff : float
+        Min. increase of the value to report.
+    thresholds : Mapping[str, tuple[float, float]] | None
+        Optional (max_ratio, min_diff) overrides for the individual metrics.
+    unit : str
+        Unit of the values to add to the descriptions (e.g., " ms").
+
+    Returns
+    -------
+    regressions : list[str]
+        Descriptions of all regressions (empty if none).
+    """
+    regressions = []
+    for run_name, metrics in results.items():
+        base_metrics = baseline.get(run_name, {})
+        for metric, value in metrics.items():
+            base_value = base_metrics.get(metric)
+            if base_value is None:
+                continue
+            (ratio, diff) = (thresholds or {}).get(metric, (max_ratio, min_diff))
+            if value > base_value * ratio and value - base_value > diff:
+                regressions.append(
+                    f"{run_name} :: {metric}: {base_value:.4g} -> {value:.4g}{unit}"
+                )
+    return regressions
+
+
+def create_arg_parser(description: str | None) -> argparse.ArgumentParser:
+    """
+    Create the command line parser with the common benchmark options.
+
+    Parameters
+    ----------
+    description : str | None
+        Description of the benchmark (e.g., the first paragraph of the module
+        docstring).
+
+    Returns
+    -------
+    parser : argparse.ArgumentParser
+        The parser to add the workload-specific options to.
+    """
+    parser = argparse.ArgumentParser(
+        description=(description or "").split("\n\n", maxsplit=1)[0].strip()
+    )
+    parser.add_argument("--output", help="Path to the JSON file to save the results to.")
+    parser.add_argument("--baseline", help="Path to the JSON results to compare against.")
+    return parser
+
+
+def report_results(
+    args: argparse.Namespace,
+    results: dict[str, Any],
+    *,
+    summary: str,
+    find_regressions_func: Callable[[dict[str, Any], dict[str, Any]], list[str]],
+) -> int:
+    """
+    Save the benchmark results, print their summary, and compare them with the
+    baseline (if any).
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Parsed command line arguments with the `output` and `baseline` paths.
+    results : dict[str, Any]
+        JSON-serializable results of the benchmark.
+    summary : str
+        Human-readable summary of the results to print.
+    find_regressions_func : Callable[[dict, dict], list[str]]
+        Compares the (loaded) baseline with the new results.
+
+    Returns
+    -------
+    exit_code : int
+        1 if any of the metrics regressed, 0 otherwise.
+    """
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh_results:
+            json.dump(results, fh_results, indent=2)
+    print(summary)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as fh_baseline:
+        baseline = json.load(fh_baseline)
+    regressions = find_regressions_func(baseline, results)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+    return 1 if regressions else 0
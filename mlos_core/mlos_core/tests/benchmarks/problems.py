@@ -0,0 +1,231 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Synthetic benchmark problems (objective functions and their parameter spaces) for the
+:py:mod:`mlos_core` optimizers.
+
+All objectives are to be minimized and have a known optimum, so the regret of an
+optimizer can be computed exactly.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import ConfigSpace as CS
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from mlos_core.spaces.adapters import SpaceAdapterType
+
+BRANIN_OPTIMUM = 0.397887357729738
+"""Global minimum of the Branin function."""
+
+HARTMANN6_OPTIMUM = -3.322368011391339
+"""Global minimum of the 6-dimensional Hartmann function."""
+
+_HARTMANN6_ALPHA = np.array([1.0, 1.2, 3.0, 3.2])
+_HARTMANN6_A = np.array(
+    [
+        [10, 3, 17, 3.5, 1.7, 8],
+        [0.05, 10, 17, 0.1, 8, 14],
+        [3, 3.5, 1.7, 10, 17, 8],
+        [17, 8, 0.05, 10, 0.1, 14],
+    ]
+)
+_HARTMANN6_P = 1e-4 * np.array(
+    [
+        [1312, 1696, 5569, 124, 8283, 5886],
+        [2329, 4135, 8307, 3736, 1004, 9991],
+        [2348, 1451, 3522, 2883, 3047, 6650],
+        [4047, 8828, 8732, 5743, 1091, 381],
+    ]
+)
+
+# Additive penalties of the categorical parameter of the mixed variants.
+_CATEGORICAL_OFFSETS = {"none": 0.0, "small": 1.0, "large": 10.0}
+
+
+def branin(x1: npt.NDArray, x2: npt.NDArray) -> npt.NDArray:
+    """The Branin function over x1 in [-5, 10] and x2 in [0, 15]."""
+    return np.asarray(
+        (x2 - 5.1 / (4 * np.pi**2) * x1**2 + 5 / np.pi * x1 - 6) ** 2
+        + 10 * (1 - 1 / (8 * np.pi)) * np.cos(x1)
+        + 10
+    )
+
+
+def hartmann6(x: npt.NDArray) -> npt.NDArray:
+    """The 6-dimensional Hartmann function over the unit hypercube, for the points
+    of shape (num_points, 6).
+    """
+    inner = ((x[:, np.newaxis, :] - _HARTMANN6_P) ** 2 * _HARTMANN6_A).sum(axis=2)
+    return np.asarray(-(_HARTMANN6_ALPHA * np.exp(-inner)).sum(axis=1))
+
+
+def rosenbrock(x: npt.NDArray) -> npt.NDArray:
+    """The Rosenbrock function for the points of shape (num_points, num_dims)."""
+    return np.asarray((100 * (x[:, 1:] - x[:, :-1] ** 2) ** 2 + (1 - x[:, :-1]) ** 2).sum(axis=1))
+
+
+def _branin_int_optimum() -> float:
+    """Minimum of the Branin function for the integer values of x1."""
+    x1 = np.arange(-5, 11, dtype=float)
+    # Branin is a parabola in x2, so its minimum is at the vertex (or the bound).
+    x2 = np.clip(5.1 / (4 * np.pi**2) * x1**2 - 5 / np.pi * x1 + 6, 0, 15)
+    return float(branin(x1, x2).min())
+
+
+@dataclass(frozen=True)
+class BenchmarkProblem:
+    """A synthetic objective to minimize over its parameter space."""
+
+    name: str
+    """Name of the problem."""
+
+    create_space: Callable[[int], CS.ConfigurationSpace]
+    """Create the parameter space of the problem for the given random seed."""
+
+    objective: Callable[[pd.DataFrame], npt.NDArray]
+    """Compute the scores of the (rows of) configs."""
+
+    optimum: float
+    """Known minimum value of the objective."""
+
+    space_adapter_type: SpaceAdapterType = SpaceAdapterType.IDENTITY
+    """Space adapter to optimize the problem with."""
+
+    space_adapter_kwargs: dict = field(default_factory=dict)
+    """Arguments of the space adapter."""
+
+    @property
+    def num_dims(self) -> int:
+        """Dimensionality of the problem's parameter space."""
+        return len(self.create_space(0))
+
+
+def _float_space(seed: int, bounds: list[tuple[float, float]]) -> CS.ConfigurationSpace:
+    """Create a space of float parameters x0, x1, etc. within the given bounds."""
+    space = CS.ConfigurationSpace(seed=seed)
+    space.add([CS.Float(f"x{i}", bound) for (i, bound) in enumerate(bounds)])
+    return space
+
+
+def _values(configs: pd.DataFrame, num_dims: int) -> npt.NDArray:
+    """Get the x0, x1, etc. values of the configs as an array of floats."""
+    return configs[[f"x{i}" for i in range(num_dims)]].to_numpy(dtype=float)
+
+
+def _offsets(configs: pd.DataFrame) -> npt.NDArray:
+    """Get the penalties for the categorical "offset" parameter values."""
+    return configs["offset"].map(_CATEGORICAL_OFFSETS).to_numpy(dtype=float)
+
+
+def branin_problem() -> BenchmarkProblem:
+    """The 2-dimensional Branin problem."""
+    return BenchmarkProblem(
+        name="branin",
+        create_space=lambda seed: _float_space(seed, [(-5.0, 10.0), (0.0, 15.0)]),
+        objective=lambda configs: branin(configs["x0"].astype(float), configs["x1"].astype(float)),
+        optimum=BRANIN_OPTIMUM,
+    )
+
+
+def branin_mixed_problem() -> BenchmarkProblem:
+    """The Branin problem with an integer x0 and an extra categorical parameter."""
+
+    def _create_space(seed: int) -> CS.ConfigurationSpace:
+        space = CS.ConfigurationSpace(seed=seed)
+        space.add(CS.Integer("x0", (-5, 10)))
+        space.add(CS.Float("x1", (0.0, 15.0)))
+        space.add(CS.Categorical("offset", list(_CATEGORICAL_OFFSETS)))
+        return space
+
+    return BenchmarkProblem(
+        name="branin_mixed",
+        create_space=_create_space,
+        objective=lambda configs: (
+            branin(configs["x0"].astype(float), configs["x1"].astype(float)) + _offsets(configs)
+        ),
+        optimum=_branin_int_optimum(),
+    )
+
+
+def hartmann6_problem() -> BenchmarkProblem:
+    """The 6-dimensional Hartmann problem."""
+    return BenchmarkProblem(
+        name="hartmann6",
+        create_space=lambda seed: _float_space(seed, [(0.0, 1.0)] * 6),
+        objective=lambda configs: hartmann6(_values(configs, 6)),
+        optimum=HARTMANN6_OPTIMUM,
+    )
+
+
+def rosenbrock_problem(num_dims: int) -> BenchmarkProblem:
+    """The n-dimensional Rosenbrock problem."""
+    return BenchmarkProblem(
+        name=f"rosenbrock_{num_dims}d",
+        create_space=lambda seed: _float_space(seed, [(-2.0, 2.0)] * num_dims),
+        objective=lambda configs: rosenbrock(_values(configs, num_dims)),
+        optimum=0.0,
+    )
+
+
+def rosenbrock_mixed_problem(num_dims: int) -> BenchmarkProblem:
+    """The n-dimensional Rosenbrock problem with every other parameter being an
+    integer and an extra categorical parameter.
+    """
+
+    def _create_space(seed: int) -> CS.ConfigurationSpace:
+        space = CS.ConfigurationSpace(seed=seed)
+        for i in range(num_dims):
+            space.add(CS.Integer(f"x{i}", (-2, 2)) if i % 2 else CS.Float(f"x{i}", (-2.0, 2.0)))
+        space.add(CS.Categorical("offset", list(_CATEGORICAL_OFFSETS)))
+        return space
+
+    return BenchmarkProblem(
+        name=f"rosenbrock_mixed_{num_dims}d",
+        create_space=_create_space,
+        objective=lambda configs: rosenbrock(_values(configs, num_dims)) + _offsets(configs),
+        optimum=0.0,
+    )
+
+
+def rosenbrock_embedded_problem(
+    num_dims: int,
+    num_effective_dims: int = 4,
+    num_low_dims: int = 8,
+) -> BenchmarkProblem:
+    """
+    A high-dimensional problem where only the first few parameters matter (i.e., the
+    Rosenbrock function of those), optimized in a low-dimensional LlamaTune
+    embedding.
+    """
+    return BenchmarkProblem(
+        name=f"rosenbrock_embedded_{num_dims}d",
+        create_space=lambda seed: _float_space(seed, [(-2.0, 2.0)] * num_dims),
+        objective=lambda configs: rosenbrock(_values(configs, num_effective_dims)),
+        optimum=0.0,
+        space_adapter_type=SpaceAdapterType.LLAMATUNE,
+        space_adapter_kwargs={
+            "num_low_dims": num_low_dims,
+            "special_param_values": None,
+            "max_unique_values_per_param": None,
+        },
+    )
+
+
+BENCHMARK_PROBLEMS: dict[str, BenchmarkProblem] = {
+    problem.name: problem
+    for problem in [
+        branin_problem(),
+        branin_mixed_problem(),
+        hartmann6_problem(),
+        *[rosenbrock_problem(num_dims) for num_dims in (2, 5, 10, 20)],
+        rosenbrock_mixed_problem(6),
+        rosenbrock_embedded_problem(50),
+    ]
+}
+"""All benchmark problems of the suite by name."""
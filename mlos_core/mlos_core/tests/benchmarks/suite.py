@@ -0,0 +1,406 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Runs the synthetic benchmark suite for the :py:mod:`mlos_core` optimizers and compares
+the results against a baseline.
+
+For each problem, optimizer type, and seed, the suite records the wall-clock time of
+every :py:meth:`~mlos_core.optimizers.optimizer.BaseOptimizer.suggest` and
+:py:meth:`~mlos_core.optimizers.optimizer.BaseOptimizer.register` call (i.e., against
+the number of observations registered so far), the regret curve (i.e., the best score
+so far minus the known optimum), and the peak memory allocated by the Python code
+during the run (via :py:mod:`tracemalloc`, in a separate run to keep the timings
+accurate).
+
+Examples
+--------
+Run the suite and save the results::
+
+    python -m mlos_core.tests.benchmarks.suite --output results.json
+
+Run it again (e.g., after a change) and compare with the baseline; the exit code is
+non-zero if any of the timings or the final regrets got (much) worse::
+
+    python -m mlos_core.tests.benchmarks.suite --output new.json --baseline results.json
+"""
+
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+import numpy as np
+import pandas as pd
+
+from mlos_core.optimizers import OptimizerFactory, OptimizerType
+from mlos_core.tests.benchmarks import harness
+from mlos_core.tests.benchmarks.problems import BENCHMARK_PROBLEMS, BenchmarkProblem
+
+_LOG = logging.getLogger(__name__)
+
+_PACKAGES = ("mlos-core", "ConfigSpace", "smac", "flaml", "numpy", "scipy", "pandas")
+
+
+@dataclass
+class BenchmarkResult:  # pylint: disable=too-many-instance-attributes
+    """Measurements of a single optimization run."""
+
+    problem: str
+    """Name of the benchmark problem."""
+
+    optimizer_type: str
+    """Name of the mlos_core OptimizerType."""
+
+    seed: int
+    """Random seed of the run."""
+
+    num_dims: int
+    """Dimensionality of the problem's parameter space."""
+
+    suggest_times: list[float]
+    """Wall-clock time (in seconds) of each suggest call."""
+
+    register_times: list[float]
+    """Wall-clock time (in seconds) of each register call."""
+
+    regret: list[float]
+    """Best score so far minus the optimum after each iteration."""
+
+    peak_memory_mb: float | None
+    """Peak memory allocated during the run (in MiB), if traced."""
+
+    @property
+    def mean_suggest_time(self) -> float:
+        """Average time of a suggest call."""
+        return float(np.mean(self.suggest_times))
+
+    @property
+    def mean_register_time(self) -> float:
+        """Average time of a register call."""
+        return float(np.mean(self.register_times))
+
+    @property
+    def final_regret(self) -> float:
+        """Regret at the end of the run."""
+        return self.regret[-1]
+
+
+def _create_optimizer_kwargs(
+    optimizer_type: OptimizerType, seed: int, num_iterations: int
+) -> dict:
+    """Get the (seeded) optimizer arguments for a run."""
+    if optimizer_type == OptimizerType.RANDOM:
+        # Seeded via the parameter space.
+        return {}
+    if optimizer_type == OptimizerType.SMAC:
+        return {"seed": seed, "max_trials": max(num_iterations, 10)}
+    return {"seed": seed}
+
+
+def _run_loop(
+    problem: BenchmarkProblem,
+    optimizer_type: OptimizerType,
+    num_iterations: int,
+    seed: int,
+) -> tuple[list[float], list[float], list[float]]:
+    """
+    Run the seeded suggest/register loop once.
+
+    Returns
+    -------
+    (suggest_times, register_times, regret) : tuple[list[float], list[float], list[float]]
+        Wall-clock times (in seconds) of each suggest and register call, and the
+        regret after each iteration.
+    """
+    np.random.seed(seed)
+    optimizer = OptimizerFactory.create(
+        parameter_space=problem.create_space(seed),
+        optimization_targets=["score"],
+        optimizer_type=optimizer_type,
+        optimizer_kwargs=_create_optimizer_kwargs(optimizer_type, seed, num_iterations),
+        space_adapter_type=problem.space_adapter_type,
+        space_adapter_kwargs=problem.space_adapter_kwargs,
+    )
+    suggest_times: list[float] = []
+    register_times: list[float] = []
+    regret: list[float] = []
+    best_score = np.inf
+    for _ in range(num_iterations):
+        start_time = time.perf_counter()
+        suggestion = optimizer.suggest()
+        suggest_times.append(time.perf_counter() - start_time)
+
+        score = float(problem.objective(suggestion.config.to_frame().T)[0])
+        best_score = min(best_score, score)
+        regret.append(best_score - problem.optimum)
+
+        observation = suggestion.complete(pd.Series({"score": score}))
+        start_time = time.perf_counter()
+        optimizer.register(observations=observation)
+        register_times.append(time.perf_counter() - start_time)
+    optimizer.cleanup()
+    return (suggest_times, register_times, regret)
+
+
+def run_benchmark(
+    problem: BenchmarkProblem,
+    optimizer_type: OptimizerType,
+    *,
+    num_iterations: int = 50,
+    seed: int = 42,
+    trace_memory: bool = True,
+) -> BenchmarkResult:
+    """
+    Run the sequential suggest/register optimization loop for the problem.
+
+    Parameters
+    ----------
+    problem : BenchmarkProblem
+        The problem to optimize.
+    optimizer_type : OptimizerType
+        The mlos_core optimizer to use.
+    num_iterations : int
+        Number of suggestions to evaluate.
+    seed : int
+        Random seed for the optimizer and the parameter space.
+    trace_memory : bool
+        Whether to measure the peak memory usage. Tracing slows down the code, so
+        the memory is measured in a separate (identically seeded) run that does not
+        affect the timings.
+
+    Returns
+    -------
+    result : BenchmarkResult
+        The measurements of the run.
+    """
+    (suggest_times, register_times, regret) = _run_loop(
+        problem, optimizer_type, num_iterations, seed
+    )
+    peak_memory_mb = None
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            _run_loop(problem, optimizer_type, num_iterations, seed)
+            (_, peak_memory) = tracemalloc.get_traced_memory()
+            peak_memory_mb = peak_memory / 2**20
+        finally:
+            tracemalloc.stop()
+
+    result = BenchmarkResult(
+        problem=problem.name,
+        optimizer_type=optimizer_type.name,
+        seed=seed,
+        num_dims=problem.num_dims,
+        suggest_times=suggest_times,
+        register_times=register_times,
+        regret=regret,
+        peak_memory_mb=peak_memory_mb,
+    )
+    _LOG.info(
+        "%s :: %s :: seed %d :: suggest %.1f ms :: register %.1f ms :: regret %.4g",
+        result.problem,
+        result.optimizer_type,
+        seed,
+        result.mean_suggest_time * 1000,
+        result.mean_register_time * 1000,
+        result.final_regret,
+    )
+    return result
+
+
+def run_suite(
+    problems: list[str] | None = None,
+    optimizer_types: list[OptimizerType] | None = None,
+    *,
+    num_iterations: int = 50,
+    seeds: list[int] | None = None,
+    trace_memory: bool = True,
+) -> dict:
+    """
+    Run all combinations of the benchmark problems, optimizers, and seeds.
+
+    Parameters
+    ----------
+    problems : list[str] | None
+        Names of the problems to run. All of the :py:data:`.BENCHMARK_PROBLEMS` by
+        default.
+    optimizer_types : list[OptimizerType] | None
+        Optimizers to benchmark. All of the OptimizerType members by default.
+    num_iterations : int
+        Number of suggestions to evaluate in each run.
+    seeds : list[int] | None
+        Random seeds to repeat the runs with. Default is a single seed of 42.
+    trace_memory : bool
+        Whether to measure the peak memory usage.
+
+    Returns
+    -------
+    results : dict
+        JSON-serializable results with the "metadata" and the "results" of all runs.
+    """
+    problems = problems or list(BENCHMARK_PROBLEMS)
+    optimizer_types = optimizer_types or list(OptimizerType)
+    seeds = seeds or [42]
+    results = [
+        run_benchmark(
+            BENCHMARK_PROBLEMS[problem],
+            optimizer_type,
+            num_iterations=num_iterations,
+            seed=seed,
+            trace_memory=trace_memory,
+        )
+        for problem in problems
+        for optimizer_type in optimizer_types
+        for seed in seeds
+    ]
+    settings = {
+        "problems": problems,
+        "optimizer_types": [optimizer_type.name for optimizer_type in optimizer_types],
+        "num_iterations": num_iterations,
+        "seeds": seeds,
+        "trace_memory": trace_memory,
+    }
+    return {
+        "metadata": harness.get_metadata(_PACKAGES, settings),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def summarize(results: dict) -> pd.DataFrame:
+    """
+    Aggregate the runs of each problem and optimizer (i.e., over the seeds).
+
+    Parameters
+    ----------
+    results : dict
+        The output of :py:func:`.run_suite` (e.g., loaded from a JSON file).
+
+    Returns
+    -------
+    summary : pandas.DataFrame
+        Mean suggest and register times (overall and for the last quarter of the
+        iterations, i.e., with the most observations), peak memory, and final regret
+        indexed by the problem and optimizer type.
+    """
+    rows = []
+    for result in results["results"]:
+        num_last = max(len(result["suggest_times"]) // 4, 1)
+        rows.append(
+            {
+                "problem": result["problem"],
+                "optimizer_type": result["optimizer_type"],
+                "num_dims": result["num_dims"],
+                "suggest_time": np.mean(result["suggest_times"]),
+                "suggest_time_last": np.mean(result["suggest_times"][-num_last:]),
+                "register_time": np.mean(result["register_times"]),
+                "register_time_last": np.mean(result["register_times"][-num_last:]),
+                "peak_memory_mb": result["peak_memory_mb"],
+                "final_regret": result["regret"][-1],
+            }
+        )
+    return pd.DataFrame(rows).groupby(["problem", "optimizer_type"]).mean()
+
+
+def find_regressions(
+    baseline: dict,
+    results: dict,
+    *,
+    max_time_ratio: float = 1.5,
+    min_time_diff: float = 0.001,
+    max_regret_ratio: float = 1.5,
+    min_regret_diff: float = 0.1,
+) -> list[str]:
+    """
+    Compare the benchmark results with the baseline.
+
+    A metric regresses if it is both more than `max_*_ratio` times and more than
+    `min_*_diff` larger than in the baseline (the latter to ignore the noise in
+    the very small values).
+
+    Parameters
+    ----------
+    baseline : dict
+        Baseline results of :py:func:`.run_suite`.
+    results : dict
+        New results of :py:func:`.run_suite`.
+    max_time_ratio : float
+        Max. acceptable slowdown of the mean suggest and register times.
+    min_time_diff : float
+        Min. slowdown (in seconds) to report.
+    max_regret_ratio : float
+        Max. acceptable ratio of the new final regret to the baseline one.
+    min_regret_diff : float
+        Min. regret increase to report.
+
+    Returns
+    -------
+    regressions : list[str]
+        Descriptions of all regressions (empty if none).
+    """
+    thresholds = {
+        "suggest_time": (max_time_ratio, min_time_diff),
+        "register_time": (max_time_ratio, min_time_diff),
+        "final_regret": (max_regret_ratio, min_regret_diff),
+    }
+
+    def _metrics(summary: pd.DataFrame) -> harness.Metrics:
+        return {
+            f"{problem} :: {optimizer_type}": {metric: float(row[metric]) for metric in thresholds}
+            for ((problem, optimizer_type), row) in summary.iterrows()
+        }
+
+    return harness.find_regressions(
+        _metrics(summarize(baseline)),
+        _metrics(summarize(results)),
+        thresholds=thresholds,
+    )
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = harness.create_arg_parser(__doc__)
+    parser.add_argument("--problems", nargs="+", choices=list(BENCHMARK_PROBLEMS))
+    parser.add_argument(
+        "--optimizer-types",
+        nargs="+",
+        choices=[member.name for member in OptimizerType],
+    )
+    parser.add_argument("--num-iterations", type=int, default=50)
+    parser.add_argument("--seeds", nargs="+", type=int, default=[42])
+    parser.add_argument(
+        "--no-trace-memory",
+        action="store_true",
+        help="Do not measure the peak memory (to avoid the extra run).",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite from the command line."""
+    args = _parse_args(argv)
+    results = run_suite(
+        problems=args.problems,
+        optimizer_types=(
+            [OptimizerType[name] for name in args.optimizer_types]
+            if args.optimizer_types
+            else None
+        ),
+        num_iterations=args.num_iterations,
+        seeds=args.seeds,
+        trace_memory=not args.no_trace_memory,
+    )
+    return harness.report_results(
+        args,
+        results,
+        summary=summarize(results).to_string(),
+        find_regressions_func=find_regressions,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
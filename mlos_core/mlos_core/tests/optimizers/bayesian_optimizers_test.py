@@ -9,8 +9,15 @@ import ConfigSpace as CS
 import pandas as pd
 import pytest
 
+from mlos_core.data_classes import Observations
 from mlos_core.optimizers import BaseOptimizer, OptimizerType
-from mlos_core.optimizers.bayesian_optimizers import BaseBayesianOptimizer
+from mlos_core.optimizers.bayesian_optimizers import (
+    BaseBayesianOptimizer,
+    SmacOptimizer,
+)
+from mlos_core.optimizers.bayesian_optimizers.smac_random_forest import (
+    ThrottledRandomForest,
+)
 
 
 @pytest.mark.filterwarnings("error:Not Implemented")
@@ -49,3 +56,53 @@ def test_context_not_implemented_warning(
     if isinstance(optimizer, BaseBayesianOptimizer):
         with pytest.raises(UserWarning):
             optimizer.surrogate_predict(suggestion=suggestion)
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize(
+    ("kwargs", "num_trains"),
+    [
+        # The first suggestion comes from the initial design.
+        ({}, 7),
+        ({"retrain_after": 4}, 2),
+        # The time budget is too small for anything but the first refit.
+        ({"max_retrain_time_ratio": 1e-9}, 1),
+    ],
+)
+def test_smac_retrain_cadence(
+    configuration_space: CS.ConfigurationSpace,
+    kwargs: dict,
+    num_trains: int,
+) -> None:
+    """Check that the surrogate model is retrained only as often as configured."""
+    optimizer = SmacOptimizer(
+        parameter_space=configuration_space,
+        optimization_targets=["score"],
+        n_random_init=1,
+        n_trees=5,
+        n_jobs=1,
+        n_challengers=100,
+        **kwargs,
+    )
+    # pylint: disable=protected-access
+    model = optimizer.base_optimizer._model
+    assert isinstance(model, ThrottledRandomForest)
+    assert model._rf_opts["n_estimators"] == 5
+    assert model._rf_opts["n_jobs"] == 1
+
+    configs = pd.DataFrame(
+        [dict(config) for config in configuration_space.sample_configuration(10)]
+    )
+    optimizer.register(
+        observations=Observations(
+            configs=configs,
+            scores=pd.DataFrame({"score": configs["x"] * configs["z"]}),
+        )
+    )
+    for _ in range(8):
+        suggestion = optimizer.suggest()
+        score = pd.Series({"score": suggestion.config["x"] * suggestion.config["z"]})
+        optimizer.register(observations=suggestion.complete(score))
+    assert model.num_trains == num_trains
+    assert model.num_trains + model.num_skipped_trains <= 7
+    optimizer.cleanup()
@@ -157,3 +157,50 @@ def test_round_trip_reverse_series(optimizer: BaseOptimizer, one_hot_series: npt
     """Round-trip test for one-hot-decoding and then encoding of a numpy array."""
     round_trip = optimizer._to_1hot(config=optimizer._from_1hot(config=one_hot_series))
     assert round_trip == pytest.approx(one_hot_series)
+
+
+def test_to_1hot_invalid_category(optimizer: BaseOptimizer, data_frame: pd.DataFrame) -> None:
+    """Fail to one-hot encode a value that is not one of the categorical choices."""
+    data_frame.loc[1, "y"] = "d"
+    with pytest.raises(ValueError):
+        optimizer._to_1hot(config=data_frame)
+
+
+def test_round_trip_large_space() -> None:
+    """Round-trip a large batch of configs with many mixed hyperparameters."""
+    configuration_space = CS.ConfigurationSpace(seed=1234)
+    for i in range(100):
+        configuration_space.add(
+            [
+                CS.UniformFloatHyperparameter(name=f"x{i}", lower=-1.0, upper=1.0),
+                CS.CategoricalHyperparameter(name=f"y{i}", choices=["a", "b", "c", "d"]),
+                CS.UniformIntegerHyperparameter(name=f"z{i}", lower=0, upper=1000),
+            ]
+        )
+    optimizer = SmacOptimizer(
+        parameter_space=configuration_space,
+        optimization_targets=["score"],
+    )
+    rng = np.random.default_rng(42)
+    n_rows = 10000
+    data_frame = pd.DataFrame(
+        {
+            **{f"y{i}": rng.choice(["a", "b", "c", "d"], n_rows) for i in range(100)},
+            **{f"z{i}": rng.integers(0, 1000, n_rows) for i in range(100)},
+            **{f"x{i}": rng.uniform(-1.0, 1.0, n_rows).astype(np.float32) for i in range(100)},
+        }
+    )
+    one_hot = optimizer._to_1hot(config=data_frame)
+    assert one_hot.shape == (n_rows, 100 * (1 + 4 + 1))
+    # Exactly one hot column in each categorical block.
+    (layout, _) = optimizer._get_1hot_layout()
+    for param, offset in layout:
+        if isinstance(param, CS.CategoricalHyperparameter):
+            assert (one_hot[:, offset : offset + 4].sum(axis=1) == 1).all()
+    df_round_trip = optimizer._from_1hot(config=one_hot)
+    assert list(df_round_trip.columns) == list(configuration_space.keys())
+    pd.testing.assert_frame_equal(
+        df_round_trip,
+        data_frame[df_round_trip.columns],
+        check_dtype=False,
+    )
@@ -5,8 +5,10 @@
 """Tests for Bayesian Optimizers."""
 
 import logging
+import pickle
 from copy import deepcopy
 from typing import Any
+from unittest.mock import patch
 
 import ConfigSpace as CS
 import numpy as np
@@ -60,9 +62,12 @@ def test_create_optimizer_and_suggest(
     myrepr = repr(optimizer)
     assert myrepr.startswith(optimizer_class.__name__)
 
-    # pending not implemented
-    with pytest.raises(NotImplementedError):
+    if optimizer_class is OptimizerType.QUASI_RANDOM.value:
         optimizer.register_pending(pending=suggestion)
+    else:
+        # pending not implemented
+        with pytest.raises(NotImplementedError):
+            optimizer.register_pending(pending=suggestion)
 
 
 @pytest.mark.parametrize(
@@ -161,6 +166,37 @@ def test_basic_interface_toy_problem(
         ]
         assert len(pred_all) == 20
 
+        # Batch predictions should match the ones for the individual configs.
+        (mean, variance) = optimizer.surrogate_predict_batch(all_observations.configs)
+        assert mean == pytest.approx(np.concatenate(pred_all))
+        assert variance.shape == (20,)
+        assert (variance >= 0).all()
+        # The default (looping) implementation for the other Bayesian optimizers.
+        (mean, variance) = BaseBayesianOptimizer.surrogate_predict_batch(
+            optimizer, all_observations.configs
+        )
+        assert mean == pytest.approx(np.concatenate(pred_all))
+        assert np.isnan(variance).all()
+
+        if isinstance(optimizer, SmacOptimizer):
+            # pylint: disable=protected-access
+            acquisition_function = optimizer.base_optimizer._config_selector._acquisition_function
+            assert acquisition_function is not None
+            acquisition_values = acquisition_function(
+                optimizer._to_configspace_configs(configs=all_observations.configs)
+            ).reshape(-1)
+            assert optimizer.acquisition_function_batch(all_observations.configs) == pytest.approx(
+                acquisition_values
+            )
+            assert BaseBayesianOptimizer.acquisition_function_batch(
+                optimizer, all_observations.configs
+            ) == pytest.approx(acquisition_values)
+            # ... as should the fallback for the unknown SMAC versions.
+            with patch("smac.version", "999.0.0"):
+                assert optimizer.acquisition_function_batch(
+                    all_observations.configs
+                ) == pytest.approx(acquisition_values)
+
 
 @pytest.mark.parametrize(
     ("optimizer_type"),
@@ -359,6 +395,16 @@ def test_optimizer_with_llamatune(optimizer_type: OptimizerType, kwargs: dict |
             for obs in llamatune_best_observations:
                 llamatune_optimizer.surrogate_predict(suggestion=obs.to_suggestion())
 
+        # ... but the batch version supports it.
+        (mean, variance) = llamatune_optimizer.surrogate_predict_batch(
+            llamatune_best_observations.configs
+        )
+        assert mean.shape == variance.shape == (len(llamatune_best_observations),)
+        acquisition_values = llamatune_optimizer.acquisition_function_batch(
+            llamatune_best_observations.configs
+        )
+        assert acquisition_values.shape == (len(llamatune_best_observations),)
+
 
 # Dynamically determine all of the optimizers we have implemented.
 # Note: these must be sorted.
@@ -458,3 +504,43 @@ def test_mixed_numerics_type_input_space_types(
     assert isinstance(all_observations.configs, pd.DataFrame)
     assert isinstance(all_observations.scores, pd.DataFrame)
     assert all_observations.contexts is None
+
+
+@pytest.mark.parametrize(
+    ("optimizer_type", "space_adapter_type"),
+    [
+        *[(member, None) for member in OptimizerType],
+        *[(member, SpaceAdapterType.LLAMATUNE) for member in OptimizerType],
+    ],
+)
+def test_optimizer_pickle(
+    configuration_space: CS.ConfigurationSpace,
+    optimizer_type: OptimizerType,
+    space_adapter_type: SpaceAdapterType | None,
+) -> None:
+    """Make sure the optimizer state can be checkpointed (pickled) and restored."""
+    optimizer = OptimizerFactory.create(
+        parameter_space=configuration_space,
+        optimization_targets=["score"],
+        optimizer_type=optimizer_type,
+        space_adapter_type=space_adapter_type,
+        space_adapter_kwargs={"num_low_dims": 2} if space_adapter_type else None,
+    )
+    for i in range(15):
+        suggestion = optimizer.suggest()
+        optimizer.register(observations=suggestion.complete(pd.Series({"score": float(i % 5)})))
+
+    restored_optimizer = pickle.loads(pickle.dumps(optimizer))
+    assert isinstance(restored_optimizer, type(optimizer))
+    assert restored_optimizer.get_observations().configs.equals(
+        optimizer.get_observations().configs
+    )
+    # The restored optimizer should continue exactly where the original one left.
+    for _ in range(3):
+        suggestion = optimizer.suggest()
+        restored_suggestion = restored_optimizer.suggest()
+        assert restored_suggestion.config.to_dict() == suggestion.config.to_dict()
+        score = pd.Series({"score": 1.0})
+        optimizer.register(observations=suggestion.complete(score))
+        restored_optimizer.register(observations=restored_suggestion.complete(score))
+    restored_optimizer.cleanup()
@@ -0,0 +1,164 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""Tests for quasi-random optimizer."""
+
+import ConfigSpace as CS
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlos_core.data_classes import Observations
+from mlos_core.optimizers.quasi_random_optimizer import QuasiRandomOptimizer
+from mlos_core.spaces.converters.util import (
+    QUANTIZATION_BINS_META_KEY,
+    monkey_patch_cs_quantization,
+)
+from mlos_core.tests import SEED
+
+
+@pytest.mark.parametrize("sampler", QuasiRandomOptimizer.SAMPLERS)
+def test_quasi_random_space_filling(sampler: str) -> None:
+    """Each stratum of the space gets exactly one of the quasi-random points."""
+    space = CS.ConfigurationSpace(seed=SEED)
+    space.add(CS.Float("x", (0.0, 1.0)))
+    space.add(CS.Integer("y", (0, 7)))
+    optimizer = QuasiRandomOptimizer(
+        parameter_space=space,
+        optimization_targets=["score"],
+        sampler=sampler,
+        batch_size=16,
+        seed=SEED,
+    )
+    configs = pd.DataFrame([optimizer.suggest().config for _ in range(16)])
+    # The rest of the batch is buffered.
+    assert optimizer.num_buffered == 0
+    assert sorted(np.floor(configs["x"] * 16)) == list(range(16))
+    assert set(configs["y"]) == set(range(8))
+    optimizer.suggest()
+    assert optimizer.num_buffered == 15
+
+
+def test_quasi_random_batch_size() -> None:
+    """Sobol batches are rounded up to a power of 2."""
+    space = CS.ConfigurationSpace(seed=SEED)
+    space.add(CS.Float("x", (0.0, 1.0)))
+    optimizer = QuasiRandomOptimizer(
+        parameter_space=space,
+        optimization_targets=["score"],
+        batch_size=10,
+    )
+    optimizer.suggest()
+    assert optimizer.num_buffered == 15
+    with pytest.raises(ValueError):
+        QuasiRandomOptimizer(parameter_space=space, optimization_targets=["score"], sampler="foo")
+
+
+def test_quasi_random_conditionals() -> None:
+    """Respect the conditions, forbidden clauses, and quantization of the space."""
+    space = CS.ConfigurationSpace(seed=SEED)
+    kind = CS.Categorical("kind", ["a", "b", "c"])
+    size = CS.Integer("size", (1, 1000), log=True)
+    ratio = CS.Float("ratio", (0.0, 1.0), meta={QUANTIZATION_BINS_META_KEY: 5})
+    weight = CS.Categorical("weight", ["low", "high"], weights=[0.75, 0.25])
+    space.add([kind, size, ratio, weight])
+    space.add(CS.EqualsCondition(ratio, kind, "b"))
+    space.add(CS.ForbiddenAndConjunction(CS.ForbiddenEqualsClause(kind, "c")))
+    monkey_patch_cs_quantization(space)
+
+    optimizer = QuasiRandomOptimizer(
+        parameter_space=space,
+        optimization_targets=["score"],
+        sampler="lhs",
+        batch_size=50,
+        seed=SEED,
+    )
+    configs = []
+    for _ in range(100):
+        config = optimizer.suggest().config.dropna().to_dict()
+        # Raises an error if outside of configuration space.
+        CS.Configuration(space, values=config).check_valid_configuration()
+        configs.append(config)
+
+    assert {config["kind"] for config in configs} == {"a", "b"}
+    assert all(("ratio" in config) == (config["kind"] == "b") for config in configs)
+    assert {config["ratio"] for config in configs if "ratio" in config} <= {
+        0.0,
+        0.25,
+        0.5,
+        0.75,
+        1.0,
+    }
+    num_low = sum(config["weight"] == "low" for config in configs)
+    assert 70 <= num_low <= 80
+
+
+def test_quasi_random_dedup() -> None:
+    """Do not repeat the registered or pending configs until the space is
+    exhausted.
+    """
+    space = CS.ConfigurationSpace(seed=SEED)
+    space.add(CS.Integer("x", (0, 3)))
+    space.add(CS.Categorical("y", ["a", "b"]))
+    optimizer = QuasiRandomOptimizer(
+        parameter_space=space,
+        optimization_targets=["score"],
+        sampler="halton",
+        batch_size=4,
+        seed=SEED,
+    )
+    configs = pd.DataFrame({"x": [0, 1], "y": ["a", "b"]})
+    optimizer.register(
+        observations=Observations(configs=configs, scores=pd.DataFrame({"score": [1.0, 2.0]}))
+    )
+    pending = optimizer.suggest()
+    optimizer.register_pending(pending)
+
+    seen = {(0, "a"), (1, "b"), (pending.config["x"], pending.config["y"])}
+    assert len(seen) == 3
+    for _ in range(5):
+        config = optimizer.suggest().config
+        key = (config["x"], config["y"])
+        assert key not in seen
+        seen.add(key)
+    assert len(seen) == 8
+
+    with pytest.warns(UserWarning, match="exhausted"):
+        optimizer.suggest()
+
+
+def test_quasi_random_dedup_buffered() -> None:
+    """Drop the configs registered from outside from the buffer, too."""
+    space = CS.ConfigurationSpace(seed=SEED)
+    space.add(CS.Integer("x", (0, 7)))
+    optimizer = QuasiRandomOptimizer(
+        parameter_space=space,
+        optimization_targets=["score"],
+        batch_size=8,
+        seed=SEED,
+    )
+    first = optimizer.suggest().config["x"]
+    assert optimizer.num_buffered == 7
+    # Register some of the configs that are still in the buffer.
+    registered = [x for x in range(8) if x != first][:4]
+    optimizer.register(
+        observations=Observations(
+            configs=pd.DataFrame({"x": registered}),
+            scores=pd.DataFrame({"score": [1.0] * len(registered)}),
+        )
+    )
+    assert optimizer.num_buffered == 3
+    suggested = [optimizer.suggest().config["x"] for _ in range(3)]
+    assert not set(suggested) & set(registered)
+
+
+def test_quasi_random_seed_from_space() -> None:
+    """Without an explicit seed, get the same suggestions for the same seeded space."""
+    suggestions = []
+    for _ in range(2):
+        space = CS.ConfigurationSpace(seed=SEED)
+        space.add(CS.Float("x", (0.0, 1.0)))
+        optimizer = QuasiRandomOptimizer(parameter_space=space, optimization_targets=["score"])
+        suggestions.append([optimizer.suggest().config["x"] for _ in range(5)])
+    assert suggestions[0] == suggestions[1]
@@ -0,0 +1,233 @@
+#
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+#
+"""
+Benchmark of the :py:class:`.SmacOptimizer` suggestion latency against the size of
+the observations history for different surrogate model settings.
+
+Run it as a script to see the timings and compare them with the baseline, e.g.::
+
+    python -m mlos_core.tests.optimizers.smac_suggest_latency_benchmark_test \\
+        --output new.json --baseline old.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Any
+
+import ConfigSpace as CS
+import numpy as np
+import pandas as pd
+import pytest
+
+from mlos_core.data_classes import Observations
+from mlos_core.optimizers.bayesian_optimizers.smac_optimizer import SmacOptimizer
+from mlos_core.tests.benchmarks import harness
+
+_LOG = logging.getLogger(__name__)
+
+SETTINGS: dict[str, dict] = {
+    "default": {},
+    "retrain_after_4": {"retrain_after": 4},
+    "retrain_time_ratio_0.1": {"max_retrain_time_ratio": 0.1},
+    "n_trees_5": {"n_trees": 5},
+    "n_jobs_1": {"n_jobs": 1},
+    "small_acq_maximizer": {"n_challengers": 1000, "n_local_search_iterations": 2},
+}
+"""SmacOptimizer constructor arguments for each benchmarked setting."""
+
+
+def _create_space(num_params: int = 8) -> CS.ConfigurationSpace:
+    """Create a configuration space with a mix of float, int, and categorical
+    parameters.
+    """
+    space = CS.ConfigurationSpace(seed=1234)
+    for i in range(num_params):
+        if i % 3 == 0:
+            space.add(CS.Float(f"x{i}", (-5.0, 5.0)))
+        elif i % 3 == 1:
+            space.add(CS.Integer(f"x{i}", (0, 100)))
+        else:
+            space.add(CS.Categorical(f"x{i}", ["a", "b", "c"]))
+    return space
+
+
+def _score(space: CS.ConfigurationSpace, configs: pd.DataFrame) -> pd.DataFrame:
+    """Synthetic objective to minimize."""
+    score = np.zeros(len(configs))
+    for col in configs.columns:
+        if isinstance(space[col], CS.CategoricalHyperparameter):
+            score += (configs[col] != "a").astype(float).to_numpy()
+        else:
+            score += (configs[col].astype(float).to_numpy() / 10.0) ** 2
+    return pd.DataFrame({"score": score})
+
+
+def run_suggest_latency_benchmark(
+    history_sizes: tuple[int, ...] = (100, 500, 1000, 2000),
+    settings: dict[str, dict] | None = None,
+    num_suggestions: int = 5,
+) -> dict[str, dict[int, float]]:
+    """
+    Measure the average latency of the suggest/register cycle of the SmacOptimizer
+    pre-warmed with `history_sizes` random observations for each of the `settings`.
+
+    Returns
+    -------
+    timings : dict[str, dict[int, float]]
+        Average suggestion latency (in seconds) for each setting and history size.
+    """
+    space = _create_space()
+    timings: dict[str, dict[int, float]] = {}
+    for name, kwargs in (settings or SETTINGS).items():
+        timings[name] = {}
+        for history_size in history_sizes:
+            optimizer = SmacOptimizer(
+                parameter_space=space,
+                optimization_targets=["score"],
+                max_trials=history_size + num_suggestions,
+                n_random_init=1,
+                seed=42,
+                **kwargs,
+            )
+            configs = pd.DataFrame(
+                [dict(config) for config in space.sample_configuration(history_size)]
+            )
+            optimizer.register(
+                observations=Observations(configs=configs, scores=_score(space, configs))
+            )
+            start_time = time.perf_counter()
+            for _ in range(num_suggestions):
+                suggestion = optimizer.suggest()
+                config = suggestion.config.to_frame().T
+                optimizer.register(observations=suggestion.complete(_score(space, config).iloc[0]))
+            timings[name][history_size] = (time.perf_counter() - start_time) / num_suggestions
+            optimizer.cleanup()
+        _LOG.info(
+            "%s: %s",
+            name,
+            {size: f"{val * 1000:.1f} ms" for (size, val) in timings[name].items()},
+        )
+    return timings
+
+
+def find_regressions(
+    baseline: dict[str, Any],
+    results: dict[str, Any],
+    *,
+    max_ratio: float = 1.5,
+    min_diff: float = 0.005,
+) -> list[str]:
+    """
+    Compare the suggestion latencies with the baseline.
+
+    A latency regresses if it is both more than `max_ratio` times and more than
+    `min_diff` seconds larger than in the baseline.
+
+    Returns
+    -------
+    regressions : list[str]
+        Descriptions of all regressions (empty if none).
+    """
+
+    def _metrics(results: dict[str, Any]) -> harness.Metrics:
+        # Use the string keys of the JSON results for the history sizes.
+        return {
+            setting: {f"history_{size}": latency for (size, latency) in timings.items()}
+            for (setting, timings) in results["results"].items()
+        }
+
+    return harness.find_regressions(
+        _metrics(baseline),
+        _metrics(results),
+        max_ratio=max_ratio,
+        min_diff=min_diff,
+        unit=" s",
+    )
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = harness.create_arg_parser(__doc__)
+    parser.add_argument("--history-sizes", nargs="+", type=int, default=[100, 500, 1000, 2000])
+    parser.add_argument("--settings", nargs="+", choices=list(SETTINGS))
+    parser.add_argument("--num-suggestions", type=int, default=5)
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the suggestion latency benchmark from the command line."""
+    args = _parse_args(argv)
+    settings = {name: SETTINGS[name] for name in (args.settings or SETTINGS)}
+    timings = run_suggest_latency_benchmark(
+        history_sizes=tuple(args.history_sizes),
+        settings=settings,
+        num_suggestions=args.num_suggestions,
+    )
+    results = {
+        "metadata": harness.get_metadata(
+            ("mlos-core", "smac", "ConfigSpace"),
+            {
+                "history_sizes": args.history_sizes,
+                "settings": settings,
+                "num_suggestions": args.num_suggestions,
+            },
+        ),
+        "results": {
+            name: {str(size): latency for (size, latency) in latencies.items()}
+            for (name, latencies) in timings.items()
+        },
+    }
+    summary = "\n".join(
+        f"{name:25s} "
+        + " ".join(f"{size}: {latency * 1000:.1f} ms" for (size, latency) in latencies.items())
+        for (name, latencies) in timings.items()
+    )
+    return harness.report_results(
+        args,
+        results,
+        summary=summary,
+        find_regressions_func=find_regressions,
+    )
+
+
+@pytest.mark.slow
+def test_suggest_latency_benchmark(tmp_path: str) -> None:
+    """Make sure the benchmark runs with different settings (timings vary too much
+    to compare them here).
+    """
+    output = os.path.join(tmp_path, "results.json")
+    argv = [
+        "--history-sizes",
+        "20",
+        "--settings",
+        "default",
+        "retrain_after_4",
+        "--num-suggestions",
+        "4",
+        "--output",
+        output,
+    ]
+    assert main(argv) == 0
+    with open(output, encoding="utf-8") as fh_results:
+        timings = json.load(fh_results)["results"]
+    assert set(timings) == {"default", "retrain_after_4"}
+    assert all(latency > 0 for latency in timings["default"].values())
+
+
+def test_find_regressions() -> None:
+    """Flag the latencies that got significantly slower than the baseline."""
+    baseline = {"results": {"default": {"100": 0.1, "500": 0.2}}}
+    assert not find_regressions(baseline, baseline)
+    results = {"results": {"default": {"100": 0.1, "500": 0.4}, "n_jobs_1": {"100": 1.0}}}
+    assert find_regressions(baseline, results) == ["default :: history_500: 0.2 -> 0.4 s"]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    sys.exit(main())
@@ -604,3 +604,62 @@ def test_deterministic_behavior_for_same_seed(
 
     assert generate_target_param_space_configs(42) == generate_target_param_space_configs(42)
     assert generate_target_param_space_configs(1234) != generate_target_param_space_configs(42)
+
+
+@pytest.mark.parametrize(
+    ("special_param_values", "max_unique_values_per_param"),
+    (
+        [
+            (special_param_values, max_unique_values_per_param)
+            for special_param_values in (
+                None,
+                {"int_0": -1, "int_1": [(0, 0.1), (256, 0.15)]},
+            )
+            for max_unique_values_per_param in (None, 60)
+        ]
+    ),
+)
+def test_batch_transform(
+    special_param_values: dict | None,
+    max_unique_values_per_param: int | None,
+) -> None:
+    """Tests that the batch transforms give exactly the same results as transforming
+    the configurations one by one.
+    """
+    input_space = construct_parameter_space(
+        n_continuous_params=4,
+        n_integer_params=4,
+        n_categorical_params=4,
+    )
+    adapter = LlamaTuneAdapter(
+        orig_parameter_space=input_space,
+        num_low_dims=3,
+        special_param_values=special_param_values,
+        max_unique_values_per_param=max_unique_values_per_param,
+        use_approximate_reverse_mapping=True,
+    )
+
+    target_configs = pd.DataFrame(
+        [dict(config) for config in adapter.target_parameter_space.sample_configuration(size=200)]
+    )
+    orig_configs = adapter.transform_batch(target_configs)
+    assert list(orig_configs.columns) == list(input_space.keys())
+    assert len(orig_configs) == len(target_configs)
+    for (_, target_config), (_, orig_config) in zip(
+        target_configs.iterrows(), orig_configs.iterrows()
+    ):
+        assert adapter.transform(target_config).to_dict() == orig_config.to_dict()
+
+    # Mix of the previously suggested configs and the new (approximately mapped) ones.
+    sampled_configs = pd.DataFrame(
+        [dict(config) for config in input_space.sample_configuration(size=50)]
+    )
+    orig_configs = pd.concat([orig_configs.iloc[:50], sampled_configs], ignore_index=True)
+    with pytest.warns(UserWarning):
+        batch_target_configs = adapter.inverse_transform_batch(orig_configs)
+    assert list(batch_target_configs.columns) == list(adapter.target_parameter_space.keys())
+    for (_, orig_config), (_, target_config) in zip(
+        orig_configs.astype("O").iterrows(), batch_target_configs.iterrows()
+    ):
+        assert adapter.inverse_transform(orig_config).to_dict() == target_config.to_dict()
+    assert batch_target_configs.iloc[:50].to_dict() == target_configs.iloc[:50].to_dict()
@@ -4,6 +4,8 @@
 #
 """Unit tests for ConfigSpace quantization monkey patching."""
 
+import pickle
+
 import numpy as np
 from ConfigSpace import (
     ConfigurationSpace,
@@ -109,6 +111,30 @@ def test_configspace_quant_repatch() -> None:
     assert len(quantized_values_new) < len(quantized_values) < len(samples_set)
 
 
+def test_configspace_quant_pickle() -> None:
+    """Make sure the patched hyperparameters can be pickled (e.g., for checkpoints)."""
+    quantized_values = set(range(0, 101, 10))
+    hp = UniformIntegerHyperparameter(
+        "hp",
+        lower=0,
+        upper=100,
+        log=False,
+        meta={QUANTIZATION_BINS_META_KEY: 11},
+    )
+    monkey_patch_hp_quantization(hp)
+    samples = hp.sample_value(100, seed=RandomState(SEED))
+    hp_restored = pickle.loads(pickle.dumps(hp))
+    restored_samples = hp_restored.sample_value(100, seed=RandomState(SEED))
+    assert set(restored_samples).issubset(quantized_values)
+    assert all(samples == restored_samples)
+
+    # Unpatched hyperparameters should be picklable, too.
+    hp_restored.meta = {}
+    monkey_patch_hp_quantization(hp_restored)
+    hp_restored = pickle.loads(pickle.dumps(hp_restored))
+    assert not set(hp_restored.sample_value(100)).issubset(quantized_values)
+
+
 def test_configspace_quant() -> None:
     """Test quantization of multiple hyperparameters in the ConfigSpace."""
     space = ConfigurationSpace(
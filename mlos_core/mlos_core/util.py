@@ -4,6 +4,7 @@
 #
 """Internal helper functions for mlos_core package."""
 
+import importlib
 
 import pandas as pd
 from ConfigSpace import Configuration, ConfigurationSpace
@@ -116,3 +117,27 @@ def normalize_config(
         config_space,
         values={key: cs_config[key] for key in config_space.get_active_hyperparameters(cs_config)},
     )
+
+
+def get_class_from_name(class_name: str) -> type:
+    """
+    Import the module and get the class from its fully qualified name.
+
+    Used to defer importing the (potentially heavy) optimizer and space adapter
+    backends until they are actually needed.
+
+    Parameters
+    ----------
+    class_name : str
+        Fully qualified class name (e.g.,
+        ``mlos_core.optimizers.random_optimizer.RandomOptimizer``).
+
+    Returns
+    -------
+    type
+        Class object.
+    """
+    (module_name, class_id) = class_name.rsplit(".", 1)
+    cls = getattr(importlib.import_module(module_name), class_id)
+    assert isinstance(cls, type)
+    return cls